@@ -15,6 +15,7 @@ from src.health import run_startup_checks
 from src.scheduler import EnhancedScheduler
 from src.web import WebServer
 from src.notifications import NotificationManager
+from src.state.state_store import configure_state_store, state_store
 from src.web_notifications_routes import register_notification_routes
 from version import __version__
 
@@ -250,6 +251,9 @@ async def main():
             pause_before_restart(pause_seconds, "Configuration validation failed")
             sys.exit(1)
         
+        # Select the state backend before anything loads persisted state
+        configure_state_store(config.state)
+        
         # Check for setup mode (missing/invalid Tapo credentials)
         setup_mode, setup_reason = config_manager.is_setup_mode()
         
@@ -369,7 +373,7 @@ async def main():
             # Run web server in main thread (blocking)
             logger.info("Starting web server (main thread)...")
             try:
-                web_server.run(host=bind_host, port=port, debug=False)
+                web_server.run(host=bind_host, port=port, debug=False, shutdown_event=shutdown_event)
             except KeyboardInterrupt:
                 logger.info("Web server interrupted")
             finally:
@@ -383,6 +387,9 @@ async def main():
                     logger.info("Stopping notification manager...")
                     notification_manager.stop()
                 
+                # Write out any state changes made after the scheduler stopped
+                state_store.flush()
+                
                 logger.info("Shutdown complete")
         
     except ConfigError as e:
@@ -0,0 +1,215 @@
+"""Bridge for running coroutines on the scheduler's event loop from other threads."""
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Callable, Coroutine, Dict, Hashable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Default deadline for a call made from a web request thread
+DEFAULT_CALL_TIMEOUT_SECONDS = 30.0
+
+# Number of recent calls used for wait/duration statistics
+METRICS_WINDOW = 100
+
+# Coroutines created by @coalesced functions -> their in-flight key
+_COALESCE_KEYS = weakref.WeakKeyDictionary()
+_COALESCE_KEYS_LOCK = threading.Lock()
+
+
+def coalesced(func: Callable) -> Callable:
+    """
+    Mark a read-only coroutine function as safe to coalesce.
+
+    When the same coroutine function is called with the same arguments while an
+    earlier call is still in flight, LoopBridge waits on the earlier call instead
+    of scheduling another one. Only use this for side-effect-free reads.
+
+    Arguments are bound to the function's signature (with defaults applied), so
+    read() and read(delay=0.05) share a key. Calls with unhashable arguments
+    are never coalesced.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        coro = func(*args, **kwargs)
+        try:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (func, tuple(bound.arguments.items()))
+            hash(key)
+        except TypeError:
+            return coro
+        with _COALESCE_KEYS_LOCK:
+            _COALESCE_KEYS[coro] = key
+        return coro
+
+    return wrapper
+
+
+def _coalesce_key(coro: Coroutine) -> Optional[Hashable]:
+    """Take the in-flight key recorded for a coroutine, or None if it must not be coalesced."""
+    try:
+        with _COALESCE_KEYS_LOCK:
+            return _COALESCE_KEYS.pop(coro, None)
+    except TypeError:
+        # Not weak-referenceable (e.g. a mock), so never recorded
+        return None
+
+
+class SchedulerCallTimeout(TimeoutError):
+    """Raised when a call to the scheduler loop exceeds its deadline."""
+    pass
+
+
+class _InFlightCall:
+    """A scheduled coroutine and the number of threads waiting on it."""
+
+    def __init__(self):
+        self.future: Optional[concurrent.futures.Future] = None
+        self.waiters = 1
+        self.started = False
+
+
+class LoopBridge:
+    """
+    Thread-safe gateway from web request threads to the scheduler's event loop.
+
+    Each call has a deadline; a call that times out is cancelled on the loop so a
+    wedged device cannot pin a request thread forever. Concurrent identical reads
+    of functions marked with @coalesced share a single execution. Queue depth and
+    wait times are tracked for diagnostics.
+    """
+
+    def __init__(self, default_timeout: float = DEFAULT_CALL_TIMEOUT_SECONDS):
+        """
+        Initialize bridge.
+
+        Args:
+            default_timeout: Seconds to wait for a call when no timeout is given
+        """
+        self.default_timeout = default_timeout
+
+        self._lock = threading.RLock()
+        self._in_flight: Dict[Hashable, _InFlightCall] = {}
+        self._pending = 0
+        self._queued = 0
+        self._peak_pending = 0
+        self._counters = {'submitted': 0, 'coalesced': 0, 'timeouts': 0, 'failures': 0}
+        self._wait_times = deque(maxlen=METRICS_WINDOW)
+        self._durations = deque(maxlen=METRICS_WINDOW)
+
+    def run(self, coro: Coroutine, loop: asyncio.AbstractEventLoop,
+            timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the given loop and wait for its result.
+
+        Args:
+            coro: Coroutine to execute
+            loop: Event loop to execute it on (must be running in another thread)
+            timeout: Seconds to wait (default: default_timeout)
+
+        Returns:
+            Result of the coroutine
+
+        Raises:
+            SchedulerCallTimeout: If the call does not finish before the deadline
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+
+        key = _coalesce_key(coro)
+        with self._lock:
+            call = self._in_flight.get(key) if key is not None else None
+            if call is not None:
+                call.waiters += 1
+                self._counters['coalesced'] += 1
+                coro.close()
+            else:
+                call = self._submit(coro, loop, key)
+
+        try:
+            return call.future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            with self._lock:
+                self._counters['timeouts'] += 1
+                abandoned = call.waiters == 1
+            if abandoned:
+                call.future.cancel()
+            name = getattr(coro, '__qualname__', 'coroutine')
+            logger.warning(f"Scheduler call {name} timed out after {timeout}s")
+            raise SchedulerCallTimeout(
+                f"Scheduler call {name} did not complete within {timeout}s"
+            ) from None
+        finally:
+            with self._lock:
+                call.waiters -= 1
+
+    def _submit(self, coro: Coroutine, loop: asyncio.AbstractEventLoop,
+                key: Optional[Hashable]) -> _InFlightCall:
+        """Schedule a coroutine on the loop. Caller must hold the lock."""
+        submitted_at = time.monotonic()
+        call = _InFlightCall()
+        call.future = asyncio.run_coroutine_threadsafe(self._timed(coro, call, submitted_at), loop)
+
+        self._counters['submitted'] += 1
+        self._pending += 1
+        self._queued += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+        if key is not None:
+            self._in_flight[key] = call
+
+        call.future.add_done_callback(lambda f: self._finished(key, call, submitted_at))
+        return call
+
+    async def _timed(self, coro: Coroutine, call: _InFlightCall, submitted_at: float) -> Any:
+        """Record how long the call waited for the loop, then run it."""
+        with self._lock:
+            call.started = True
+            self._queued -= 1
+            self._wait_times.append(time.monotonic() - submitted_at)
+        return await coro
+
+    def _finished(self, key: Optional[Hashable], call: _InFlightCall, submitted_at: float):
+        """Bookkeeping when a scheduled call completes, fails or is cancelled."""
+        with self._lock:
+            self._pending -= 1
+            if not call.started:
+                self._queued -= 1
+            self._durations.append(time.monotonic() - submitted_at)
+            if call.future.cancelled() or call.future.exception() is not None:
+                self._counters['failures'] += 1
+            if key is not None and self._in_flight.get(key) is call:
+                del self._in_flight[key]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get bridge metrics.
+
+        Returns:
+            Dictionary with queue depth, call counters and recent wait/duration stats
+        """
+        with self._lock:
+            wait_times = list(self._wait_times)
+            durations = list(self._durations)
+            metrics = {
+                'pending': self._pending,
+                'queued': self._queued,
+                'peak_pending': self._peak_pending,
+                **self._counters
+            }
+
+        metrics['avg_wait_ms'] = round(sum(wait_times) / len(wait_times) * 1000, 1) if wait_times else None
+        metrics['max_wait_ms'] = round(max(wait_times) * 1000, 1) if wait_times else None
+        metrics['avg_duration_ms'] = round(sum(durations) / len(durations) * 1000, 1) if durations else None
+        metrics['max_duration_ms'] = round(max(durations) * 1000, 1) if durations else None
+        return metrics
@@ -6,6 +6,9 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from .validators import is_positive_number
+from .yaml_loader import load_config_file
+
 
 logger = logging.getLogger(__name__)
 
@@ -222,8 +225,7 @@ class Config:
         
         try:
             logger.debug(f"Reading configuration file: {self.config_path}")
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_config_file(self.config_path)
             
             if config is None:
                 logger.warning("Configuration file is empty, using empty config structure")
@@ -349,6 +351,12 @@ class Config:
                     logger.error(f"Group '{group_name}' must be a dictionary")
                     raise ConfigError(f"Group '{group_name}' configuration must be a dictionary")
                 
+                if group_config.get('power_watts') is not None:
+                    power_watts = group_config['power_watts']
+                    if not is_positive_number(power_watts):
+                        logger.error(f"Group '{group_name}' has invalid power_watts: {power_watts!r}")
+                        raise ConfigError(f"Group '{group_name}' power_watts must be a positive number")
+                
                 if 'items' in group_config:
                     items = group_config['items']
                     if not isinstance(items, list):
@@ -417,6 +425,26 @@ class Config:
                 logger.error(f"Invalid value for {field}: {safety[field]}")
                 raise ConfigError(f"{field} must be a valid positive number: {e}")
         
+        # Validate state persistence (optional section)
+        state = self._config.get('state')
+        if state is not None:
+            if not isinstance(state, dict):
+                logger.error(f"State must be a dictionary, got: {type(state)}")
+                raise ConfigError("State configuration must be a dictionary")
+            
+            backend = state.get('backend', 'json')
+            if backend not in ('json', 'sqlite'):
+                logger.error(f"Invalid state backend: {backend}")
+                raise ConfigError(f"state.backend must be 'json' or 'sqlite', got: {backend}")
+            
+            if 'flush_interval_seconds' in state:
+                try:
+                    value = float(state['flush_interval_seconds'])
+                    if value <= 0:
+                        raise ConfigError(f"state.flush_interval_seconds must be positive, got: {value}")
+                except (ValueError, TypeError) as e:
+                    raise ConfigError(f"state.flush_interval_seconds must be a valid number: {e}")
+        
         logger.info("Configuration validation completed successfully")
     
     @property
@@ -510,6 +538,20 @@ class Config:
             'port': 4329
         })
     
+    @property
+    def history(self) -> Dict[str, Any]:
+        """Get runtime history configuration."""
+        return self._config.get('history', {
+            'enabled': True
+        })
+    
+    @property
+    def state(self) -> Dict[str, Any]:
+        """Get state persistence configuration."""
+        return self._config.get('state', {
+            'backend': 'json'
+        })
+    
     @property
     def web(self) -> Dict[str, Any]:
         """Get web UI configuration."""
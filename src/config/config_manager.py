@@ -5,10 +5,15 @@ import yaml
 import logging
 import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from datetime import datetime
 import copy
 
+from .patch import ConfigChange, ConfigPatchError, apply_json_patch, diff_config
+from .snapshot import ConfigSnapshot, FrozenDict, thaw
+from .validators import is_positive_number
+from .yaml_loader import config_file_cache, load_config_file, safe_load
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,6 +51,26 @@ class ConfigManager:
         ('web', 'auth', 'password_hash'),
     }
     
+    # Changes under these paths take effect only after a restart
+    RESTART_PATHS = (
+        ('devices', 'groups'),  # Device group structure changes
+        ('weather_api', 'provider'),  # Weather provider change
+        ('web', 'port'),  # Web server port change
+        ('health_server', 'port'),  # Health server port change
+        ('state', 'backend'),  # State persistence backend change
+        ('state', 'database'),  # State database location change
+        ('notifications', 'outbox', 'enabled'),  # Notification outbox on/off
+        ('notifications', 'outbox', 'state_file'),  # Notification outbox location
+    )
+    
+    # Subsystems that pick up changes without a restart, by path prefix ('*' matches any key).
+    # Listeners registered with add_change_listener() perform the reload.
+    HOT_RELOAD_SUBSYSTEMS = (
+        (('devices', 'groups', '*', 'schedules'), 'schedules'),
+        (('thresholds',), 'thresholds'),
+        (('notifications',), 'notifications'),
+    )
+    
     # Default configuration template
     DEFAULT_CONFIG = {
         'location': {
@@ -131,7 +156,10 @@ class ConfigManager:
         },
         'scheduler': {
             'check_interval_minutes': 10,
-            'forecast_hours': 12
+            'forecast_hours': 12,
+            'concurrent_groups': True,
+            'max_concurrent_groups': 4,
+            'group_timeout_seconds': 120
         },
         'logging': {
             'level': 'INFO',
@@ -203,8 +231,13 @@ class ConfigManager:
         self.config_path = Path(config_path)
         logger.info(f"Configuration path: {self.config_path}")
         
+        # Called with (changes, snapshot) after each published change
+        self._change_listeners: List[Callable[[List[ConfigChange], ConfigSnapshot], None]] = []
+        
         # Load or create initial configuration
-        self._config, self._env_overridden_paths = self._load_or_create_config()
+        self._snapshot: Optional[ConfigSnapshot] = None
+        config, self._env_overridden_paths = self._load_or_create_config()
+        self._publish(config)
         self._config_last_modified = datetime.now()
         
         logger.info("ConfigManager initialized successfully")
@@ -249,7 +282,7 @@ class ConfigManager:
                     # Verify it's readable
                     try:
                         with open(self.config_path, 'r') as f:
-                            test_load = yaml.safe_load(f)
+                            test_load = safe_load(f)
                             if test_load:
                                 logger.info("✓ Verified config file is readable")
                     except Exception as e:
@@ -272,8 +305,7 @@ class ConfigManager:
             return config_with_env, env_overridden_paths
         
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_config_file(self.config_path)
             
             if config is None or not isinstance(config, dict):
                 logger.error(f"Invalid configuration file format: {self.config_path}")
@@ -453,6 +485,15 @@ class ConfigManager:
                 # Log error but don't crash startup - keep in-memory config
                 logger.error(f"Failed to sync env overrides to disk (continuing with in-memory config): {e}")
     
+    # Top-level sections with a dedicated validator (see _validate_sections)
+    _SECTION_VALIDATORS = {
+        'location': '_validate_location',
+        'devices': '_validate_devices',
+        'thresholds': '_validate_thresholds',
+        'safety': '_validate_safety',
+        'notifications': '_validate_notifications',
+    }
+    
     def _validate_config(self, config: Dict[str, Any]) -> None:
         """
         Validate configuration.
@@ -463,13 +504,60 @@ class ConfigManager:
         Raises:
             ConfigValidationError: If validation fails
         """
+        # Static validators, so this can also be called without an instance
+        ConfigManager._validate_required_sections(config)
+        for validator in ConfigManager._SECTION_VALIDATORS.values():
+            getattr(ConfigManager, validator)(config)
+    
+    def _validate_sections(self, config: Dict[str, Any], paths: List[Tuple]) -> None:
+        """
+        Validate only the subtrees of a configuration that contain the given paths.
+        
+        A change inside one device group validates just that group; a change
+        anywhere else in a section validates the whole section. Sections without
+        a validator are not checked (as in _validate_config).
+        
+        Args:
+            config: Configuration to validate
+            paths: Changed paths (tuples of keys from the root)
+            
+        Raises:
+            ConfigValidationError: If validation fails
+        """
+        self._validate_required_sections(config)
+        
+        validated = set()
+        for path in paths:
+            if not path:
+                self._validate_config(config)
+                return
+            
+            section = path[0]
+            if section == 'devices' and len(path) >= 3 and path[1] == 'groups':
+                key = ('devices', 'groups', path[2])
+                groups = config['devices'].get('groups')
+                if key in validated or 'devices' in validated:
+                    continue
+                if isinstance(groups, dict) and path[2] in groups:
+                    self._validate_device_group(path[2], groups[path[2]])
+                    self._validate_group_schedules(path[2], groups[path[2]])
+                validated.add(key)
+            elif section in self._SECTION_VALIDATORS and section not in validated:
+                getattr(self, self._SECTION_VALIDATORS[section])(config)
+                validated.add(section)
+    
+    @staticmethod
+    def _validate_required_sections(config: Dict[str, Any]) -> None:
+        """Check that all required top-level sections are present."""
         # Required sections (thresholds and morning_mode are now optional for backward compatibility)
         required_sections = ['location', 'devices', 'safety', 'scheduler']
         for section in required_sections:
             if section not in config:
                 raise ConfigValidationError(f"Missing required section: {section}")
-        
-        # Validate location
+    
+    @staticmethod
+    def _validate_location(config: Dict[str, Any]) -> None:
+        """Validate the location section."""
         location = config['location']
         if not isinstance(location, dict):
             raise ConfigValidationError("location must be a dictionary")
@@ -486,8 +574,10 @@ class ConfigManager:
                 raise ConfigValidationError(f"Invalid longitude: {lon} (must be -180 to 180)")
         except (ValueError, TypeError) as e:
             raise ConfigValidationError(f"Invalid latitude/longitude: {e}")
-        
-        # Validate devices
+    
+    @staticmethod
+    def _validate_devices(config: Dict[str, Any]) -> None:
+        """Validate the devices section (credentials and all groups)."""
         devices = config['devices']
         if not isinstance(devices, dict):
             raise ConfigValidationError("devices must be a dictionary")
@@ -514,44 +604,78 @@ class ConfigManager:
                 raise ConfigValidationError("devices.groups must be a dictionary")
             
             for group_name, group_config in groups.items():
-                if not isinstance(group_config, dict):
-                    raise ConfigValidationError(f"devices.groups.{group_name} must be a dictionary")
-                
-                # Validate enabled field if present
-                if 'enabled' in group_config:
-                    if not isinstance(group_config['enabled'], bool):
-                        raise ConfigValidationError(f"devices.groups.{group_name}.enabled must be a boolean")
-                
-                # Validate items
-                if 'items' in group_config:
-                    items = group_config['items']
-                    if not isinstance(items, list):
-                        raise ConfigValidationError(f"devices.groups.{group_name}.items must be a list")
+                ConfigManager._validate_device_group(group_name, group_config)
+                ConfigManager._validate_group_schedules(group_name, group_config)
+    
+    @staticmethod
+    def _validate_device_group(group_name: str, group_config: Any) -> None:
+        """Validate a single device group."""
+        if not isinstance(group_config, dict):
+            raise ConfigValidationError(f"devices.groups.{group_name} must be a dictionary")
+        
+        # Validate enabled field if present
+        if 'enabled' in group_config:
+            if not isinstance(group_config['enabled'], bool):
+                raise ConfigValidationError(f"devices.groups.{group_name}.enabled must be a boolean")
+        
+        # Validate power_watts if present (used for energy estimates)
+        if group_config.get('power_watts') is not None:
+            if not is_positive_number(group_config['power_watts']):
+                raise ConfigValidationError(f"devices.groups.{group_name}.power_watts must be a positive number")
+        
+        # Validate items
+        if 'items' in group_config:
+            items = group_config['items']
+            if not isinstance(items, list):
+                raise ConfigValidationError(f"devices.groups.{group_name}.items must be a list")
+            
+            for idx, item in enumerate(items):
+                if not isinstance(item, dict):
+                    raise ConfigValidationError(f"devices.groups.{group_name}.items[{idx}] must be a dictionary")
+                
+                # Validate required fields
+                if 'name' not in item or not item['name']:
+                    raise ConfigValidationError(f"devices.groups.{group_name}.items[{idx}] must include 'name' field")
+                
+                if 'ip_address' not in item or not item['ip_address']:
+                    raise ConfigValidationError(f"devices.groups.{group_name}.items[{idx}] must include 'ip_address' field")
+                
+                # Validate outlets if present
+                if 'outlets' in item:
+                    outlets = item['outlets']
+                    if not isinstance(outlets, list):
+                        raise ConfigValidationError(f"devices.groups.{group_name}.items[{idx}].outlets must be a list")
                     
-                    for idx, item in enumerate(items):
-                        if not isinstance(item, dict):
-                            raise ConfigValidationError(f"devices.groups.{group_name}.items[{idx}] must be a dictionary")
-                        
-                        # Validate required fields
-                        if 'name' not in item or not item['name']:
-                            raise ConfigValidationError(f"devices.groups.{group_name}.items[{idx}] must include 'name' field")
-                        
-                        if 'ip_address' not in item or not item['ip_address']:
-                            raise ConfigValidationError(f"devices.groups.{group_name}.items[{idx}] must include 'ip_address' field")
-                        
-                        # Validate outlets if present
-                        if 'outlets' in item:
-                            outlets = item['outlets']
-                            if not isinstance(outlets, list):
-                                raise ConfigValidationError(f"devices.groups.{group_name}.items[{idx}].outlets must be a list")
-                            
-                            for outlet_idx, outlet in enumerate(outlets):
-                                if not isinstance(outlet, int) or outlet < 0:
-                                    raise ConfigValidationError(
-                                        f"devices.groups.{group_name}.items[{idx}].outlets[{outlet_idx}] must be a non-negative integer"
-                                    )
-        
-        # Validate thresholds if present (optional for backward compatibility, deprecated)
+                    for outlet_idx, outlet in enumerate(outlets):
+                        if not isinstance(outlet, int) or outlet < 0:
+                            raise ConfigValidationError(
+                                f"devices.groups.{group_name}.items[{idx}].outlets[{outlet_idx}] must be a non-negative integer"
+                            )
+    
+    @staticmethod
+    def _validate_group_schedules(group_name: str, group_config: Dict[str, Any]) -> None:
+        """
+        Validate a device group's schedules by parsing them as the scheduler does.
+        
+        Schedules are hot-reloaded by change listeners, so any the scheduler could
+        not parse must be rejected before the change is written to disk.
+        """
+        from src.scheduler.schedule_types import parse_schedules
+        
+        schedules = group_config.get('schedules')
+        if schedules is None:
+            return
+        if not isinstance(schedules, list):
+            raise ConfigValidationError(f"devices.groups.{group_name}.schedules must be a list")
+        
+        try:
+            parse_schedules(thaw(schedules))
+        except (ValueError, TypeError, AttributeError) as e:
+            raise ConfigValidationError(f"devices.groups.{group_name}.schedules: {e}")
+    
+    @staticmethod
+    def _validate_thresholds(config: Dict[str, Any]) -> None:
+        """Validate the thresholds section if present (optional, deprecated)."""
         if 'thresholds' in config:
             thresholds = config['thresholds']
             if not isinstance(thresholds, dict):
@@ -567,8 +691,10 @@ class ConfigManager:
                         raise ConfigValidationError(f"{field} must be non-negative")
                 except (ValueError, TypeError):
                     raise ConfigValidationError(f"Invalid {field} value")
-        
-        # Validate safety
+    
+    @staticmethod
+    def _validate_safety(config: Dict[str, Any]) -> None:
+        """Validate the safety section."""
         safety = config['safety']
         if not isinstance(safety, dict):
             raise ConfigValidationError("safety must be a dictionary")
@@ -582,8 +708,10 @@ class ConfigManager:
                     raise ConfigValidationError(f"{field} must be positive")
             except (ValueError, TypeError):
                 raise ConfigValidationError(f"Invalid {field} value")
-        
-        # Validate notifications if present
+    
+    @staticmethod
+    def _validate_notifications(config: Dict[str, Any]) -> None:
+        """Validate the notifications section if present."""
         if 'notifications' in config:
             notifications = config['notifications']
             if not isinstance(notifications, dict):
@@ -633,6 +761,19 @@ class ConfigManager:
                     # Validate use_tls is a boolean if present
                     if 'use_tls' in email and not isinstance(email['use_tls'], bool):
                         raise ConfigValidationError("notifications.email.use_tls must be a boolean")
+                    
+                    if 'smtp_max_sessions' in email:
+                        value = email['smtp_max_sessions']
+                        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                            raise ConfigValidationError(
+                                "notifications.email.smtp_max_sessions must be a positive integer"
+                            )
+                    if 'smtp_session_idle_seconds' in email:
+                        value = email['smtp_session_idle_seconds']
+                        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                            raise ConfigValidationError(
+                                "notifications.email.smtp_session_idle_seconds must be a non-negative number"
+                            )
             
             # Validate webhook notifications if enabled
             if 'webhook' in notifications:
@@ -646,6 +787,28 @@ class ConfigManager:
                         raise ConfigValidationError(
                             "notifications.webhook.url is required when webhook notifications are enabled"
                         )
+            
+            # Validate the notification outbox if present
+            if 'outbox' in notifications:
+                outbox = notifications['outbox']
+                if not isinstance(outbox, dict):
+                    raise ConfigValidationError("notifications.outbox must be a dictionary")
+                if 'enabled' in outbox and not isinstance(outbox['enabled'], bool):
+                    raise ConfigValidationError("notifications.outbox.enabled must be a boolean")
+                for field in ('digest_window_seconds', 'retry_base_seconds', 'retry_max_seconds'):
+                    if field in outbox:
+                        value = outbox[field]
+                        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                            raise ConfigValidationError(
+                                f"notifications.outbox.{field} must be a non-negative number"
+                            )
+                for field in ('rate_limit_per_minute', 'max_attempts'):
+                    if field in outbox:
+                        value = outbox[field]
+                        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                            raise ConfigValidationError(
+                                f"notifications.outbox.{field} must be a positive integer"
+                            )
     
     def _write_config_to_disk(self, config: Dict[str, Any]) -> None:
         """
@@ -658,19 +821,56 @@ class ConfigManager:
         temp_path = self.config_path.with_suffix('.tmp')
         
         try:
-            with open(temp_path, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            data = yaml.dump(config, default_flow_style=False, sort_keys=False).encode('utf-8')
+            with open(temp_path, 'wb') as f:
+                f.write(data)
             
             # Atomic rename
             temp_path.replace(self.config_path)
             logger.info(f"Configuration written to: {self.config_path}")
             
+            # The next load (reload_config, Config) reuses this document instead of re-parsing
+            config_file_cache.store(self.config_path, data, config)
+            
         except Exception as e:
             logger.error(f"Failed to write configuration: {e}")
             if temp_path.exists():
                 temp_path.unlink()
             raise
     
+    def _publish(self, config: Dict[str, Any]) -> None:
+        """
+        Publish a new immutable snapshot of the configuration.
+        
+        Builds the frozen full and secrets-masked views up front and swaps them in
+        with a single reference assignment, so readers never need the lock.
+        
+        Args:
+            config: New configuration (not retained; callers may keep mutating it)
+        """
+        previous = self._snapshot
+        self._snapshot = ConfigSnapshot.build(
+            revision=previous.revision + 1 if previous else 1,
+            config=config,
+            public=self._filter_secrets(config),
+            previous=previous
+        )
+    
+    @property
+    def _config(self) -> FrozenDict:
+        """Current full configuration (read-only)."""
+        return self._snapshot.config
+    
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Current configuration snapshot.
+        
+        Lock-free; the returned snapshot never changes, later updates publish a
+        new one.
+        """
+        return self._snapshot
+    
     def get_config(self, include_secrets: bool = False) -> Dict[str, Any]:
         """
         Get current configuration.
@@ -679,15 +879,34 @@ class ConfigManager:
             include_secrets: Whether to include secret values (default: False)
             
         Returns:
-            Configuration dictionary (deep copy)
+            Configuration dictionary (mutable deep copy)
         """
-        with self._lock:
-            config = copy.deepcopy(self._config)
-            
-            if not include_secrets:
-                config = self._filter_secrets(config)
+        return thaw(self.get_config_view(include_secrets))
+    
+    def get_config_view(self, include_secrets: bool = False) -> FrozenDict:
+        """
+        Get a read-only view of the current configuration without copying.
+        
+        Prefer this over get_config() for code that only reads the configuration.
+        The view behaves like a dict but raises TypeError on modification.
+        
+        Args:
+            include_secrets: Whether to include secret values (default: False)
             
-            return config
+        Returns:
+            Frozen configuration dictionary
+        """
+        snapshot = self._snapshot
+        return snapshot.config if include_secrets else snapshot.public
+    
+    @property
+    def revision(self) -> int:
+        """
+        Configuration revision, incremented whenever the in-memory config changes.
+        
+        Cheap to read; use it to key caches derived from the configuration.
+        """
+        return self._snapshot.revision
     
     def reload_config(self) -> None:
         """
@@ -702,8 +921,7 @@ class ConfigManager:
                     logger.warning(f"Cannot reload: config file not found at {self.config_path}")
                     return
                 
-                with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f)
+                config = load_config_file(self.config_path)
                 
                 if config is None or not isinstance(config, dict):
                     logger.error(f"Cannot reload: invalid config file format at {self.config_path}")
@@ -716,11 +934,13 @@ class ConfigManager:
                 self._validate_config(config)
                 
                 # Update in-memory config
-                self._config = config
+                changes = diff_config(self._snapshot.config, config)
                 self._env_overridden_paths = env_overridden_paths
+                self._publish(config)
                 self._config_last_modified = datetime.now()
                 
                 logger.debug("Configuration reloaded from disk")
+                self._notify_change_listeners(changes)
                 
             except Exception as e:
                 logger.error(f"Failed to reload configuration from disk: {e}", exc_info=True)
@@ -752,6 +972,141 @@ class ConfigManager:
         
         return config
     
+    def apply_patch(self, operations: List[Dict[str, Any]], preserve_secrets: bool = True) -> Dict[str, Any]:
+        """
+        Apply a JSON Patch (RFC 6902) to the configuration.
+        
+        Unlike update_config, only the subtrees touched by the patch are validated
+        and restart detection looks only at the changed paths. Changes to
+        hot-reloadable subsystems (schedules, thresholds, notifications) never
+        require a restart; change listeners apply them to the running services.
+        
+        Args:
+            operations: List of {'op', 'path', 'value'} operations (add, remove, replace, test)
+            preserve_secrets: If True, keep existing secret values when the patch sets them empty/masked
+            
+        Returns:
+            Dictionary with keys: 'status' ('ok' or 'error'), 'message', 'restart_required',
+            'changes' (list of {'path', 'old', 'new'}, secrets masked) and 'reloaded'
+            (hot-reloaded subsystems). Errors also carry 'error_type': 'patch' (the
+            patch does not apply, e.g. a failed test op or missing path), 'validation'
+            or 'internal'.
+        """
+        with self._lock:
+            try:
+                current = self._snapshot.config
+                patched = apply_json_patch(current, operations)
+                
+                if preserve_secrets:
+                    patched = self._merge_secrets(patched, current)
+                
+                changes = diff_config(current, patched)
+                if changes:
+                    self._validate_sections(patched, [change.path for change in changes])
+                    self._write_config_to_disk(patched)
+                    self._publish(patched)
+                    self._config_last_modified = datetime.now()
+                
+            except ConfigPatchError as e:
+                logger.error(f"Configuration patch rejected: {e}")
+                return self._error_result(f"Invalid patch: {str(e)}", 'patch')
+            except ConfigValidationError as e:
+                logger.error(f"Configuration validation failed: {e}")
+                return self._error_result(f"Validation error: {str(e)}", 'validation')
+            except Exception as e:
+                logger.error(f"Failed to patch configuration: {e}", exc_info=True)
+                return self._error_result(f"Failed to update configuration: {str(e)}", 'internal')
+        
+        restart_required = any(self._change_requires_restart(change) for change in changes)
+        reloaded = sorted({
+            subsystem for subsystem in map(self.get_change_subsystem, (c.path for c in changes)) if subsystem
+        })
+        
+        logger.info(
+            f"Configuration patched: {len(changes)} change(s)"
+            + (f", hot-reloading {', '.join(reloaded)}" if reloaded else "")
+        )
+        self._notify_change_listeners(changes)
+        
+        return {
+            'status': 'ok',
+            'message': 'Configuration updated successfully' if changes else 'No changes',
+            'restart_required': str(restart_required).lower(),
+            'changes': [self._mask_change(change) for change in changes],
+            'reloaded': reloaded
+        }
+    
+    @staticmethod
+    def _error_result(message: str, error_type: str) -> Dict[str, Any]:
+        """Build an apply_patch error result."""
+        return {
+            'status': 'error',
+            'error_type': error_type,
+            'message': message,
+            'restart_required': 'false',
+            'changes': [],
+            'reloaded': []
+        }
+    
+    def _mask_change(self, change: ConfigChange) -> Dict[str, Any]:
+        """Serialize a change, masking secret values."""
+        result = change.to_dict()
+        if any(change.path[:len(secret)] == secret for secret in self.SECRET_FIELDS):
+            result['old'] = '********' if change.old else change.old
+            result['new'] = '********' if change.new else change.new
+        return result
+    
+    @classmethod
+    def get_change_subsystem(cls, path: Tuple) -> Optional[str]:
+        """
+        Get the hot-reloadable subsystem a changed path belongs to.
+        
+        Args:
+            path: Changed path (tuple of keys from the root)
+            
+        Returns:
+            Subsystem name ('schedules', 'thresholds', 'notifications') or None
+        """
+        for prefix, subsystem in cls.HOT_RELOAD_SUBSYSTEMS:
+            if len(path) >= len(prefix) and all(
+                expected in ('*', key) for expected, key in zip(prefix, path)
+            ):
+                return subsystem
+        return None
+    
+    def _change_requires_restart(self, change: ConfigChange) -> bool:
+        """Check whether a change touches a restart-only path (and is not hot-reloadable)."""
+        if self.get_change_subsystem(change.path):
+            return False
+        return any(
+            change.path[:len(restart_path)] == restart_path or restart_path[:len(change.path)] == change.path
+            for restart_path in self.RESTART_PATHS
+        )
+    
+    def add_change_listener(self, listener: Callable[[List[ConfigChange], ConfigSnapshot], None]) -> None:
+        """
+        Register a callback for configuration changes.
+        
+        The listener is called with the list of changes and the newly published
+        snapshot after every update, patch or reload that changed something.
+        Listener errors are logged and do not affect the update.
+        
+        Args:
+            listener: Callable taking (changes, snapshot)
+        """
+        self._change_listeners.append(listener)
+    
+    def _notify_change_listeners(self, changes: List[ConfigChange]) -> None:
+        """Call change listeners with the current snapshot."""
+        if not changes:
+            return
+        snapshot = self._snapshot
+        for listener in list(self._change_listeners):
+            try:
+                listener(changes, snapshot)
+            except Exception as e:
+                logger.error(f"Configuration change listener failed: {e}", exc_info=True)
+    
     def update_config(self, new_config: Dict[str, Any], preserve_secrets: bool = True) -> Dict[str, str]:
         """
         Update configuration with validation and atomic write.
@@ -785,10 +1140,12 @@ class ConfigManager:
                 self._write_config_to_disk(config_to_validate)
                 
                 # Update in-memory config
-                self._config = config_to_validate
+                changes = diff_config(self._snapshot.config, config_to_validate)
+                self._publish(config_to_validate)
                 self._config_last_modified = datetime.now()
                 
                 logger.info("Configuration updated successfully")
+                self._notify_change_listeners(changes)
                 
                 return {
                     'status': 'ok',
@@ -862,24 +1219,9 @@ class ConfigManager:
         Returns:
             True if restart is recommended
         """
-        # Changes that require restart
-        restart_keys = [
-            ('devices', 'groups'),  # Device group structure changes
-            ('weather_api', 'provider'),  # Weather provider change
-            ('web', 'port'),  # Web server port change
-            ('health_server', 'port'),  # Health server port change
-        ]
-        
-        for key_path in restart_keys:
-            old_val = old_config
-            new_val = new_config
-            
-            for key in key_path:
-                old_val = old_val.get(key) if isinstance(old_val, dict) else None
-                new_val = new_val.get(key) if isinstance(new_val, dict) else None
-            
-            if old_val != new_val:
-                logger.info(f"Configuration change requires restart: {'.'.join(key_path)}")
+        for change in diff_config(old_config, new_config):
+            if self._change_requires_restart(change):
+                logger.info(f"Configuration change requires restart: {change.dotted}")
                 return True
         
         return False
@@ -0,0 +1,207 @@
+"""JSON Patch (RFC 6902) application and structured diffs for configuration trees."""
+
+import copy
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple, Union
+
+from .snapshot import config_equal
+
+
+PathKey = Union[str, int]
+
+
+class ConfigPatchError(ValueError):
+    """Malformed patch or patch that does not apply to the configuration."""
+    pass
+
+
+@dataclass(frozen=True)
+class ConfigChange:
+    """
+    A single changed leaf (or replaced subtree) between two configurations.
+
+    Attributes:
+        path: Keys from the root (dict keys and list indexes)
+        old: Previous value (None if added)
+        new: New value (None if removed)
+    """
+    path: Tuple[PathKey, ...]
+    old: Any
+    new: Any
+
+    @property
+    def dotted(self) -> str:
+        """Path as a dotted string (e.g. 'devices.groups.mats.schedules.0.enabled')."""
+        return '.'.join(str(key) for key in self.path)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable representation."""
+        return {'path': self.dotted, 'old': self.old, 'new': self.new}
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """
+    Split a JSON Pointer (RFC 6901) into unescaped reference tokens.
+
+    Args:
+        pointer: Pointer such as '/devices/groups/mats/schedules/0/enabled'
+
+    Returns:
+        List of tokens (empty for the whole document)
+
+    Raises:
+        ConfigPatchError: If the pointer is malformed
+    """
+    if not isinstance(pointer, str):
+        raise ConfigPatchError(f"Patch path must be a string, got {type(pointer).__name__}")
+    if pointer == '':
+        return []
+    if not pointer.startswith('/'):
+        raise ConfigPatchError(f"Patch path must start with '/': {pointer}")
+    return [token.replace('~1', '/').replace('~0', '~') for token in pointer[1:].split('/')]
+
+
+def to_pointer(*keys: PathKey) -> str:
+    """
+    Build a JSON Pointer from path keys, escaping '~' and '/'.
+
+    Args:
+        keys: Dict keys and list indexes from the root
+
+    Returns:
+        Pointer such as '/devices/groups/mats/schedules/0'
+    """
+    return ''.join('/' + str(key).replace('~', '~0').replace('/', '~1') for key in keys)
+
+
+def _list_index(container: list, token: str, allow_end: bool = False) -> int:
+    """Resolve a list index token ('-' means the end when allow_end)."""
+    if allow_end and token == '-':
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith('0')):
+        raise ConfigPatchError(f"Invalid list index: {token}")
+    index = int(token)
+    limit = len(container) + (1 if allow_end else 0)
+    if index >= limit:
+        raise ConfigPatchError(f"List index out of range: {token}")
+    return index
+
+
+def _resolve_parent(document: Any, tokens: List[str]) -> Tuple[Any, str]:
+    """Walk to the container holding the final token."""
+    current = document
+    for token in tokens[:-1]:
+        if isinstance(current, dict):
+            if token not in current:
+                raise ConfigPatchError(f"Path not found: /{'/'.join(tokens)}")
+            current = current[token]
+        elif isinstance(current, list):
+            current = current[_list_index(current, token)]
+        else:
+            raise ConfigPatchError(f"Path not found: /{'/'.join(tokens)}")
+    return current, tokens[-1]
+
+
+def apply_json_patch(document: Dict[str, Any], operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Apply JSON Patch operations to a copy of a configuration document.
+
+    Supports the add, remove, replace and test operations. Operations are
+    applied in order; the input document is not modified.
+
+    Args:
+        document: Configuration dictionary
+        operations: List of {'op', 'path', 'value'} operations
+
+    Returns:
+        Patched copy of the document
+
+    Raises:
+        ConfigPatchError: If an operation is malformed or does not apply
+    """
+    if not isinstance(operations, list) or not operations:
+        raise ConfigPatchError("Patch must be a non-empty list of operations")
+
+    result = copy.deepcopy(document)
+
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise ConfigPatchError("Each patch operation must be an object")
+
+        op = operation.get('op')
+        tokens = parse_pointer(operation.get('path'))
+        if op in ('add', 'replace', 'test') and 'value' not in operation:
+            raise ConfigPatchError(f"'{op}' operation requires a value")
+        if not tokens:
+            raise ConfigPatchError("Patching the whole configuration is not supported; use update_config")
+
+        parent, token = _resolve_parent(result, tokens)
+        value = copy.deepcopy(operation.get('value'))
+
+        if isinstance(parent, dict):
+            exists = token in parent
+            if op == 'add':
+                parent[token] = value
+            elif op == 'replace':
+                if not exists:
+                    raise ConfigPatchError(f"Cannot replace missing path: {operation['path']}")
+                parent[token] = value
+            elif op == 'remove':
+                if not exists:
+                    raise ConfigPatchError(f"Cannot remove missing path: {operation['path']}")
+                del parent[token]
+            elif op == 'test':
+                if not exists or parent[token] != value:
+                    raise ConfigPatchError(f"Test failed for path: {operation['path']}")
+            else:
+                raise ConfigPatchError(f"Unsupported patch operation: {op}")
+        elif isinstance(parent, list):
+            if op == 'add':
+                parent.insert(_list_index(parent, token, allow_end=True), value)
+            elif op == 'replace':
+                parent[_list_index(parent, token)] = value
+            elif op == 'remove':
+                del parent[_list_index(parent, token)]
+            elif op == 'test':
+                if parent[_list_index(parent, token)] != value:
+                    raise ConfigPatchError(f"Test failed for path: {operation['path']}")
+            else:
+                raise ConfigPatchError(f"Unsupported patch operation: {op}")
+        else:
+            raise ConfigPatchError(f"Path not found: {operation['path']}")
+
+    return result
+
+
+def diff_config(old: Any, new: Any, path: Tuple[PathKey, ...] = ()) -> List[ConfigChange]:
+    """
+    Compute the changes between two configuration trees.
+
+    Dictionaries are compared key by key and equal-length lists index by index;
+    anything else that differs (including lists that grew or shrank) is reported
+    as a single change at its path.
+
+    Args:
+        old: Previous configuration
+        new: New configuration
+        path: Path prefix (for recursion)
+
+    Returns:
+        List of ConfigChange, empty if the trees are equal
+    """
+    if config_equal(old, new):
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for key in list(old) + [key for key in new if key not in old]:
+            changes.extend(diff_config(old.get(key), new.get(key), path + (key,)))
+        return changes
+
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new) and path:
+        changes = []
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            changes.extend(diff_config(old_item, new_item, path + (index,)))
+        return changes
+
+    return [ConfigChange(path=path, old=copy.deepcopy(old), new=copy.deepcopy(new))]
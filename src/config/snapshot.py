@@ -0,0 +1,165 @@
+"""Immutable, versioned configuration snapshots shared between threads without copying."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("Configuration snapshots are read-only; use ConfigManager.get_config() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict used for configuration snapshots.
+
+    Subclasses dict so existing readers (``.get()``, ``isinstance(x, dict)``,
+    JSON serialization) keep working; every mutating method raises TypeError.
+    Copying returns a plain, mutable dict.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (dict, (thaw(self),))
+
+
+class FrozenList(list):
+    """Read-only list used for configuration snapshots (see FrozenDict)."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (list, (thaw(self),))
+
+
+def config_equal(a: Any, b: Any) -> bool:
+    """
+    Compare two configuration trees, treating values of different types as different.
+
+    Plain ``==`` considers ``1``, ``1.0`` and ``True`` equal, which would hide
+    edits that only change a value's type. Frozen and plain containers compare
+    equal when their contents do.
+
+    Args:
+        a: Configuration value
+        b: Configuration value
+
+    Returns:
+        True if both trees have the same structure, values and value types
+    """
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(config_equal(a[key], b[key]) for key in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(map(config_equal, a, b))
+    return type(a) is type(b) and a == b
+
+
+def freeze(value: Any, previous: Any = None) -> Any:
+    """
+    Build a read-only copy of a configuration tree.
+
+    Subtrees equal to the corresponding subtree of ``previous`` (an earlier
+    frozen tree) are reused instead of rebuilt, so unchanged sections keep
+    their identity across versions.
+
+    Args:
+        value: Plain configuration value (dicts, lists and scalars)
+        previous: Frozen value from the previous snapshot at the same path
+
+    Returns:
+        FrozenDict/FrozenList tree, or the scalar itself
+    """
+    if isinstance(value, dict):
+        if isinstance(previous, FrozenDict) and config_equal(previous, value):
+            return previous
+        prev = previous if isinstance(previous, FrozenDict) else {}
+        return FrozenDict(
+            (key, freeze(item, prev.get(key))) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        if isinstance(previous, FrozenList) and config_equal(previous, value):
+            return previous
+        prev = previous if isinstance(previous, FrozenList) and len(previous) == len(value) else None
+        return FrozenList(
+            freeze(item, prev[index] if prev is not None else None) for index, item in enumerate(value)
+        )
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Build a plain, mutable deep copy of a (possibly frozen) configuration tree.
+
+    Args:
+        value: Configuration value
+
+    Returns:
+        Tree of plain dicts and lists
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    One published version of the configuration.
+
+    A new snapshot replaces the previous one atomically on every change, so a
+    reader holding a reference always sees a consistent configuration.
+
+    Attributes:
+        revision: Configuration revision (incremented on every change)
+        config: Full configuration including secrets
+        public: Configuration with secret fields masked
+    """
+    revision: int
+    config: FrozenDict
+    public: FrozenDict
+
+    @classmethod
+    def build(
+        cls,
+        revision: int,
+        config: Dict[str, Any],
+        public: Dict[str, Any],
+        previous: Optional['ConfigSnapshot'] = None
+    ) -> 'ConfigSnapshot':
+        """
+        Freeze plain config dictionaries into a snapshot.
+
+        Args:
+            revision: Revision number for the new snapshot
+            config: Full configuration
+            public: Configuration with secrets masked
+            previous: Previous snapshot whose unchanged subtrees are shared
+
+        Returns:
+            New ConfigSnapshot
+        """
+        return cls(
+            revision=revision,
+            config=freeze(config, previous.config if previous else None),
+            public=freeze(public, previous.public if previous else None)
+        )
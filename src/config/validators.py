@@ -0,0 +1,24 @@
+"""Value checks shared by the configuration validators."""
+
+from typing import Any
+
+
+def is_positive_number(value: Any) -> bool:
+    """
+    Check whether a configuration value is a positive number.
+
+    Numeric strings are accepted, as they are coerced with float() where the
+    value is used; booleans are not.
+
+    Args:
+        value: Value to check
+
+    Returns:
+        True if the value is a positive number
+    """
+    if isinstance(value, bool):
+        return False
+    try:
+        return float(value) > 0
+    except (ValueError, TypeError):
+        return False
@@ -0,0 +1,149 @@
+"""Shared YAML loading for configuration files (libyaml when available, parsed-file cache)."""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Union
+
+import yaml
+
+from .snapshot import freeze, thaw
+
+
+logger = logging.getLogger(__name__)
+
+# libyaml's C loader is several times faster than the pure-Python one; both accept the same documents
+try:
+    SafeLoader = yaml.CSafeLoader
+    HAS_LIBYAML = True
+except AttributeError:  # PyYAML built without libyaml
+    SafeLoader = yaml.SafeLoader
+    HAS_LIBYAML = False
+
+
+def safe_load(stream: Union[str, bytes, Any]) -> Any:
+    """
+    Parse a YAML document like yaml.safe_load, using the C loader when available.
+
+    Args:
+        stream: YAML text, bytes or an open file
+
+    Returns:
+        Parsed document
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+class _CacheEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+    document: Any
+
+
+class ConfigFileCache:
+    """
+    Parsed YAML documents keyed by file path, modification time and content hash.
+
+    The configuration file is read by the startup checks, ConfigManager and
+    Config; with this cache it is parsed once and later loads return a copy of
+    the parsed document. Entries are revalidated by stat() and, if the file's
+    mtime or size changed, by the SHA-256 of its contents, so a rewrite with
+    identical contents is not re-parsed either.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _CacheEntry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: Union[str, Path]) -> Any:
+        """
+        Load and parse a YAML file, reusing the cached parse when unchanged.
+
+        Args:
+            path: File path
+
+        Returns:
+            Parsed document (a private, mutable copy)
+
+        Raises:
+            OSError: If the file cannot be read
+            yaml.YAMLError: If the file is not valid YAML
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+            return self._hit(entry)
+
+        with open(key, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+
+        if entry and entry.digest == digest:
+            with self._lock:
+                self._entries[key] = entry._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            return self._hit(entry)
+
+        document = safe_load(data)
+        with self._lock:
+            self._entries[key] = _CacheEntry(stat.st_mtime_ns, stat.st_size, digest, freeze(document))
+            self.misses += 1
+        logger.debug(f"Parsed {key} ({len(data)} bytes, libyaml={HAS_LIBYAML})")
+        return document
+
+    def store(self, path: Union[str, Path], data: bytes, document: Any) -> None:
+        """
+        Record the parsed form of a file just written, so the next load skips parsing.
+
+        Args:
+            path: File path (already written)
+            data: Exact bytes written to the file
+            document: Document the bytes were serialized from
+        """
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return
+        with self._lock:
+            self._entries[key] = _CacheEntry(
+                stat.st_mtime_ns, stat.st_size, hashlib.sha256(data).hexdigest(), freeze(document)
+            )
+
+    def clear(self) -> None:
+        """Drop all cached documents."""
+        with self._lock:
+            self._entries.clear()
+
+    def _hit(self, entry: _CacheEntry) -> Any:
+        with self._lock:
+            self.hits += 1
+        return thaw(entry.document)
+
+
+# Process-wide cache shared by Config, ConfigManager and the startup checks
+config_file_cache = ConfigFileCache()
+
+
+def load_config_file(path: Union[str, Path]) -> Any:
+    """
+    Load a configuration file through the shared parsed-file cache.
+
+    Args:
+        path: Configuration file path
+
+    Returns:
+        Parsed document (a private, mutable copy)
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    return config_file_cache.load(path)
@@ -4,6 +4,7 @@ from .device_controller import TapoController, DeviceControllerError
 from .device_discovery import (
     DeviceInfo,
     discover_devices,
+    iter_discovered_devices,
     run_device_discovery_and_diagnostics,
     get_local_ip_and_subnet,
     is_ip_in_same_subnet,
@@ -16,6 +17,7 @@ __all__ = [
     'DeviceControllerError',
     'DeviceInfo',
     'discover_devices',
+    'iter_discovered_devices',
     'run_device_discovery_and_diagnostics',
     'get_local_ip_and_subnet',
     'is_ip_in_same_subnet',
@@ -5,11 +5,17 @@ import logging
 import socket
 import subprocess
 import ipaddress
-from typing import List, Dict, Any, Optional, Tuple
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from kasa import Discover
 
 logger = logging.getLogger(__name__)
 
+# Devices updated at once after a broadcast discovery
+DEFAULT_UPDATE_CONCURRENCY = 8
+
+# Time allowed for fetching one discovered device's info (seconds)
+DEFAULT_UPDATE_TIMEOUT_SECONDS = 5.0
+
 
 def get_local_ip_and_subnet() -> Optional[Tuple[str, str]]:
     """
@@ -93,6 +99,15 @@ def is_ip_in_same_subnet(target_ip: str, local_ip: str, subnet_cidr: str) -> boo
         return False
 
 
+def _device_attr(device, name: str, default: Any) -> Any:
+    """Read a device property that may be unavailable (e.g. before update())."""
+    try:
+        value = getattr(device, name)
+    except Exception:
+        return default
+    return default if value is None else value
+
+
 class DeviceInfo:
     """Container for discovered device information."""
     
@@ -100,28 +115,25 @@ class DeviceInfo:
         """Initialize device info from discovered device.
         
         Args:
-            device: Discovered device from python-kasa
+            device: Discovered device from python-kasa (updated, or only
+                carrying its discovery reply)
         """
         self.device = device
         self.ip = device.host
-        self.alias = getattr(device, 'alias', 'Unknown')
-        self.model = getattr(device, 'model', 'Unknown')
-        self.mac = getattr(device, 'mac', 'Unknown')
-        self.is_on = getattr(device, 'is_on', None)
+        self.alias = _device_attr(device, 'alias', 'Unknown')
+        self.model = _device_attr(device, 'model', 'Unknown')
+        self.mac = _device_attr(device, 'mac', 'Unknown')
+        self.is_on = _device_attr(device, 'is_on', None)
         
         # RSSI (signal strength) - may not be available on all devices
-        self.rssi = None
-        if hasattr(device, 'rssi'):
-            self.rssi = device.rssi
+        self.rssi = _device_attr(device, 'rssi', None)
         
         # Features
-        self.features = []
-        if hasattr(device, 'features'):
-            self.features = list(device.features)
+        self.features = list(_device_attr(device, 'features', []))
         
         # Hardware info
-        self.hw_version = getattr(device, 'hw_version', 'Unknown')
-        self.sw_version = getattr(device, 'sw_version', 'Unknown')
+        self.hw_version = _device_attr(device, 'hw_version', 'Unknown')
+        self.sw_version = _device_attr(device, 'sw_version', 'Unknown')
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert device info to dictionary.
@@ -163,16 +175,50 @@ class DeviceInfo:
         return '\n'.join(parts)
 
 
-async def discover_devices(timeout: int = 10, target: Optional[str] = None) -> List[DeviceInfo]:
+async def _fetch_device_info(ip: str, device, semaphore: asyncio.Semaphore,
+                             update_timeout: float) -> Optional[DeviceInfo]:
     """
-    Discover Kasa/Tapo devices on the network.
+    Update one discovered device and wrap it in DeviceInfo.
+    
+    Returns:
+        DeviceInfo, or None if the device failed or timed out
+    """
+    async with semaphore:
+        try:
+            logger.debug(f"Processing device at {ip}...")
+            await asyncio.wait_for(device.update(), timeout=update_timeout)
+            return DeviceInfo(device)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out getting info for device at {ip} after {update_timeout}s")
+        except Exception as e:
+            logger.warning(f"Failed to get info for device at {ip}: {e}")
+    return None
+
+
+async def iter_discovered_devices(timeout: int = 10, target: Optional[str] = None,
+                                  max_concurrency: int = DEFAULT_UPDATE_CONCURRENCY,
+                                  update_timeout: float = DEFAULT_UPDATE_TIMEOUT_SECONDS
+                                  ) -> AsyncIterator[DeviceInfo]:
+    """
+    Discover Kasa/Tapo devices and yield each one as soon as its info is fetched.
+    
+    After the broadcast discovery, devices are updated concurrently (at most
+    max_concurrency at a time, each limited to update_timeout seconds) and
+    yielded in completion order, so callers can show devices progressively.
+    Devices that fail or time out are logged and skipped. Closing the
+    generator early cancels the remaining updates.
     
     Args:
         timeout: Discovery timeout in seconds
         target: Optional target IP address or subnet (e.g., "192.168.1.255")
+        max_concurrency: Maximum device updates in flight
+        update_timeout: Seconds allowed for each device's update
         
-    Returns:
-        List of DeviceInfo objects for discovered devices
+    Yields:
+        DeviceInfo for each device that answered
+        
+    Raises:
+        Exception: Errors from the broadcast discovery itself
     """
     logger.info("=" * 60)
     logger.info("Starting device discovery...")
@@ -192,35 +238,56 @@ async def discover_devices(timeout: int = 10, target: Optional[str] = None) -> L
     else:
         logger.info(f"Scanning local network (timeout: {timeout}s)")
     
+    # Discover devices on the network
+    logger.debug(f"Calling Discover.discover() with timeout={timeout}")
+    
+    if target:
+        devices = await Discover.discover(target=target, timeout=timeout)
+    else:
+        devices = await Discover.discover(timeout=timeout)
+    
+    logger.info(f"Discovery completed - found {len(devices)} device(s)")
+    
+    # Fetch device info concurrently and yield in completion order
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    tasks = [
+        asyncio.create_task(_fetch_device_info(ip, device, semaphore, update_timeout))
+        for ip, device in devices.items()
+    ]
     try:
-        # Discover devices on the network
-        logger.debug(f"Calling Discover.discover() with timeout={timeout}")
-        
-        if target:
-            devices = await Discover.discover(target=target, timeout=timeout)
-        else:
-            devices = await Discover.discover(timeout=timeout)
-        
-        logger.info(f"Discovery completed - found {len(devices)} device(s)")
+        for completed in asyncio.as_completed(tasks):
+            device_info = await completed
+            if device_info is not None:
+                yield device_info
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def discover_devices(timeout: int = 10, target: Optional[str] = None,
+                           max_concurrency: int = DEFAULT_UPDATE_CONCURRENCY,
+                           update_timeout: float = DEFAULT_UPDATE_TIMEOUT_SECONDS) -> List[DeviceInfo]:
+    """
+    Discover Kasa/Tapo devices on the network.
+    
+    Args:
+        timeout: Discovery timeout in seconds
+        target: Optional target IP address or subnet (e.g., "192.168.1.255")
+        max_concurrency: Maximum device updates in flight
+        update_timeout: Seconds allowed for each device's update
         
-        # Process discovered devices
-        device_infos = []
-        for ip, device in devices.items():
-            try:
-                logger.debug(f"Processing device at {ip}...")
-                
-                # Update device to get latest information
-                await device.update()
-                
-                device_info = DeviceInfo(device)
-                device_infos.append(device_info)
-                
-                logger.info(f"\n{device_info}")
-                logger.info("-" * 60)
-                
-            except Exception as e:
-                logger.warning(f"Failed to get info for device at {ip}: {e}")
-                continue
+    Returns:
+        List of DeviceInfo objects for discovered devices
+    """
+    device_infos = []
+    try:
+        async for device_info in iter_discovered_devices(
+            timeout=timeout, target=target,
+            max_concurrency=max_concurrency, update_timeout=update_timeout
+        ):
+            device_infos.append(device_info)
+            logger.info(f"\n{device_info}")
+            logger.info("-" * 60)
         
         return device_infos
         
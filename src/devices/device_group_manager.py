@@ -3,13 +3,28 @@
 import asyncio
 import logging
 import os
+import time
 from typing import Dict, List, Optional, Any
 from kasa import Discover
+from src.async_bridge import coalesced
 from src.devices.device_controller import DeviceControllerError
 
 
 logger = logging.getLogger(__name__)
 
+# Device settings that can be set for all devices under devices: and overridden per item
+DEVICE_DEFAULT_KEYS = ('state_cache_ttl_seconds', 'verify_after_write')
+
+# Maximum devices initialized at once across all groups
+DEFAULT_MAX_CONCURRENT_INITIALIZATIONS = 8
+
+# Seconds startup waits for device discovery; slower devices finish in the background
+DEFAULT_INITIAL_DEADLINE_SECONDS = 10
+
+# Background re-initialization of unreachable devices (seconds, doubled after each failed round)
+DEFAULT_REINIT_RETRY_SECONDS = 60
+MAX_REINIT_RETRY_SECONDS = 900
+
 
 class DeviceGroupManager:
     """Manager for controlling groups of smart devices."""
@@ -27,33 +42,105 @@ class DeviceGroupManager:
         self.password = self.credentials.get('password')
         self.groups = {}
         self._initialized = False
+        self.device_defaults = {
+            key: devices_config[key] for key in DEVICE_DEFAULT_KEYS if key in devices_config
+        }
+        self.max_concurrent_initializations = devices_config.get(
+            'max_concurrent_initializations', DEFAULT_MAX_CONCURRENT_INITIALIZATIONS
+        )
+        self.reinit_retry_seconds = devices_config.get(
+            'reinit_retry_seconds', DEFAULT_REINIT_RETRY_SECONDS
+        )
+        self.initial_deadline_seconds = devices_config.get(
+            'initial_deadline_seconds', DEFAULT_INITIAL_DEADLINE_SECONDS
+        )
+        self._init_semaphore: Optional[asyncio.Semaphore] = None
+        self._reinit_task: Optional[asyncio.Task] = None
         
         if not self.username or not self.password:
             raise DeviceControllerError("Username and password are required in devices.credentials")
     
     async def initialize(self):
-        """Initialize all device groups."""
+        """
+        Initialize all device groups.
+        
+        All devices across all groups are initialized concurrently, with at most
+        max_concurrent_initializations discoveries in flight. Waiting stops after
+        initial_deadline_seconds; devices still initializing then, and devices that
+        fail, are finished or retried in the background, so reachable devices can be
+        controlled immediately.
+        """
         logger.info("Initializing device group manager...")
         
         groups_config = self.devices_config.get('groups', {})
+        self._init_semaphore = asyncio.Semaphore(self.max_concurrent_initializations)
         
+        groups = {}
         for group_name, group_config in groups_config.items():
             if not group_config.get('enabled', True):
                 logger.info(f"Group '{group_name}' is disabled, skipping")
                 continue
             
             logger.info(f"Initializing group: {group_name}")
-            group = DeviceGroup(
+            groups[group_name] = DeviceGroup(
                 name=group_name,
                 config=group_config,
                 username=self.username,
-                password=self.password
+                password=self.password,
+                device_defaults=self.device_defaults
             )
-            await group.initialize()
-            self.groups[group_name] = group
+        
+        await asyncio.gather(
+            *[group.initialize(self._init_semaphore, self.initial_deadline_seconds)
+              for group in groups.values()]
+        )
+        self.groups.update(groups)
         
         self._initialized = True
         logger.info(f"Device group manager initialized with {len(self.groups)} groups")
+        
+        pending = sum(len(group.pending_devices) for group in self.groups.values())
+        if pending:
+            logger.warning(
+                f"{pending} device(s) not initialized yet - retrying in the background "
+                f"every {self.reinit_retry_seconds}s (with backoff)"
+            )
+            self._reinit_task = asyncio.create_task(self._reinitialize_failed_devices())
+    
+    async def _reinitialize_failed_devices(self):
+        """Collect devices that outlived the initial deadline, then retry failed devices until all are reachable."""
+        delay = self.reinit_retry_seconds
+        
+        stragglers = [group for group in self.groups.values() if group.has_stragglers]
+        if stragglers:
+            await asyncio.gather(*[group.settle_stragglers() for group in stragglers])
+            if not any(group.pending_devices for group in self.groups.values()):
+                logger.info("All slow devices finished initializing")
+                return
+        
+        while True:
+            await asyncio.sleep(delay)
+            
+            groups = [group for group in self.groups.values() if group.pending_devices]
+            if not groups:
+                return
+            
+            recovered = await asyncio.gather(
+                *[group.retry_failed_devices(self._init_semaphore) for group in groups]
+            )
+            
+            remaining = sum(len(group.pending_devices) for group in self.groups.values())
+            if remaining == 0:
+                logger.info("All previously unreachable devices are now initialized")
+                return
+            
+            if sum(recovered):
+                delay = self.reinit_retry_seconds
+            else:
+                delay = min(delay * 2, MAX_REINIT_RETRY_SECONDS)
+            logger.info(
+                f"{remaining} device(s) still unreachable - next retry in {delay}s"
+            )
     
     async def turn_on_group(self, group_name: str):
         """
@@ -149,7 +236,8 @@ class DeviceGroupManager:
         """Get list of all group names."""
         return list(self.groups.keys())
     
-    async def get_all_devices_status(self) -> List[Dict[str, Any]]:
+    @coalesced
+    async def get_all_devices_status(self, max_age: Optional[float] = None) -> List[Dict[str, Any]]:
         """
         Get detailed status of all devices across all groups.
         
@@ -161,6 +249,10 @@ class DeviceGroupManager:
         Unreachable devices are included in the results with reachable=False
         and an error message, rather than raising exceptions.
         
+        Args:
+            max_age: Maximum acceptable device state age in seconds (default:
+                each device's state_cache_ttl, 0 queries every device)
+        
         Returns:
             List of device status dictionaries with device info and outlet states
         """
@@ -169,7 +261,7 @@ class DeviceGroupManager:
         logger.debug(f"Getting status for {len(self.groups)} group(s)")
         
         for group_name, group in self.groups.items():
-            devices_status = await group.get_devices_status()
+            devices_status = await group.get_devices_status(max_age=max_age)
             logger.debug(f"Group '{group_name}': retrieved status for {len(devices_status)} device(s)")
             for device_status in devices_status:
                 device_status['group'] = group_name
@@ -250,6 +342,15 @@ class DeviceGroupManager:
     async def close(self):
         """Close all device connections."""
         logger.info("Closing all device group connections...")
+        
+        if self._reinit_task and not self._reinit_task.done():
+            self._reinit_task.cancel()
+            try:
+                await self._reinit_task
+            except asyncio.CancelledError:
+                pass
+        self._reinit_task = None
+        
         for group in self.groups.values():
             await group.close()
 
@@ -257,7 +358,8 @@ class DeviceGroupManager:
 class DeviceGroup:
     """Represents a group of devices with common automation rules."""
     
-    def __init__(self, name: str, config: Dict[str, Any], username: str, password: str):
+    def __init__(self, name: str, config: Dict[str, Any], username: str, password: str,
+                 device_defaults: Optional[Dict[str, Any]] = None):
         """
         Initialize a device group.
         
@@ -266,18 +368,33 @@ class DeviceGroup:
             config: Group configuration
             username: Tapo account username
             password: Tapo account password
+            device_defaults: Settings applied to devices that don't override them
         """
         self.name = name
         self.config = config
         self.username = username
         self.password = password
+        self.device_defaults = device_defaults or {}
         self.devices = []
         self._initialized = False
         self._configured_device_count = 0  # Track how many devices were configured
         self._failed_devices = []  # Track devices that failed to initialize
+        self.pending_devices = []  # Failed devices that can be retried (ManagedDevice objects)
+        self._device_order = {}  # Device name -> position in config, to keep devices ordered
+        self._straggler_tasks = {}  # ManagedDevice -> initialization task still running past the deadline
     
-    async def initialize(self):
-        """Initialize all devices in the group."""
+    async def initialize(self, semaphore: Optional[asyncio.Semaphore] = None,
+                         deadline: Optional[float] = None):
+        """
+        Initialize all devices in the group concurrently.
+        
+        Devices still initializing after the deadline keep going in the background
+        and are reported as pending until settle_stragglers() collects them.
+        
+        Args:
+            semaphore: Optional semaphore limiting concurrent initializations
+            deadline: Seconds to wait for the devices (None waits for all of them)
+        """
         items = self.config.get('items', [])
         self._configured_device_count = len(items)
         
@@ -287,28 +404,47 @@ class DeviceGroup:
         
         logger.info(f"Initializing {len(items)} device(s) in group '{self.name}'")
         
-        for item_config in items:
+        entries = [self._create_device(item_config) for item_config in items]
+        tasks = {
+            index: asyncio.create_task(self._initialize_device(device, semaphore))
+            for index, (device, error) in enumerate(entries) if device is not None
+        }
+        if tasks:
+            await asyncio.wait(tasks.values(), timeout=deadline)
+        
+        for index, (item_config, (device, error)) in enumerate(zip(items, entries)):
             device_name = item_config.get('name', 'unknown')
             device_ip = item_config.get('ip_address', 'unknown')
+            self._device_order[device_name] = index
             
-            try:
-                device = ManagedDevice(
-                    config=item_config,
-                    username=self.username,
-                    password=self.password
-                )
-                await device.initialize()
+            task = tasks.get(index)
+            if task is not None and not task.done():
+                # Straggler: leave it running and collect it in settle_stragglers()
+                self._straggler_tasks[device] = task
+                self._failed_devices.append({
+                    'name': device_name,
+                    'ip_address': device_ip,
+                    'error': f"Still initializing after {deadline}s"
+                })
+                self.pending_devices.append(device)
+                logger.warning(f"  … Device '{device_name}' at {device_ip} still initializing after {deadline}s - continuing in the background")
+                continue
+            if task is not None:
+                error = task.result()
+            
+            if error is None:
                 self.devices.append(device)
                 logger.info(f"  ✓ Initialized device: {device.name} at {device.ip_address}")
-            except Exception as e:
+            else:
                 # Track failed device for reporting
                 self._failed_devices.append({
                     'name': device_name,
                     'ip_address': device_ip,
-                    'error': str(e)
+                    'error': str(error)
                 })
-                logger.error(f"  ✗ Failed to initialize device '{device_name}' at {device_ip}: {e}")
-                # Continue with other devices even if one fails
+                if device is not None:
+                    self.pending_devices.append(device)
+                logger.error(f"  ✗ Failed to initialize device '{device_name}' at {device_ip}: {error}")
         
         self._initialized = True
         
@@ -319,6 +455,98 @@ class DeviceGroup:
         else:
             logger.info(f"Group '{self.name}' initialized successfully with {len(self.devices)} device(s)")
     
+    def _create_device(self, item_config: Dict[str, Any]):
+        """
+        Create one device from its config, never raising.
+        
+        Returns:
+            Tuple of (device or None, exception or None)
+        """
+        try:
+            return ManagedDevice(
+                config=item_config,
+                username=self.username,
+                password=self.password,
+                defaults=self.device_defaults
+            ), None
+        except Exception as e:
+            return None, e
+    
+    @staticmethod
+    async def _initialize_device(device: 'ManagedDevice',
+                                 semaphore: Optional[asyncio.Semaphore]) -> Optional[Exception]:
+        """Initialize one device, returning the exception instead of raising it."""
+        try:
+            if semaphore is not None:
+                async with semaphore:
+                    await device.initialize()
+            else:
+                await device.initialize()
+            return None
+        except Exception as e:
+            return e
+    
+    @property
+    def has_stragglers(self) -> bool:
+        """True while devices from the initial pass are still initializing."""
+        return bool(self._straggler_tasks)
+    
+    async def settle_stragglers(self) -> int:
+        """
+        Wait for devices that outlived the initial deadline.
+        
+        Returns:
+            Number of those devices that initialized successfully
+        """
+        stragglers = list(self._straggler_tasks.items())
+        errors = await asyncio.gather(*[task for _, task in stragglers])
+        self._straggler_tasks.clear()
+        return self._record_retry_results([device for device, _ in stragglers], errors)
+    
+    async def retry_failed_devices(self, semaphore: Optional[asyncio.Semaphore] = None) -> int:
+        """
+        Retry initialization of devices that previously failed.
+        
+        Recovered devices join the group (in config order) and are removed from
+        the failed list. Devices still initializing from the initial pass are skipped.
+        
+        Args:
+            semaphore: Optional semaphore limiting concurrent initializations
+            
+        Returns:
+            Number of devices recovered
+        """
+        pending = [device for device in self.pending_devices if device not in self._straggler_tasks]
+        errors = await asyncio.gather(
+            *[self._initialize_device(device, semaphore) for device in pending]
+        )
+        return self._record_retry_results(pending, errors)
+    
+    def _record_retry_results(self, devices: List['ManagedDevice'],
+                              errors: List[Optional[Exception]]) -> int:
+        """Move devices that initialized from the pending list into the group."""
+        recovered = 0
+        for device, error in zip(devices, errors):
+            if error is not None:
+                for failed in self._failed_devices:
+                    if failed['name'] == device.name:
+                        failed['error'] = str(error)
+                logger.debug(f"Device '{device.name}' still unreachable: {error}")
+                continue
+            
+            self.pending_devices.remove(device)
+            self._failed_devices = [
+                failed for failed in self._failed_devices if failed['name'] != device.name
+            ]
+            self.devices.append(device)
+            recovered += 1
+            logger.info(f"  ✓ Re-initialized device: {device.name} at {device.ip_address} (group '{self.name}')")
+        
+        if recovered:
+            self.devices.sort(key=lambda d: self._device_order.get(d.name, len(self._device_order)))
+        
+        return recovered
+    
     async def turn_on(self):
         """Turn on all devices in the group."""
         logger.info(f"Turning ON all devices in group '{self.name}'")
@@ -356,20 +584,20 @@ class DeviceGroup:
         # Return True if any device is on (and didn't fail)
         return any(state is True for state in states if not isinstance(state, Exception))
     
-    async def get_devices_status(self) -> List[Dict[str, Any]]:
+    async def get_devices_status(self, max_age: Optional[float] = None) -> List[Dict[str, Any]]:
         """
-        Get detailed status of all devices in the group.
+        Get detailed status of all devices in the group, querying them concurrently.
+        
+        Args:
+            max_age: Maximum acceptable device state age in seconds (default:
+                each device's state_cache_ttl, 0 queries every device)
         
         Returns:
             List of device status dictionaries
         """
-        devices_status = []
-        
-        for device in self.devices:
-            status = await device.get_detailed_status()
-            devices_status.append(status)
-        
-        return devices_status
+        return list(await asyncio.gather(
+            *[device.get_detailed_status(max_age=max_age) for device in self.devices]
+        ))
     
     def get_initialization_info(self) -> Dict[str, Any]:
         """
@@ -418,6 +646,12 @@ class DeviceGroup:
     
     async def close(self):
         """Close all device connections."""
+        for task in self._straggler_tasks.values():
+            task.cancel()
+        if self._straggler_tasks:
+            await asyncio.gather(*self._straggler_tasks.values(), return_exceptions=True)
+        self._straggler_tasks.clear()
+        
         for device in self.devices:
             await device.close()
 
@@ -433,7 +667,15 @@ class ManagedDevice:
     # Lower than discovery timeout since device is already initialized
     DEFAULT_STATUS_UPDATE_TIMEOUT = 10
     
-    def __init__(self, config: Dict[str, Any], username: str, password: str):
+    # How long a device.update() result is reused by reads (in seconds)
+    # Covers the reads of one scheduler cycle or UI refresh; writes invalidate it
+    DEFAULT_STATE_CACHE_TTL = 10
+    
+    # Delay before the background state verification after a write (in seconds)
+    VERIFY_DELAY_SECONDS = 1
+    
+    def __init__(self, config: Dict[str, Any], username: str, password: str,
+                 defaults: Optional[Dict[str, Any]] = None):
         """
         Initialize a managed device.
         
@@ -441,7 +683,9 @@ class ManagedDevice:
             config: Device configuration
             username: Tapo account username
             password: Tapo account password
+            defaults: Settings used when the device config doesn't set them
         """
+        defaults = defaults or {}
         self.name = config.get('name', 'Unknown Device')
         self.ip_address = config.get('ip_address')
         self.outlets = config.get('outlets', [])  # Empty list means control entire device
@@ -454,6 +698,18 @@ class ManagedDevice:
         # Allow timeout configuration per device (optional)
         self.discovery_timeout = config.get('discovery_timeout_seconds', self.DEFAULT_DISCOVERY_TIMEOUT)
         
+        # State cache: reads reuse a recent device.update() for up to state_cache_ttl seconds
+        self.state_cache_ttl = config.get(
+            'state_cache_ttl_seconds',
+            defaults.get('state_cache_ttl_seconds', self.DEFAULT_STATE_CACHE_TTL)
+        )
+        self.verify_after_write = config.get(
+            'verify_after_write', defaults.get('verify_after_write', True)
+        )
+        self._state_updated_at: Optional[float] = None  # time.monotonic() of last update()
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._verify_task: Optional[asyncio.Task] = None
+        
         if not self.ip_address:
             raise DeviceControllerError(f"IP address is required for device '{self.name}'")
     
@@ -493,6 +749,7 @@ class ManagedDevice:
                     self.device.update(),
                     timeout=self.discovery_timeout
                 )
+                self._state_updated_at = time.monotonic()
                 
             except asyncio.TimeoutError as te:
                 error_msg = (
@@ -530,13 +787,88 @@ class ManagedDevice:
             self._initialization_error = error_msg
             raise DeviceControllerError(f"Failed to initialize device '{self.name}': {error_msg}") from e
     
+    @property
+    def state_age_seconds(self) -> Optional[float]:
+        """Seconds since the cached device state was fetched, or None if not cached."""
+        if self._state_updated_at is None:
+            return None
+        return time.monotonic() - self._state_updated_at
+    
+    def invalidate_state(self):
+        """Discard the cached device state so the next read queries the device."""
+        self._state_updated_at = None
+    
+    async def refresh_state(self, max_age: Optional[float] = None,
+                            timeout: Optional[float] = None) -> bool:
+        """
+        Call device.update() unless the cached state is recent enough.
+        
+        Concurrent callers share a single update().
+        
+        Args:
+            max_age: Maximum acceptable age in seconds (default: state_cache_ttl,
+                0 forces an update)
+            timeout: Optional timeout for the update in seconds
+            
+        Returns:
+            True if the device was queried, False if the cached state was reused
+            
+        Raises:
+            asyncio.TimeoutError: If the update exceeds timeout
+        """
+        if max_age is None:
+            max_age = self.state_cache_ttl
+        
+        age = self.state_age_seconds
+        if age is not None and age < max_age:
+            return False
+        
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited
+            age = self.state_age_seconds
+            if age is not None and age < max_age:
+                return False
+            
+            if timeout is not None:
+                await asyncio.wait_for(self.device.update(), timeout=timeout)
+            else:
+                await self.device.update()
+            self._state_updated_at = time.monotonic()
+            return True
+    
+    def _after_write(self):
+        """Invalidate cached state and schedule background verification if enabled."""
+        self.invalidate_state()
+        
+        if not self.verify_after_write:
+            return
+        
+        if self._verify_task and not self._verify_task.done():
+            self._verify_task.cancel()
+        self._verify_task = asyncio.create_task(self._verify_state())
+    
+    async def _verify_state(self):
+        """Re-read device state shortly after a write (runs in the background)."""
+        try:
+            await asyncio.sleep(self.VERIFY_DELAY_SECONDS)
+            await self.refresh_state(max_age=0, timeout=self.DEFAULT_STATUS_UPDATE_TIMEOUT)
+            logger.debug(f"Verified state of device '{self.name}' after write")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to verify state of device '{self.name}' after write: {e}")
+    
     async def turn_on(self):
         """Turn on the device or specified outlets."""
         if not self._initialized:
             await self.initialize()
         
         try:
-            await self.device.update()
+            await self.refresh_state()
+            changed = False
             
             # If outlets are specified, control only those outlets
             if self.outlets and hasattr(self.device, 'children') and self.device.children:
@@ -546,17 +878,18 @@ class ManagedDevice:
                         child = self.device.children[outlet_index]
                         if not child.is_on:
                             await child.turn_on()
+                            changed = True
                             logger.debug(f"  ✓ Outlet {outlet_index} turned ON")
             else:
                 # Control entire device
                 if not self.device.is_on:
                     logger.debug(f"Turning ON device '{self.name}'")
                     await self.device.turn_on()
+                    changed = True
                     logger.debug(f"  ✓ Device '{self.name}' turned ON")
             
-            # Verify state
-            await asyncio.sleep(1)
-            await self.device.update()
+            if changed:
+                self._after_write()
             
         except Exception as e:
             logger.error(f"Failed to turn on device '{self.name}': {e}")
@@ -568,7 +901,8 @@ class ManagedDevice:
             await self.initialize()
         
         try:
-            await self.device.update()
+            await self.refresh_state()
+            changed = False
             
             # If outlets are specified, control only those outlets
             if self.outlets and hasattr(self.device, 'children') and self.device.children:
@@ -578,17 +912,18 @@ class ManagedDevice:
                         child = self.device.children[outlet_index]
                         if child.is_on:
                             await child.turn_off()
+                            changed = True
                             logger.debug(f"  ✓ Outlet {outlet_index} turned OFF")
             else:
                 # Control entire device
                 if self.device.is_on:
                     logger.debug(f"Turning OFF device '{self.name}'")
                     await self.device.turn_off()
+                    changed = True
                     logger.debug(f"  ✓ Device '{self.name}' turned OFF")
             
-            # Verify state
-            await asyncio.sleep(1)
-            await self.device.update()
+            if changed:
+                self._after_write()
             
         except Exception as e:
             logger.error(f"Failed to turn off device '{self.name}': {e}")
@@ -605,7 +940,7 @@ class ManagedDevice:
             await self.initialize()
         
         try:
-            await self.device.update()
+            await self.refresh_state()
             
             # If outlets are specified, check those outlets
             if self.outlets and hasattr(self.device, 'children') and self.device.children:
@@ -622,12 +957,17 @@ class ManagedDevice:
             logger.error(f"Failed to get state of device '{self.name}': {e}")
             raise DeviceControllerError(f"Failed to get state of device '{self.name}': {e}")
     
-    async def get_detailed_status(self) -> Dict[str, Any]:
+    async def get_detailed_status(self, max_age: Optional[float] = None) -> Dict[str, Any]:
         """
         Get detailed status of the device including outlet states.
         
-        This method always fetches fresh device state from the hardware by calling
-        device.update() with timeout protection to prevent hanging on slow/unresponsive devices.
+        Reuses cached device state younger than max_age; otherwise calls
+        device.update() with timeout protection to prevent hanging on
+        slow/unresponsive devices.
+        
+        Args:
+            max_age: Maximum acceptable state age in seconds (default: state_cache_ttl,
+                0 forces a fresh query)
         
         Returns:
             Dictionary with device information and outlet states
@@ -641,7 +981,8 @@ class ManagedDevice:
             'outlets': [],
             'model': 'Unknown',
             'error': None,
-            'initialization_error': self._initialization_error
+            'initialization_error': self._initialization_error,
+            'state_age_seconds': None
         }
         
         # If device never initialized successfully, return status with initialization error
@@ -656,10 +997,7 @@ class ManagedDevice:
             # Update device state with timeout protection to prevent hanging
             timeout_seconds = self.DEFAULT_STATUS_UPDATE_TIMEOUT
             try:
-                await asyncio.wait_for(
-                    self.device.update(),
-                    timeout=timeout_seconds
-                )
+                await self.refresh_state(max_age=max_age, timeout=timeout_seconds)
             except asyncio.TimeoutError:
                 error_msg = f"Timeout after {timeout_seconds}s while updating device state"
                 logger.warning(f"Device '{self.name}' at {self.ip_address}: {error_msg}")
@@ -669,6 +1007,7 @@ class ManagedDevice:
             
             status['reachable'] = True
             status['initialized'] = True
+            status['state_age_seconds'] = round(self.state_age_seconds or 0.0, 1)
             
             # Get device model
             status['model'] = getattr(self.device, 'model', 'Unknown')
@@ -726,7 +1065,7 @@ class ManagedDevice:
             if not self._initialized:
                 await self.initialize()
             
-            await self.device.update()
+            await self.refresh_state()
             
             # Validate action
             if action not in ['on', 'off']:
@@ -761,9 +1100,7 @@ class ManagedDevice:
                     await self.device.turn_off()
                     logger.info(f"Manually turned OFF device '{self.name}'")
             
-            # Verify state after action
-            await asyncio.sleep(1)
-            await self.device.update()
+            self._after_write()
             
             result['success'] = True
             logger.info(f"Successfully {action} device '{self.name}' outlet {outlet_index}")
@@ -776,6 +1113,9 @@ class ManagedDevice:
     
     async def close(self):
         """Close connection to the device."""
+        if self._verify_task and not self._verify_task.done():
+            self._verify_task.cancel()
+        
         if self.device:
             try:
                 # python-kasa doesn't require explicit close for SmartPlug
@@ -0,0 +1,161 @@
+"""Shared, periodically refreshed snapshot of every device's status."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds between scheduler-driven refreshes; older snapshots are served as stale
+DEFAULT_STATUS_REFRESH_SECONDS = 60.0
+
+
+class DeviceStatusSnapshot:
+    """
+    Latest detailed status of all devices, shared by the API and the scheduler.
+
+    The scheduler runs ``run()`` on its event loop, which queries every device
+    every ``refresh_interval`` seconds and again soon after a control action
+    (``request_refresh()``). API requests read the snapshot with ``get()``
+    instead of querying devices themselves: an old snapshot is still served
+    (stale-while-revalidate) and triggers a background refresh, so UI
+    traffic does not cause device I/O. ``refresh()`` queries the devices now
+    for callers that need current state.
+
+    ``get()`` and ``request_refresh()`` are safe to call from any thread;
+    ``refresh()`` and ``run()`` must run on the scheduler's loop.
+    """
+
+    def __init__(self, device_manager, refresh_interval: float = DEFAULT_STATUS_REFRESH_SECONDS):
+        """
+        Initialize an empty snapshot.
+
+        Args:
+            device_manager: DeviceGroupManager to query
+            refresh_interval: Seconds between refreshes (and snapshot age considered stale)
+        """
+        self.device_manager = device_manager
+        self.refresh_interval = refresh_interval
+        self.refresh_count = 0
+
+        self._devices: Optional[List[Dict[str, Any]]] = None
+        self._taken_at: Optional[float] = None  # time.monotonic() when the devices were queried
+        self._timestamp: Optional[datetime] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def age_seconds(self) -> Optional[float]:
+        """Seconds since the snapshot was taken, or None before the first refresh."""
+        if self._taken_at is None:
+            return None
+        return time.monotonic() - self._taken_at
+
+    def is_stale(self) -> bool:
+        """Whether the snapshot is missing or older than the refresh interval."""
+        age = self.age_seconds
+        return age is None or age >= self.refresh_interval
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the snapshot, requesting a background refresh if it is stale.
+
+        Returns:
+            Dict with 'devices', 'age_seconds', 'snapshot_time' and 'stale',
+            or None if no snapshot has been taken yet
+        """
+        devices, taken_at, timestamp = self._devices, self._taken_at, self._timestamp
+        if devices is None:
+            return None
+        age = time.monotonic() - taken_at
+        stale = age >= self.refresh_interval
+        if stale and not self._refreshing():
+            self.request_refresh()
+        return {
+            'devices': devices,
+            'age_seconds': round(age, 1),
+            'snapshot_time': timestamp.isoformat(),
+            'stale': stale,
+        }
+
+    def group_is_on(self, group_name: str) -> Optional[bool]:
+        """
+        Whether any controlled outlet of a group is on, according to the snapshot.
+
+        Returns:
+            True/False, or None if the snapshot has no reachable device in the group
+        """
+        devices = self._devices
+        if devices is None:
+            return None
+        if self.is_stale() and not self._refreshing():
+            self.request_refresh()
+
+        reachable = [d for d in devices if d.get('group') == group_name and d.get('reachable')]
+        if not reachable:
+            return None
+        return any(
+            outlet.get('is_on') is True
+            for device in reachable
+            for outlet in device.get('outlets', [])
+            if outlet.get('controlled', True)
+        )
+
+    async def refresh(self) -> Dict[str, Any]:
+        """
+        Query all devices (bypassing their state caches) and replace the snapshot.
+
+        Concurrent callers share one refresh.
+
+        Returns:
+            The new snapshot (see get())
+        """
+        if not self._refreshing():
+            self._refresh_task = asyncio.ensure_future(self._refresh())
+        await asyncio.shield(self._refresh_task)
+        return self.get()
+
+    def _refreshing(self) -> bool:
+        task = self._refresh_task
+        return task is not None and not task.done()
+
+    async def _refresh(self):
+        started = time.monotonic()
+        devices = await self.device_manager.get_all_devices_status(max_age=0)
+        self._devices, self._taken_at, self._timestamp = devices, started, datetime.now()
+        self.refresh_count += 1
+        logger.debug(f"Device status snapshot refreshed in {time.monotonic() - started:.2f}s")
+
+    def request_refresh(self):
+        """Ask the refresh loop to refresh soon. Safe to call from any thread."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    async def run(self):
+        """Refresh every refresh_interval seconds, or sooner when requested, until cancelled."""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        logger.info(f"Device status snapshot refreshing every {self.refresh_interval:g}s")
+        try:
+            while True:
+                self._wakeup.clear()
+                try:
+                    await self.refresh()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Device status snapshot refresh failed: {type(e).__name__}: {e}")
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.refresh_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._loop = None
+            self._wakeup = None
@@ -0,0 +1,192 @@
+"""In-process event broker for pushing state changes to web clients (Server-Sent Events)."""
+
+import itertools
+import json
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+from zoneinfo import ZoneInfo
+
+
+logger = logging.getLogger(__name__)
+
+# Event types published by the scheduler and web server
+EVENT_CYCLE = 'cycle'
+EVENT_DEVICES = 'devices'
+EVENT_WEATHER = 'weather'
+EVENT_OVERRIDE = 'override'
+
+# Broker defaults
+DEFAULT_MAX_SUBSCRIBERS = 8
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 64
+DEFAULT_HEARTBEAT_SECONDS = 15
+
+# How often an idle stream checks whether it should stop (seconds)
+STREAM_POLL_INTERVAL = 1.0
+
+# Client reconnect delay sent to EventSource (milliseconds)
+CLIENT_RETRY_MS = 5000
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """
+    Format an event as a Server-Sent Events message.
+
+    Args:
+        event: Event dictionary with id, type, timestamp and data
+
+    Returns:
+        SSE message text
+    """
+    payload = json.dumps({'timestamp': event['timestamp'], 'data': event['data']}, default=str)
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    """A subscriber's bounded queue of pending events."""
+
+    def __init__(self, queue_size: int):
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def put(self, event: Dict[str, Any]):
+        """Queue an event, dropping the oldest one if the subscriber has fallen behind."""
+        while True:
+            try:
+                self.queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+
+class EventBroker:
+    """
+    Thread-safe publish/subscribe hub for state change notifications.
+
+    The scheduler publishes after each cycle, device state change, weather
+    refresh and override change; each open /api/events stream is a subscriber.
+    Publishing never blocks: slow subscribers lose their oldest events.
+    """
+
+    def __init__(
+        self,
+        max_subscribers: int = DEFAULT_MAX_SUBSCRIBERS,
+        queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        timezone: Optional[str] = None
+    ):
+        """
+        Initialize event broker.
+
+        Args:
+            max_subscribers: Maximum simultaneous subscribers (each holds a web worker)
+            queue_size: Maximum pending events per subscriber
+            timezone: Timezone name for event timestamps (default: system local time)
+        """
+        self.max_subscribers = max_subscribers
+        self.queue_size = queue_size
+        self.timezone = ZoneInfo(timezone) if timezone else None
+
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._ids = itertools.count(1)
+        self._published = 0
+
+    def publish(self, event_type: str, data: Optional[Dict[str, Any]] = None):
+        """
+        Publish an event to all subscribers.
+
+        Args:
+            event_type: Event type (e.g. 'cycle', 'devices', 'weather', 'override')
+            data: JSON-serializable event payload
+        """
+        with self._lock:
+            event = {
+                'id': next(self._ids),
+                'type': event_type,
+                'timestamp': datetime.now(self.timezone).isoformat(),
+                'data': data or {}
+            }
+            self._published += 1
+            subscribers = list(self._subscribers)
+
+        for subscription in subscribers:
+            subscription.put(event)
+
+        logger.debug(f"Published '{event_type}' event to {len(subscribers)} subscriber(s)")
+
+    def subscribe(self) -> Optional[Subscription]:
+        """
+        Register a new subscriber.
+
+        Returns:
+            Subscription, or None if the subscriber limit has been reached
+        """
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                return None
+            subscription = Subscription(self.queue_size)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a subscriber."""
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscribers."""
+        with self._lock:
+            return len(self._subscribers)
+
+    def stream(
+        self,
+        subscription: Subscription,
+        should_stop: Optional[Callable[[], bool]] = None,
+        heartbeat_seconds: float = DEFAULT_HEARTBEAT_SECONDS
+    ) -> Iterator[str]:
+        """
+        Yield SSE messages for a subscription until stopped or the client disconnects.
+
+        Sends a comment line as a heartbeat when idle so proxies and the server's
+        socket timeout do not close the connection. The subscription is removed
+        when the generator is closed.
+
+        Args:
+            subscription: Subscription returned by subscribe()
+            should_stop: Polled while idle; returning True ends the stream
+            heartbeat_seconds: Idle interval between heartbeats
+        """
+        try:
+            yield f"retry: {CLIENT_RETRY_MS}\n\n"
+            last_sent = time.monotonic()
+
+            while not (should_stop and should_stop()):
+                try:
+                    event = subscription.queue.get(timeout=STREAM_POLL_INTERVAL)
+                except queue.Empty:
+                    if time.monotonic() - last_sent >= heartbeat_seconds:
+                        yield ": keepalive\n\n"
+                        last_sent = time.monotonic()
+                    continue
+
+                yield format_sse(event)
+                last_sent = time.monotonic()
+        finally:
+            self.unsubscribe(subscription)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get broker statistics."""
+        with self._lock:
+            return {
+                'subscribers': len(self._subscribers),
+                'max_subscribers': self.max_subscribers,
+                'published': self._published
+            }
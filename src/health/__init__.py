@@ -1,11 +1,13 @@
 """Health check and monitoring package."""
 
 from .health_check import HealthCheckService
+from .health_probe import HealthProbe
 from .health_server import HealthCheckServer
 from .startup_checks import run_startup_checks
 
 __all__ = [
     'HealthCheckService',
+    'HealthProbe',
     'HealthCheckServer',
     'run_startup_checks',
 ]
@@ -3,9 +3,10 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
-from src.devices.device_discovery import discover_devices, DeviceInfo, get_local_ip_and_subnet, is_ip_in_same_subnet
+from src.devices.device_discovery import DeviceInfo, get_local_ip_and_subnet, is_ip_in_same_subnet
+from src.health.health_probe import HealthProbe, DEFAULT_MAX_PROBE_TIMEOUT_SECONDS, DEFAULT_SWEEP_INTERVAL_HOURS
 from src.notifications import NotificationService
 
 logger = logging.getLogger(__name__)
@@ -29,7 +30,9 @@ class HealthCheckService:
     def __init__(self, check_interval_hours: float, configured_ips: list = None,
                  configured_devices: Dict[str, str] = None,
                  notification_service: Optional[NotificationService] = None,
-                 max_consecutive_failures: int = 3):
+                 max_consecutive_failures: int = 3,
+                 probe_timeout_seconds: float = DEFAULT_MAX_PROBE_TIMEOUT_SECONDS,
+                 sweep_interval_hours: float = DEFAULT_SWEEP_INTERVAL_HOURS):
         """
         Initialize health check service.
         
@@ -39,12 +42,15 @@ class HealthCheckService:
             configured_devices: Dict mapping IP address -> label (e.g., "group_name: device_name")
             notification_service: Optional notification service for alerts
             max_consecutive_failures: Maximum consecutive failures before triggering re-init
+            probe_timeout_seconds: Longest wait for a configured device's probe reply
+            sweep_interval_hours: Hours between full broadcast discovery sweeps
         """
         self.check_interval_hours = check_interval_hours
         self.notification_service = notification_service
         self.max_consecutive_failures = max_consecutive_failures
         
         self.state = HealthCheckState()
+        self.probe = HealthProbe(max_timeout=probe_timeout_seconds, sweep_interval_hours=sweep_interval_hours)
         
         # Support both old list format and new dict format
         if configured_devices:
@@ -133,10 +139,9 @@ class HealthCheckService:
             local_ip, subnet_cidr = local_info
             logger.debug(f"Local network: {local_ip} (subnet: {subnet_cidr})")
         
-        # Discover devices
-        devices = await discover_devices(timeout=10)
+        devices, answered = await self._find_devices()
         
-        if not devices:
+        if not answered:
             logger.warning("⚠ No devices found during health check!")
             
             # Check if any configured IPs are outside subnet
@@ -312,6 +317,38 @@ class HealthCheckService:
         
         return True
     
+    async def _find_devices(self) -> Tuple[List[DeviceInfo], int]:
+        """
+        Probe configured devices, adding a broadcast sweep when one is needed.
+        
+        Configured devices are probed concurrently by unicast. The broadcast
+        sweep runs when its interval is due, when a configured device did not
+        answer after previously being seen (it may have moved to another IP)
+        or when there is nothing to probe. Between sweeps, unconfigured devices
+        seen by the last sweep are carried over so they are not reported as lost.
+        
+        Returns:
+            Tuple of (devices, number of devices that answered in this check)
+        """
+        found = await self.probe.probe_all(self.state.configured_ips)
+        newly_missing = [
+            ip for ip in self.state.configured_ips
+            if ip not in found and ip in self.state.last_known_devices
+        ]
+        logger.info(f"Probed {len(self.state.configured_ips)} configured device(s): "
+                    f"{len(found)} answered")
+        
+        if self.probe.sweep_due() or newly_missing or not self.state.configured_ips:
+            for device in await self.probe.sweep():
+                found.setdefault(device.ip, device)
+            return list(found.values()), len(found)
+        
+        answered = len(found)
+        for ip, device in self.state.last_known_devices.items():
+            if ip not in self.state.configured_ips:
+                found.setdefault(ip, device)
+        return list(found.values()), answered
+    
     def needs_reinitialization(self) -> bool:
         """
         Check if the scheduler needs re-initialization due to health check failures.
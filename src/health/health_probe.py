@@ -0,0 +1,140 @@
+"""Unicast reachability probes for configured devices."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from kasa import Discover
+
+from src.devices.device_discovery import DeviceInfo, discover_devices
+
+logger = logging.getLogger(__name__)
+
+# Probe timeout bounds (seconds); the per-device timeout adapts between them
+DEFAULT_MIN_PROBE_TIMEOUT_SECONDS = 0.5
+DEFAULT_MAX_PROBE_TIMEOUT_SECONDS = 5.0
+
+# Full broadcast sweep interval (detects devices that moved to another IP)
+DEFAULT_SWEEP_INTERVAL_HOURS = 168.0
+
+# Broadcast sweep listening time (seconds)
+SWEEP_TIMEOUT_SECONDS = 10
+
+
+@dataclass
+class ProbeTiming:
+    """Smoothed round-trip estimate for one device (RFC 6298 style)."""
+    srtt: Optional[float] = None
+    rttvar: float = 0.0
+    misses: int = 0
+
+
+class HealthProbe:
+    """
+    Concurrent unicast probes of known device IPs plus an occasional broadcast sweep.
+
+    Each configured device is probed with a unicast discovery request to its
+    IP; a device answers with its identity (alias, MAC, model) in one round
+    trip, so checking every device takes about as long as the slowest reply.
+    Per-device timeouts follow the device's smoothed round-trip time
+    (``srtt + 4 * rttvar``, clamped to the min/max bounds) and double after
+    each unanswered probe.
+
+    The broadcast sweep (``discover_devices``) still runs every
+    ``sweep_interval_hours`` and whenever a configured device stops
+    answering, to notice new devices and devices that moved to another IP.
+    """
+
+    def __init__(
+        self,
+        min_timeout: float = DEFAULT_MIN_PROBE_TIMEOUT_SECONDS,
+        max_timeout: float = DEFAULT_MAX_PROBE_TIMEOUT_SECONDS,
+        sweep_interval_hours: float = DEFAULT_SWEEP_INTERVAL_HOURS,
+    ):
+        """
+        Initialize the probe engine.
+
+        Args:
+            min_timeout: Lower bound for a probe timeout in seconds
+            max_timeout: Upper bound (and initial value) for a probe timeout in seconds
+            sweep_interval_hours: Hours between broadcast sweeps
+        """
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.sweep_interval_hours = sweep_interval_hours
+        self.timings: Dict[str, ProbeTiming] = {}
+        self.last_sweep: Optional[float] = None
+
+    def timeout_for(self, ip: str) -> float:
+        """Current probe timeout for a device in seconds."""
+        timing = self.timings.get(ip)
+        if timing is None or timing.srtt is None:
+            return self.max_timeout
+        timeout = (timing.srtt + 4 * timing.rttvar) * 2 ** min(timing.misses, 8)
+        return min(max(timeout, self.min_timeout), self.max_timeout)
+
+    async def probe(self, ip: str) -> Optional[DeviceInfo]:
+        """
+        Probe one device.
+
+        Args:
+            ip: Device IP address
+
+        Returns:
+            DeviceInfo from the device's reply, or None if it did not answer
+        """
+        timing = self.timings.setdefault(ip, ProbeTiming())
+        timeout = self.timeout_for(ip)
+        started = time.monotonic()
+        try:
+            device = await asyncio.wait_for(
+                Discover.discover_single(ip, discovery_timeout=timeout), timeout=timeout + 1
+            )
+        except Exception as e:
+            logger.debug(f"Probe of {ip} failed: {type(e).__name__}: {e}")
+            device = None
+
+        if device is None:
+            timing.misses += 1
+            logger.debug(f"No probe reply from {ip} within {timeout:.2f}s")
+            return None
+
+        self._record_rtt(timing, time.monotonic() - started)
+        return DeviceInfo(device)
+
+    async def probe_all(self, ips: Iterable[str]) -> Dict[str, DeviceInfo]:
+        """
+        Probe devices concurrently.
+
+        Args:
+            ips: Device IP addresses
+
+        Returns:
+            Devices that answered, keyed by IP
+        """
+        ips = list(ips)
+        results = await asyncio.gather(*(self.probe(ip) for ip in ips))
+        return {ip: info for ip, info in zip(ips, results) if info is not None}
+
+    def sweep_due(self) -> bool:
+        """Whether the periodic broadcast sweep should run."""
+        if self.last_sweep is None:
+            return True
+        return time.monotonic() - self.last_sweep >= self.sweep_interval_hours * 3600
+
+    async def sweep(self) -> List[DeviceInfo]:
+        """Run a full broadcast discovery of the local network."""
+        self.last_sweep = time.monotonic()
+        return await discover_devices(timeout=SWEEP_TIMEOUT_SECONDS)
+
+    @staticmethod
+    def _record_rtt(timing: ProbeTiming, rtt: float):
+        if timing.srtt is None:
+            timing.srtt = rtt
+            timing.rttvar = rtt / 2
+        else:
+            timing.rttvar = 0.75 * timing.rttvar + 0.25 * abs(timing.srtt - rtt)
+            timing.srtt = 0.875 * timing.srtt + 0.125 * rtt
+        timing.misses = 0
@@ -199,9 +199,8 @@ def check_config_file(config_path: str = "config.yaml") -> Tuple[bool, Optional[
     
     # Try to parse it
     try:
-        import yaml
-        with open(path, 'r') as f:
-            config = yaml.safe_load(f)
+        from src.config.yaml_loader import load_config_file, HAS_LIBYAML
+        config = load_config_file(path)
         
         if config is None:
             print(f"  ⚠ Config file is empty")
@@ -211,7 +210,7 @@ def check_config_file(config_path: str = "config.yaml") -> Tuple[bool, Optional[
             print(f"  ✗ Config file has invalid format (not a dictionary)")
             return False, None
         
-        print(f"  ✓ Config file parsed successfully")
+        print(f"  ✓ Config file parsed successfully ({'libyaml' if HAS_LIBYAML else 'pure-Python'} loader)")
         print(f"  Configuration sections: {', '.join(config.keys())}")
         
         # Check for required sections
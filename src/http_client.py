@@ -0,0 +1,131 @@
+"""Shared HTTP client session for outbound API and webhook requests."""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+
+logger = logging.getLogger(__name__)
+
+# Connection pool defaults (weather providers and webhooks are low-volume)
+DEFAULT_CONNECTION_LIMIT = 20
+DEFAULT_LIMIT_PER_HOST = 4
+DEFAULT_DNS_CACHE_TTL_SECONDS = 300
+DEFAULT_KEEPALIVE_TIMEOUT_SECONDS = 60
+
+
+class HttpSessionPool:
+    """
+    Process-wide aiohttp session owned by the scheduler's event loop.
+
+    Requests made on the owning loop share one keep-alive connection pool with
+    a DNS cache and per-host connection limits, so repeated weather fetches and
+    webhook posts skip DNS, TCP and TLS setup. Requests made on any other loop
+    (e.g. one-off asyncio.run() calls from the web thread) fall back to a
+    short-lived session, since aiohttp sessions cannot cross event loops.
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL_SECONDS,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT_SECONDS
+    ):
+        """
+        Initialize session pool.
+
+        Args:
+            limit: Maximum simultaneous connections
+            limit_per_host: Maximum simultaneous connections per host
+            dns_cache_ttl: Seconds to cache DNS lookups
+            keepalive_timeout: Seconds to keep idle connections open
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def attach(self, loop: asyncio.AbstractEventLoop):
+        """
+        Set the event loop that owns the shared session.
+
+        Args:
+            loop: Long-running event loop (the scheduler's loop)
+        """
+        self._loop = loop
+        logger.debug(f"HTTP session pool attached to loop {loop}")
+
+    def _on_owner_loop(self) -> bool:
+        """Check if the caller is running on the owning event loop."""
+        if self._loop is None:
+            return False
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _get_shared_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            logger.info(
+                f"Created shared HTTP session (limit={self.limit}, "
+                f"per_host={self.limit_per_host}, dns_ttl={self.dns_cache_ttl}s)"
+            )
+        return self._session
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Get a session for the duration of a request.
+
+        Yields:
+            Shared session on the owning loop, otherwise a temporary session
+            that is closed on exit
+        """
+        if self._on_owner_loop():
+            yield self._get_shared_session()
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
+    async def close(self):
+        """Close the shared session and detach from the owning loop."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("Closed shared HTTP session")
+        self._session = None
+        self._loop = None
+
+
+_pool = HttpSessionPool()
+
+
+def get_http_pool() -> HttpSessionPool:
+    """Get the process-wide HTTP session pool."""
+    return _pool
+
+
+def http_session():
+    """
+    Get a session context manager from the process-wide pool.
+
+    Usage:
+        async with http_session() as session:
+            async with session.get(url) as response:
+                ...
+    """
+    return _pool.session()
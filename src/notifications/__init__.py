@@ -7,6 +7,7 @@ from .notification_service import (
     validate_and_test_notifications,
     create_notification_service_from_config,
 )
+from .outbox import NotificationOutbox, create_notification_outbox
 from .forecast_notifier import ForecastNotifier
 from .notification_manager import NotificationManager, ProviderStatus, ProviderHealth
 
@@ -16,6 +17,8 @@ __all__ = [
     'NotificationValidationError',
     'validate_and_test_notifications',
     'create_notification_service_from_config',
+    'NotificationOutbox',
+    'create_notification_outbox',
     'ForecastNotifier',
     'NotificationManager',
     'ProviderStatus',
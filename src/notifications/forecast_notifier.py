@@ -8,6 +8,8 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+from src.state.state_store import state_store
+
 
 logger = logging.getLogger(__name__)
 
@@ -60,26 +62,23 @@ class ForecastNotifier:
     def _load_state(self) -> None:
         """Load last forecast state from file."""
         try:
-            if self.state_file.exists():
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
-                    self.last_forecast_hash = state.get('forecast_hash')
-                    self.last_forecast_summary = state.get('forecast_summary')
-                    logger.debug(f"Loaded forecast state: hash={self.last_forecast_hash}")
+            if state_store.exists(self.state_file):
+                state = state_store.read(self.state_file)
+                self.last_forecast_hash = state.get('forecast_hash')
+                self.last_forecast_summary = state.get('forecast_summary')
+                logger.debug(f"Loaded forecast state: hash={self.last_forecast_hash}")
         except Exception as e:
             logger.warning(f"Failed to load forecast state: {e}")
     
     def _save_state(self) -> None:
-        """Save last forecast state to file."""
+        """Queue the last forecast state for the state store's next flush."""
         try:
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.state_file, 'w') as f:
-                state = {
-                    'forecast_hash': self.last_forecast_hash,
-                    'forecast_summary': self.last_forecast_summary,
-                    'last_updated': datetime.now().isoformat()
-                }
-                json.dump(state, f, indent=2)
+            state_store.write(self.state_file, {
+                'forecast_hash': self.last_forecast_hash,
+                'forecast_summary': self.last_forecast_summary,
+                'last_updated': datetime.now().isoformat()
+            })
         except Exception as e:
             logger.warning(f"Failed to save forecast state: {e}")
     
@@ -12,6 +12,11 @@ from typing import Dict, Any, Optional, List, Tuple
 from abc import ABC, abstractmethod
 from urllib.parse import urlparse
 
+from src.http_client import http_session
+from src.notifications.smtp_pool import (
+    SMTPSessionPool, DEFAULT_MAX_SESSIONS, DEFAULT_IDLE_TIMEOUT_SECONDS
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +70,10 @@ class NotificationProvider(ABC):
             Tuple of (is_connected, error_message)
         """
         pass
+    
+    def close(self):
+        """Release connections held by the provider (default: nothing to release)."""
+        pass
 
 
 class EmailNotificationProvider(NotificationProvider):
@@ -72,7 +81,8 @@ class EmailNotificationProvider(NotificationProvider):
     
     def __init__(self, smtp_host: str, smtp_port: int, smtp_username: str, 
                  smtp_password: str, from_email: str, to_emails: List[str],
-                 use_tls: bool = True):
+                 use_tls: bool = True, max_sessions: int = DEFAULT_MAX_SESSIONS,
+                 session_idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS):
         """
         Initialize email notification provider.
         
@@ -84,6 +94,8 @@ class EmailNotificationProvider(NotificationProvider):
             from_email: From email address
             to_emails: List of recipient email addresses
             use_tls: Whether to use TLS (default True)
+            max_sessions: SMTP sessions kept for reuse (and sending threads)
+            session_idle_timeout: Seconds before an unused session is closed
         """
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
@@ -93,6 +105,12 @@ class EmailNotificationProvider(NotificationProvider):
         self.to_emails = to_emails
         self.use_tls = use_tls
         
+        # Logged-in sessions reused across messages, on a dedicated executor
+        self._pool = SMTPSessionPool(
+            smtp_host, smtp_port, smtp_username, smtp_password, use_tls=use_tls,
+            max_sessions=max_sessions, idle_timeout_seconds=session_idle_timeout
+        )
+        
         logger.info(f"Email notifications configured: {smtp_host}:{smtp_port} -> {', '.join(to_emails)}")
     
     def validate_config(self) -> Tuple[bool, Optional[str]]:
@@ -129,7 +147,7 @@ class EmailNotificationProvider(NotificationProvider):
         """
         try:
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._test_smtp_connection, timeout)
+            await loop.run_in_executor(self._pool.executor, self._test_smtp_connection, timeout)
             return True, None
         except Exception as e:
             return False, f"{type(e).__name__}: {str(e)}"
@@ -204,9 +222,9 @@ class EmailNotificationProvider(NotificationProvider):
             msg['Subject'] = subject
             msg.attach(MIMEText(body, 'plain'))
             
-            # Send email in thread pool (SMTP is blocking)
+            # Send email on the SMTP pool's threads (SMTP is blocking)
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._send_smtp, msg)
+            await loop.run_in_executor(self._pool.executor, self._send_smtp, msg)
             
             logger.info(f"Email notification sent successfully: {event_type}")
             return True
@@ -220,20 +238,16 @@ class EmailNotificationProvider(NotificationProvider):
     
     def _send_smtp(self, msg: MIMEMultipart):
         """
-        Send SMTP email (blocking operation).
+        Send SMTP email over a pooled session (blocking operation).
         
         Args:
             msg: Email message to send
         """
-        if self.use_tls:
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
-        else:
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
+        self._pool.send_messages([msg])
+    
+    def close(self):
+        """Close pooled SMTP sessions."""
+        self._pool.close()
 
 
 class WebhookNotificationProvider(NotificationProvider):
@@ -289,7 +303,7 @@ class WebhookNotificationProvider(NotificationProvider):
             Tuple of (is_connected, error_message)
         """
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_session() as session:
                 # Try a HEAD or GET request to test connectivity
                 async with session.head(
                     self.webhook_url,
@@ -331,7 +345,7 @@ class WebhookNotificationProvider(NotificationProvider):
             }
             
             # Send webhook
-            async with aiohttp.ClientSession() as session:
+            async with http_session() as session:
                 async with session.post(
                     self.webhook_url,
                     json=payload,
@@ -373,6 +387,8 @@ class NotificationService:
         self.providers: Dict[str, NotificationProvider] = {}
         self._enabled = False
         self.routing = routing or {}
+        # NotificationOutbox that delivers notify() calls in the background (None: send directly)
+        self.outbox = None
         logger.info("Notification service initialized")
     
     def add_provider(self, name: str, provider: NotificationProvider):
@@ -396,6 +412,11 @@ class NotificationService:
         """
         return self._enabled and len(self.providers) > 0
     
+    def close(self):
+        """Release provider connections (e.g. pooled SMTP sessions)."""
+        for provider in self.providers.values():
+            provider.close()
+    
     def get_providers_for_event(self, event_type: str) -> List[Tuple[str, NotificationProvider]]:
         """
         Get providers that should receive this event based on routing configuration.
@@ -429,6 +450,9 @@ class NotificationService:
         """
         Send notification to configured providers based on routing.
         
+        With an outbox attached the notification is queued per provider and
+        this returns immediately; otherwise it is sent to the providers now.
+        
         Args:
             event_type: Type of event (e.g., "device_lost", "device_ip_changed", "connectivity_lost")
             message: Human-readable message
@@ -448,6 +472,12 @@ class NotificationService:
             logger.debug(f"No providers configured for event: {event_type}")
             return
         
+        if self.outbox is not None:
+            for name, _ in providers_for_event:
+                self.outbox.enqueue(name, event_type, message, details)
+            logger.info(f"Queued notification: {event_type} for {len(providers_for_event)} provider(s)")
+            return
+        
         logger.info(f"Sending notification: {event_type} to {len(providers_for_event)} provider(s)")
         logger.debug(f"Message: {message}")
         logger.debug(f"Details: {details}")
@@ -535,6 +565,26 @@ def create_notification_service_from_config(config: Dict[str, Any]) -> Notificat
     routing = config.get('routing', {})
     service = NotificationService(routing=routing)
     
+    try:
+        _add_providers_from_config(service, config)
+    except Exception:
+        # Release any provider already created (e.g. an SMTP session pool)
+        service.close()
+        raise
+    
+    if not service.is_enabled():
+        logger.info("No notification providers configured (all notifications disabled)")
+    
+    return service
+
+
+def _add_providers_from_config(service: NotificationService, config: Dict[str, Any]):
+    """
+    Add the email and webhook providers enabled in the configuration.
+    
+    Raises:
+        NotificationValidationError: If an enabled provider is misconfigured
+    """
     # Email notifications
     email_config = config.get('email', {})
     email_enabled = email_config.get('enabled', False)
@@ -569,7 +619,9 @@ def create_notification_service_from_config(config: Dict[str, Any]) -> Notificat
                 smtp_password=email_config['smtp_password'],
                 from_email=email_config['from_email'],
                 to_emails=email_config['to_emails'],
-                use_tls=email_config.get('use_tls', True)
+                use_tls=email_config.get('use_tls', True),
+                max_sessions=email_config.get('smtp_max_sessions', DEFAULT_MAX_SESSIONS),
+                session_idle_timeout=email_config.get('smtp_session_idle_seconds', DEFAULT_IDLE_TIMEOUT_SECONDS)
             )
             
             # Validate configuration
@@ -633,11 +685,6 @@ def create_notification_service_from_config(config: Dict[str, Any]) -> Notificat
             raise NotificationValidationError(f"Failed to configure webhook: {e}")
     else:
         logger.info("Webhook notifications disabled (notifications.webhook.enabled=false)")
-    
-    if not service.is_enabled():
-        logger.info("No notification providers configured (all notifications disabled)")
-    
-    return service
 
 
 async def validate_and_test_notifications(
@@ -654,8 +701,10 @@ async def validate_and_test_notifications(
         send_test: If True, send test notification to each provider
         
     Returns:
-        Tuple of (success, NotificationService)
+        Tuple of (success, NotificationService); the service is None (and has
+        been closed) when validation fails
     """
+    service = None
     try:
         # Create service from config (will validate configuration)
         service = create_notification_service_from_config(config)
@@ -690,7 +739,10 @@ async def validate_and_test_notifications(
         
     except NotificationValidationError as e:
         logger.error(f"Notification validation failed: {e}")
-        return False, None
     except Exception as e:
         logger.error(f"Unexpected error during notification validation: {e}")
-        return False, None
+    
+    # Release the rejected service's connections (e.g. its SMTP session pool)
+    if service is not None:
+        service.close()
+    return False, None
@@ -0,0 +1,358 @@
+"""Persistent notification outbox drained by a background worker."""
+
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.state.state_store import state_store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTBOX_FILE = "state/notification_outbox.json"
+
+# Same-type events for a provider arriving within this window are sent as one digest
+DEFAULT_DIGEST_WINDOW_SECONDS = 30.0
+
+# Sends per provider per rolling minute; queued entries wait for the window to free up
+DEFAULT_RATE_LIMIT_PER_MINUTE = 10
+
+# Delivery attempts before an entry is dropped
+DEFAULT_MAX_ATTEMPTS = 10
+
+# Retry backoff: base * 2**(attempts - 1), capped
+DEFAULT_RETRY_BASE_SECONDS = 30.0
+DEFAULT_RETRY_MAX_SECONDS = 3600.0
+
+# Events listed in full in a digest message; the rest are summarized by count
+MAX_DIGEST_LINES = 20
+
+
+@dataclass
+class OutboxEntry:
+    """One notification waiting to be delivered to one provider."""
+    id: int
+    provider: str
+    event_type: str
+    message: str
+    details: Dict[str, Any] = field(default_factory=dict)
+    created_at: float = 0.0
+    next_attempt_at: float = 0.0
+    attempts: int = 0
+
+
+class NotificationOutbox:
+    """
+    Durable per-provider notification queue with coalescing, retry and rate limiting.
+
+    ``NotificationService.notify`` enqueues one entry per routed provider and
+    returns immediately; a worker task on the scheduler's event loop delivers
+    them. New entries are held for ``digest_window_seconds`` so a burst of
+    same-type events (e.g. ``device_lost`` for every configured IP) goes out as
+    one digest message. Failed sends are retried with exponential backoff and
+    dropped after ``max_attempts``. Each provider is limited to
+    ``rate_limit_per_minute`` sends and providers are drained concurrently, so
+    a slow SMTP server does not hold up webhooks.
+
+    The queue is persisted through the state store after every change and
+    reloaded on start, so undelivered notifications survive restarts.
+    """
+
+    def __init__(
+        self,
+        state_file: str = DEFAULT_OUTBOX_FILE,
+        digest_window_seconds: float = DEFAULT_DIGEST_WINDOW_SECONDS,
+        rate_limit_per_minute: int = DEFAULT_RATE_LIMIT_PER_MINUTE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_base_seconds: float = DEFAULT_RETRY_BASE_SECONDS,
+        retry_max_seconds: float = DEFAULT_RETRY_MAX_SECONDS,
+    ):
+        """
+        Initialize the outbox and load undelivered entries.
+
+        Args:
+            state_file: Path of the persisted queue
+            digest_window_seconds: How long new entries wait for same-type events to coalesce
+            rate_limit_per_minute: Maximum sends per provider per rolling minute
+            max_attempts: Delivery attempts before an entry is dropped
+            retry_base_seconds: Delay after the first failed attempt
+            retry_max_seconds: Upper bound for the retry delay
+        """
+        self.state_file = Path(state_file)
+        self.digest_window_seconds = digest_window_seconds
+        self.rate_limit_per_minute = rate_limit_per_minute
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+
+        self._service = None
+        self._lock = threading.Lock()
+        self._entries: List[OutboxEntry] = []
+        self._sent: Dict[str, Deque[float]] = defaultdict(deque)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._ids = itertools.count(1)
+        self._load()
+
+    def configure(self, outbox_config: Optional[Dict[str, Any]]):
+        """
+        Apply delivery settings; takes effect for entries queued afterwards.
+
+        Args:
+            outbox_config: Mapping with optional 'digest_window_seconds',
+                'rate_limit_per_minute', 'max_attempts', 'retry_base_seconds'
+                and 'retry_max_seconds'
+        """
+        outbox_config = outbox_config or {}
+        self.digest_window_seconds = float(
+            outbox_config.get('digest_window_seconds', DEFAULT_DIGEST_WINDOW_SECONDS)
+        )
+        self.rate_limit_per_minute = int(outbox_config.get('rate_limit_per_minute', DEFAULT_RATE_LIMIT_PER_MINUTE))
+        self.max_attempts = int(outbox_config.get('max_attempts', DEFAULT_MAX_ATTEMPTS))
+        self.retry_base_seconds = float(outbox_config.get('retry_base_seconds', DEFAULT_RETRY_BASE_SECONDS))
+        self.retry_max_seconds = float(outbox_config.get('retry_max_seconds', DEFAULT_RETRY_MAX_SECONDS))
+
+    @property
+    def service(self):
+        """NotificationService whose providers deliver the queued entries."""
+        return self._service
+
+    @service.setter
+    def service(self, service):
+        self._service = service
+        self._wake()
+
+    def pending_count(self, provider: Optional[str] = None) -> int:
+        """Number of undelivered entries, optionally for one provider."""
+        with self._lock:
+            return sum(1 for e in self._entries if provider is None or e.provider == provider)
+
+    def enqueue(self, provider: str, event_type: str, message: str, details: Optional[Dict[str, Any]] = None):
+        """
+        Queue a notification for one provider. Safe to call from any thread.
+
+        Args:
+            provider: Provider name (e.g., 'email', 'webhook')
+            event_type: Type of event
+            message: Human-readable message
+            details: Additional details; stored as JSON (non-JSON values become strings)
+        """
+        now = time.time()
+        details = json.loads(json.dumps(details or {}, default=str))
+        with self._lock:
+            self._entries.append(OutboxEntry(
+                id=next(self._ids),
+                provider=provider,
+                event_type=event_type,
+                message=message,
+                details=details,
+                created_at=now,
+                next_attempt_at=now + self.digest_window_seconds,
+            ))
+            self._persist_locked()
+        self._wake()
+
+    async def run(self):
+        """Deliver entries as they become due until cancelled."""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        logger.info(f"Notification outbox worker started ({self.pending_count()} pending)")
+        try:
+            while True:
+                self._wakeup.clear()
+                delay = await self.drain()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._loop = None
+            self._wakeup = None
+
+    async def drain(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Send every due entry the rate limits allow.
+
+        Args:
+            now: Current epoch time (defaults to time.time())
+
+        Returns:
+            Seconds until the next entry becomes sendable, or None if nothing is queued
+        """
+        now = time.time() if now is None else now
+        service = self._service
+        if service is None:
+            return None
+
+        with self._lock:
+            providers = list(dict.fromkeys(e.provider for e in self._entries))
+        if providers:
+            await asyncio.gather(*(
+                self._drain_provider(name, service.providers.get(name), now) for name in providers
+            ))
+
+        with self._lock:
+            self._persist_locked()
+            if not self._entries:
+                return None
+            next_due = min(
+                max(e.next_attempt_at, self._rate_limit_free_at(e.provider, now)) for e in self._entries
+            )
+        return max(next_due - now, 0.0)
+
+    async def _drain_provider(self, name: str, provider, now: float):
+        """Send one provider's due entries, one message per event type."""
+        with self._lock:
+            entries = [e for e in self._entries if e.provider == name]
+            if provider is None:
+                logger.warning(f"Dropping {len(entries)} queued notification(s) for removed provider '{name}'")
+                self._remove_locked(entries)
+                return
+
+        by_type: Dict[str, List[OutboxEntry]] = {}
+        for entry in entries:
+            by_type.setdefault(entry.event_type, []).append(entry)
+
+        for event_type, group in by_type.items():
+            if not any(e.next_attempt_at <= now for e in group):
+                continue
+            if self._rate_limit_free_at(name, now) > now:
+                logger.debug(f"Notification provider '{name}' rate limited; {len(entries)} queued")
+                return
+            self._sent[name].append(now)
+
+            # Entries still in their digest window ride along with the due ones
+            batch = [e for e in group if e.next_attempt_at <= now or e.attempts == 0]
+            event_type, message, details = self._compose(batch)
+            try:
+                ok = await provider.send(event_type, message, details)
+            except Exception as e:
+                logger.error(
+                    f"Notification provider '{name}' raised exception for {event_type}: "
+                    f"{type(e).__name__}: {e}"
+                )
+                ok = False
+
+            with self._lock:
+                if ok is True:
+                    logger.info(f"Notification sent: {event_type} to '{name}' ({len(batch)} event(s))")
+                    self._remove_locked(batch)
+                else:
+                    self._retry_locked(name, batch, now)
+
+    def _retry_locked(self, name: str, batch: List[OutboxEntry], now: float):
+        retried, dropped = [], []
+        for entry in batch:
+            entry.attempts += 1
+            if entry.attempts >= self.max_attempts:
+                dropped.append(entry)
+                continue
+            delay = min(self.retry_base_seconds * 2 ** (entry.attempts - 1), self.retry_max_seconds)
+            entry.next_attempt_at = now + delay
+            retried.append(entry)
+        if dropped:
+            logger.error(
+                f"Dropping {len(dropped)} {dropped[0].event_type} notification(s) for '{name}' "
+                f"after {self.max_attempts} failed attempts"
+            )
+            self._remove_locked(dropped)
+        if retried:
+            logger.warning(
+                f"Notification provider '{name}' failed for {retried[0].event_type}; "
+                f"retrying {len(retried)} event(s) in {retried[0].next_attempt_at - now:.0f}s"
+            )
+
+    def _rate_limit_free_at(self, name: str, now: float) -> float:
+        """Earliest time another message may be sent to a provider."""
+        sent = self._sent[name]
+        while sent and sent[0] <= now - 60:
+            sent.popleft()
+        if len(sent) < self.rate_limit_per_minute:
+            return now
+        return sent[0] + 60
+
+    @staticmethod
+    def _compose(batch: List[OutboxEntry]) -> Tuple[str, str, Dict[str, Any]]:
+        """Build the message for a batch; several entries become one digest."""
+        first = batch[0]
+        if len(batch) == 1:
+            return first.event_type, first.message, first.details
+
+        label = first.event_type.replace('_', ' ')
+        lines = [f"{len(batch)} {label} events:"]
+        for entry in batch[:MAX_DIGEST_LINES]:
+            lines.append(f"- [{datetime.fromtimestamp(entry.created_at).strftime('%H:%M:%S')}] {entry.message}")
+        if len(batch) > MAX_DIGEST_LINES:
+            lines.append(f"- ... and {len(batch) - MAX_DIGEST_LINES} more")
+
+        details = {
+            'digest': True,
+            'count': len(batch),
+            'events': [
+                {
+                    'time': datetime.fromtimestamp(e.created_at).isoformat(),
+                    'message': e.message,
+                    'details': e.details,
+                }
+                for e in batch
+            ],
+        }
+        return first.event_type, "\n".join(lines), details
+
+    def _remove_locked(self, entries: List[OutboxEntry]):
+        ids = {e.id for e in entries}
+        self._entries = [e for e in self._entries if e.id not in ids]
+
+    def _persist_locked(self):
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            state_store.write(self.state_file, {'entries': [asdict(e) for e in self._entries]})
+        except Exception as e:
+            logger.warning(f"Failed to save notification outbox: {e}")
+
+    def _load(self):
+        try:
+            if not state_store.exists(self.state_file):
+                return
+            entries = [OutboxEntry(**e) for e in state_store.read(self.state_file).get('entries', [])]
+        except Exception as e:
+            logger.warning(f"Failed to load notification outbox: {e}")
+            return
+        self._entries = entries
+        self._ids = itertools.count(max((e.id for e in entries), default=0) + 1)
+        if entries:
+            logger.info(f"Loaded {len(entries)} undelivered notification(s) from {self.state_file}")
+
+    def _wake(self):
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
+
+def create_notification_outbox(outbox_config: Optional[Dict[str, Any]]) -> Optional[NotificationOutbox]:
+    """
+    Create the notification outbox from the 'notifications.outbox' configuration.
+
+    Args:
+        outbox_config: Mapping with optional 'enabled', 'state_file' and the
+            settings accepted by NotificationOutbox.configure()
+
+    Returns:
+        NotificationOutbox, or None when disabled (notifications are then sent directly)
+    """
+    outbox_config = outbox_config or {}
+    if not outbox_config.get('enabled', True):
+        return None
+    outbox = NotificationOutbox(state_file=outbox_config.get('state_file', DEFAULT_OUTBOX_FILE))
+    outbox.configure(outbox_config)
+    return outbox
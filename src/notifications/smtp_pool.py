@@ -0,0 +1,203 @@
+"""Reusable SMTP sessions for the email notification provider."""
+
+import logging
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sessions (and executor threads) per SMTP server; alerts are rare, so one is usually enough
+DEFAULT_MAX_SESSIONS = 1
+
+# Idle sessions are closed after this long (most servers drop them after 60-300 seconds)
+DEFAULT_IDLE_TIMEOUT_SECONDS = 60.0
+
+# Idle sessions older than this are checked with NOOP before reuse
+DEFAULT_KEEPALIVE_SECONDS = 15.0
+
+# Socket timeout for connecting and every SMTP command
+DEFAULT_SMTP_TIMEOUT_SECONDS = 30.0
+
+
+class SMTPSessionPool:
+    """
+    Pool of logged-in SMTP sessions served by a dedicated thread pool.
+
+    Sending reuses an idle session when there is one, so a burst of alerts
+    costs one connect/STARTTLS/login instead of one per message. A session
+    that sat idle for ``keepalive_seconds`` is checked with NOOP first, and
+    one idle for ``idle_timeout_seconds`` is closed (by a timer, so the
+    server connection is not held open between alerts). A reused session
+    the server has dropped is replaced once transparently.
+
+    Blocking SMTP work runs on the pool's own ``executor`` rather than the
+    event loop's default executor, which is shared with everything else.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        use_tls: bool = True,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        keepalive_seconds: float = DEFAULT_KEEPALIVE_SECONDS,
+        timeout: float = DEFAULT_SMTP_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize the pool; no connection is made until the first send.
+
+        Args:
+            host: SMTP server hostname
+            port: SMTP server port
+            username: SMTP authentication username
+            password: SMTP authentication password
+            use_tls: Whether to upgrade sessions with STARTTLS
+            max_sessions: Maximum concurrent sessions (and executor threads)
+            idle_timeout_seconds: Close sessions idle for this long
+            keepalive_seconds: NOOP-check sessions idle for this long before reuse
+            timeout: Socket timeout in seconds
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.keepalive_seconds = keepalive_seconds
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_sessions), thread_name_prefix='SMTP')
+
+        self._lock = threading.Lock()
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []  # (session, last used), most recent last
+        self._expiry_timer: Optional[threading.Timer] = None
+        self._closed = False
+        self.connections_opened = 0
+
+    def send_messages(self, messages: List[Message]):
+        """
+        Send messages over one session (blocking; run on ``executor``).
+
+        Args:
+            messages: Email messages to send, in order
+
+        Raises:
+            smtplib.SMTPException: If the server rejects a message or login
+            OSError: If the server cannot be reached
+        """
+        session, reused = self._acquire()
+        remaining = list(messages)
+        try:
+            while remaining:
+                try:
+                    session.send_message(remaining[0])
+                except smtplib.SMTPServerDisconnected:
+                    if not reused:
+                        raise
+                    # The server dropped the idle session since its last check; reconnect once
+                    logger.debug(f"SMTP session to {self.host} was closed by the server; reconnecting")
+                    self._quit(session)
+                    session, reused = self._connect(), False
+                    continue
+                remaining.pop(0)
+        except BaseException:
+            self._quit(session)
+            raise
+        self._release(session)
+
+    def close(self):
+        """Close idle sessions and stop the executor (pending sends finish first)."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            if self._expiry_timer is not None:
+                self._expiry_timer.cancel()
+                self._expiry_timer = None
+        for session, _ in idle:
+            self._quit(session)
+        self.executor.shutdown(wait=False)
+
+    def idle_count(self) -> int:
+        """Number of open sessions waiting to be reused."""
+        with self._lock:
+            return len(self._idle)
+
+    def _acquire(self) -> Tuple[smtplib.SMTP, bool]:
+        """Return (session, reused), preferring a live idle session."""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                session, last_used = self._idle.pop()
+            idle_for = time.monotonic() - last_used
+            if idle_for >= self.idle_timeout_seconds:
+                self._quit(session)
+                continue
+            if idle_for >= self.keepalive_seconds:
+                try:
+                    code, _ = session.noop()
+                except (smtplib.SMTPException, OSError):
+                    code = None
+                if code != 250:
+                    self._quit(session)
+                    continue
+            return session, True
+        return self._connect(), False
+
+    def _release(self, session: smtplib.SMTP):
+        with self._lock:
+            if not self._closed:
+                self._idle.append((session, time.monotonic()))
+                self._schedule_expiry_locked()
+                return
+        self._quit(session)
+
+    def _connect(self) -> smtplib.SMTP:
+        session = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                session.starttls()
+            session.login(self.username, self.password)
+        except BaseException:
+            self._quit(session)
+            raise
+        self.connections_opened += 1
+        logger.debug(f"Opened SMTP session to {self.host}:{self.port}")
+        return session
+
+    def _schedule_expiry_locked(self):
+        if self._expiry_timer is None and self._idle:
+            oldest = self._idle[0][1]
+            delay = max(oldest + self.idle_timeout_seconds - time.monotonic(), 0.0)
+            self._expiry_timer = threading.Timer(delay, self._expire_idle)
+            self._expiry_timer.daemon = True
+            self._expiry_timer.start()
+
+    def _expire_idle(self):
+        """Close sessions idle past the timeout and re-arm for the rest."""
+        now = time.monotonic()
+        with self._lock:
+            self._expiry_timer = None
+            expired = [s for s, used in self._idle if now - used >= self.idle_timeout_seconds]
+            self._idle = [(s, used) for s, used in self._idle if now - used < self.idle_timeout_seconds]
+            self._schedule_expiry_locked()
+        for session in expired:
+            self._quit(session)
+        if expired:
+            logger.debug(f"Closed {len(expired)} idle SMTP session(s) to {self.host}")
+
+    @staticmethod
+    def _quit(session: smtplib.SMTP):
+        try:
+            session.quit()
+        except (smtplib.SMTPException, OSError):
+            try:
+                session.close()
+            except OSError:
+                pass
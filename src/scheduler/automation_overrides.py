@@ -10,6 +10,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional, Any
 
+from src.state.state_store import state_store
 
 logger = logging.getLogger(__name__)
 
@@ -41,20 +42,19 @@ class AutomationOverrides:
     
     def _load_overrides(self):
         """Load overrides from JSON file."""
-        if not self.state_file.exists():
+        if not state_store.exists(self.state_file):
             logger.info(f"No automation overrides file found at {self.state_file}")
             self.overrides = {}
             return
         
         try:
-            with open(self.state_file, 'r') as f:
-                data = json.load(f)
-                if not isinstance(data, dict):
-                    logger.warning(f"Invalid overrides file format (expected dict): {self.state_file}")
-                    self.overrides = {}
-                else:
-                    self.overrides = data
-                    logger.info(f"Loaded automation overrides for {len(self.overrides)} group(s)")
+            data = state_store.read(self.state_file)
+            if not isinstance(data, dict):
+                logger.warning(f"Invalid overrides file format (expected dict): {self.state_file}")
+                self.overrides = {}
+            else:
+                self.overrides = data
+                logger.info(f"Loaded automation overrides for {len(self.overrides)} group(s)")
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse overrides file {self.state_file}: {e}")
             self.overrides = {}
@@ -63,12 +63,9 @@ class AutomationOverrides:
             self.overrides = {}
     
     def _save_overrides(self):
-        """Save overrides to JSON file."""
+        """Queue the overrides for the next write-behind flush (no file I/O here)."""
         try:
-            self._ensure_state_dir()
-            with open(self.state_file, 'w') as f:
-                json.dump(self.overrides, f, indent=2)
-            logger.debug(f"Saved automation overrides to {self.state_file}")
+            state_store.write(self.state_file, self.overrides)
         except Exception as e:
             logger.error(f"Failed to save overrides to {self.state_file}: {e}")
     
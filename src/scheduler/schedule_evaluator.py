@@ -1,11 +1,11 @@
 """Schedule evaluation logic for unified conditional scheduling."""
 
 import logging
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
-from .schedule_types import Schedule, ScheduleTimeType, SchedulePriority
+from .schedule_types import Schedule, ScheduleTimeType, SchedulePriority, TimeSpec
 from .solar_calculator import SolarCalculator
 
 
@@ -21,8 +21,14 @@ class ScheduleEvaluator:
     - Day-of-week filtering
     - Weather condition evaluation
     - Priority-based conflict resolution
+    
+    Schedules arrive pre-compiled (see parse_schedules); the evaluator only
+    resolves solar-based times, once per date.
     """
     
+    # Number of dates to keep resolved solar times for
+    SOLAR_CACHE_DAYS = 8
+    
     def __init__(self, solar_calculator: SolarCalculator, timezone: ZoneInfo):
         """
         Initialize schedule evaluator.
@@ -34,6 +40,11 @@ class ScheduleEvaluator:
         self.solar_calculator = solar_calculator
         self.timezone = timezone
         self.logger = logging.getLogger(__name__)
+        
+        # Resolved solar times: date -> {TimeSpec: time}. Location and timezone
+        # changes require a restart, which builds a new evaluator, so entries
+        # never need invalidating.
+        self._solar_times: Dict[date, Dict[TimeSpec, time]] = {}
     
     def should_turn_on(
         self,
@@ -71,7 +82,7 @@ class ScheduleEvaluator:
                 continue
             
             # Check day of week
-            if current_day not in schedule.days:
+            if not schedule.is_active_on_day(current_day):
                 self.logger.debug(
                     f"Schedule '{schedule.name}' not active on day {current_day}"
                 )
@@ -127,8 +138,8 @@ class ScheduleEvaluator:
                     )
                     continue
                 
-                if not self._evaluate_conditions(
-                    schedule.conditions, weather_conditions
+                if not self._evaluate_condition_checks(
+                    schedule.condition_checks, weather_conditions
                 ):
                     self.logger.debug(
                         f"Schedule '{schedule.name}' conditions not met"
@@ -145,12 +156,7 @@ class ScheduleEvaluator:
         # If any schedule wants ON, return the highest priority one
         if active_schedules:
             # Sort by priority (CRITICAL > NORMAL > LOW)
-            priority_order = {
-                SchedulePriority.CRITICAL: 0,
-                SchedulePriority.NORMAL: 1,
-                SchedulePriority.LOW: 2
-            }
-            active_schedules.sort(key=lambda s: priority_order[s.priority])
+            active_schedules.sort(key=lambda s: s.priority_rank)
             
             winning_schedule = active_schedules[0]
             reason = (
@@ -216,59 +222,60 @@ class ScheduleEvaluator:
         Raises:
             ValueError: If time calculation fails
         """
-        # Calculate on_time
-        on_config = schedule.on_config
-        on_type = ScheduleTimeType(on_config['type'])
-        
-        if on_type == ScheduleTimeType.TIME:
-            on_time = datetime.strptime(on_config['value'], "%H:%M").time()
-        
-        elif on_type == ScheduleTimeType.SUNRISE:
-            on_time = self.solar_calculator.get_sunrise_time(
-                current_date,
-                offset_minutes=on_config.get('offset', 0),
-                fallback=on_config.get('fallback')
-            )
+        on_time = self._resolve_time(schedule.on_spec, current_date)
+        if on_time is None:
+            raise ValueError(f"Invalid on_time type: {schedule.on_spec.type}")
         
-        elif on_type == ScheduleTimeType.SUNSET:
-            on_time = self.solar_calculator.get_sunset_time(
-                current_date,
-                offset_minutes=on_config.get('offset', 0),
-                fallback=on_config.get('fallback')
-            )
+        # Duration-based: off_time is None (handled by state manager)
+        off_time = self._resolve_time(schedule.off_spec, current_date)
         
-        else:
-            raise ValueError(f"Invalid on_time type: {on_type}")
-        
-        # Calculate off_time
-        off_config = schedule.off_config
-        off_type = ScheduleTimeType(off_config['type'])
+        return on_time, off_time
+    
+    def _resolve_time(self, spec: TimeSpec, current_date: date) -> Optional[time]:
+        """
+        Resolve a compiled time specification to a clock time on a date.
         
-        if off_type == ScheduleTimeType.TIME:
-            off_time = datetime.strptime(off_config['value'], "%H:%M").time()
+        Solar-based times are computed once per (date, spec) and cached.
         
-        elif off_type == ScheduleTimeType.SUNRISE:
-            off_time = self.solar_calculator.get_sunrise_time(
-                current_date,
-                offset_minutes=off_config.get('offset', 0),
-                fallback=off_config.get('fallback')
-            )
+        Args:
+            spec: Compiled time specification
+            current_date: Date to resolve for
+            
+        Returns:
+            Clock time, or None for duration-based specs
+            
+        Raises:
+            ValueError: If solar calculation fails and no fallback is configured
+        """
+        if spec.type == ScheduleTimeType.TIME:
+            return spec.clock
         
-        elif off_type == ScheduleTimeType.SUNSET:
-            off_time = self.solar_calculator.get_sunset_time(
-                current_date,
-                offset_minutes=off_config.get('offset', 0),
-                fallback=off_config.get('fallback')
-            )
+        if not spec.is_solar:
+            return None
         
-        elif off_type == ScheduleTimeType.DURATION:
-            # Duration-based: return None for off_time (handled by state manager)
-            off_time = None
+        day_cache = self._solar_times.get(current_date)
+        if day_cache is None:
+            if len(self._solar_times) >= self.SOLAR_CACHE_DAYS:
+                self._solar_times.pop(min(self._solar_times))
+            day_cache = self._solar_times[current_date] = {}
         
-        else:
-            raise ValueError(f"Invalid off_time type: {off_type}")
+        resolved = day_cache.get(spec)
+        if resolved is None:
+            if spec.type == ScheduleTimeType.SUNRISE:
+                resolved = self.solar_calculator.get_sunrise_time(
+                    current_date,
+                    offset_minutes=spec.offset_minutes,
+                    fallback=spec.fallback
+                )
+            else:
+                resolved = self.solar_calculator.get_sunset_time(
+                    current_date,
+                    offset_minutes=spec.offset_minutes,
+                    fallback=spec.fallback
+                )
+            day_cache[spec] = resolved
         
-        return on_time, off_time
+        return resolved
     
     def _evaluate_conditions(
         self,
@@ -285,69 +292,165 @@ class ScheduleEvaluator:
         Returns:
             True if all conditions are met
         """
+        return self._evaluate_condition_checks(
+            Schedule._compile_conditions(conditions), weather_conditions
+        )
+    
+    def _evaluate_condition_checks(
+        self,
+        checks: Tuple[Tuple[str, Any], ...],
+        weather_conditions: Optional[Dict[str, Any]]
+    ) -> bool:
+        """
+        Evaluate compiled condition checks (see Schedule.condition_checks).
+        
+        Args:
+            checks: Ordered (name, required_value) pairs
+            weather_conditions: Current weather data
+            
+        Returns:
+            True if all checks pass
+        """
         if not weather_conditions:
             self.logger.warning("No weather data available for condition evaluation")
             return False
         
-        # Check temperature_max condition
-        if 'temperature_max' in conditions:
-            temp_max = conditions['temperature_max']
-            current_temp = weather_conditions.get('temperature_f')
+        for name, required in checks:
+            if name == 'temperature_max':
+                current_temp = weather_conditions.get('temperature_f')
+                
+                if current_temp is None:
+                    self.logger.warning("Temperature data not available")
+                    return False
+                
+                if current_temp > required:
+                    self.logger.debug(
+                        f"Temperature condition not met: {current_temp}°F > {required}°F"
+                    )
+                    return False
             
-            if current_temp is None:
-                self.logger.warning("Temperature data not available")
-                return False
+            elif name == 'precipitation_active':
+                precip_active = weather_conditions.get('precipitation_active', False)
+                
+                if required and not precip_active:
+                    self.logger.debug("Precipitation required but not active")
+                    return False
+                
+                if not required and precip_active:
+                    self.logger.debug("Precipitation not wanted but is active")
+                    return False
             
-            if current_temp > temp_max:
-                self.logger.debug(
-                    f"Temperature condition not met: {current_temp}°F > {temp_max}°F"
-                )
-                return False
+            elif name == 'black_ice_risk':
+                risk_active = weather_conditions.get('black_ice_risk', False)
+                
+                if required and not risk_active:
+                    self.logger.debug("Black ice risk required but not detected")
+                    return False
+                
+                if not required and risk_active:
+                    self.logger.debug("Black ice risk not wanted but is detected")
+                    return False
         
-        # Check precipitation_active condition
-        if 'precipitation_active' in conditions:
-            precip_required = conditions['precipitation_active']
-            precip_active = weather_conditions.get('precipitation_active', False)
-            
-            if precip_required and not precip_active:
-                self.logger.debug("Precipitation required but not active")
-                return False
+        # All conditions met
+        return True
+    
+    def get_transition_candidates(
+        self,
+        schedules: List[Schedule],
+        start: datetime,
+        end: datetime
+    ) -> List[datetime]:
+        """
+        Enumerate the instants in (start, end] at which schedule output may change.
+        
+        Candidates are local midnights (day-of-week changes) and the on/off
+        edges of every enabled schedule, with solar edges resolved per date.
+        Between two consecutive candidates should_turn_on() is constant for
+        fixed weather conditions.
+        
+        Args:
+            schedules: Schedules to enumerate edges for
+            start: Range start (exclusive, timezone-aware)
+            end: Range end (inclusive, timezone-aware)
             
-            if not precip_required and precip_active:
-                self.logger.debug("Precipitation not wanted but is active")
-                return False
-        
-        # Check black_ice_risk condition
-        if 'black_ice_risk' in conditions:
-            risk_required = conditions['black_ice_risk']
-            risk_active = weather_conditions.get('black_ice_risk', False)
+        Returns:
+            Sorted list of unique timezone-aware datetimes
+        """
+        tz = start.tzinfo or self.timezone
+        candidates = set()
+        
+        # Start one day early so day-spanning windows from yesterday are covered
+        current_date = start.date() - timedelta(days=1)
+        while current_date <= end.date():
+            candidates.add(datetime.combine(current_date, time(0, 0), tzinfo=tz))
             
-            if risk_required and not risk_active:
-                self.logger.debug("Black ice risk required but not detected")
-                return False
+            for schedule in schedules:
+                if not schedule.enabled or schedule.is_all_day():
+                    continue
+                try:
+                    on_time, off_time = self._get_schedule_times(
+                        schedule, current_date, start
+                    )
+                except Exception as e:
+                    self.logger.debug(
+                        f"Skipping edges for schedule '{schedule.name}' on {current_date}: {e}"
+                    )
+                    continue
+                
+                candidates.add(datetime.combine(current_date, on_time, tzinfo=tz))
+                if off_time is not None:
+                    candidates.add(datetime.combine(current_date, off_time, tzinfo=tz))
             
-            if not risk_required and risk_active:
-                self.logger.debug("Black ice risk not wanted but is detected")
-                return False
+            current_date += timedelta(days=1)
         
-        # All conditions met
-        return True
+        return sorted(c for c in candidates if start < c <= end)
     
     def get_next_schedule_change(
         self,
         schedules: List[Schedule],
-        current_time: datetime
+        current_time: datetime,
+        weather_conditions: Optional[Dict[str, Any]] = None,
+        weather_offline: bool = False,
+        horizon_hours: float = 48
     ) -> Optional[Tuple[datetime, str]]:
         """
         Calculate the next expected schedule change time.
         
+        Walks the transition candidates after current_time and returns the
+        first one at which the desired state or winning schedule differs.
+        Weather conditions are held constant over the horizon.
+        
         Args:
             schedules: List of schedules to evaluate
-            current_time: Current datetime
+            current_time: Current datetime (timezone-aware)
+            weather_conditions: Optional weather data dict (see should_turn_on)
+            weather_offline: True if weather service is offline
+            horizon_hours: How far ahead to look
             
         Returns:
             Tuple of (next_change_time, description) or None if no changes expected
         """
-        # This is a simplified version - could be enhanced to look ahead
-        # For now, return None (not critical for initial implementation)
+        if not schedules:
+            return None
+        
+        should_on, winning, _ = self.should_turn_on(
+            schedules, current_time, weather_conditions, weather_offline
+        )
+        current_state = (should_on, winning.name if winning else None)
+        
+        end = current_time + timedelta(hours=horizon_hours)
+        for candidate in self.get_transition_candidates(schedules, current_time, end):
+            should_on, winning, _ = self.should_turn_on(
+                schedules, candidate, weather_conditions, weather_offline
+            )
+            state = (should_on, winning.name if winning else None)
+            if state == current_state:
+                continue
+            
+            if should_on:
+                description = f"ON (schedule '{winning.name}')"
+            else:
+                description = "OFF (no active schedules)"
+            return candidate, description
+        
         return None
@@ -1,6 +1,7 @@
 """Schedule data structures and validation for unified scheduling."""
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime, time
 from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
@@ -24,6 +25,62 @@ class SchedulePriority(Enum):
     LOW = "low"  # Nice-to-have automation
 
 
+# Sort rank for priority-based conflict resolution (lower wins)
+PRIORITY_RANK = {
+    SchedulePriority.CRITICAL: 0,
+    SchedulePriority.NORMAL: 1,
+    SchedulePriority.LOW: 2
+}
+
+
+@dataclass(frozen=True)
+class TimeSpec:
+    """
+    Pre-parsed on/off time specification.
+
+    Built once when a schedule is parsed so evaluation never re-parses
+    HH:MM strings or rebuilds ScheduleTimeType enums.
+    """
+    type: ScheduleTimeType
+    clock: Optional[time] = None  # Absolute time for TIME specs
+    offset_minutes: float = 0  # Solar offset for SUNRISE/SUNSET specs
+    fallback: Optional[str] = None  # Solar fallback (HH:MM) for SUNRISE/SUNSET specs
+    duration_hours: Optional[float] = None  # Hours after turn on for DURATION specs
+
+    @property
+    def is_solar(self) -> bool:
+        """Check if this time depends on the date's sunrise/sunset."""
+        return self.type in (ScheduleTimeType.SUNRISE, ScheduleTimeType.SUNSET)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'TimeSpec':
+        """
+        Build a time specification from a validated on/off config dictionary.
+
+        Args:
+            config: Time configuration (already validated by Schedule)
+
+        Returns:
+            TimeSpec instance
+        """
+        time_type = ScheduleTimeType(config['type'].lower())
+
+        if time_type == ScheduleTimeType.TIME:
+            return cls(
+                type=time_type,
+                clock=datetime.strptime(config['value'], "%H:%M").time()
+            )
+
+        if time_type == ScheduleTimeType.DURATION:
+            return cls(type=time_type, duration_hours=config['value'])
+
+        return cls(
+            type=time_type,
+            offset_minutes=config.get('offset', 0),
+            fallback=config.get('fallback')
+        )
+
+
 class Schedule:
     """
     Represents a single schedule with time specification and conditions.
@@ -84,6 +141,15 @@ class Schedule:
         # Safety limits (optional overrides)
         self.safety = schedule_dict.get('safety', {})
         self._validate_safety(self.safety)
+        
+        # Compiled evaluation plan (everything evaluation needs, pre-parsed)
+        self.day_mask = 0
+        for day in self.days:
+            self.day_mask |= 1 << day
+        self.priority_rank = PRIORITY_RANK[self.priority]
+        self.on_spec = None if self.all_day else TimeSpec.from_config(self.on_config)
+        self.off_spec = None if self.all_day else TimeSpec.from_config(self.off_config)
+        self.condition_checks = self._compile_conditions(self.conditions)
     
     def _validate_time_config(self, config: Dict[str, Any], label: str):
         """Validate time configuration."""
@@ -163,6 +229,22 @@ class Schedule:
             if not isinstance(precip, bool):
                 raise ValueError("precipitation_active must be true or false")
     
+    @staticmethod
+    def _compile_conditions(conditions: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Resolve conditions into an ordered tuple of (name, required_value) checks.
+
+        Order matches ScheduleEvaluator's evaluation order so the first failing
+        check (and its log message) is unchanged.
+        """
+        if not conditions:
+            return ()
+        return tuple(
+            (name, conditions[name])
+            for name in ('temperature_max', 'precipitation_active', 'black_ice_risk')
+            if name in conditions
+        )
+    
     def _validate_safety(self, safety: Dict[str, Any]):
         """Validate safety limit configuration."""
         if not safety:
@@ -184,6 +266,10 @@ class Schedule:
         """Check if schedule has weather conditions."""
         return bool(self.conditions)
     
+    def is_active_on_day(self, isoweekday: int) -> bool:
+        """Check if the schedule runs on a day of week (1=Monday, 7=Sunday)."""
+        return bool(self.day_mask & (1 << isoweekday))
+    
     def is_all_day(self) -> bool:
         """Check if this is an all-day schedule."""
         return self.all_day
@@ -259,6 +345,10 @@ def parse_schedules(schedules_config: List[Dict[str, Any]]) -> List[Schedule]:
     """
     Parse schedule configurations into Schedule objects.
     
+    Each Schedule carries its compiled evaluation plan (parsed times, day
+    bitmask, condition checks and priority rank), so parsing once per config
+    change is all the evaluator needs.
+    
     Args:
         schedules_config: List of schedule dictionaries
         
@@ -2,16 +2,28 @@
 
 import asyncio
 import logging
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Tuple, List, Optional, Iterable
 
 from src.config import Config
-from src.weather import WeatherServiceFactory, WeatherServiceError
+from src.config.snapshot import thaw
+from src.weather import WeatherServiceFactory, WeatherServiceError, WeatherConditionsSnapshot
 from src.devices import DeviceGroupManager
+from src.devices.status_snapshot import DeviceStatusSnapshot, DEFAULT_STATUS_REFRESH_SECONDS
 from src.scheduler.state_manager import StateManager
+from src.state.history_store import create_history_store
+from src.state.state_store import state_store
 from src.health import HealthCheckService, HealthCheckServer
+from src.health.health_probe import DEFAULT_MAX_PROBE_TIMEOUT_SECONDS, DEFAULT_SWEEP_INTERVAL_HOURS
+from src.http_client import get_http_pool
+from src.async_bridge import LoopBridge, coalesced, DEFAULT_CALL_TIMEOUT_SECONDS
+from src.events import (
+    EventBroker, DEFAULT_MAX_SUBSCRIBERS, EVENT_CYCLE, EVENT_DEVICES, EVENT_WEATHER, EVENT_OVERRIDE
+)
 from src.scheduler.automation_overrides import AutomationOverrides
 from src.scheduler.solar_calculator import SolarCalculator
 from src.scheduler.schedule_types import Schedule, parse_schedules
@@ -21,6 +33,7 @@ from src.notifications.notification_service import (
     validate_and_test_notifications,
     NotificationValidationError
 )
+from src.notifications.outbox import create_notification_outbox
 
 
 logger = logging.getLogger(__name__)
@@ -32,6 +45,13 @@ class EnhancedScheduler:
     and schedule-based automation.
     """
     
+    # Maximum distance (seconds) between the time a weather snapshot was evaluated
+    # for and the time it is reused at, before it is rebuilt
+    WEATHER_SNAPSHOT_MAX_AGE_SECONDS = 60
+    
+    # Width of the time bucket within which memoized window predictions are reused
+    PREDICTION_BUCKET_MINUTES = 5
+    
     def __init__(self, config: Config, setup_mode: bool = False):
         """
         Initialize enhanced scheduler.
@@ -65,6 +85,15 @@ class EnhancedScheduler:
             self.logger.info("Using multi-device group configuration")
             self.device_manager = DeviceGroupManager(config.devices)
         
+        # Device status shared by the web API, refreshed in the background
+        self.device_status = None
+        self._device_status_task = None
+        if self.device_manager is not None:
+            self.device_status = DeviceStatusSnapshot(
+                self.device_manager,
+                refresh_interval=config.devices.get('status_refresh_seconds', DEFAULT_STATUS_REFRESH_SECONDS)
+            )
+        
         # State management per group
         self.states = {}  # group_name -> StateManager
         
@@ -77,10 +106,30 @@ class EnhancedScheduler:
         self.manual_override = ManualOverrideManager(timezone=tz_name)
         self.logger.info("Manual override manager initialized")
         
+        # State change notifications pushed to web clients (/api/events)
+        self.events = EventBroker(
+            max_subscribers=config.web.get('max_event_streams', DEFAULT_MAX_SUBSCRIBERS),
+            timezone=tz_name
+        )
+        self.manual_override.on_change = self._on_override_change
+        
+        # Runtime/energy history (nothing to record while device control is disabled)
+        history_config = getattr(config, 'history', None)
+        self.history = None
+        if not setup_mode and isinstance(history_config, dict):
+            self.history = create_history_store(history_config, timezone=tz_name)
+        
         # Initialize notification service (will be set during validation)
         self.notification_service = None
         self.notification_service_available = False  # Track if notifications are working
         
+        # Durable outbox shared by every notification service created on (re)load
+        notifications_config = getattr(config, 'notifications', None)
+        self.notification_outbox = None
+        self._outbox_task = None
+        if not setup_mode and isinstance(notifications_config, dict):
+            self.notification_outbox = create_notification_outbox(notifications_config.get('outbox'))
+        
         # Collect all configured device IPs with labels for health check
         configured_devices = {}  # IP -> label mapping
         groups = config.devices.get('groups', {})
@@ -99,7 +148,9 @@ class EnhancedScheduler:
             check_interval_hours=health_check_config.get('interval_hours', 24),
             configured_devices=configured_devices,
             notification_service=None,  # Set after validation
-            max_consecutive_failures=health_check_config.get('max_consecutive_failures', 3)
+            max_consecutive_failures=health_check_config.get('max_consecutive_failures', 3),
+            probe_timeout_seconds=health_check_config.get('probe_timeout_seconds', DEFAULT_MAX_PROBE_TIMEOUT_SECONDS),
+            sweep_interval_hours=health_check_config.get('sweep_interval_hours', DEFAULT_SWEEP_INTERVAL_HOURS)
         )
         
         # Health check HTTP server (optional)
@@ -120,6 +171,26 @@ class EnhancedScheduler:
         # to prevent "Timeout context manager should be used inside a task" errors.
         self.loop = None
         
+        # Gateway used by web threads to run coroutines on self.loop (deadlines, coalescing, metrics)
+        self.loop_bridge = LoopBridge(
+            default_timeout=config.web.get('scheduler_call_timeout_seconds', DEFAULT_CALL_TIMEOUT_SECONDS)
+        )
+        
+        # Weather conditions shared by all groups, rebuilt once per cycle or cache refresh
+        self.weather_snapshot: Optional[WeatherConditionsSnapshot] = None
+        
+        # Summary of the most recent scheduler cycle (per-group action and latency)
+        self.last_cycle_summary: Dict[str, Any] = {}
+        
+        # Memoized predict_group_windows() result as (inputs key, windows). The web
+        # server stamps config_revision with the ConfigManager revision whenever it
+        # changes scheduler inputs (schedules, vacation mode).
+        self.config_revision = 0
+        self._predictions: Optional[Tuple[Tuple, Dict[str, Any]]] = None
+        self._prediction_lock = threading.Lock()
+        self._prediction_horizon_hours: Optional[int] = None
+        self._prediction_refresh_task: Optional[asyncio.Task] = None
+        
         # Timezone for local time calculations
         try:
             tz_name = config.location.get('timezone', 'UTC')
@@ -213,26 +284,96 @@ class EnhancedScheduler:
         self.logger.warning("Unable to access raw config data, using empty dict")
         return {}
     
-    async def initialize(self):
-        """Initialize the scheduler and device connections."""
-        self.logger.info("Initializing Enhanced Scheduler...")
+    def apply_config_changes(
+        self,
+        config: Dict[str, Any],
+        subsystems: Iterable[str],
+        groups: Iterable[str] = ()
+    ):
+        """
+        Hot-reload configuration subsystems that changed at runtime.
         
-        # Validate and initialize notification service
-        self.logger.info("=" * 80)
-        self.logger.info("NOTIFICATION SERVICE INITIALIZATION")
-        self.logger.info("=" * 80)
+        Called from web threads after a configuration update. Schedules for the
+        given groups are all parsed first, so an invalid schedule raises before
+        anything changes; the parsed schedules and the new sections are then
+        applied together on the scheduler loop. Thresholds invalidate the shared
+        weather snapshot and notifications re-create the notification service.
+        Everything else still requires a restart.
         
-        notifications_config = self.config.notifications
-        test_on_startup = notifications_config.get('test_on_startup', False)
+        Args:
+            config: New full configuration (including secrets)
+            subsystems: Changed subsystems ('schedules', 'thresholds', 'notifications')
+            groups: Groups whose schedules changed
+            
+        Raises:
+            ValueError: If any changed schedule is invalid (nothing is applied)
+        """
+        subsystems = set(subsystems)
         
-        self.logger.info(f"Test on startup: {test_on_startup}")
+        schedules = {}
+        if 'schedules' in subsystems:
+            groups_config = config.get('devices', {}).get('groups', {})
+            for group_name in groups:
+                schedules_config = groups_config.get(group_name, {}).get('schedules', [])
+                schedules[group_name] = parse_schedules(thaw(schedules_config))
+        
+        sections = {
+            section: thaw(config[section]) if section in config else None
+            for section in ('thresholds', 'notifications') if section in subsystems
+        }
+        
+        loop = self.loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._apply_config_changes, schedules, sections)
+                return
+            except RuntimeError:
+                # Loop already closed (shutting down)
+                pass
+        self._apply_config_changes(schedules, sections)
+    
+    def _apply_config_changes(
+        self,
+        schedules: Dict[str, List[Schedule]],
+        sections: Dict[str, Optional[Dict[str, Any]]]
+    ):
+        """Apply parsed schedules and reloaded sections (runs on the scheduler loop)."""
+        for group_name, group_schedules in schedules.items():
+            self.group_schedules[group_name] = group_schedules
+            self.logger.info(f"Reloaded {len(group_schedules)} schedule(s) for group '{group_name}'")
+        
+        for section, value in sections.items():
+            if value is not None:
+                self.config._config[section] = value
+            else:
+                self.config._config.pop(section, None)
+            self.logger.info(f"Reloaded {section} configuration")
+        
+        if 'thresholds' in sections:
+            self.weather_snapshot = None
+        
+        if 'notifications' in sections and self.loop is not None and not self.loop.is_closed():
+            self.loop.create_task(self._initialize_notifications())
+        
+        self.schedule_prediction_refresh()
+    
+    async def _initialize_notifications(self, send_test: bool = False):
+        """
+        Validate the notification configuration and (re)create the notification service.
+        
+        Failures never raise: notifications are disabled and the scheduler keeps running.
+        
+        Args:
+            send_test: Whether to send a test notification after validation
+        """
+        notifications_config = self.config.notifications
         
         try:
             # Validate notification configuration and test connectivity
             success, notification_service = await validate_and_test_notifications(
                 notifications_config,
                 test_connectivity=True,
-                send_test=test_on_startup
+                send_test=send_test
             )
             
             if not success:
@@ -256,10 +397,23 @@ class EnhancedScheduler:
                 # DO NOT CRASH - just disable notifications
                 notification_service = None
             
-            self.notification_service = notification_service
+            if self.notification_outbox:
+                if notification_service:
+                    outbox_config = notifications_config.get('outbox') if isinstance(notifications_config, dict) else None
+                    self.notification_outbox.configure(outbox_config)
+                    notification_service.outbox = self.notification_outbox
+                # Detach from the previous service before it is closed; queued
+                # entries wait until a valid configuration is loaded
+                self.notification_outbox.service = notification_service
+            
+            previous_service, self.notification_service = self.notification_service, notification_service
+            if previous_service is not None and previous_service is not notification_service:
+                previous_service.close()
             
             # Update health check service with validated notification service
             self.health_check.notification_service = notification_service
+            if self.weather is not None:
+                self.weather.notification_service = notification_service
             
             if notification_service and notification_service.is_enabled():
                 self.logger.info(f"✓ Notification service initialized with {len(notification_service.providers)} provider(s)")
@@ -274,9 +428,27 @@ class EnhancedScheduler:
             self.logger.error("Notification initialization failed - notifications will be DISABLED.")
             self.logger.error("Fix notification configuration to enable notifications.")
             
+            if self.notification_outbox:
+                self.notification_outbox.service = None
+            if self.notification_service is not None:
+                self.notification_service.close()
             self.notification_service = None
             self.notification_service_available = False
             self.health_check.notification_service = None
+    
+    async def initialize(self):
+        """Initialize the scheduler and device connections."""
+        self.logger.info("Initializing Enhanced Scheduler...")
+        
+        # Validate and initialize notification service
+        self.logger.info("=" * 80)
+        self.logger.info("NOTIFICATION SERVICE INITIALIZATION")
+        self.logger.info("=" * 80)
+        
+        test_on_startup = self.config.notifications.get('test_on_startup', False)
+        self.logger.info(f"Test on startup: {test_on_startup}")
+        
+        await self._initialize_notifications(send_test=test_on_startup)
         
         self.logger.info("=" * 80)
         
@@ -477,6 +649,148 @@ class EnhancedScheduler:
             self.logger.debug(f"Group '{group_name}': Using legacy automation logic")
             return await self._should_turn_on_legacy(group_name, now_local)
     
+    def _weather_cache_version(self) -> Optional[str]:
+        """
+        Get a version marker for the weather cache (its fetched_at timestamp).
+        
+        Returns:
+            fetched_at string of the cached forecast, or None if unavailable
+        """
+        cache = getattr(self.weather, 'cache', None)
+        cache_data = getattr(cache, 'cache_data', None)
+        if isinstance(cache_data, dict):
+            return cache_data.get('fetched_at')
+        return None
+    
+    @coalesced
+    async def get_weather_snapshot(
+        self,
+        now_local: Optional[datetime] = None,
+        force_refresh: bool = False
+    ) -> WeatherConditionsSnapshot:
+        """
+        Get the shared weather conditions snapshot, rebuilding it only when needed.
+        
+        The snapshot is reused while the weather cache has not been refreshed and
+        now_local is within WEATHER_SNAPSHOT_MAX_AGE_SECONDS of the time it was
+        evaluated for. The scheduler forces a rebuild at the start of every cycle.
+        
+        Args:
+            now_local: Local time to evaluate conditions for (defaults to now)
+            force_refresh: Rebuild the snapshot even if the cached one is reusable
+            
+        Returns:
+            WeatherConditionsSnapshot shared by all groups
+        """
+        if now_local is None:
+            now_local = self._get_local_now()
+        
+        snapshot = self.weather_snapshot
+        if (
+            not force_refresh
+            and snapshot is not None
+            and snapshot.cache_version == self._weather_cache_version()
+            and snapshot.age_seconds(now_local) <= self.WEATHER_SNAPSHOT_MAX_AGE_SECONDS
+        ):
+            return snapshot
+        
+        snapshot = await self._build_weather_snapshot(now_local)
+        self.weather_snapshot = snapshot
+        return snapshot
+    
+    async def _build_weather_snapshot(self, now_local: datetime) -> WeatherConditionsSnapshot:
+        """
+        Read current conditions, precipitation and black ice risk from the weather service.
+        
+        Args:
+            now_local: Local time to evaluate lead times against
+            
+        Returns:
+            Newly built WeatherConditionsSnapshot
+        """
+        if not (self.weather_enabled and self.weather):
+            return WeatherConditionsSnapshot(evaluated_at=now_local, weather_enabled=False)
+        
+        cache_version = self._weather_cache_version()
+        
+        # Check if weather service is offline
+        weather_offline = self.weather.is_offline()
+        if weather_offline:
+            return WeatherConditionsSnapshot(
+                evaluated_at=now_local,
+                cache_version=cache_version,
+                weather_offline=True
+            )
+        
+        try:
+            conditions = await self.weather.get_current_conditions()
+            if not conditions:
+                return WeatherConditionsSnapshot(evaluated_at=now_local, cache_version=cache_version)
+            
+            temp_f, precip_mm = conditions
+            raw_config = self._get_raw_config()
+            thresholds = raw_config.get('thresholds', {})
+            forecast_hours = self.config.scheduler.get('forecast_hours', 12)
+            
+            # Check for precipitation in forecast
+            forecast_result = await self.weather.check_precipitation_forecast(
+                hours_ahead=forecast_hours,
+                temperature_threshold_f=999  # We'll check temp in schedule conditions
+            )
+            
+            precip_active = False
+            precip_time = None
+            if forecast_result and forecast_result != (False, None, None):
+                has_precip, precip_time, _ = forecast_result
+                # Consider precipitation active if expected within configured lead time
+                if has_precip and precip_time:
+                    lead_time_minutes = thresholds.get('lead_time_minutes', 60)
+                    time_to_precip = (precip_time - now_local).total_seconds() / 60
+                    precip_active = time_to_precip <= lead_time_minutes
+            
+            # Check for black ice risk if enabled
+            black_ice_risk = False
+            black_ice_time = None
+            black_ice_config = thresholds.get('black_ice_detection', {})
+            if black_ice_config.get('enabled', True):
+                try:
+                    black_ice_result = await self.weather.check_black_ice_risk(
+                        hours_ahead=forecast_hours,
+                        temperature_max_f=black_ice_config.get('temperature_max_f', 36.0),
+                        dew_point_spread_f=black_ice_config.get('dew_point_spread_f', 4.0),
+                        humidity_min_percent=black_ice_config.get('humidity_min_percent', 80.0)
+                    )
+                    
+                    if black_ice_result and black_ice_result != (False, None, None, None):
+                        has_risk, risk_time, risk_temp, risk_dewpoint = black_ice_result
+                        # Consider black ice risk active if expected within 60 minutes
+                        if has_risk and risk_time:
+                            time_to_risk = (risk_time - now_local).total_seconds() / 60
+                            if time_to_risk <= 60:
+                                black_ice_risk = True
+                                black_ice_time = risk_time
+                                self.logger.info(
+                                    f"BLACK ICE RISK DETECTED: "
+                                    f"temp={risk_temp}°F, dewpoint={risk_dewpoint}°F at {risk_time}"
+                                )
+                except Exception as e:
+                    self.logger.warning(f"Failed to check black ice risk: {e}")
+            
+            return WeatherConditionsSnapshot(
+                evaluated_at=now_local,
+                cache_version=cache_version,
+                available=True,
+                temperature_f=temp_f,
+                precipitation_mm=precip_mm,
+                precipitation_active=precip_active,
+                precipitation_time=precip_time,
+                black_ice_risk=black_ice_risk,
+                black_ice_time=black_ice_time
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to get weather conditions: {e}")
+            return WeatherConditionsSnapshot(evaluated_at=now_local, cache_version=cache_version)
+    
     async def _gather_weather_conditions(
         self,
         group_name: str,
@@ -486,6 +800,9 @@ class EnhancedScheduler:
         """
         Gather current weather conditions for schedule evaluation.
         
+        Conditions come from the shared per-cycle WeatherConditionsSnapshot, so
+        the weather service is consulted once per cycle rather than once per group.
+        
         Args:
             group_name: Name of the device group (for logging context)
             now_local: Current local time (for precipitation lead-time calculation)
@@ -499,74 +816,8 @@ class EnhancedScheduler:
                 - precipitation_active: Whether precipitation is active/imminent
                 - black_ice_risk: Whether black ice risk is detected (only if include_black_ice=True)
         """
-        weather_conditions = None
-        weather_offline = False
-        
-        if self.weather_enabled and self.weather:
-            # Check if weather service is offline
-            weather_offline = self.weather.is_offline()
-            
-            if not weather_offline:
-                try:
-                    conditions = await self.weather.get_current_conditions()
-                    if conditions:
-                        temp_f, precip_mm = conditions
-                        # Check for precipitation in forecast
-                        forecast_result = await self.weather.check_precipitation_forecast(
-                            hours_ahead=self.config.scheduler.get('forecast_hours', 12),
-                            temperature_threshold_f=999  # We'll check temp in schedule conditions
-                        )
-                        
-                        precip_active = False
-                        if forecast_result and forecast_result != (False, None, None):
-                            has_precip, precip_time, _ = forecast_result
-                            # Consider precipitation active if expected within configured lead time
-                            if has_precip and precip_time:
-                                raw_config = self._get_raw_config()
-                                thresholds = raw_config.get('thresholds', {})
-                                lead_time_minutes = thresholds.get('lead_time_minutes', 60)
-                                time_to_precip = (precip_time - now_local).total_seconds() / 60
-                                precip_active = time_to_precip <= lead_time_minutes
-                        
-                        # Check for black ice risk if enabled and requested
-                        black_ice_risk = False
-                        if include_black_ice:
-                            raw_config = self._get_raw_config()
-                            thresholds = raw_config.get('thresholds', {})
-                            black_ice_config = thresholds.get('black_ice_detection', {})
-                            
-                            if black_ice_config.get('enabled', True):
-                                try:
-                                    black_ice_result = await self.weather.check_black_ice_risk(
-                                        hours_ahead=self.config.scheduler.get('forecast_hours', 12),
-                                        temperature_max_f=black_ice_config.get('temperature_max_f', 36.0),
-                                        dew_point_spread_f=black_ice_config.get('dew_point_spread_f', 4.0),
-                                        humidity_min_percent=black_ice_config.get('humidity_min_percent', 80.0)
-                                    )
-                                    
-                                    if black_ice_result and black_ice_result != (False, None, None, None):
-                                        has_risk, risk_time, risk_temp, risk_dewpoint = black_ice_result
-                                        # Consider black ice risk active if expected within 60 minutes
-                                        if has_risk and risk_time:
-                                            time_to_risk = (risk_time - now_local).total_seconds() / 60
-                                            if time_to_risk <= 60:
-                                                black_ice_risk = True
-                                                self.logger.info(
-                                                    f"BLACK ICE RISK DETECTED for group '{group_name}': "
-                                                    f"temp={risk_temp}°F, dewpoint={risk_dewpoint}°F at {risk_time}"
-                                                )
-                                except Exception as e:
-                                    self.logger.warning(f"Failed to check black ice risk: {e}")
-                        
-                        weather_conditions = {
-                            'temperature_f': temp_f,
-                            'precipitation_active': precip_active,
-                            'black_ice_risk': black_ice_risk
-                        }
-                except Exception as e:
-                    self.logger.warning(f"Failed to get weather conditions: {e}")
-        
-        return (weather_conditions, weather_offline)
+        snapshot = await self.get_weather_snapshot(now_local)
+        return (snapshot.get_conditions(include_black_ice=include_black_ice), snapshot.weather_offline)
     
     async def _should_turn_on_unified(
         self, 
@@ -941,8 +1192,20 @@ class EnhancedScheduler:
         
         return False
     
-    async def run_cycle_multi_device(self):
-        """Run one scheduler cycle for multi-device configuration."""
+    async def run_cycle_multi_device(self) -> Dict[str, Any]:
+        """
+        Run one scheduler cycle for multi-device configuration.
+        
+        Groups are evaluated concurrently by default (scheduler.concurrent_groups).
+        At most scheduler.max_concurrent_groups groups perform device I/O at the
+        same time, and each group is bounded by scheduler.group_timeout_seconds so
+        a group with unreachable plugs cannot hold up the others. Set
+        concurrent_groups to false to process groups one at a time.
+        
+        Returns:
+            Cycle summary dictionary with total duration and per-group results
+            (action, duration_ms, error). Also stored in self.last_cycle_summary.
+        """
         self.logger.info("=" * 60)
         self.logger.info("Starting multi-device scheduler cycle")
         self.logger.info("=" * 60)
@@ -950,65 +1213,203 @@ class EnhancedScheduler:
         # Skip in setup mode
         if not self.device_manager:
             self.logger.warning("Device manager not available (setup mode) - skipping cycle")
+            return {}
+        
+        scheduler_config = self.config.scheduler
+        concurrent = scheduler_config.get('concurrent_groups', True)
+        max_concurrent = max(1, int(scheduler_config.get('max_concurrent_groups', 4)))
+        group_timeout = scheduler_config.get('group_timeout_seconds', 120)
+        
+        cycle_start = time.monotonic()
+        started_at = datetime.now(self.timezone)
+        group_names = self.device_manager.get_all_groups()
+        
+        # Evaluate weather once for the whole cycle; every group shares this snapshot
+        await self.get_weather_snapshot(force_refresh=True)
+        
+        if concurrent and len(group_names) > 1:
+            semaphore = asyncio.Semaphore(max_concurrent)
+            
+            async def _bounded(group_name: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._run_group_cycle(group_name, group_timeout)
+            
+            group_results = await asyncio.gather(
+                *[_bounded(group_name) for group_name in group_names]
+            )
+        else:
+            group_results = []
+            for group_name in group_names:
+                group_results.append(await self._run_group_cycle(group_name, group_timeout))
+        
+        summary = {
+            'started_at': started_at.isoformat(),
+            'mode': 'concurrent' if concurrent else 'sequential',
+            'duration_ms': round((time.monotonic() - cycle_start) * 1000, 1),
+            'groups': {result['group']: result for result in group_results}
+        }
+        self.last_cycle_summary = summary
+        self.events.publish(EVENT_CYCLE, summary)
+        self.schedule_prediction_refresh()
+        await self._record_history(group_results)
+        
+        failed = [r['group'] for r in group_results if r['error']]
+        self.logger.info(
+            f"Multi-device scheduler cycle completed in {summary['duration_ms']:.0f}ms "
+            f"({len(group_results)} group(s), {len(failed)} failed, mode={summary['mode']})"
+        )
+        for result in group_results:
+            self.logger.info(
+                f"  {result['group']}: {result['action']} in {result['duration_ms']:.0f}ms"
+                + (f" (error: {result['error']})" if result['error'] else "")
+            )
+        
+        return summary
+    
+    async def _record_history(self, group_results: List[Dict[str, Any]]):
+        """
+        Record one history reading per group for this cycle and write them out.
+        
+        Args:
+            group_results: Per-group results from the cycle
+        """
+        if not self.history:
             return
         
-        for group_name in self.device_manager.get_all_groups():
-            try:
-                self.logger.info(f"Processing group: {group_name}")
-                state = self.states[group_name]
-                
-                # Check for manual override first
-                if self.manual_override.is_active(group_name):
-                    override_action = self.manual_override.get_action(group_name)
-                    override_status = self.manual_override.get_status(group_name)
-                    expires_at = override_status.get('expires_at', 'unknown')
-                    
-                    self.logger.info(f"  Manual override active: {override_action} (expires: {expires_at})")
-                    
-                    # Check if a schedule boundary should clear the override
-                    should_clear = await self._should_schedule_clear_override(group_name, override_action)
-                    if should_clear:
-                        self.logger.info(f"  Schedule boundary detected - clearing manual override")
-                        self.manual_override.clear_override(group_name)
-                        # Continue with normal scheduling logic below
-                    else:
-                        self.logger.info(f"  Skipping automatic scheduling for this group")
-                        continue
-                
-                # Get current group state
-                group_is_on = await self.device_manager.get_group_state(group_name)
-                self.logger.info(f"  Current state: {'ON' if group_is_on else 'OFF'}")
-                
-                if group_is_on:
-                    # Check if should turn off
-                    should_off = await self.should_turn_off_group(group_name)
-                    
-                    if should_off:
-                        self.logger.info(f"  DECISION: Turn OFF group '{group_name}'")
-                        await self.device_manager.turn_off_group(group_name)
-                        state.mark_turned_off()
-                        state.start_cooldown()
-                        self.logger.info(f"  ✓ Group '{group_name}' turned OFF")
-                    else:
-                        runtime_hours = state.get_current_runtime_hours()
-                        self.logger.info(f"  DECISION: Keep ON (runtime: {runtime_hours:.2f}h)")
+        snapshot = self.weather_snapshot
+        temperature_f = snapshot.temperature_f if snapshot and snapshot.available else None
+        groups_config = self.config.devices.get('groups', {})
+        
+        try:
+            for result in group_results:
+                group_name = result['group']
+                action = result['action']
+                if action in ('turned_on', 'keep_on'):
+                    is_on = True
+                elif action in ('turned_off', 'keep_off'):
+                    is_on = False
+                elif action == 'override':
+                    is_on = self.manual_override.get_action(group_name) == 'on'
                 else:
-                    # Check if should turn on
-                    should_on = await self.should_turn_on_group(group_name)
-                    
-                    if should_on:
-                        self.logger.info(f"  DECISION: Turn ON group '{group_name}'")
-                        await self.device_manager.turn_on_group(group_name)
-                        state.mark_turned_on()
-                        self.logger.info(f"  ✓ Group '{group_name}' turned ON")
-                    else:
-                        self.logger.info(f"  DECISION: Keep OFF")
+                    continue  # State unknown (error or timeout)
+                
+                power_watts = (groups_config.get(group_name) or {}).get('power_watts')
+                self.history.record_reading(
+                    group_name,
+                    is_on,
+                    temperature_f=temperature_f,
+                    power_watts=float(power_watts) if power_watts is not None else None
+                )
             
-            except Exception as e:
-                self.logger.error(f"Error processing group '{group_name}': {e}")
-                self.logger.exception("Full traceback:")
+            await asyncio.to_thread(self.history.flush)
+        except Exception as e:
+            self.logger.warning(f"Failed to record history: {e}")
+    
+    async def _run_group_cycle(self, group_name: str, timeout_seconds: Optional[float]) -> Dict[str, Any]:
+        """
+        Process a single group within a scheduler cycle, isolating its failures.
+        
+        Args:
+            group_name: Name of the group to process
+            timeout_seconds: Maximum time allowed for the group (None or 0 disables)
+            
+        Returns:
+            Per-group result dictionary with group, action, duration_ms and error
+        """
+        start = time.monotonic()
+        result = {'group': group_name, 'action': 'none', 'duration_ms': 0.0, 'error': None}
+        
+        try:
+            if timeout_seconds:
+                result['action'] = await asyncio.wait_for(
+                    self._process_group(group_name), timeout=timeout_seconds
+                )
+            else:
+                result['action'] = await self._process_group(group_name)
+        except asyncio.TimeoutError:
+            result['action'] = 'error'
+            result['error'] = f"Timed out after {timeout_seconds}s"
+            self.logger.error(f"Group '{group_name}' timed out after {timeout_seconds}s")
+        except Exception as e:
+            result['action'] = 'error'
+            result['error'] = str(e)
+            self.logger.error(f"Error processing group '{group_name}': {e}")
+            self.logger.exception("Full traceback:")
+        
+        result['duration_ms'] = round((time.monotonic() - start) * 1000, 1)
+        return result
+    
+    async def _process_group(self, group_name: str) -> str:
+        """
+        Evaluate and apply the desired state for one group.
+        
+        Args:
+            group_name: Name of the group to process
+            
+        Returns:
+            Action taken: 'override', 'turned_on', 'turned_off', 'keep_on' or 'keep_off'
+        """
+        self.logger.info(f"Processing group: {group_name}")
+        state = self.states[group_name]
+        
+        # Check for manual override first
+        if self.manual_override.is_active(group_name):
+            override_action = self.manual_override.get_action(group_name)
+            override_status = self.manual_override.get_status(group_name)
+            expires_at = override_status.get('expires_at', 'unknown')
+            
+            self.logger.info(
+                f"  [{group_name}] Manual override active: {override_action} (expires: {expires_at})"
+            )
+            
+            # Check if a schedule boundary should clear the override
+            should_clear = await self._should_schedule_clear_override(group_name, override_action)
+            if should_clear:
+                self.logger.info(f"  [{group_name}] Schedule boundary detected - clearing manual override")
+                self.manual_override.clear_override(group_name)
+                # Continue with normal scheduling logic below
+            else:
+                self.logger.info(f"  [{group_name}] Skipping automatic scheduling for this group")
+                return 'override'
+        
+        # Get current group state
+        group_is_on = await self.device_manager.get_group_state(group_name)
+        self.logger.info(f"  [{group_name}] Current state: {'ON' if group_is_on else 'OFF'}")
+        
+        if group_is_on:
+            # Check if should turn off
+            should_off = await self.should_turn_off_group(group_name)
+            
+            if should_off:
+                self.logger.info(f"  [{group_name}] DECISION: Turn OFF group '{group_name}'")
+                await self.device_manager.turn_off_group(group_name)
+                state.mark_turned_off()
+                state.start_cooldown()
+                if self.history:
+                    self.history.record_transition(group_name, False)
+                self._publish_devices_event({'group': group_name, 'state': 'off', 'source': 'scheduler'})
+                self.logger.info(f"  ✓ Group '{group_name}' turned OFF")
+                return 'turned_off'
+            
+            runtime_hours = state.get_current_runtime_hours()
+            self.logger.info(f"  [{group_name}] DECISION: Keep ON (runtime: {runtime_hours:.2f}h)")
+            return 'keep_on'
         
-        self.logger.info("Multi-device scheduler cycle completed")
+        # Check if should turn on
+        should_on = await self.should_turn_on_group(group_name)
+        
+        if should_on:
+            self.logger.info(f"  [{group_name}] DECISION: Turn ON group '{group_name}'")
+            await self.device_manager.turn_on_group(group_name)
+            state.mark_turned_on()
+            if self.history:
+                self.history.record_transition(group_name, True)
+            self._publish_devices_event({'group': group_name, 'state': 'on', 'source': 'scheduler'})
+            self.logger.info(f"  ✓ Group '{group_name}' turned ON")
+            return 'turned_on'
+        
+        self.logger.info(f"  [{group_name}] DECISION: Keep OFF")
+        return 'keep_off'
     
     async def _weather_fetch_loop(self):
         """Background task to fetch weather data at regular intervals."""
@@ -1040,11 +1441,15 @@ class EnhancedScheduler:
                     pass
                 
                 # Fetch weather forecast
+                cache_version = self._weather_cache_version()
                 success = await self.weather.fetch_and_cache_forecast()
                 
                 if not success:
                     # Update retry interval with exponential backoff
                     self.weather.update_retry_interval()
+                elif self._weather_cache_version() != cache_version:
+                    self.events.publish(EVENT_WEATHER, {'fetched_at': self._weather_cache_version()})
+                    self.schedule_prediction_refresh()
                 
         except asyncio.CancelledError:
             self.logger.info("Weather fetch loop cancelled")
@@ -1053,6 +1458,7 @@ class EnhancedScheduler:
             self.logger.error(f"Error in weather fetch loop: {type(e).__name__}: {e}")
             raise
     
+    @coalesced
     async def get_device_expectations(self):
         """
         Get device expectations for all configured device groups.
@@ -1096,9 +1502,11 @@ class EnhancedScheduler:
                     self.logger.warning(f"Could not determine expected state for group '{group_name}': {e}")
                     expected_state = "unknown"
                 
-                # Get actual current state from physical devices
+                # Get actual current state from the shared snapshot, or the physical devices
                 try:
-                    actual_group_state = await self.device_manager.get_group_state(group_name)
+                    actual_group_state = self.device_status.group_is_on(group_name) if self.device_status else None
+                    if actual_group_state is None:
+                        actual_group_state = await self.device_manager.get_group_state(group_name)
                     current_state = "on" if actual_group_state else "off"
                 except Exception as e:
                     self.logger.warning(f"Could not get actual device state for group '{group_name}': {e}")
@@ -1122,7 +1530,7 @@ class EnhancedScheduler:
                         
                         # Check if schedule is for today
                         current_day = now_local.isoweekday()
-                        if current_day not in schedule.days:
+                        if not schedule.is_active_on_day(current_day):
                             continue
                         
                         try:
@@ -1211,9 +1619,9 @@ class EnhancedScheduler:
         
         return expectations
     
-    def predict_group_windows(self, horizon_hours: int, step_minutes: int) -> Dict[str, Any]:
+    def predict_group_windows(self, horizon_hours: int, step_minutes: Optional[int] = None) -> Dict[str, Any]:
         """
-        Predict per-group ON/OFF windows over the next horizon_hours, stepping in step_minutes increments.
+        Predict per-group ON/OFF windows over the next horizon_hours.
         
         Uses the unified scheduling system (schedules: array) with ScheduleEvaluator to determine
         whether devices should be on or off at a given time, including:
@@ -1221,13 +1629,24 @@ class EnhancedScheduler:
         - Weather conditions (temperature thresholds, precipitation)
         - Day-of-week filtering
         - Priority-based conflict resolution
+        - Manual override expiry
+        
+        Rather than sampling the horizon, this enumerates the instants at which the
+        predicted state can change (schedule and solar edges, midnights, forecast entry
+        boundaries and override expiry) and evaluates state once per interval, so
+        window edges are exact.
+        
+        Results are memoized under _prediction_key() (config revision, weather cache
+        fetch time, vacation mode, overrides and the current time bucket), so repeated
+        calls with unchanged inputs return the cached windows without recomputing.
+        The returned dictionary is shared and must not be modified.
         
         Must NOT talk to devices or external systems.
         Only uses current config, current in-memory weather state, and scheduler-internal helper methods.
         
         Args:
             horizon_hours: Number of hours ahead to predict
-            step_minutes: Time step in minutes for prediction granularity
+            step_minutes: Unused; kept for API compatibility (windows are exact)
             
         Returns:
             Dictionary with per-group windows: {group_name: [window_dict, ...]}
@@ -1236,66 +1655,247 @@ class EnhancedScheduler:
         if not self.device_manager:
             return {}
         
-        result = {}
         now = datetime.now(self.timezone)
+        key = self._prediction_key(horizon_hours, now)
+        self._prediction_horizon_hours = horizon_hours
+        
+        cached = self._predictions
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        # Concurrent callers with the same inputs wait for one computation
+        with self._prediction_lock:
+            cached = self._predictions
+            if cached and cached[0] == key:
+                return cached[1]
+            
+            try:
+                result = self._compute_predicted_windows(now, now + timedelta(hours=horizon_hours))
+            except Exception as e:
+                self.logger.error(f"Error predicting group windows: {e}", exc_info=True)
+                return {}
+            
+            self._predictions = (key, result)
+            return result
+    
+    def _compute_predicted_windows(self, now: datetime, end: datetime) -> Dict[str, Any]:
+        """
+        Compute per-group windows between now and end (uncached).
+        
+        Args:
+            now: Prediction start (timezone-aware)
+            end: Prediction end
+            
+        Returns:
+            Dictionary with per-group windows
+        """
+        result = {}
+        groups = self.device_manager.get_all_groups()
+        weather_points = self._get_forecast_switch_points(now, end)
+        
+        for group_name in groups:
+            group_config = self.device_manager.get_group_config(group_name)
+            if not group_config or not group_config.get('enabled', True):
+                result[group_name] = []
+                continue
+            
+            result[group_name] = self._compute_group_windows(
+                group_name, group_config, now, end, weather_points
+            )
         
+        return result
+    
+    def _prediction_key(self, horizon_hours: int, now: datetime) -> Tuple:
+        """
+        Build the version key of every input that can change window predictions.
+        
+        Covers the config revision (and identity of the parsed schedules), the
+        weather cache fetch time and availability, vacation mode, the manual
+        override version and the current PREDICTION_BUCKET_MINUTES time bucket.
+        
+        Args:
+            horizon_hours: Prediction horizon
+            now: Current time
+            
+        Returns:
+            Hashable key; predictions are recomputed when it changes
+        """
+        # Version counter rather than the override dict itself: this runs on web
+        # and worker threads while the scheduler loop may be removing expired overrides
+        overrides = self.manual_override.version
+        schedules = tuple(
+            (group_name, id(schedules)) for group_name, schedules in self.group_schedules.items()
+        )
+        weather_offline = None
+        if self.weather_enabled and self.weather and hasattr(self.weather, 'is_offline'):
+            weather_offline = bool(self.weather.is_offline())
+        bucket = int(now.timestamp() // (self.PREDICTION_BUCKET_MINUTES * 60))
+        
+        return (
+            horizon_hours,
+            self.config_revision,
+            schedules,
+            self._weather_cache_version(),
+            weather_offline,
+            self.vacation_mode,
+            overrides,
+            bucket
+        )
+    
+    def schedule_prediction_refresh(self):
+        """
+        Recompute memoized window predictions on the scheduler loop's executor.
+        
+        Thread-safe. Does nothing until predictions have been requested at least
+        once (the horizon is taken from the last request) or if a refresh is
+        already running; unchanged inputs make the refresh a cheap key comparison.
+        """
+        loop = self.loop
+        if loop is None or self._prediction_horizon_hours is None:
+            return
         try:
-            groups = self.device_manager.get_all_groups()
+            loop.call_soon_threadsafe(self._start_prediction_refresh)
+        except RuntimeError:
+            # Loop already closed (shutting down)
+            pass
+    
+    def _start_prediction_refresh(self):
+        """Start the background prediction refresh task (runs on the scheduler loop)."""
+        task = self._prediction_refresh_task
+        if task and not task.done():
+            return
+        self._prediction_refresh_task = asyncio.create_task(
+            asyncio.to_thread(self.predict_group_windows, self._prediction_horizon_hours)
+        )
+    
+    def _publish_devices_event(self, payload: Dict[str, Any]):
+        """Publish a group switch and refresh the device status snapshot soon."""
+        self.events.publish(EVENT_DEVICES, payload)
+        if self.device_status:
+            self.device_status.request_refresh()
+    
+    def _on_override_change(self, group_name: str, override: Optional[Dict[str, Any]]):
+        """Publish a manual override change and refresh predictions that depend on it."""
+        self.events.publish(EVENT_OVERRIDE, {'group': group_name, 'override': override})
+        self.schedule_prediction_refresh()
+    
+    def _get_forecast_switch_points(self, start: datetime, end: datetime) -> List[datetime]:
+        """
+        Get the instants at which the cached forecast entry used for predictions changes.
+        
+        Args:
+            start: Range start (exclusive)
+            end: Range end (exclusive)
             
-            for group_name in groups:
-                group_config = self.device_manager.get_group_config(group_name)
-                if not group_config or not group_config.get('enabled', True):
-                    result[group_name] = []
-                    continue
-                
-                windows = []
-                current_window = None
-                
-                # Step through the time horizon
-                for step in range(0, int(horizon_hours * 60 / step_minutes) + 1):
-                    check_time = now + timedelta(minutes=step * step_minutes)
-                    
-                    # Determine if group should be ON at this time
-                    should_be_on, reason = self._predict_group_state_at_time(
-                        group_name, group_config, check_time
-                    )
-                    
-                    state = "on" if should_be_on else "off"
-                    
-                    # Coalesce adjacent steps with same state into windows
-                    if current_window is None:
-                        # Start first window
-                        current_window = {
-                            'start': check_time.isoformat(),
-                            'end': check_time.isoformat(),
-                            'state': state,
-                            'reason': reason,
-                            'details': {}
-                        }
-                    elif current_window['state'] == state and current_window['reason'] == reason:
-                        # Extend current window
-                        current_window['end'] = check_time.isoformat()
-                    else:
-                        # State or reason changed, close current window and start new one
-                        windows.append(current_window)
-                        current_window = {
-                            'start': check_time.isoformat(),
-                            'end': check_time.isoformat(),
-                            'state': state,
-                            'reason': reason,
-                            'details': {}
-                        }
-                
-                # Add final window
-                if current_window is not None:
-                    windows.append(current_window)
-                
-                result[group_name] = windows
+        Returns:
+            Time-ordered list of datetimes (empty if weather is unavailable)
+        """
+        if not self.weather_enabled or not self.weather:
+            return []
+        
+        cache = getattr(self.weather, 'cache', None)
+        if not cache:
+            return []
         
+        try:
+            points = cache.get_forecast_switch_points(start, end)
         except Exception as e:
-            self.logger.error(f"Error predicting group windows: {e}", exc_info=True)
+            self.logger.debug(f"Could not get forecast switch points: {e}")
+            return []
         
-        return result
+        return points if isinstance(points, list) else []
+    
+    def _get_override_expiry(self, group_name: str, now: datetime) -> Optional[Tuple[str, datetime]]:
+        """
+        Get the action and expiry of a group's active manual override.
+        
+        Reads the override record without triggering expiry cleanup.
+        
+        Args:
+            group_name: Name of the group
+            now: Current time (timezone-aware)
+            
+        Returns:
+            Tuple of (action, expires_at), or None if no override is active
+        """
+        override = self.manual_override.state.get(group_name)
+        if not isinstance(override, dict):
+            return None
+        
+        try:
+            expires_at = datetime.fromisoformat(override['expires_at'])
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=self.timezone)
+        except (KeyError, TypeError, ValueError):
+            return None
+        
+        if expires_at <= now:
+            return None
+        
+        return override.get('action'), expires_at
+    
+    def _compute_group_windows(
+        self,
+        group_name: str,
+        group_config: Dict[str, Any],
+        start: datetime,
+        end: datetime,
+        weather_points: List[datetime]
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute exact ON/OFF windows for one group between start and end.
+        
+        Args:
+            group_name: Name of the group
+            group_config: Group configuration dictionary
+            start: Window range start (timezone-aware)
+            end: Window range end (timezone-aware)
+            weather_points: Instants at which forecast inputs change
+            
+        Returns:
+            List of coalesced window dicts covering [start, end]
+        """
+        override = self._get_override_expiry(group_name, start)
+        
+        candidates = set(weather_points)
+        schedules = self.group_schedules.get(group_name, [])
+        if schedules and self.schedule_evaluator:
+            candidates.update(
+                self.schedule_evaluator.get_transition_candidates(schedules, start, end)
+            )
+        if override:
+            candidates.add(override[1])
+        
+        edges = [start] + sorted(c for c in candidates if start < c < end) + [end]
+        
+        windows = []
+        for interval_start, interval_end in zip(edges, edges[1:]):
+            # Evaluate inside the interval so boundary conventions don't matter
+            check_time = interval_start + (interval_end - interval_start) / 2
+            
+            if override and check_time < override[1]:
+                should_be_on = override[0] == 'on'
+                reason = "manual_override"
+            else:
+                should_be_on, reason = self._predict_group_state_at_time(
+                    group_name, group_config, check_time
+                )
+            
+            state = "on" if should_be_on else "off"
+            
+            # Coalesce adjacent intervals with same state into windows
+            if windows and windows[-1]['state'] == state and windows[-1]['reason'] == reason:
+                windows[-1]['end'] = interval_end.isoformat()
+            else:
+                windows.append({
+                    'start': interval_start.isoformat(),
+                    'end': interval_end.isoformat(),
+                    'state': state,
+                    'reason': reason,
+                    'details': {}
+                })
+        
+        return windows
     
     def _predict_group_state_at_time(
         self, group_name: str, group_config: Dict[str, Any], check_time: datetime
@@ -1393,7 +1993,7 @@ class EnhancedScheduler:
         # No schedules configured for this group
         return (False, "no_schedules_configured")
     
-    def run_coro_in_loop(self, coro):
+    def run_coro_in_loop(self, coro, timeout: Optional[float] = None):
         """
         Execute a coroutine on the scheduler's event loop from another thread.
         
@@ -1402,14 +2002,20 @@ class EnhancedScheduler:
         All kasa device I/O must run on the same asyncio event loop to avoid runtime errors
         such as "Timeout context manager should be used inside a task" and INTERNAL_QUERY_ERROR.
         
+        Calls go through self.loop_bridge: each call has a deadline
+        (web.scheduler_call_timeout_seconds) and is cancelled on the loop when it
+        expires, and concurrent identical reads marked @coalesced share one execution.
+        
         Args:
             coro: Coroutine to execute on the scheduler's event loop
+            timeout: Seconds to wait (default: web.scheduler_call_timeout_seconds)
             
         Returns:
             Result of the coroutine execution
             
         Raises:
             RuntimeError: If the scheduler loop is not initialized
+            SchedulerCallTimeout: If the call does not complete before the deadline
         """
         if self.loop is None:
             raise RuntimeError(
@@ -1417,10 +2023,7 @@ class EnhancedScheduler:
                 "Ensure the scheduler is running before calling this method."
             )
         
-        # Use asyncio.run_coroutine_threadsafe to schedule the coroutine on the scheduler's loop
-        # and block until it completes
-        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
-        return future.result()
+        return self.loop_bridge.run(coro, self.loop, timeout=timeout)
     
     async def run(self):
         """Run the main scheduler loop."""
@@ -1429,6 +2032,9 @@ class EnhancedScheduler:
         self.loop = asyncio.get_running_loop()
         self.logger.info(f"Scheduler event loop initialized: {self.loop}")
         
+        # Outbound HTTP (weather providers, webhooks) shares one pooled session on this loop
+        get_http_pool().attach(self.loop)
+        
         await self.initialize()
         
         # In setup mode, run a minimal idle loop
@@ -1452,6 +2058,8 @@ class EnhancedScheduler:
                     if int(asyncio.get_event_loop().time()) % 300 == 0:
                         self.logger.info("Setup mode active - waiting for credential configuration...")
             finally:
+                await get_http_pool().close()
+                await asyncio.to_thread(state_store.flush)
                 self.logger.info("Scheduler shutdown (setup mode)")
             
             return
@@ -1472,6 +2080,12 @@ class EnhancedScheduler:
             self.logger.info("Starting weather fetch background task...")
             weather_task = asyncio.create_task(self._weather_fetch_loop())
         
+        if self.notification_outbox:
+            self._outbox_task = asyncio.create_task(self.notification_outbox.run())
+        
+        if self.device_status:
+            self._device_status_task = asyncio.create_task(self.device_status.run())
+        
         # Import shutdown event from main
         from main import shutdown_event
         
@@ -1536,6 +2150,26 @@ class EnhancedScheduler:
                 except asyncio.CancelledError:
                     pass
             
+            if self._prediction_refresh_task and not self._prediction_refresh_task.done():
+                self._prediction_refresh_task.cancel()
+            
+            # Undelivered notifications stay in the persisted outbox for the next start
+            if self._outbox_task and not self._outbox_task.done():
+                self._outbox_task.cancel()
+                try:
+                    await self._outbox_task
+                except asyncio.CancelledError:
+                    pass
+            if self.notification_service:
+                self.notification_service.close()
+            
+            if self._device_status_task and not self._device_status_task.done():
+                self._device_status_task.cancel()
+                try:
+                    await self._device_status_task
+                except asyncio.CancelledError:
+                    pass
+            
             # Stop health check service
             await self.health_check.stop()
             
@@ -1545,5 +2179,11 @@ class EnhancedScheduler:
             
             # Close connections
             await self.device_manager.close()
+            await get_http_pool().close()
+            
+            # Persist state changes still waiting for the write-behind flush
+            await asyncio.to_thread(state_store.flush)
+            if self.history:
+                await asyncio.to_thread(self.history.close)
             
             self.logger.info("Scheduler shutdown complete")
@@ -1,11 +1,11 @@
 """State management for tracking runtime and cooldown periods."""
 
-import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from src.state.state_store import state_store
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +32,12 @@ class StateManager:
     
     def _load_state(self):
         """Load state from file."""
-        if not self.state_file.exists():
+        if not state_store.exists(self.state_file):
             logger.info("No existing state file found, starting fresh")
             return
         
         try:
-            with open(self.state_file, 'r') as f:
-                data = json.load(f)
+            data = state_store.read(self.state_file)
             
             self.device_on = data.get('device_on', False)
             
@@ -55,7 +54,7 @@ class StateManager:
             logger.error(f"Error loading state file: {e}, starting fresh")
     
     def _save_state(self):
-        """Save state to file."""
+        """Queue the state for the next write-behind flush (no file I/O here)."""
         try:
             data = {
                 'device_on': self.device_on,
@@ -65,10 +64,7 @@ class StateManager:
                 'last_updated': datetime.now().isoformat()
             }
             
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            logger.debug(f"Saved state to {self.state_file}")
+            state_store.write(self.state_file, data)
         except Exception as e:
             logger.error(f"Error saving state file: {e}")
     
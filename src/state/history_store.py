@@ -0,0 +1,441 @@
+"""Runtime and energy history: append-only time series with hourly and daily rollups."""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+
+from src.state.state_store import DEFAULT_DATABASE_PATH
+
+
+logger = logging.getLogger(__name__)
+
+# Retention defaults: raw readings, then hourly, then daily aggregates
+DEFAULT_RAW_RETENTION_DAYS = 7
+DEFAULT_HOURLY_RETENTION_DAYS = 90
+DEFAULT_DAILY_RETENTION_DAYS = 730
+
+# Minimum time between rollup/retention passes (seconds)
+COMPACTION_INTERVAL_SECONDS = 3600
+
+# 'auto' resolution uses hourly points up to this range, daily beyond it
+AUTO_HOURLY_MAX_DAYS = 14
+
+HISTORY_RESOLUTIONS = ('auto', 'raw', 'hour', 'day')
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS history_transitions ("
+    "group_name TEXT NOT NULL, ts REAL NOT NULL, is_on INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS history_transitions_ts ON history_transitions (ts, group_name)",
+    "CREATE TABLE IF NOT EXISTS history_readings ("
+    "group_name TEXT NOT NULL, ts REAL NOT NULL, is_on INTEGER NOT NULL, "
+    "on_seconds REAL NOT NULL, energy_wh REAL, temperature_f REAL)",
+    "CREATE INDEX IF NOT EXISTS history_readings_ts ON history_readings (ts, group_name)",
+) + tuple(
+    f"CREATE TABLE IF NOT EXISTS history_{table} ("
+    "group_name TEXT NOT NULL, bucket INTEGER NOT NULL, "
+    "on_seconds REAL NOT NULL DEFAULT 0, energy_wh REAL, "
+    "temp_sum REAL, temp_count INTEGER NOT NULL DEFAULT 0, temp_min REAL, temp_max REAL, "
+    "samples INTEGER NOT NULL DEFAULT 0, turn_ons INTEGER NOT NULL DEFAULT 0, "
+    "PRIMARY KEY (bucket, group_name)) WITHOUT ROWID"
+    for table in ('hourly', 'daily')
+)
+
+# Adds an aggregate row into an existing bucket (energy stays NULL only if both sides are NULL)
+_UPSERT_AGGREGATE = (
+    " ON CONFLICT (bucket, group_name) DO UPDATE SET "
+    "on_seconds = on_seconds + excluded.on_seconds, "
+    "energy_wh = CASE WHEN energy_wh IS NULL AND excluded.energy_wh IS NULL THEN NULL "
+    "ELSE coalesce(energy_wh, 0) + coalesce(excluded.energy_wh, 0) END, "
+    "temp_sum = CASE WHEN temp_sum IS NULL AND excluded.temp_sum IS NULL THEN NULL "
+    "ELSE coalesce(temp_sum, 0) + coalesce(excluded.temp_sum, 0) END, "
+    "temp_count = temp_count + excluded.temp_count, "
+    "temp_min = min(coalesce(temp_min, excluded.temp_min), coalesce(excluded.temp_min, temp_min)), "
+    "temp_max = max(coalesce(temp_max, excluded.temp_max), coalesce(excluded.temp_max, temp_max)), "
+    "samples = samples + excluded.samples, "
+    "turn_ons = turn_ons + excluded.turn_ons"
+)
+
+_AGGREGATE_COLUMNS = "group_name, bucket, on_seconds, energy_wh, temp_sum, temp_count, temp_min, temp_max, samples, turn_ons"
+
+
+@dataclass
+class _GroupTrack:
+    """In-memory accounting for a group between readings."""
+    is_on: Optional[bool] = None
+    on_start: Optional[float] = None
+    on_seconds: float = 0.0
+
+
+class HistoryStore:
+    """
+    Per-group on/off transitions and periodic readings in SQLite.
+
+    The scheduler records a transition whenever it switches a group and one
+    reading per group per cycle (on/off state, seconds on since the previous
+    reading, estimated energy and outdoor temperature). Records are buffered
+    in memory and written in one transaction by ``flush()``, which runs off
+    the event loop once per cycle.
+
+    Raw readings and transitions are kept for ``raw_retention_days``, then
+    rolled up into hourly aggregates, which after ``hourly_retention_days``
+    are rolled up into daily aggregates (local calendar days), which are
+    deleted after ``daily_retention_days``. Range queries read the aggregate
+    tiers by their (bucket, group) primary keys and aggregate the recent raw
+    tail on the fly.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, Path] = DEFAULT_DATABASE_PATH,
+        timezone: str = "UTC",
+        raw_retention_days: float = DEFAULT_RAW_RETENTION_DAYS,
+        hourly_retention_days: float = DEFAULT_HOURLY_RETENTION_DAYS,
+        daily_retention_days: float = DEFAULT_DAILY_RETENTION_DAYS
+    ):
+        """
+        Initialize the history store (the database is opened on first use).
+
+        Args:
+            database: SQLite database file (may be shared with the state backend)
+            timezone: Timezone for daily buckets and returned timestamps
+            raw_retention_days: Days of raw readings and transitions to keep
+            hourly_retention_days: Days of hourly aggregates to keep
+            daily_retention_days: Days of daily aggregates to keep
+        """
+        self.database = Path(os.path.abspath(database))
+        self.tz = ZoneInfo(timezone)
+        self.raw_retention_days = raw_retention_days
+        self.hourly_retention_days = hourly_retention_days
+        self.daily_retention_days = daily_retention_days
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._tracks: Dict[str, _GroupTrack] = {}
+        self._pending_transitions: List[Tuple[str, float, int]] = []
+        self._pending_readings: List[Tuple[str, float, int, float, Optional[float], Optional[float]]] = []
+        self._last_compaction = 0.0
+        # Local midnight by 15-minute slot (UTC offsets are multiples of 15 minutes)
+        self._day_starts: Dict[int, int] = {}
+
+    def _local_day(self, ts: float) -> int:
+        """Epoch seconds of local midnight for a timestamp (SQL function local_day)."""
+        quarter = int(ts) // 900
+        day = self._day_starts.get(quarter)
+        if day is None:
+            if len(self._day_starts) > 100_000:
+                self._day_starts.clear()
+            local = datetime.fromtimestamp(quarter * 900, self.tz)
+            day = int(local.replace(hour=0, minute=0, second=0, microsecond=0).timestamp())
+            self._day_starts[quarter] = day
+        return day
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock)."""
+        if self._conn is None:
+            self.database.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.database), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.create_function('local_day', 1, self._local_day, deterministic=True)
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+            logger.info(f"History store opened at {self.database}")
+        return self._conn
+
+    def record_transition(self, group_name: str, is_on: bool, when: Optional[datetime] = None):
+        """
+        Record that a group was switched on or off (buffered until flush).
+
+        Args:
+            group_name: Device group
+            is_on: New state
+            when: Time of the switch (default now)
+        """
+        ts = when.timestamp() if when else time.time()
+        with self._lock:
+            self._transition_locked(group_name, is_on, ts)
+
+    def _transition_locked(self, group_name: str, is_on: bool, ts: float):
+        track = self._tracks.setdefault(group_name, _GroupTrack())
+        if track.is_on == is_on:
+            return
+        if track.is_on and track.on_start is not None:
+            track.on_seconds += max(0.0, ts - track.on_start)
+        track.is_on = is_on
+        track.on_start = ts if is_on else None
+        self._pending_transitions.append((group_name, ts, int(is_on)))
+
+    def record_reading(
+        self,
+        group_name: str,
+        is_on: bool,
+        temperature_f: Optional[float] = None,
+        power_watts: Optional[float] = None,
+        when: Optional[datetime] = None
+    ):
+        """
+        Record a periodic reading for a group (buffered until flush).
+
+        A state different from the last known one is recorded as a transition
+        at the reading time (e.g. a group switched from the Web UI).
+
+        Args:
+            group_name: Device group
+            is_on: Current state
+            temperature_f: Outdoor temperature, if known
+            power_watts: Group load for energy estimates (None if not configured)
+            when: Reading time (default now)
+        """
+        ts = when.timestamp() if when else time.time()
+        with self._lock:
+            track = self._tracks.setdefault(group_name, _GroupTrack())
+            if track.is_on is None:
+                # First reading since startup: nothing is known about the time before it
+                track.is_on = is_on
+                track.on_start = ts if is_on else None
+            elif track.is_on != is_on:
+                self._transition_locked(group_name, is_on, ts)
+
+            if track.is_on and track.on_start is not None:
+                track.on_seconds += max(0.0, ts - track.on_start)
+                track.on_start = ts
+            on_seconds, track.on_seconds = track.on_seconds, 0.0
+
+            energy_wh = on_seconds * power_watts / 3600 if power_watts else None
+            self._pending_readings.append((group_name, ts, int(is_on), on_seconds, energy_wh, temperature_f))
+
+    def flush(self):
+        """Write buffered records in one transaction and run rollups when due."""
+        with self._lock:
+            transitions, self._pending_transitions = self._pending_transitions, []
+            readings, self._pending_readings = self._pending_readings, []
+            if not transitions and not readings:
+                return
+            conn = self._connection()
+            try:
+                conn.execute("BEGIN")
+                conn.executemany("INSERT INTO history_transitions VALUES (?, ?, ?)", transitions)
+                conn.executemany("INSERT INTO history_readings VALUES (?, ?, ?, ?, ?, ?)", readings)
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                with suppress(sqlite3.Error):
+                    conn.execute("ROLLBACK")
+                logger.error(f"Failed to write history ({len(readings)} reading(s)): {e}")
+                return
+
+        if time.monotonic() - self._last_compaction >= COMPACTION_INTERVAL_SECONDS:
+            self.compact()
+
+    def compact(self, now: Optional[datetime] = None):
+        """
+        Roll expired raw data into hourly aggregates, hourly into daily, and drop old days.
+
+        Args:
+            now: Reference time (default now)
+        """
+        now_ts = now.timestamp() if now else time.time()
+        raw_cutoff = int(now_ts - self.raw_retention_days * 86400) // 3600 * 3600
+        hourly_cutoff = self._local_day(now_ts - self.hourly_retention_days * 86400)
+        daily_cutoff = self._local_day(now_ts - self.daily_retention_days * 86400)
+
+        with self._lock:
+            conn = self._connection()
+            try:
+                conn.execute("BEGIN")
+                conn.execute(
+                    f"INSERT INTO history_hourly ({_AGGREGATE_COLUMNS}) "
+                    "SELECT group_name, CAST(ts / 3600 AS INTEGER) * 3600, sum(on_seconds), sum(energy_wh), "
+                    "sum(temperature_f), count(temperature_f), min(temperature_f), max(temperature_f), count(*), 0 "
+                    "FROM history_readings WHERE ts < ? GROUP BY 1, 2" + _UPSERT_AGGREGATE,
+                    (raw_cutoff,)
+                )
+                conn.execute(
+                    f"INSERT INTO history_hourly ({_AGGREGATE_COLUMNS}) "
+                    "SELECT group_name, CAST(ts / 3600 AS INTEGER) * 3600, 0, NULL, NULL, 0, NULL, NULL, 0, count(*) "
+                    "FROM history_transitions WHERE ts < ? AND is_on = 1 GROUP BY 1, 2" + _UPSERT_AGGREGATE,
+                    (raw_cutoff,)
+                )
+                conn.execute("DELETE FROM history_readings WHERE ts < ?", (raw_cutoff,))
+                conn.execute("DELETE FROM history_transitions WHERE ts < ?", (raw_cutoff,))
+
+                conn.execute(
+                    f"INSERT INTO history_daily ({_AGGREGATE_COLUMNS}) "
+                    "SELECT group_name, local_day(bucket), sum(on_seconds), sum(energy_wh), sum(temp_sum), "
+                    "sum(temp_count), min(temp_min), max(temp_max), sum(samples), sum(turn_ons) "
+                    "FROM history_hourly WHERE bucket < ? GROUP BY 1, 2" + _UPSERT_AGGREGATE,
+                    (hourly_cutoff,)
+                )
+                conn.execute("DELETE FROM history_hourly WHERE bucket < ?", (hourly_cutoff,))
+                conn.execute("DELETE FROM history_daily WHERE bucket < ?", (daily_cutoff,))
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                with suppress(sqlite3.Error):
+                    conn.execute("ROLLBACK")
+                logger.error(f"History rollup failed: {e}")
+                return
+            self._last_compaction = time.monotonic()
+        logger.debug("History rollup completed")
+
+    def query(
+        self,
+        start: datetime,
+        end: datetime,
+        group_name: Optional[str] = None,
+        resolution: str = 'auto'
+    ) -> Dict[str, Any]:
+        """
+        Query history for a time range.
+
+        Args:
+            start: Range start (inclusive)
+            end: Range end (exclusive)
+            group_name: Limit to one group (None for all groups)
+            resolution: 'raw' (individual readings), 'hour', 'day' or 'auto'
+                ('hour' up to AUTO_HOURLY_MAX_DAYS, else 'day')
+
+        Returns:
+            Dict with resolution, start, end and per-group points and transitions
+
+        Raises:
+            ValueError: If the resolution is unknown or the range is empty
+        """
+        if resolution not in HISTORY_RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution} (expected one of {', '.join(HISTORY_RESOLUTIONS)})")
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        if end_ts <= start_ts:
+            raise ValueError("History range end must be after start")
+        if resolution == 'auto':
+            resolution = 'hour' if end_ts - start_ts <= AUTO_HOURLY_MAX_DAYS * 86400 else 'day'
+
+        group_filter = " AND group_name = ?" if group_name else ""
+        group_args = (group_name,) if group_name else ()
+
+        with self._lock:
+            conn = self._connection()
+            if resolution == 'raw':
+                rows = conn.execute(
+                    "SELECT group_name, ts, on_seconds, energy_wh, temperature_f, temperature_f IS NOT NULL, "
+                    "temperature_f, temperature_f, 1, 0 FROM history_readings "
+                    f"WHERE ts >= ? AND ts < ?{group_filter} ORDER BY group_name, ts",
+                    (start_ts, end_ts) + group_args
+                ).fetchall()
+            else:
+                rows = self._query_buckets(conn, resolution, start_ts, end_ts, group_filter, group_args)
+            transitions = conn.execute(
+                "SELECT group_name, ts, is_on FROM history_transitions "
+                f"WHERE ts >= ? AND ts < ?{group_filter} ORDER BY group_name, ts",
+                (start_ts, end_ts) + group_args
+            ).fetchall()
+
+        groups: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        for name, bucket, on_seconds, energy_wh, temp_sum, temp_count, temp_min, temp_max, samples, turn_ons in rows:
+            groups.setdefault(name, {'points': [], 'transitions': []})['points'].append({
+                'time': datetime.fromtimestamp(bucket, self.tz).isoformat(),
+                'on_seconds': round(on_seconds, 1),
+                'energy_wh': round(energy_wh, 2) if energy_wh is not None else None,
+                'temperature_f': {
+                    'avg': round(temp_sum / temp_count, 1),
+                    'min': temp_min,
+                    'max': temp_max
+                } if temp_count else None,
+                'samples': samples,
+                'turn_ons': turn_ons
+            })
+        for name, ts, is_on in transitions:
+            groups.setdefault(name, {'points': [], 'transitions': []})['transitions'].append({
+                'time': datetime.fromtimestamp(ts, self.tz).isoformat(),
+                'state': 'on' if is_on else 'off'
+            })
+
+        return {
+            'resolution': resolution,
+            'start': datetime.fromtimestamp(start_ts, self.tz).isoformat(),
+            'end': datetime.fromtimestamp(end_ts, self.tz).isoformat(),
+            'groups': groups
+        }
+
+    def _query_buckets(
+        self,
+        conn: sqlite3.Connection,
+        resolution: str,
+        start_ts: float,
+        end_ts: float,
+        group_filter: str,
+        group_args: Tuple[str, ...]
+    ) -> List[Tuple]:
+        """Aggregate all tiers that overlap the range into hourly or daily buckets."""
+        if resolution == 'hour':
+            bucket_of = "CAST({} / 3600 AS INTEGER) * 3600"
+            tiers = [("history_hourly", start_ts // 3600 * 3600)]
+        else:
+            bucket_of = "local_day({})"
+            # Hourly rows are re-bucketed into days; daily rows are already days
+            tiers = [("history_daily", self._local_day(start_ts)), ("history_hourly", self._local_day(start_ts))]
+
+        parts, args = [], []
+        for table, tier_start in tiers:
+            parts.append(
+                f"SELECT group_name, {bucket_of.format('bucket')} AS b, on_seconds, energy_wh, temp_sum, "
+                f"temp_count, temp_min, temp_max, samples, turn_ons FROM {table} "
+                f"WHERE bucket >= ? AND bucket < ?{group_filter}"
+            )
+            args.extend((tier_start, end_ts) + group_args)
+        parts.append(
+            f"SELECT group_name, {bucket_of.format('ts')}, on_seconds, energy_wh, temperature_f, "
+            "temperature_f IS NOT NULL, temperature_f, temperature_f, 1, 0 FROM history_readings "
+            f"WHERE ts >= ? AND ts < ?{group_filter}"
+        )
+        args.extend((start_ts, end_ts) + group_args)
+        parts.append(
+            f"SELECT group_name, {bucket_of.format('ts')}, 0, NULL, NULL, 0, NULL, NULL, 0, 1 "
+            f"FROM history_transitions WHERE ts >= ? AND ts < ? AND is_on = 1{group_filter}"
+        )
+        args.extend((start_ts, end_ts) + group_args)
+
+        return conn.execute(
+            "SELECT group_name, b, sum(on_seconds), sum(energy_wh), sum(temp_sum), sum(temp_count), "
+            "min(temp_min), max(temp_max), sum(samples), sum(turn_ons) "
+            f"FROM ({' UNION ALL '.join(parts)}) GROUP BY group_name, b ORDER BY group_name, b",
+            args
+        ).fetchall()
+
+    def close(self):
+        """Write buffered records and close the database."""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def create_history_store(history_config: Optional[Dict[str, Any]], timezone: str = "UTC") -> Optional[HistoryStore]:
+    """
+    Build a HistoryStore from the 'history' configuration section.
+
+    Args:
+        history_config: Mapping with optional 'enabled', 'database' and
+            '*_retention_days' keys
+        timezone: Local timezone name
+
+    Returns:
+        HistoryStore, or None if history is disabled
+    """
+    history_config = history_config or {}
+    if not history_config.get('enabled', True):
+        return None
+    return HistoryStore(
+        database=history_config.get('database', DEFAULT_DATABASE_PATH),
+        timezone=timezone,
+        raw_retention_days=history_config.get('raw_retention_days', DEFAULT_RAW_RETENTION_DAYS),
+        hourly_retention_days=history_config.get('hourly_retention_days', DEFAULT_HOURLY_RETENTION_DAYS),
+        daily_retention_days=history_config.get('daily_retention_days', DEFAULT_DAILY_RETENTION_DAYS)
+    )
@@ -2,11 +2,14 @@
 
 import json
 import logging
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict
 from zoneinfo import ZoneInfo
 
+from src.state.state_store import state_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +27,14 @@ class ManualOverrideManager:
         self.timezone = ZoneInfo(timezone)
         self.state: Dict[str, dict] = {}
         
+        # Incremented on every change to state; lets other threads detect changes
+        # without iterating state while the scheduler loop modifies it
+        self.version = 0
+        self._version_lock = threading.Lock()
+        
+        # Optional callback invoked as on_change(group_name, override_or_None) after changes
+        self.on_change: Optional[Callable[[str, Optional[dict]], None]] = None
+        
         # Create parent directories if they don't exist
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
         
@@ -34,10 +45,9 @@ class ManualOverrideManager:
     
     def _load_state(self):
         """Load state from JSON file."""
-        if self.state_file.exists():
+        if state_store.exists(self.state_file):
             try:
-                with open(self.state_file, 'r') as f:
-                    self.state = json.load(f)
+                self.state = state_store.read(self.state_file)
                 logger.debug(f"Loaded state from {self.state_file}: {len(self.state)} override(s)")
             except (json.JSONDecodeError, IOError) as e:
                 logger.warning(f"Failed to load state file: {e}. Starting with empty state.")
@@ -47,16 +57,22 @@ class ManualOverrideManager:
             self.state = {}
     
     def _save_state(self):
-        """Save state to JSON file."""
+        """Bump the version and queue the state for the next write-behind flush (no file I/O here)."""
+        with self._version_lock:
+            self.version += 1
         try:
-            # Ensure parent directory exists
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
-            logger.debug(f"Saved state to {self.state_file}")
-        except IOError as e:
-            logger.error(f"Failed to save state file: {e}")
+            state_store.write(self.state_file, self.state)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to serialize override state: {e}")
+    
+    def _notify_change(self, group_name: str, override: Optional[dict]):
+        """Invoke the on_change callback, never letting it break state updates."""
+        if self.on_change is None:
+            return
+        try:
+            self.on_change(group_name, override.copy() if override else None)
+        except Exception as e:
+            logger.warning(f"Override change callback failed for '{group_name}': {e}")
     
     def set_override(self, group_name: str, action: str, timeout_hours: float) -> dict:
         """Set a manual override for a device group.
@@ -94,13 +110,15 @@ class ManualOverrideManager:
         
         # Log with full ISO timestamp for debugging
         logger.info(f"Set override for '{group_name}': {action} (expires: {expires_at.isoformat()})")
+        self._notify_change(group_name, override)
         
         return override.copy()
     
     def is_active(self, group_name: str) -> bool:
         """Check if an override is active for a group.
         
-        Auto-clears expired overrides.
+        Auto-clears expired overrides (in memory; the removal is persisted
+        by the state store's next flush).
         
         Args:
             group_name: Name of the device group
@@ -122,6 +140,7 @@ class ManualOverrideManager:
             logger.info(f"Override for '{group_name}' has expired. Auto-clearing.")
             del self.state[group_name]
             self._save_state()
+            self._notify_change(group_name, None)
             return False
         
         return True
@@ -139,6 +158,7 @@ class ManualOverrideManager:
             del self.state[group_name]
             self._save_state()
             logger.info(f"Cleared override for '{group_name}'")
+            self._notify_change(group_name, None)
             return True
         
         return False
@@ -178,6 +198,8 @@ class ManualOverrideManager:
         
         if expired_groups:
             self._save_state()
+            for group_name in expired_groups:
+                self._notify_change(group_name, None)
         
         return self.state.copy()
     
@@ -221,5 +243,7 @@ class ManualOverrideManager:
         
         if expired_groups:
             self._save_state()
+            for group_name in expired_groups:
+                self._notify_change(group_name, None)
         
         return expired_groups
@@ -0,0 +1,412 @@
+"""Write-behind JSON state store shared by the runtime state managers."""
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+# Delay between the first unflushed write and the batch being written to disk (seconds)
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Default SQLite database location for the 'sqlite' backend
+DEFAULT_DATABASE_PATH = "state/state.db"
+
+STATE_BACKENDS = ('json', 'sqlite')
+
+
+def _fsync_directory(directory: Path):
+    """Persist a rename by syncing its directory (not supported on every platform)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_json_atomic(path: Path, payload: str):
+    """
+    Replace a file's contents atomically (temp file, fsync, rename).
+
+    Args:
+        path: Destination file; its directory must exist
+        payload: Serialized JSON text
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    _fsync_directory(path.parent)
+
+
+class JSONFileBackend:
+    """One JSON file per state document (the default backend)."""
+
+    name = 'json'
+
+    def read(self, path: Path) -> Optional[str]:
+        """Return the file's text, or None if it does not exist."""
+        try:
+            with open(path, 'r') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def write(self, documents: Dict[Path, str]) -> Dict[Path, Exception]:
+        """
+        Write documents, each atomically.
+
+        Documents whose directory no longer exists are dropped with a warning.
+
+        Returns:
+            Documents that failed and should be retried, mapped to their error
+        """
+        failed = {}
+        for path, payload in documents.items():
+            try:
+                write_json_atomic(path, payload)
+                logger.debug(f"Flushed state to {path}")
+            except OSError as e:
+                if path.parent.is_dir():
+                    failed[path] = e
+                else:
+                    logger.warning(f"Dropping state for {path}: directory no longer exists")
+        return failed
+
+    def delete(self, path: Path):
+        path.unlink(missing_ok=True)
+
+    def close(self):
+        pass
+
+
+class SQLiteStateBackend:
+    """
+    All state documents in one SQLite database (WAL mode).
+
+    Documents are keyed by their state file path relative to the database's
+    directory, so ``state/<group>.json`` is stored as ``<group>.json``. A
+    document missing from the database is imported from its JSON file on
+    first read; the file is left in place. Each flush is one transaction, so
+    changes to several groups made within a flush interval are committed
+    together or not at all.
+
+    One connection is shared by the store's flush path and reads, serialized
+    by a lock; it is the database's only writer.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, database: Union[str, Path] = DEFAULT_DATABASE_PATH):
+        """
+        Open (and create if needed) the state database.
+
+        Args:
+            database: Database file path
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        self.database = Path(os.path.abspath(database))
+        self.database.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.database), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            "key TEXT PRIMARY KEY, document TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        logger.info(f"Using SQLite state database {self.database}")
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.database.parent).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def read(self, path: Path) -> Optional[str]:
+        """Return the stored document, importing it from its JSON file if needed."""
+        key = self._key(path)
+        with self._lock:
+            row = self._conn.execute("SELECT document FROM documents WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            return row[0]
+
+        try:
+            with open(path, 'r') as f:
+                payload = f.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            json.loads(payload)
+        except json.JSONDecodeError:
+            return payload  # Let the caller report the unreadable file; do not import it
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO documents (key, document, updated_at) VALUES (?, ?, ?)",
+                (key, payload, time.time())
+            )
+        logger.info(f"Migrated {path} into {self.database}")
+        return payload
+
+    def exists(self, path: Path) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM documents WHERE key = ?", (self._key(path),)).fetchone()
+        return row is not None or path.exists()
+
+    def write(self, documents: Dict[Path, str]) -> Dict[Path, Exception]:
+        """
+        Write documents in a single transaction.
+
+        Returns:
+            All documents mapped to the error if the transaction failed, else {}
+        """
+        now = time.time()
+        rows = [(self._key(path), payload, now) for path, payload in documents.items()]
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO documents (key, document, updated_at) VALUES (?, ?, ?)", rows
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                with suppress(sqlite3.Error):
+                    self._conn.execute("ROLLBACK")
+                return {path: e for path in documents}
+        logger.debug(f"Flushed {len(rows)} state document(s) to {self.database}")
+        return {}
+
+    def delete(self, path: Path):
+        """Delete a document (and its JSON file, so it is not imported again)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM documents WHERE key = ?", (self._key(path),))
+        path.unlink(missing_ok=True)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class StateStore:
+    """
+    Coalescing, write-behind store for small JSON state documents.
+
+    Writes only record the latest serialized document for a path; a timer
+    flushes all pending documents together ``flush_interval`` seconds after
+    the first unflushed write, and ``flush()`` runs at shutdown. Several
+    updates to the same file within the interval cost one disk write, and
+    callers (including the scheduler's event loop) never block on file I/O.
+
+    Reads return the pending document when there is one, so a new manager
+    opened on the same file sees the latest state before it reaches disk.
+    Documents are persisted by a backend: JSON files (default) or SQLite.
+    """
+
+    def __init__(self, flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS, backend=None):
+        """
+        Initialize the state store.
+
+        Args:
+            flush_interval: Seconds between the first pending write and the flush
+            backend: JSONFileBackend (default) or SQLiteStateBackend
+        """
+        self.flush_interval = flush_interval
+        self.backend = backend or JSONFileBackend()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[Path, str] = {}
+        self._flushing: Dict[Path, str] = {}
+        self._timer: Optional[threading.Timer] = None
+        self.files_written = 0
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> Path:
+        return Path(os.path.abspath(path))
+
+    def use_backend(self, backend):
+        """
+        Switch persistence backends, flushing pending documents to the old one first.
+
+        Args:
+            backend: New backend
+        """
+        self.flush()
+        with self._flush_lock:
+            previous, self.backend = self.backend, backend
+        if previous is not backend:
+            previous.close()
+
+    def write(self, path: Union[str, Path], data: Any):
+        """
+        Queue a document to be written to a file.
+
+        The document is serialized immediately, so later changes to ``data``
+        do not affect what is written.
+
+        Args:
+            path: State file path
+            data: JSON-serializable document
+        """
+        payload = json.dumps(data, separators=(',', ':'))
+        with self._lock:
+            self._pending[self._key(path)] = payload
+            self._schedule_flush_locked()
+
+    def write_now(self, path: Union[str, Path], data: Any):
+        """
+        Write a document immediately, replacing any pending write for the path.
+
+        Args:
+            path: State file path (its directory must exist for the JSON backend)
+            data: JSON-serializable document
+
+        Raises:
+            OSError: If the JSON backend cannot write the file
+            sqlite3.Error: If the SQLite backend cannot commit the document
+        """
+        key = self._key(path)
+        payload = json.dumps(data, separators=(',', ':'))
+        with self._flush_lock:
+            with self._lock:
+                self._pending.pop(key, None)
+            failed = self.backend.write({key: payload})
+        if failed:
+            raise failed[key]
+        self.files_written += 1
+
+    def read(self, path: Union[str, Path]) -> Any:
+        """
+        Read a state document, preferring a pending (not yet flushed) one.
+
+        Args:
+            path: State file path
+
+        Returns:
+            Parsed document
+
+        Raises:
+            FileNotFoundError: If the document does not exist
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If the stored document is not valid JSON
+        """
+        key = self._key(path)
+        with self._lock:
+            payload = self._pending.get(key, self._flushing.get(key))
+        if payload is None:
+            payload = self.backend.read(key)
+        if payload is None:
+            raise FileNotFoundError(f"No state document for {key}")
+        return json.loads(payload)
+
+    def exists(self, path: Union[str, Path]) -> bool:
+        """Whether a state document exists (stored or pending)."""
+        key = self._key(path)
+        with self._lock:
+            if key in self._pending or key in self._flushing:
+                return True
+        return self.backend.exists(key)
+
+    def delete(self, path: Union[str, Path]):
+        """
+        Delete a state document and drop any pending write for it.
+
+        Args:
+            path: State file path
+        """
+        key = self._key(path)
+        with self._flush_lock:
+            with self._lock:
+                self._pending.pop(key, None)
+            self.backend.delete(key)
+
+    def flush(self):
+        """Write all pending documents now."""
+        with self._flush_lock:
+            with self._lock:
+                self._flushing, self._pending = self._pending, {}
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                batch = self._flushing
+
+            failed = self.backend.write(batch) if batch else {}
+            self.files_written += len(batch) - len(failed)
+
+            with self._lock:
+                for path, error in failed.items():
+                    logger.error(f"Failed to write state for {path}: {error}; will retry")
+                    self._pending.setdefault(path, batch[path])
+                self._schedule_flush_locked()
+                self._flushing = {}
+
+    def _schedule_flush_locked(self):
+        if self._timer is None and self._pending:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+
+# Process-wide store used by the scheduler's state managers, overrides and caches
+state_store = StateStore()
+atexit.register(state_store.flush)
+
+
+def configure_state_store(state_config: Optional[Dict[str, Any]]) -> StateStore:
+    """
+    Apply the 'state' configuration section to the process-wide store.
+
+    Call before the state managers are created so they load from the chosen backend.
+
+    Args:
+        state_config: Mapping with optional 'backend' ('json' or 'sqlite'),
+            'database' and 'flush_interval_seconds'
+
+    Returns:
+        The configured store
+
+    Raises:
+        ValueError: If the backend is unknown
+        sqlite3.Error: If the SQLite database cannot be opened
+    """
+    state_config = state_config or {}
+    backend_name = state_config.get('backend', 'json')
+    if backend_name not in STATE_BACKENDS:
+        raise ValueError(f"Unknown state backend: {backend_name} (expected one of {', '.join(STATE_BACKENDS)})")
+
+    state_store.flush_interval = float(state_config.get('flush_interval_seconds', DEFAULT_FLUSH_INTERVAL_SECONDS))
+    if backend_name == 'sqlite':
+        state_store.use_backend(SQLiteStateBackend(state_config.get('database', DEFAULT_DATABASE_PATH)))
+    elif state_store.backend.name != 'json':
+        state_store.use_backend(JSONFileBackend())
+    return state_store
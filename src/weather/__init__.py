@@ -1,6 +1,7 @@
 """Weather services package."""
 
 from .weather_cache import WeatherCache
+from .weather_conditions import WeatherConditionsSnapshot
 from .weather_factory import WeatherServiceFactory
 from .weather_openweathermap import OpenWeatherMapService
 from .weather_service import WeatherService, WeatherServiceError
@@ -8,6 +9,7 @@ from .resilient_weather_service import ResilientWeatherService
 
 __all__ = [
     'WeatherCache',
+    'WeatherConditionsSnapshot',
     'WeatherServiceFactory',
     'OpenWeatherMapService',
     'WeatherService',
@@ -1,6 +1,8 @@
 """Resilient weather service with caching and outage handling."""
 
 import asyncio
+import hashlib
+import json
 import logging
 from datetime import datetime, timedelta
 from enum import Enum
@@ -12,6 +14,9 @@ from src.weather.weather_service import WeatherServiceError
 
 logger = logging.getLogger(__name__)
 
+# Provider payload fields that differ between otherwise identical responses
+VOLATILE_PAYLOAD_KEYS = ('generationtime_ms',)
+
 
 class WeatherServiceState(Enum):
     """States for the weather service."""
@@ -250,18 +255,44 @@ class ResilientWeatherService:
         try:
             logger.info("Fetching fresh weather forecast...")
             
-            # Get forecast from underlying service
-            forecast_data = await self.weather_service.get_forecast(
-                hours_ahead=self.forecast_horizon_hours
-            )
+            # Get forecast from underlying service (conditional when the cache allows it)
+            validators = self._get_request_validators()
+            if validators is not None:
+                forecast_data, response_validators = await self.weather_service.get_forecast_conditional(
+                    hours_ahead=self.forecast_horizon_hours,
+                    validators=validators
+                )
+            else:
+                forecast_data = await self.weather_service.get_forecast(
+                    hours_ahead=self.forecast_horizon_hours
+                )
+                response_validators = {}
             
-            # Save to cache
-            success = self.cache.save_forecast(
-                latitude=self.weather_service.latitude,
-                longitude=self.weather_service.longitude,
-                forecast_data=forecast_data,
-                forecast_hours=self.forecast_horizon_hours
-            )
+            # Skip the cache rewrite and notifications if nothing changed
+            content_hash = None
+            if forecast_data is None:
+                unchanged = True
+            else:
+                content_hash = self._content_hash(forecast_data)
+                unchanged = (
+                    content_hash == self.cache.validators.get('content_hash')
+                    and self._cache_covers_horizon()
+                )
+            
+            if unchanged:
+                logger.info("Weather forecast unchanged, keeping cached data")
+                self.cache.save_validators(response_validators)
+                success = True
+            else:
+                # Save to cache
+                success = self.cache.save_forecast(
+                    latitude=self.weather_service.latitude,
+                    longitude=self.weather_service.longitude,
+                    forecast_data=forecast_data,
+                    forecast_hours=self.forecast_horizon_hours
+                )
+                if success:
+                    self.cache.save_validators(response_validators, content_hash)
             
             if success:
                 # Update state tracking
@@ -277,7 +308,7 @@ class ResilientWeatherService:
                 logger.info(f"Successfully fetched and cached weather forecast")
                 
                 # Send forecast summary notification if configured
-                if self.forecast_notifier:
+                if self.forecast_notifier and not unchanged:
                     try:
                         # Get forecast data for notification (it's already in forecast_data)
                         # We'll pass it to the notifier
@@ -318,6 +349,67 @@ class ResilientWeatherService:
             
             return False
     
+    def _get_request_validators(self) -> Optional[Dict[str, str]]:
+        """
+        Get validators for a conditional forecast request.
+        
+        A conditional request is only safe when a 304 can be answered from the
+        cache, i.e. the cache is for this location and still covers the horizon.
+        Otherwise no validators are sent, but the response's are still recorded.
+        
+        Returns:
+            Dict of stored validators (empty for an unconditional request), or
+            None if the provider does not support conditional requests
+        """
+        if not callable(getattr(type(self.weather_service), 'get_forecast_conditional', None)):
+            return None
+        
+        if not self.cache.location_matches(
+            self.weather_service.latitude, self.weather_service.longitude
+        ):
+            return {}
+        
+        if not self._cache_covers_horizon():
+            return {}
+        
+        return {
+            key: self.cache.validators[key]
+            for key in ('etag', 'last_modified')
+            if self.cache.validators.get(key)
+        }
+    
+    def _cache_covers_horizon(self) -> bool:
+        """
+        Check if the cached forecast still reaches the end of the forecast horizon.
+        
+        Entries are hourly, so the cache covers the horizon if its last entry is
+        within an hour of now + forecast_horizon_hours.
+        """
+        forecast_end = self.cache.get_forecast_end()
+        if forecast_end is None:
+            return False
+        
+        horizon_end = datetime.now(forecast_end.tzinfo) + timedelta(hours=self.forecast_horizon_hours - 1)
+        return forecast_end >= horizon_end
+    
+    @staticmethod
+    def _content_hash(forecast_data: Dict[str, Any]) -> str:
+        """
+        Hash the provider payload, ignoring fields that change on every response.
+        
+        Args:
+            forecast_data: Raw forecast data from the weather API
+            
+        Returns:
+            Hex digest of the payload content
+        """
+        content = {
+            key: value for key, value in forecast_data.items()
+            if key not in VOLATILE_PAYLOAD_KEYS
+        }
+        encoded = json.dumps(content, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+    
     def get_next_fetch_interval_minutes(self) -> int:
         """
         Get the interval until next fetch attempt.
@@ -394,38 +486,31 @@ class ResilientWeatherService:
             return (False, None, None)
         
         try:
-            forecast = self.cache.cache_data['forecast']
+            index = self.cache.forecast_index
+            if not index:
+                logger.warning("No cached forecast data available")
+                return (False, None, None)
+            
             # Use timezone-aware datetime from cache
             now = datetime.now(self.cache.tz)
             cutoff_time = now + timedelta(hours=hours_ahead)
+            lo, hi = index.range(now, cutoff_time)
             
-            for entry in forecast:
-                try:
-                    forecast_time = datetime.fromisoformat(entry['timestamp'])
-                    # Ensure forecast_time is timezone-aware
-                    if forecast_time.tzinfo is None:
-                        forecast_time = forecast_time.replace(tzinfo=self.cache.tz)
-                    
-                    if forecast_time > cutoff_time:
-                        break
-                    
-                    if forecast_time < now:
-                        continue
-                    
-                    temp = entry['temperature_f']
-                    precip = entry['precipitation_mm']
-                    
-                    # Check if there's precipitation and temperature is below threshold
-                    if precip > 0 and temp < temperature_threshold_f:
-                        logger.info(
-                            f"PRECIPITATION DETECTED (from cache): Expected at {forecast_time}: "
-                            f"{precip}mm precipitation, temp: {temp}°F (threshold: {temperature_threshold_f}°F)"
-                        )
-                        return (True, forecast_time, temp)
-                
-                except (KeyError, ValueError) as e:
-                    logger.warning(f"Error processing cached forecast entry: {e}")
+            for i in range(lo, hi):
+                temp = index.temperature_f[i]
+                precip = index.precipitation_mm[i]
+                if temp is None or precip is None:
+                    logger.warning(f"Cached forecast entry {i} missing temperature or precipitation")
                     continue
+                
+                # Check if there's precipitation and temperature is below threshold
+                if precip > 0 and temp < temperature_threshold_f:
+                    forecast_time = index.time_at(i)
+                    logger.info(
+                        f"PRECIPITATION DETECTED (from cache): Expected at {forecast_time}: "
+                        f"{precip}mm precipitation, temp: {temp}°F (threshold: {temperature_threshold_f}°F)"
+                    )
+                    return (True, forecast_time, temp)
             
             logger.info(
                 f"No precipitation expected below {temperature_threshold_f}°F threshold "
@@ -528,50 +613,40 @@ class ResilientWeatherService:
             return (False, None, None, None)
         
         try:
-            forecast = self.cache.cache_data['forecast']
+            index = self.cache.forecast_index
+            if not index:
+                logger.warning("No cached forecast data available")
+                return (False, None, None, None)
+            
             # Use timezone-aware datetime from cache
             now = datetime.now(self.cache.tz)
             cutoff_time = now + timedelta(hours=hours_ahead)
+            lo, hi = index.range(now, cutoff_time)
             
-            for entry in forecast:
-                try:
-                    forecast_time = datetime.fromisoformat(entry['timestamp'])
-                    # Ensure forecast_time is timezone-aware
-                    if forecast_time.tzinfo is None:
-                        forecast_time = forecast_time.replace(tzinfo=self.cache.tz)
-                    
-                    if forecast_time > cutoff_time:
-                        break
-                    
-                    if forecast_time < now:
-                        continue
-                    
-                    temp = entry.get('temperature_f')
-                    dewpoint = entry.get('dewpoint_f')
-                    humidity = entry.get('humidity_percent')
-                    
-                    # Skip if required data is missing
-                    if temp is None or dewpoint is None or humidity is None:
-                        logger.debug(f"Missing data at {forecast_time}, skipping black ice check")
-                        continue
-                    
-                    # Check black ice conditions
-                    dew_spread = temp - dewpoint
-                    
-                    if (temp <= temperature_max_f and 
-                        dew_spread <= dew_point_spread_f and 
-                        humidity >= humidity_min_percent):
-                        logger.info(
-                            f"BLACK ICE RISK DETECTED (from cache) at {forecast_time}: "
-                            f"temp={temp}°F (≤{temperature_max_f}°F), "
-                            f"dewpoint={dewpoint}°F, spread={dew_spread:.1f}°F (≤{dew_point_spread_f}°F), "
-                            f"humidity={humidity}% (≥{humidity_min_percent}%)"
-                        )
-                        return (True, forecast_time, temp, dewpoint)
+            for i in range(lo, hi):
+                temp = index.temperature_f[i]
+                dewpoint = index.dewpoint_f[i]
+                humidity = index.humidity_percent[i]
                 
-                except (KeyError, ValueError) as e:
-                    logger.warning(f"Error processing cached forecast entry: {e}")
+                # Skip if required data is missing
+                if temp is None or dewpoint is None or humidity is None:
+                    logger.debug(f"Missing data in cached forecast entry {i}, skipping black ice check")
                     continue
+                
+                # Check black ice conditions
+                dew_spread = temp - dewpoint
+                
+                if (temp <= temperature_max_f and 
+                    dew_spread <= dew_point_spread_f and 
+                    humidity >= humidity_min_percent):
+                    forecast_time = index.time_at(i)
+                    logger.info(
+                        f"BLACK ICE RISK DETECTED (from cache) at {forecast_time}: "
+                        f"temp={temp}°F (≤{temperature_max_f}°F), "
+                        f"dewpoint={dewpoint}°F, spread={dew_spread:.1f}°F (≤{dew_point_spread_f}°F), "
+                        f"humidity={humidity}% (≥{humidity_min_percent}%)"
+                    )
+                    return (True, forecast_time, temp, dewpoint)
             
             logger.info(
                 f"No black ice risk detected in next {hours_ahead} hours (from cache) "
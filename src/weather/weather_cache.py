@@ -2,12 +2,15 @@
 
 import json
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass, asdict
 from zoneinfo import ZoneInfo
 
+from src.state.state_store import state_store
+
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,135 @@ class WeatherSnapshot:
         return cls(**data)
 
 
+class ForecastIndex:
+    """
+    Parsed, time-sorted columnar view of a cached forecast.
+    
+    Timestamps are parsed once into epoch seconds and stored in ascending order
+    alongside parallel columns for temperature, precipitation, dewpoint and
+    humidity. Nearest-entry lookups are a bisect and range queries return
+    index bounds, so callers never re-parse ISO strings.
+    """
+    
+    __slots__ = ('epochs', 'temperature_f', 'precipitation_mm', 'dewpoint_f',
+                 'humidity_percent', 'entries', 'tz')
+    
+    def __init__(self, forecast: List[Dict[str, Any]], tz: ZoneInfo):
+        """
+        Build the index from cached forecast entries.
+        
+        Args:
+            forecast: List of forecast entry dicts with ISO 'timestamp' keys
+            tz: Timezone applied to naive timestamps
+        """
+        self.tz = tz
+        parsed = []
+        for entry in forecast:
+            try:
+                entry_time = datetime.fromisoformat(entry['timestamp'])
+                if entry_time.tzinfo is None:
+                    entry_time = entry_time.replace(tzinfo=tz)
+                parsed.append((entry_time.timestamp(), entry))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping unparseable forecast entry: {e}")
+        
+        parsed.sort(key=lambda item: item[0])
+        
+        self.epochs: List[float] = [epoch for epoch, _ in parsed]
+        self.entries: List[Dict[str, Any]] = [entry for _, entry in parsed]
+        self.temperature_f: List[Optional[float]] = [e.get('temperature_f') for e in self.entries]
+        self.precipitation_mm: List[Optional[float]] = [e.get('precipitation_mm') for e in self.entries]
+        self.dewpoint_f: List[Optional[float]] = [e.get('dewpoint_f') for e in self.entries]
+        self.humidity_percent: List[Optional[float]] = [e.get('humidity_percent') for e in self.entries]
+    
+    def __len__(self) -> int:
+        return len(self.epochs)
+    
+    def _to_epoch(self, value: datetime) -> float:
+        """Convert a (naive or aware) datetime to epoch seconds."""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=self.tz)
+        return value.timestamp()
+    
+    def nearest(self, target_time: datetime) -> Optional[int]:
+        """
+        Find the index of the entry closest to target_time.
+        
+        Ties resolve to the earlier entry.
+        
+        Args:
+            target_time: Time to look up (naive times use the index timezone)
+            
+        Returns:
+            Entry index, or None if the index is empty
+        """
+        if not self.epochs:
+            return None
+        
+        target = self._to_epoch(target_time)
+        i = bisect_left(self.epochs, target)
+        if i == 0:
+            return 0
+        if i == len(self.epochs):
+            return i - 1
+        if target - self.epochs[i - 1] <= self.epochs[i] - target:
+            return i - 1
+        return i
+    
+    def range(self, start: datetime, end: datetime) -> Tuple[int, int]:
+        """
+        Get slice bounds for entries with start <= timestamp <= end.
+        
+        Args:
+            start: Range start (inclusive)
+            end: Range end (inclusive)
+            
+        Returns:
+            Tuple of (lo, hi) suitable for slicing any column
+        """
+        lo = bisect_left(self.epochs, self._to_epoch(start))
+        hi = bisect_right(self.epochs, self._to_epoch(end))
+        return lo, max(lo, hi)
+    
+    def time_at(self, i: int) -> datetime:
+        """
+        Get the timezone-aware timestamp of entry i.
+        
+        Args:
+            i: Entry index
+            
+        Returns:
+            Entry timestamp as stored in the cache (naive values get the index timezone)
+        """
+        entry_time = datetime.fromisoformat(self.entries[i]['timestamp'])
+        if entry_time.tzinfo is None:
+            entry_time = entry_time.replace(tzinfo=self.tz)
+        return entry_time
+    
+    def switch_points(self, start: datetime, end: datetime) -> List[datetime]:
+        """
+        Get the instants in (start, end) at which nearest() changes entry.
+        
+        These are the midpoints between consecutive forecast entries; any
+        value derived from nearest() is constant between two switch points.
+        
+        Args:
+            start: Range start (exclusive)
+            end: Range end (exclusive)
+            
+        Returns:
+            Time-ordered list of timezone-aware datetimes
+        """
+        lo_epoch = self._to_epoch(start)
+        hi_epoch = self._to_epoch(end)
+        points = []
+        for i in range(1, len(self.epochs)):
+            midpoint = (self.epochs[i - 1] + self.epochs[i]) / 2
+            if lo_epoch < midpoint < hi_epoch:
+                points.append(datetime.fromtimestamp(midpoint, tz=self.tz))
+        return points
+
+
 class WeatherCache:
     """
     Cache for weather forecast data with persistence and validation.
@@ -48,6 +180,9 @@ class WeatherCache:
             timezone: Timezone for forecast data (e.g., "America/New_York", "UTC")
         """
         self.cache_file = Path(cache_file)
+        # Response validators (ETag/Last-Modified, content hash) live beside the cache
+        self.validators_file = self.cache_file.with_name(self.cache_file.stem + '.validators.json')
+        self.validators: Dict[str, Any] = {}
         self.timezone = timezone
         try:
             self.tz = ZoneInfo(timezone)
@@ -56,19 +191,46 @@ class WeatherCache:
             self.timezone = "UTC"
             self.tz = ZoneInfo("UTC")
         
-        self.cache_data: Optional[Dict[str, Any]] = None
+        self._cache_data: Optional[Dict[str, Any]] = None
+        self._index: Optional[ForecastIndex] = None
         self._load_cache()
+        self._load_validators()
+    
+    @property
+    def cache_data(self) -> Optional[Dict[str, Any]]:
+        """Cached forecast data as persisted to disk."""
+        return self._cache_data
+    
+    @cache_data.setter
+    def cache_data(self, value: Optional[Dict[str, Any]]) -> None:
+        """Replace cached data and invalidate the parsed forecast index."""
+        self._cache_data = value
+        self._index = None
+    
+    @property
+    def forecast_index(self) -> Optional[ForecastIndex]:
+        """
+        Parsed, time-sorted view of the cached forecast (built on first use).
+        
+        Returns:
+            ForecastIndex, or None if there is no cached forecast
+        """
+        if self._index is None:
+            cache_data = self._cache_data
+            if not isinstance(cache_data, dict) or not cache_data.get('forecast'):
+                return None
+            self._index = ForecastIndex(cache_data['forecast'], self.tz)
+        return self._index
     
     def _load_cache(self) -> None:
         """Load cache from disk if it exists."""
-        if not self.cache_file.exists():
+        if not state_store.exists(self.cache_file):
             logger.info(f"No existing cache file found at {self.cache_file}")
             self.cache_data = None
             return
         
         try:
-            with open(self.cache_file, 'r') as f:
-                data = json.load(f)
+            data = state_store.read(self.cache_file)
             
             # Validate cache structure
             if not self._validate_cache_structure(data):
@@ -90,6 +252,58 @@ class WeatherCache:
             logger.warning(f"Failed to load cache: {type(e).__name__}: {e}")
             self.cache_data = None
     
+    def _load_validators(self) -> None:
+        """Load response validators from disk if they exist."""
+        if self.cache_data is None or not state_store.exists(self.validators_file):
+            self.validators = {}
+            return
+        
+        try:
+            data = state_store.read(self.validators_file)
+            self.validators = data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load cache validators: {type(e).__name__}: {e}")
+            self.validators = {}
+    
+    def save_validators(
+        self,
+        response_validators: Dict[str, str],
+        content_hash: Optional[str] = None
+    ) -> None:
+        """
+        Record that the cached forecast was confirmed current by the provider.
+        
+        Args:
+            response_validators: 'etag' / 'last_modified' from the latest response
+            content_hash: Hash of the provider payload the cache was built from
+                (None keeps the stored hash)
+        """
+        validators = {
+            'content_hash': content_hash if content_hash is not None else self.validators.get('content_hash'),
+            'validated_at': datetime.now(self.tz).isoformat()
+        }
+        validators.update(response_validators)
+        
+        try:
+            self.validators_file.parent.mkdir(parents=True, exist_ok=True)
+            state_store.write_now(self.validators_file, validators)
+        except Exception as e:
+            logger.warning(f"Failed to save cache validators: {e}")
+        
+        self.validators = validators
+    
+    def get_forecast_end(self) -> Optional[datetime]:
+        """
+        Get the timestamp of the last cached forecast entry.
+        
+        Returns:
+            Timezone-aware datetime, or None if there is no cached forecast
+        """
+        index = self.forecast_index
+        if not index:
+            return None
+        return index.time_at(len(index) - 1)
+    
     def _validate_cache_structure(self, data: Dict[str, Any]) -> bool:
         """
         Validate that cache has required structure.
@@ -222,10 +436,12 @@ class WeatherCache:
             
             # Save to disk
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            state_store.write_now(self.cache_file, cache_data)
             
             self.cache_data = cache_data
+            # Validators described the previous payload
+            self.validators = {}
+            state_store.delete(self.validators_file)
             logger.info(f"Saved weather cache with {len(forecast_list)} entries to {self.cache_file}")
             return True
             
@@ -247,6 +463,15 @@ class WeatherCache:
             fetched_at = datetime.fromisoformat(self.cache_data['fetched_at'])
             if fetched_at.tzinfo is None:
                 fetched_at = fetched_at.replace(tzinfo=self.tz)
+            
+            # A provider confirming the data unchanged makes it as fresh as a new fetch
+            validated_at = self.validators.get('validated_at')
+            if validated_at:
+                validated_at = datetime.fromisoformat(validated_at)
+                if validated_at.tzinfo is None:
+                    validated_at = validated_at.replace(tzinfo=self.tz)
+                fetched_at = max(fetched_at, validated_at)
+            
             age = datetime.now(self.tz) - fetched_at
             return age.total_seconds() / 3600
         except (KeyError, ValueError) as e:
@@ -310,43 +535,56 @@ class WeatherCache:
         Returns:
             WeatherSnapshot if found, None otherwise
         """
-        if not self.cache_data:
-            return None
-        
         try:
-            forecast = self.cache_data['forecast']
-            if not forecast:
+            index = self.forecast_index
+            if not index:
                 return None
             
-            # Ensure target_time is timezone-aware
-            if target_time.tzinfo is None:
-                target_time = target_time.replace(tzinfo=self.tz)
-            
-            # Find closest forecast entry
-            closest_entry = None
-            min_diff = None
-            
-            for entry in forecast:
-                entry_time = datetime.fromisoformat(entry['timestamp'])
-                # Ensure entry_time is timezone-aware
-                if entry_time.tzinfo is None:
-                    entry_time = entry_time.replace(tzinfo=self.tz)
-                
-                time_diff = abs((entry_time - target_time).total_seconds())
-                
-                if min_diff is None or time_diff < min_diff:
-                    min_diff = time_diff
-                    closest_entry = entry
-            
-            if closest_entry:
-                return WeatherSnapshot.from_dict(closest_entry)
+            i = index.nearest(target_time)
+            if i is None:
+                return None
             
-            return None
+            return WeatherSnapshot.from_dict(index.entries[i])
             
         except Exception as e:
             logger.error(f"Error retrieving weather from cache: {type(e).__name__}: {e}")
             return None
     
+    def get_forecast_range(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """
+        Get cached forecast entries with start <= timestamp <= end.
+        
+        Args:
+            start: Range start (inclusive, naive or aware)
+            end: Range end (inclusive, naive or aware)
+            
+        Returns:
+            Time-ordered list of forecast entry dicts (empty if no cache)
+        """
+        index = self.forecast_index
+        if not index:
+            return []
+        
+        lo, hi = index.range(start, end)
+        return index.entries[lo:hi]
+    
+    def get_forecast_switch_points(self, start: datetime, end: datetime) -> List[datetime]:
+        """
+        Get the instants in (start, end) at which get_weather_at changes entry.
+        
+        Args:
+            start: Range start (exclusive, naive or aware)
+            end: Range end (exclusive, naive or aware)
+            
+        Returns:
+            Time-ordered list of timezone-aware datetimes (empty if no cache)
+        """
+        index = self.forecast_index
+        if not index:
+            return []
+        
+        return index.switch_points(start, end)
+    
     def get_current_conditions(self) -> Optional[Tuple[float, float]]:
         """
         Get current temperature and precipitation from cache.
@@ -0,0 +1,75 @@
+"""Cycle-scoped weather conditions snapshot shared by schedule evaluation."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+
+@dataclass(frozen=True)
+class WeatherConditionsSnapshot:
+    """
+    Immutable view of the weather conditions used for schedule evaluation.
+
+    Computed once per scheduler cycle (or when the weather cache is refreshed)
+    and shared by every group, by device expectations and by the web endpoints,
+    so evaluation cost does not grow with the number of groups.
+    """
+    evaluated_at: datetime  # Local time the conditions were evaluated for
+    cache_version: Optional[str] = None  # Weather cache 'fetched_at' the snapshot was built from
+    weather_enabled: bool = True
+    weather_offline: bool = False
+    available: bool = False  # True if current conditions could be read from the cache
+    temperature_f: Optional[float] = None
+    precipitation_mm: Optional[float] = None
+    precipitation_active: bool = False
+    precipitation_time: Optional[datetime] = None
+    black_ice_risk: bool = False
+    black_ice_time: Optional[datetime] = None
+
+    def get_conditions(self, include_black_ice: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get the weather conditions dictionary expected by ScheduleEvaluator.
+
+        Args:
+            include_black_ice: Whether to report black ice risk (False forces it off)
+
+        Returns:
+            Dict with temperature_f, precipitation_active and black_ice_risk,
+            or None if no weather data is available
+        """
+        if not self.available:
+            return None
+
+        return {
+            'temperature_f': self.temperature_f,
+            'precipitation_active': self.precipitation_active,
+            'black_ice_risk': self.black_ice_risk if include_black_ice else False
+        }
+
+    def age_seconds(self, now: datetime) -> float:
+        """
+        Get the absolute time distance between now and the evaluation time.
+
+        Args:
+            now: Time to compare against (must share awareness with evaluated_at)
+
+        Returns:
+            Distance in seconds
+        """
+        return abs((now - self.evaluated_at).total_seconds())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'evaluated_at': self.evaluated_at.isoformat(),
+            'cache_version': self.cache_version,
+            'weather_enabled': self.weather_enabled,
+            'weather_offline': self.weather_offline,
+            'available': self.available,
+            'temperature_f': self.temperature_f,
+            'precipitation_mm': self.precipitation_mm,
+            'precipitation_active': self.precipitation_active,
+            'precipitation_time': self.precipitation_time.isoformat() if self.precipitation_time else None,
+            'black_ice_risk': self.black_ice_risk,
+            'black_ice_time': self.black_ice_time.isoformat() if self.black_ice_time else None
+        }
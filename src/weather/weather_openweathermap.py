@@ -7,6 +7,9 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from src.http_client import http_session
+from src.weather.weather_service import conditional_headers, response_validators
+
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +55,42 @@ class OpenWeatherMapService:
         Returns:
             Dictionary containing forecast data
         """
+        data, _ = await self._request_forecast(hours_ahead)
+        return data
+    
+    async def get_forecast_conditional(
+        self,
+        hours_ahead: int = 12,
+        validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[Dict], Dict[str, str]]:
+        """
+        Get weather forecast unless it is unchanged since the last fetch.
+        
+        Args:
+            hours_ahead: Number of hours to forecast ahead
+            validators: 'etag' and/or 'last_modified' from the previous response
+            
+        Returns:
+            Tuple of (forecast_data, validators). forecast_data is None if the
+            server answered 304 Not Modified.
+        """
+        return await self._request_forecast(hours_ahead, validators or {})
+    
+    async def _request_forecast(
+        self,
+        hours_ahead: int,
+        validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[Dict], Dict[str, str]]:
+        """
+        Request forecast data, optionally as a conditional request.
+        
+        Args:
+            hours_ahead: Number of hours to forecast ahead
+            validators: Previous response validators, or None for a plain request
+            
+        Returns:
+            Tuple of (forecast_data or None on 304, response validators)
+        """
         # Validate input parameters
         if not isinstance(hours_ahead, (int, float)) or hours_ahead <= 0:
             logger.error(f"Invalid hours_ahead parameter: {hours_ahead}")
@@ -71,12 +110,18 @@ class OpenWeatherMapService:
         logger.debug(f"API request URL: {endpoint}")
         logger.debug(f"API request parameters (without key): lat={params['lat']}, lon={params['lon']}, units={params['units']}")
         
+        headers = conditional_headers(validators) if validators else None
+        
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_session() as session:
                 logger.debug(f"Opening HTTP session to {endpoint}")
-                async with session.get(endpoint, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                async with session.get(endpoint, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
                     logger.debug(f"Received HTTP response with status: {response.status}")
                     
+                    if validators and response.status == 304:
+                        logger.info("OpenWeatherMap forecast not modified since last fetch")
+                        return None, validators
+                    
                     if response.status != 200:
                         error_text = await response.text()
                         logger.error(f"API request failed with status {response.status}")
@@ -99,7 +144,9 @@ class OpenWeatherMapService:
                         raise OpenWeatherMapError("Invalid response format from OpenWeatherMap")
                     
                     logger.debug(f"Received {len(data.get('list', []))} forecast entries")
-                    return data
+                    if validators is None:
+                        return data, {}
+                    return data, response_validators(response)
                     
         except aiohttp.ClientError as e:
             logger.error(f"HTTP client error while fetching weather data: {type(e).__name__}: {e}")
@@ -219,7 +266,7 @@ class OpenWeatherMapService:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_session() as session:
                 async with session.get(endpoint, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
                     if response.status != 200:
                         error_text = await response.text()
@@ -3,13 +3,53 @@
 import aiohttp
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 import logging
 
+from src.http_client import http_session
+
 
 logger = logging.getLogger(__name__)
 
 
+def conditional_headers(validators: Dict[str, str]) -> Dict[str, str]:
+    """
+    Build conditional request headers from stored response validators.
+    
+    Args:
+        validators: Dict with optional 'etag' and 'last_modified' keys
+        
+    Returns:
+        Dict of If-None-Match / If-Modified-Since headers
+    """
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+
+def response_validators(response: Any) -> Dict[str, str]:
+    """
+    Extract ETag / Last-Modified validators from a response.
+    
+    Args:
+        response: aiohttp response
+        
+    Returns:
+        Dict with 'etag' and/or 'last_modified' keys (empty if none were sent)
+    """
+    validators = {}
+    etag = response.headers.get('ETag')
+    if isinstance(etag, str) and etag:
+        validators['etag'] = etag
+    last_modified = response.headers.get('Last-Modified')
+    if isinstance(last_modified, str) and last_modified:
+        validators['last_modified'] = last_modified
+    return validators
+
+
 class WeatherServiceError(Exception):
     """Weather service error exception."""
     pass
@@ -43,6 +83,45 @@ class WeatherService:
         Returns:
             Dictionary containing forecast data
         """
+        data, _ = await self._request_forecast(hours_ahead)
+        return data
+    
+    async def get_forecast_conditional(
+        self,
+        hours_ahead: int = 12,
+        validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[Dict], Dict[str, str]]:
+        """
+        Get weather forecast unless it is unchanged since the last fetch.
+        
+        Sends If-None-Match / If-Modified-Since built from the validators of the
+        previous response.
+        
+        Args:
+            hours_ahead: Number of hours to forecast ahead
+            validators: 'etag' and/or 'last_modified' from the previous response
+            
+        Returns:
+            Tuple of (forecast_data, validators). forecast_data is None if the
+            server answered 304 Not Modified.
+        """
+        return await self._request_forecast(hours_ahead, validators or {})
+    
+    async def _request_forecast(
+        self,
+        hours_ahead: int,
+        validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[Dict], Dict[str, str]]:
+        """
+        Request forecast data, optionally as a conditional request.
+        
+        Args:
+            hours_ahead: Number of hours to forecast ahead
+            validators: Previous response validators, or None for a plain request
+            
+        Returns:
+            Tuple of (forecast_data or None on 304, response validators)
+        """
         # Validate input parameters
         if not isinstance(hours_ahead, (int, float)) or hours_ahead <= 0:
             logger.error(f"Invalid hours_ahead parameter: {hours_ahead}")
@@ -61,12 +140,18 @@ class WeatherService:
         logger.debug(f"API request URL: {self.BASE_URL}")
         logger.debug(f"API request parameters: {params}")
         
+        headers = conditional_headers(validators) if validators else None
+        
         try:
-            async with aiohttp.ClientSession() as session:
+            async with http_session() as session:
                 logger.debug(f"Opening HTTP session to {self.BASE_URL}")
-                async with session.get(self.BASE_URL, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                async with session.get(self.BASE_URL, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
                     logger.debug(f"Received HTTP response with status: {response.status}")
                     
+                    if validators and response.status == 304:
+                        logger.info("Weather forecast not modified since last fetch")
+                        return None, validators
+                    
                     if response.status != 200:
                         error_text = await response.text()
                         logger.error(f"API request failed with status {response.status}")
@@ -85,7 +170,9 @@ class WeatherService:
                         raise WeatherServiceError("Empty response from weather API")
                     
                     logger.debug(f"Full weather data: {data}")
-                    return data
+                    if validators is None:
+                        return data, {}
+                    return data, response_validators(response)
         except aiohttp.ClientError as e:
             logger.error(f"HTTP client error while fetching weather data: {type(e).__name__}: {e}")
             raise WeatherServiceError(f"Failed to fetch weather data: {e}")
@@ -0,0 +1,77 @@
+"""Pre-rendered JSON responses with ETag and gzip support."""
+
+import gzip
+import hashlib
+import json
+from typing import Any, Dict, Hashable, Optional
+
+from flask import Request, Response
+
+
+# Bodies smaller than this are not worth compressing
+MIN_GZIP_BYTES = 1024
+GZIP_LEVEL = 6
+
+
+class CachedJSONResponse:
+    """
+    A JSON payload serialized once, with a strong ETag and a lazily built gzip body.
+
+    Endpoints keep one of these per data version (the key) and serve it until the
+    key changes, so repeated requests skip payload construction and serialization.
+    """
+
+    def __init__(self, key: Hashable, payload: Dict[str, Any]):
+        """
+        Render payload.
+
+        Args:
+            key: Version of the inputs the payload was built from
+            payload: JSON-serializable response payload
+        """
+        self.key = key
+        self.body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        self.etag_value = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{self.etag_value}"'
+        self._gzip_body: Optional[bytes] = None
+
+    @property
+    def gzip_body(self) -> bytes:
+        """Gzip-compressed body (compressed on first use)."""
+        if self._gzip_body is None:
+            self._gzip_body = gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)
+        return self._gzip_body
+
+    def to_response(self, request: Request, max_age: int = 0) -> Response:
+        """
+        Build a response for a request, honoring If-None-Match and Accept-Encoding.
+
+        Args:
+            request: Incoming Flask request
+            max_age: Cache-Control max-age in seconds (clients always revalidate when 0)
+
+        Returns:
+            304 response if the client's copy is current, otherwise the JSON body
+            (gzip-encoded when accepted and worthwhile)
+        """
+        headers = {
+            'ETag': self.etag,
+            'Cache-Control': f'private, max-age={max_age}, must-revalidate',
+            'Vary': 'Accept-Encoding'
+        }
+
+        use_gzip = len(self.body) >= MIN_GZIP_BYTES and request.accept_encodings['gzip'] > 0
+        if use_gzip:
+            # Each encoding is a distinct representation with its own validator
+            headers['ETag'] = f'"{self.etag_value}-gzip"'
+
+        if (request.if_none_match.contains_weak(self.etag_value)
+                or request.if_none_match.contains_weak(f'{self.etag_value}-gzip')):
+            return Response(status=304, headers=headers)
+
+        body = self.body
+        if use_gzip:
+            body = self.gzip_body
+            headers['Content-Encoding'] = 'gzip'
+
+        return Response(body, status=200, mimetype='application/json', headers=headers)
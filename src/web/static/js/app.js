@@ -3249,8 +3249,70 @@ window.addEventListener('load', () => {
         const currentView = getHealthViewPreference();
         healthViewToggle.checked = (currentView === 'group');
     }
+    
+    // Subscribe to server-pushed updates instead of polling
+    startEventStream();
 });
 
+// Server-Sent Events: refresh the visible tab when the server reports a change
+const EVENT_REFRESH_TABS = {
+    cycle: ['status', 'health'],
+    devices: ['status', 'health'],
+    weather: ['status', 'weather'],
+    override: ['status']
+};
+const EVENT_REFRESH_DEBOUNCE_MS = 500;
+const EVENT_STREAM_RETRY_MS = 30000;
+let eventSource = null;
+let eventRefreshTimer = null;
+let pendingRefreshTabs = new Set();
+
+function startEventStream() {
+    if (!window.EventSource || eventSource) {
+        return;
+    }
+    
+    eventSource = new EventSource('/api/events');
+    
+    Object.keys(EVENT_REFRESH_TABS).forEach(eventType => {
+        eventSource.addEventListener(eventType, () => scheduleEventRefresh(EVENT_REFRESH_TABS[eventType]));
+    });
+    
+    eventSource.onerror = () => {
+        // EventSource reconnects by itself unless the server refused the stream
+        if (eventSource.readyState === EventSource.CLOSED) {
+            eventSource = null;
+            setTimeout(startEventStream, EVENT_STREAM_RETRY_MS);
+        }
+    };
+}
+
+function scheduleEventRefresh(tabs) {
+    tabs.forEach(tab => pendingRefreshTabs.add(tab));
+    
+    // Coalesce bursts of events (e.g. several groups switching in one cycle) into one refresh
+    if (eventRefreshTimer) {
+        return;
+    }
+    eventRefreshTimer = setTimeout(() => {
+        const tabName = getActiveTabName();
+        const shouldRefresh = pendingRefreshTabs.has(tabName);
+        pendingRefreshTabs = new Set();
+        eventRefreshTimer = null;
+        
+        if (!shouldRefresh) {
+            return;
+        }
+        if (tabName === 'status') {
+            refreshStatus();
+        } else if (tabName === 'health') {
+            refreshHealth();
+        } else if (tabName === 'weather') {
+            refreshWeather();
+        }
+    }, EVENT_REFRESH_DEBOUNCE_MS);
+}
+
 /**
  * Restart the application
  */
@@ -3408,24 +3470,27 @@ function toggleCollapsible(header) {
     }
 }
 
-// Refresh current tab (for FAB button)
-function refreshCurrentTab() {
+// Get the name of the active tab (defaults to 'status')
+function getActiveTabName() {
     const activeTab = document.querySelector('.tab.active');
     if (!activeTab) {
-        refreshStatus();
-        return;
+        return 'status';
     }
     
     // Extract tab name from onclick attribute for more reliable identification
     const onclickAttr = activeTab.getAttribute('onclick');
     if (!onclickAttr) {
-        refreshStatus();
-        return;
+        return 'status';
     }
     
     // Parse switchTab('tabname') to get the tab name
     const match = onclickAttr.match(/switchTab\('([^']+)'\)/);
-    const tabName = match ? match[1] : 'status';
+    return match ? match[1] : 'status';
+}
+
+// Refresh current tab (for FAB button)
+function refreshCurrentTab() {
+    const tabName = getActiveTabName();
     
     // Call appropriate refresh function based on tab name
     if (tabName === 'status') {
@@ -24,8 +24,35 @@ function initializeControlPage() {
     // Initial status fetch
     fetchStatus();
     
-    // Set up auto-refresh (every 10 seconds)
-    autoRefreshInterval = setInterval(() => fetchStatus(), 10000);
+    // Refresh when the server pushes a change; poll only if event streams are unavailable
+    startStatusUpdates();
+}
+
+/**
+ * Subscribe to server-pushed state changes, falling back to polling every 10 seconds
+ */
+function startStatusUpdates() {
+    if (!window.EventSource) {
+        startPolling();
+        return;
+    }
+    
+    const events = new EventSource('/api/events');
+    ['cycle', 'devices', 'override'].forEach(eventType => {
+        events.addEventListener(eventType, () => fetchStatus());
+    });
+    events.onerror = () => {
+        // EventSource reconnects by itself unless the server refused the stream
+        if (events.readyState === EventSource.CLOSED) {
+            startPolling();
+        }
+    };
+}
+
+function startPolling() {
+    if (!autoRefreshInterval) {
+        autoRefreshInterval = setInterval(() => fetchStatus(), 10000);
+    }
 }
 
 /**
@@ -10,10 +10,22 @@ import yaml
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from zoneinfo import ZoneInfo
-from flask import Flask, request, jsonify, send_from_directory, render_template, abort, send_file
+from flask import Flask, Response, request, jsonify, send_from_directory, render_template, abort, send_file
 from pathlib import Path
 from werkzeug.utils import secure_filename
 
+from src.config.config_manager import ConfigManager
+from src.config.patch import ConfigChange, to_pointer
+from src.config.snapshot import ConfigSnapshot
+from src.config.yaml_loader import safe_load
+from src.devices.status_snapshot import DeviceStatusSnapshot
+from src.state.history_store import HistoryStore
+from src.weather.weather_conditions import WeatherConditionsSnapshot
+from src.async_bridge import LoopBridge, SchedulerCallTimeout
+from src.events import EventBroker, EVENT_DEVICES
+from src.web import wsgi_server
+from src.web.response_cache import CachedJSONResponse
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +47,16 @@ class WebServer:
         self.config_manager = config_manager
         self.scheduler = scheduler
         
+        # Set by run(); ends open event streams on shutdown
+        self._shutdown_event = None
+        
+        # Pre-rendered /api/weather/forecast response (rebuilt when its inputs change)
+        self._weather_forecast_response: Optional[CachedJSONResponse] = None
+        
+        # Hot-reload scheduler subsystems when the configuration changes
+        if isinstance(config_manager, ConfigManager):
+            config_manager.add_change_listener(self._on_config_changed)
+        
         # Create Flask app
         # Static and template folders are relative to this module's location
         module_dir = Path(__file__).parent
@@ -201,7 +223,7 @@ class WebServer:
                 JSON: Health status
             """
             try:
-                config = self.config_manager.get_config(include_secrets=False)
+                config = self._config_view()
                 
                 return jsonify({
                     'status': 'ok',
@@ -244,6 +266,50 @@ class WebServer:
                     'details': str(e)
                 }), 500
         
+        @self.app.route('/api/events', methods=['GET'])
+        def api_events():
+            """
+            Server-Sent Events stream of state changes.
+            
+            Event types: cycle (scheduler cycle summary), devices (group switched),
+            weather (new forecast cached) and override (manual override set/cleared).
+            Clients subscribe once and refresh views on events instead of polling.
+            
+            Returns:
+                text/event-stream response, or 503 when streaming is unavailable or
+                the subscriber limit is reached (clients should fall back to polling)
+            """
+            # HEAD responses have no body, so the stream would never run to unsubscribe
+            if request.method == 'HEAD':
+                return Response(status=405, headers={'Allow': 'GET'})
+            
+            broker = self._get_event_broker()
+            if broker is None:
+                return jsonify({'error': 'Event stream not available'}), 503
+            
+            subscription = broker.subscribe()
+            if subscription is None:
+                return jsonify({
+                    'error': 'Too many event streams',
+                    'max_streams': broker.max_subscribers
+                }), 503
+            
+            shutdown_event = self._shutdown_event
+            should_stop = shutdown_event.is_set if shutdown_event is not None else None
+            
+            response = Response(
+                broker.stream(subscription, should_stop=should_stop),
+                mimetype='text/event-stream',
+                headers={
+                    'Cache-Control': 'no-cache',
+                    'X-Accel-Buffering': 'no'
+                }
+            )
+            # stream() only unsubscribes once iterated; also release the slot
+            # if the body is never sent
+            response.call_on_close(lambda: broker.unsubscribe(subscription))
+            return response
+        
         @self.app.route('/api/system/status', methods=['GET'])
         def api_system_status():
             """
@@ -267,7 +333,7 @@ class WebServer:
                     
                     # If notifications not available, provide reason
                     if not status['notifications_available']:
-                        config = self.config_manager.get_config(include_secrets=False)
+                        config = self._config_view()
                         notifications_config = config.get('notifications', {})
                         
                         if notifications_config.get('email', {}).get('enabled', False):
@@ -298,7 +364,7 @@ class WebServer:
             """
             try:
                 # Get config without secrets and env overridden paths
-                config = self.config_manager.get_config(include_secrets=False)
+                config = self._config_view()
                 env_overridden_paths = self.config_manager.get_env_overridden_paths()
                 
                 # Build annotated config with metadata
@@ -353,6 +419,52 @@ class WebServer:
                     'message': f'Failed to update configuration: {str(e)}'
                 }), 500
         
+        @self.app.route('/api/config', methods=['PATCH'])
+        def api_config_patch():
+            """
+            Partially update configuration with a JSON Patch (RFC 6902).
+            
+            Only the changed subtrees are validated. Schedule, threshold and
+            notification changes are applied to the running scheduler without
+            a restart.
+            
+            Expects:
+                JSON: List of operations, e.g.
+                [{"op": "replace", "path": "/thresholds/temperature_f", "value": 30}]
+                
+            Returns:
+                JSON: Update result with status, restart_required flag, the
+                structured diff ('changes') and hot-reloaded subsystems ('reloaded')
+            """
+            try:
+                if not request.is_json:
+                    return jsonify({
+                        'status': 'error',
+                        'message': 'Request must be JSON'
+                    }), 400
+                
+                operations = request.get_json()
+                
+                if not isinstance(operations, list):
+                    return jsonify({
+                        'status': 'error',
+                        'message': 'Patch must be a list of operations'
+                    }), 400
+                
+                result = self.config_manager.apply_patch(operations, preserve_secrets=True)
+                
+                if result['status'] == 'ok':
+                    return jsonify(result)
+                else:
+                    return jsonify(result), 400
+                    
+            except Exception as e:
+                logger.error(f"Failed to patch config: {e}", exc_info=True)
+                return jsonify({
+                    'status': 'error',
+                    'message': f'Failed to update configuration: {str(e)}'
+                }), 500
+        
         @self.app.route('/api/credentials', methods=['POST'])
         def api_credentials_update():
             """
@@ -543,7 +655,7 @@ class WebServer:
                 
                 # Parse YAML
                 try:
-                    new_config = yaml.safe_load(file_content)
+                    new_config = safe_load(file_content)
                 except yaml.YAMLError as e:
                     return jsonify({
                         'status': 'error',
@@ -639,11 +751,17 @@ class WebServer:
             """
             Get detailed status of all devices and outlets.
             
-            This endpoint returns real-time status information for all configured
-            devices including their reachability, outlet states, and any errors.
+            This endpoint returns status information for all configured devices
+            including their reachability, outlet states, and any errors.
             Also includes initialization summary to help diagnose when devices
             fail to initialize (e.g., timeout during discovery).
             
+            Status is served from the scheduler's shared snapshot (refreshed
+            every devices.status_refresh_seconds and after control actions);
+            age_seconds tells how old it is. A stale snapshot is still returned
+            and triggers a background refresh. Pass ?fresh=1 to query the
+            devices now.
+            
             Returns:
                 JSON: List of devices with outlet states, reachability info, and initialization summary
                 {
@@ -684,7 +802,10 @@ class WebServer:
                             }
                         }
                     },
-                    "timestamp": "2024-01-01T12:00:00"
+                    "timestamp": "2024-01-01T12:00:00",
+                    "age_seconds": 12.5,
+                    "snapshot_time": "2024-01-01T11:59:47.500000",
+                    "stale": false
                 }
             """
             try:
@@ -700,14 +821,43 @@ class WebServer:
                         'message': 'Configure valid Tapo credentials to enable device control'
                     }), 503
                 
+                # Serve the shared snapshot; query devices only for ?fresh=1 or before the first refresh
+                snapshot_view = None
+                device_status = self._get_device_status_snapshot()
+                if device_status is not None:
+                    fresh = request.args.get('fresh', '').lower() in ('1', 'true', 'yes')
+                    snapshot_view = None if fresh else device_status.get()
+                    if snapshot_view is None:
+                        try:
+                            snapshot_view = self.scheduler.run_coro_in_loop(device_status.refresh())
+                        except SchedulerCallTimeout as e:
+                            logger.error(f"Device status query timed out: {e}")
+                            return jsonify({
+                                'error': 'Device status query timed out',
+                                'details': str(e)
+                            }), 504
+                        except RuntimeError as e:
+                            logger.error(f"Scheduler loop not available: {e}")
+                            return jsonify({
+                                'error': 'Async operations not available',
+                                'details': str(e)
+                            }), 500
+                    devices_status = snapshot_view['devices']
+                
                 # Check if scheduler has the run_coro_in_loop method (for thread-safe async execution)
-                if hasattr(self.scheduler, 'run_coro_in_loop'):
+                elif hasattr(self.scheduler, 'run_coro_in_loop'):
                     # Use the scheduler's event loop to avoid python-kasa async issues
                     # This prevents "Timeout context manager should be used inside a task" errors
                     try:
                         devices_status = self.scheduler.run_coro_in_loop(
                             self.scheduler.device_manager.get_all_devices_status()
                         )
+                    except SchedulerCallTimeout as e:
+                        logger.error(f"Device status query timed out: {e}")
+                        return jsonify({
+                            'error': 'Device status query timed out',
+                            'details': str(e)
+                        }), 504
                     except RuntimeError as e:
                         logger.error(f"Scheduler loop not available: {e}")
                         return jsonify({
@@ -729,12 +879,17 @@ class WebServer:
                 # Get initialization summary
                 init_summary = self.scheduler.device_manager.get_initialization_summary()
                 
-                return jsonify({
+                response = {
                     'status': 'ok',
                     'devices': devices_status,
                     'initialization_summary': init_summary,
                     'timestamp': datetime.now().isoformat()
-                })
+                }
+                if snapshot_view is not None:
+                    response['age_seconds'] = snapshot_view['age_seconds']
+                    response['snapshot_time'] = snapshot_view['snapshot_time']
+                    response['stale'] = snapshot_view['stale']
+                return jsonify(response)
                 
             except Exception as e:
                 logger.error(f"Failed to get devices status: {e}", exc_info=True)
@@ -831,6 +986,13 @@ class WebServer:
                                 group_name, device_name, outlet_index, action
                             )
                         )
+                    except SchedulerCallTimeout as e:
+                        logger.error(f"Device control timed out: {e}")
+                        return jsonify({
+                            'success': False,
+                            'error': 'Device control timed out',
+                            'details': str(e)
+                        }), 504
                     except RuntimeError as e:
                         logger.error(f"Scheduler loop not available: {e}")
                         return jsonify({
@@ -857,6 +1019,10 @@ class WebServer:
                         f"Manual control via WebUI: {action.upper()} device '{device_name}' "
                         f"outlet {outlet_index} in group '{group_name}'"
                     )
+                    self._publish_event(EVENT_DEVICES, {
+                        'group': group_name, 'device': device_name, 'outlet': outlet_index,
+                        'state': action, 'source': 'web'
+                    })
                     return jsonify(result)
                 else:
                     return jsonify(result), 400
@@ -943,7 +1109,7 @@ class WebServer:
                     }), 400
                 
                 # Get group config
-                config = self.config_manager.get_config(include_secrets=False)
+                config = self._config_view()
                 groups = config.get('devices', {}).get('groups', {})
                 
                 if group_name not in groups:
@@ -1023,6 +1189,8 @@ class WebServer:
                     f"Group control via WebUI: {action.upper()} group '{group_name}' "
                     f"({successful} successful, {failed} failed)"
                 )
+                if successful:
+                    self._publish_event(EVENT_DEVICES, {'group': group_name, 'state': action, 'source': 'web'})
                 
                 return jsonify({
                     'success': successful > 0,
@@ -1073,7 +1241,7 @@ class WebServer:
                     }), 503
                 
                 # Get group config
-                config = self.config_manager.get_config(include_secrets=False)
+                config = self._config_view()
                 groups = config.get('devices', {}).get('groups', {})
                 
                 if group_name not in groups:
@@ -1145,7 +1313,7 @@ class WebServer:
                     }), 400
                 
                 # Get group config
-                config = self.config_manager.get_config(include_secrets=False)
+                config = self._config_view()
                 groups = config.get('devices', {}).get('groups', {})
                 
                 if group_name not in groups:
@@ -1231,6 +1399,7 @@ class WebServer:
                     # Update scheduler
                     if self.scheduler:
                         self.scheduler.vacation_mode = enabled
+                        self.scheduler.schedule_prediction_refresh()
                         logger.info(f"Vacation mode {'enabled' if enabled else 'disabled'} via API")
                     
                     # Update config file
@@ -1251,6 +1420,52 @@ class WebServer:
                     'details': str(e)
                 }), 500
         
+        @self.app.route('/api/history', methods=['GET'])
+        def api_history():
+            """
+            Query per-group runtime, energy and temperature history.
+            
+            Query parameters:
+                group: Limit to one device group (default: all groups)
+                start: ISO 8601 time (default: 7 days before end)
+                end: ISO 8601 time (default: now)
+                resolution: raw, hour, day or auto (default)
+            
+            Returns:
+                JSON: {
+                    "resolution": "hour",
+                    "start": "...", "end": "...",
+                    "groups": {"<group>": {"points": [...], "transitions": [...]}}
+                }
+            """
+            history = getattr(self.scheduler, 'history', None) if self.scheduler else None
+            if not isinstance(history, HistoryStore):
+                return jsonify({'error': 'History not available'}), 503
+            
+            def _parse_time(name: str) -> Optional[datetime]:
+                value = request.args.get(name)
+                if not value:
+                    return None
+                # A '+' in an unencoded UTC offset arrives as a space
+                parsed = datetime.fromisoformat(value.replace(' ', '+'))
+                return parsed if parsed.tzinfo else parsed.replace(tzinfo=history.tz)
+            
+            try:
+                end = _parse_time('end') or datetime.now(history.tz)
+                start = _parse_time('start') or end - timedelta(days=7)
+                result = history.query(
+                    start, end,
+                    group_name=request.args.get('group') or None,
+                    resolution=request.args.get('resolution', 'auto')
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            except Exception as e:
+                logger.error(f"Failed to query history: {e}", exc_info=True)
+                return jsonify({'error': 'Failed to query history', 'details': str(e)}), 500
+            
+            return jsonify(result)
+        
         @self.app.route('/api/solar_times', methods=['GET'])
         def api_solar_times():
             """
@@ -1296,7 +1511,7 @@ class WebServer:
             POST: Adds a new schedule to the group
             """
             try:
-                config = self.config_manager.get_config(include_secrets=True)
+                config = self.config_manager.get_config_view()
                 groups = config.get('devices', {}).get('groups', {})
                 
                 if group_name not in groups:
@@ -1323,21 +1538,15 @@ class WebServer:
                             'details': errors
                         }), 400
                     
-                    # Add schedule to group
-                    schedules = groups[group_name].get('schedules', [])
-                    schedules.append(new_schedule)
-                    groups[group_name]['schedules'] = schedules
-                    
-                    # Save config
-                    self.config_manager._write_config_to_disk(config)
-                    
-                    # Reload config from disk to sync in-memory cache
-                    self.config_manager.reload_config()
+                    # Add schedule to group (scheduler schedules are hot-reloaded by the change listener)
+                    if 'schedules' in groups[group_name]:
+                        operation = {'op': 'add', 'path': self._schedule_pointer(group_name, '-'), 'value': new_schedule}
+                    else:
+                        operation = {'op': 'add', 'path': self._schedule_pointer(group_name), 'value': [new_schedule]}
                     
-                    # Reload scheduler schedules
-                    if self.scheduler:
-                        from src.scheduler.schedule_types import parse_schedules
-                        self.scheduler.group_schedules[group_name] = parse_schedules(schedules)
+                    result = self.config_manager.apply_patch([operation])
+                    if result['status'] != 'ok':
+                        return self._schedule_patch_error(result)
                     
                     logger.info(f"Added schedule '{new_schedule.get('name')}' to group '{group_name}'")
                     
@@ -1363,7 +1572,7 @@ class WebServer:
             DELETE: Deletes the schedule at the given index
             """
             try:
-                config = self.config_manager.get_config(include_secrets=True)
+                config = self.config_manager.get_config_view()
                 groups = config.get('devices', {}).get('groups', {})
                 
                 if group_name not in groups:
@@ -1395,20 +1604,14 @@ class WebServer:
                             'details': errors
                         }), 400
                     
-                    # Update schedule
-                    schedules[schedule_index] = updated_schedule
-                    groups[group_name]['schedules'] = schedules
-                    
-                    # Save config
-                    self.config_manager._write_config_to_disk(config)
-                    
-                    # Reload config from disk to sync in-memory cache
-                    self.config_manager.reload_config()
-                    
-                    # Reload scheduler schedules
-                    if self.scheduler:
-                        from src.scheduler.schedule_types import parse_schedules
-                        self.scheduler.group_schedules[group_name] = parse_schedules(schedules)
+                    # Update schedule (fails if it was changed concurrently)
+                    path = self._schedule_pointer(group_name, schedule_index)
+                    result = self.config_manager.apply_patch([
+                        {'op': 'test', 'path': path, 'value': schedules[schedule_index]},
+                        {'op': 'replace', 'path': path, 'value': updated_schedule}
+                    ])
+                    if result['status'] != 'ok':
+                        return self._schedule_patch_error(result)
                     
                     logger.info(f"Updated schedule {schedule_index} for group '{group_name}'")
                     
@@ -1418,20 +1621,15 @@ class WebServer:
                     })
                 
                 elif request.method == 'DELETE':
-                    # Remove schedule
-                    removed_schedule = schedules.pop(schedule_index)
-                    groups[group_name]['schedules'] = schedules
-                    
-                    # Save config
-                    self.config_manager._write_config_to_disk(config)
-                    
-                    # Reload config from disk to sync in-memory cache
-                    self.config_manager.reload_config()
-                    
-                    # Reload scheduler schedules
-                    if self.scheduler:
-                        from src.scheduler.schedule_types import parse_schedules
-                        self.scheduler.group_schedules[group_name] = parse_schedules(schedules)
+                    # Remove schedule (fails if it was changed concurrently)
+                    removed_schedule = schedules[schedule_index]
+                    path = self._schedule_pointer(group_name, schedule_index)
+                    result = self.config_manager.apply_patch([
+                        {'op': 'test', 'path': path, 'value': removed_schedule},
+                        {'op': 'remove', 'path': path}
+                    ])
+                    if result['status'] != 'ok':
+                        return self._schedule_patch_error(result)
                     
                     logger.info(f"Deleted schedule {schedule_index} from group '{group_name}'")
                     
@@ -1461,7 +1659,7 @@ class WebServer:
                 
                 enabled = bool(data['enabled'])
                 
-                config = self.config_manager.get_config(include_secrets=True)
+                config = self.config_manager.get_config_view()
                 groups = config.get('devices', {}).get('groups', {})
                 
                 if group_name not in groups:
@@ -1472,20 +1670,14 @@ class WebServer:
                 if schedule_index < 0 or schedule_index >= len(schedules):
                     return jsonify({'error': f"Schedule index {schedule_index} out of range"}), 404
                 
-                # Update enabled status
-                schedules[schedule_index]['enabled'] = enabled
-                groups[group_name]['schedules'] = schedules
-                
-                # Save config
-                self.config_manager._write_config_to_disk(config)
-                
-                # Reload config from disk to sync in-memory cache
-                self.config_manager.reload_config()
-                
-                # Reload scheduler schedules
-                if self.scheduler:
-                    from src.scheduler.schedule_types import parse_schedules
-                    self.scheduler.group_schedules[group_name] = parse_schedules(schedules)
+                # Update enabled status (fails if the schedule was changed concurrently)
+                path = self._schedule_pointer(group_name, schedule_index)
+                result = self.config_manager.apply_patch([
+                    {'op': 'test', 'path': path, 'value': schedules[schedule_index]},
+                    {'op': 'add', 'path': f"{path}/enabled", 'value': enabled}
+                ])
+                if result['status'] != 'ok':
+                    return self._schedule_patch_error(result)
                 
                 logger.info(
                     f"{'Enabled' if enabled else 'Disabled'} schedule {schedule_index} "
@@ -1512,6 +1704,10 @@ class WebServer:
             This is a strictly read-only endpoint that returns cached weather data.
             Does NOT trigger any outbound network calls to weather providers.
             
+            The payload is rendered once per forecast, configuration change and
+            weather state (and at most every 6 minutes for cache age), then served
+            with an ETag (304 on If-None-Match) and gzip when accepted.
+            
             Returns:
                 JSON: Weather forecast with hourly data, alerts, and metadata
             """
@@ -1522,8 +1718,16 @@ class WebServer:
                         'reason': 'Scheduler not available'
                     }), 200
                 
+                # Serve the pre-rendered payload while its inputs are unchanged
+                weather = getattr(self.scheduler, 'weather', None)
+                cache = getattr(weather, 'cache', None) if weather else None
+                if cache and cache.cache_data:
+                    cached = self._weather_forecast_response
+                    if cached is not None and cached.key == self._weather_forecast_key(weather, cache):
+                        return cached.to_response(request)
+                
                 # Check if weather is enabled
-                config = self.config_manager.get_config(include_secrets=False)
+                config = self._config_view()
                 weather_enabled = config.get('weather_api', {}).get('enabled', True)
                 
                 if not weather_enabled:
@@ -1532,110 +1736,22 @@ class WebServer:
                         'reason': 'Weather service is disabled in configuration'
                     }), 200
                 
-                # Get weather service
-                weather = getattr(self.scheduler, 'weather', None)
                 if not weather:
                     return jsonify({
                         'status': 'no_data',
                         'reason': 'Weather service not initialized'
                     }), 200
                 
-                # Get cached data
-                cache = getattr(weather, 'cache', None)
                 if not cache or not cache.cache_data:
                     return jsonify({
                         'status': 'no_data',
                         'reason': 'No cached weather data available'
                     }), 200
                 
-                # Check cache validity
-                cache_age_hours = cache.get_cache_age_hours()
-                cache_valid_hours = config.get('weather_api', {}).get('resilience', {}).get(
-                    'cache_valid_hours', 6.0
-                )
-                
-                # Build response from cached data
-                cache_data = cache.cache_data
-                
-                # Get provider info
-                provider = config.get('weather_api', {}).get('provider', 'open-meteo')
-                
-                # Get timezone from location config
-                timezone = config.get('location', {}).get('timezone', 'auto')
-                
-                # Get last fetch time
-                last_updated = cache_data.get('fetched_at')
-                
-                # Build hourly forecast data
-                hours = []
-                forecast_list = cache_data.get('forecast', [])
-                
-                # Get black ice detection config
-                thresholds = config.get('thresholds', {})
-                black_ice_config = thresholds.get('black_ice_detection', {})
-                black_ice_enabled = black_ice_config.get('enabled', True)
-                temp_max = black_ice_config.get('temperature_max_f', 36.0)
-                dew_spread_max = black_ice_config.get('dew_point_spread_f', 4.0)
-                humidity_min = black_ice_config.get('humidity_min_percent', 80.0)
-                
-                for entry in forecast_list:
-                    temp_f = entry.get('temperature_f')
-                    dewpoint_f = entry.get('dewpoint_f')
-                    humidity = entry.get('humidity_percent')
-                    
-                    # Calculate black ice risk
-                    black_ice_risk = False
-                    if black_ice_enabled and temp_f is not None and dewpoint_f is not None and humidity is not None:
-                        dew_spread = temp_f - dewpoint_f
-                        if temp_f <= temp_max and dew_spread <= dew_spread_max and humidity >= humidity_min:
-                            black_ice_risk = True
-                    
-                    hour_data = {
-                        'time': entry.get('timestamp'),
-                        'temp_f': temp_f,
-                        'temp_c': round((temp_f - 32) * 5/9, 1) if temp_f else None,
-                        'dewpoint_f': dewpoint_f,
-                        'dewpoint_c': round((dewpoint_f - 32) * 5/9, 1) if dewpoint_f else None,
-                        'humidity_percent': humidity,
-                        'black_ice_risk': black_ice_risk,
-                        'precip_prob': None,  # Not stored in current cache format
-                        'precip_intensity': entry.get('precipitation_mm'),
-                        'precip_type': 'snow' if temp_f and temp_f <= 32 and entry.get('precipitation_mm', 0) > 0 else ('rain' if entry.get('precipitation_mm', 0) > 0 else None),
-                        'wind_speed_mph': None,  # Not stored in current cache format
-                        'wind_gust_mph': None,  # Not stored in current cache format
-                        'alerts': [],
-                        'raw': entry
-                    }
-                    hours.append(hour_data)
-                
-                # Get weather state
-                weather_state = None
-                if hasattr(weather, 'state'):
-                    state = weather.state
-                    if hasattr(state, 'value'):
-                        weather_state = state.value
-                    elif hasattr(state, 'name'):
-                        weather_state = state.name
-                    else:
-                        weather_state = str(state)
-                
-                # Get configured forecast hours from scheduler config and validate
-                forecast_hours = config.get('scheduler', {}).get('forecast_hours', 12)
-                if not isinstance(forecast_hours, int) or forecast_hours < 1:
-                    forecast_hours = 12
-                
-                return jsonify({
-                    'status': 'ok',
-                    'last_updated': last_updated,
-                    'provider': provider,
-                    'timezone': timezone,
-                    'cache_age_hours': cache_age_hours,
-                    'cache_valid_hours': cache_valid_hours,
-                    'forecast_hours': forecast_hours,
-                    'hours': hours,
-                    'alerts': [],  # Would need additional data source for alerts
-                    'weather_state': weather_state
-                })
+                key = self._weather_forecast_key(weather, cache)
+                cached = CachedJSONResponse(key, self._build_weather_forecast_payload(config, weather, cache))
+                self._weather_forecast_response = cached
+                return cached.to_response(request)
                 
             except Exception as e:
                 logger.error(f"Failed to get weather forecast: {e}", exc_info=True)
@@ -1664,7 +1780,7 @@ class WebServer:
                     }), 200
                 
                 # Get configuration
-                config = self.config_manager.get_config(include_secrets=False)
+                config = self._config_view()
                 
                 # Get forecast horizon from config
                 forecast_hours = config.get('scheduler', {}).get('forecast_hours', 12)
@@ -1813,11 +1929,14 @@ class WebServer:
                             'error': 'Scheduler or device manager not available'
                         }), 503
                     
-                    config = self.config_manager.get_config(include_secrets=False)
+                    config = self._config_view()
                     groups = config.get('devices', {}).get('groups', {})
                     
                     result = {}
                     
+                    # Weather is shared by all groups - read it once per request
+                    temperature = self._get_current_temperature_c()
+                    
                     for group_name, group_config in groups.items():
                         # Query actual device state from hardware
                         is_on = False
@@ -1846,20 +1965,6 @@ class WebServer:
                         # Check if group has schedule
                         has_schedule = self._group_has_schedule(group_name)
                         
-                        # Get temperature (optional, from weather service)
-                        temperature = None
-                        try:
-                            if self.scheduler.weather:
-                                conditions = self.scheduler.run_coro_in_loop(
-                                    self.scheduler.weather.get_current_conditions()
-                                )
-                                if conditions:
-                                    temp_f, precip_mm = conditions
-                                    # Convert to Celsius
-                                    temperature = round((temp_f - 32) * 5/9, 1)
-                        except Exception as e:
-                            logger.debug(f"Failed to get temperature: {e}")
-                        
                         # Determine mode
                         if override:
                             mode = 'manual'
@@ -1974,7 +2079,7 @@ class WebServer:
                             'error': 'Scheduler or device manager not available'
                         }), 503
                     
-                    config = self.config_manager.get_config(include_secrets=False)
+                    config = self._config_view()
                     groups = config.get('devices', {}).get('groups', {})
                     
                     if group_name not in groups:
@@ -2025,6 +2130,8 @@ class WebServer:
                             except Exception as e:
                                 logger.error(f"Failed to control {device_name} outlet {outlet_index}: {e}")
                     
+                    self._publish_event(EVENT_DEVICES, {'group': group_name, 'state': action, 'source': 'web'})
+                    
                     # Return updated status
                     return api_mat_status()
                 
@@ -2097,6 +2204,9 @@ class WebServer:
                                 self.scheduler.run_coro_in_loop(
                                     self.scheduler.device_manager.turn_off_group(group_name)
                                 )
+                            self._publish_event(EVENT_DEVICES, {
+                                'group': group_name, 'state': 'on' if should_be_on else 'off', 'source': 'web'
+                            })
                         except TimeoutError as e:
                             logger.error(f"Timeout applying schedule for group '{group_name}': {e}")
                             return jsonify({
@@ -2199,7 +2309,7 @@ class WebServer:
         Returns:
             Override duration in hours (default: 3.0)
         """
-        config = self.config_manager.get_config(include_secrets=False)
+        config = self._config_view()
         
         # Check group-specific override hours first
         groups = config.get('devices', {}).get('groups', {})
@@ -2213,6 +2323,254 @@ class WebServer:
         web_config = config.get('web', {})
         return float(web_config.get('manual_override_timeout_hours', 3.0))
     
+    def _weather_state_name(self, weather) -> Optional[str]:
+        """Get the weather service state as a JSON-serializable string."""
+        if not hasattr(weather, 'state'):
+            return None
+        state = weather.state
+        if hasattr(state, 'value'):
+            return state.value
+        if hasattr(state, 'name'):
+            return state.name
+        return str(state)
+    
+    def _rounded_cache_age_hours(self, cache) -> Optional[float]:
+        """Cache age rounded to 0.1 hour (the precision shown in the UI)."""
+        cache_age_hours = cache.get_cache_age_hours()
+        return round(cache_age_hours, 1) if cache_age_hours is not None else None
+    
+    def _weather_forecast_key(self, weather, cache) -> tuple:
+        """
+        Version of everything /api/weather/forecast is built from.
+        
+        Covers the configuration revision, the cached forecast (replaced on each
+        save), the weather service state and the displayed cache age.
+        """
+        cache_data = cache.cache_data
+        return (
+            self.config_manager.revision,
+            id(cache_data),
+            cache_data.get('fetched_at'),
+            self._weather_state_name(weather),
+            self._rounded_cache_age_hours(cache)
+        )
+    
+    def _build_weather_forecast_payload(self, config: Dict[str, Any], weather, cache) -> Dict[str, Any]:
+        """
+        Build the /api/weather/forecast payload from cached weather data.
+        
+        Args:
+            config: Configuration (secrets filtered)
+            weather: Weather service
+            cache: Weather cache with forecast data
+            
+        Returns:
+            Forecast payload with hourly data and metadata
+        """
+        # Check cache validity
+        cache_age_hours = self._rounded_cache_age_hours(cache)
+        cache_valid_hours = config.get('weather_api', {}).get('resilience', {}).get(
+            'cache_valid_hours', 6.0
+        )
+        
+        # Build response from cached data
+        cache_data = cache.cache_data
+        
+        # Get provider info
+        provider = config.get('weather_api', {}).get('provider', 'open-meteo')
+        
+        # Get timezone from location config
+        timezone = config.get('location', {}).get('timezone', 'auto')
+        
+        # Get last fetch time
+        last_updated = cache_data.get('fetched_at')
+        
+        # Build hourly forecast data
+        hours = []
+        forecast_list = cache_data.get('forecast', [])
+        
+        # Get black ice detection config
+        thresholds = config.get('thresholds', {})
+        black_ice_config = thresholds.get('black_ice_detection', {})
+        black_ice_enabled = black_ice_config.get('enabled', True)
+        temp_max = black_ice_config.get('temperature_max_f', 36.0)
+        dew_spread_max = black_ice_config.get('dew_point_spread_f', 4.0)
+        humidity_min = black_ice_config.get('humidity_min_percent', 80.0)
+        
+        for entry in forecast_list:
+            temp_f = entry.get('temperature_f')
+            dewpoint_f = entry.get('dewpoint_f')
+            humidity = entry.get('humidity_percent')
+            
+            # Calculate black ice risk
+            black_ice_risk = False
+            if black_ice_enabled and temp_f is not None and dewpoint_f is not None and humidity is not None:
+                dew_spread = temp_f - dewpoint_f
+                if temp_f <= temp_max and dew_spread <= dew_spread_max and humidity >= humidity_min:
+                    black_ice_risk = True
+            
+            hour_data = {
+                'time': entry.get('timestamp'),
+                'temp_f': temp_f,
+                'temp_c': round((temp_f - 32) * 5/9, 1) if temp_f else None,
+                'dewpoint_f': dewpoint_f,
+                'dewpoint_c': round((dewpoint_f - 32) * 5/9, 1) if dewpoint_f else None,
+                'humidity_percent': humidity,
+                'black_ice_risk': black_ice_risk,
+                'precip_prob': None,  # Not stored in current cache format
+                'precip_intensity': entry.get('precipitation_mm'),
+                'precip_type': 'snow' if temp_f and temp_f <= 32 and entry.get('precipitation_mm', 0) > 0 else ('rain' if entry.get('precipitation_mm', 0) > 0 else None),
+                'wind_speed_mph': None,  # Not stored in current cache format
+                'wind_gust_mph': None,  # Not stored in current cache format
+                'alerts': [],
+                'raw': entry
+            }
+            hours.append(hour_data)
+        
+        # Get weather state
+        weather_state = self._weather_state_name(weather)
+        
+        # Get configured forecast hours from scheduler config and validate
+        forecast_hours = config.get('scheduler', {}).get('forecast_hours', 12)
+        if not isinstance(forecast_hours, int) or forecast_hours < 1:
+            forecast_hours = 12
+        
+        return {
+            'status': 'ok',
+            'last_updated': last_updated,
+            'provider': provider,
+            'timezone': timezone,
+            'cache_age_hours': cache_age_hours,
+            'cache_valid_hours': cache_valid_hours,
+            'forecast_hours': forecast_hours,
+            'hours': hours,
+            'alerts': [],  # Would need additional data source for alerts
+            'weather_state': weather_state
+        }
+    
+    def _config_view(self) -> Dict[str, Any]:
+        """
+        Get the current configuration with secrets masked, for read-only use.
+        
+        Returns the config manager's published snapshot without copying; use
+        config_manager.get_config() when the result will be modified.
+        """
+        if isinstance(self.config_manager, ConfigManager):
+            return self.config_manager.get_config_view()
+        return self.config_manager.get_config(include_secrets=False)
+    
+    @staticmethod
+    def _schedule_pointer(group_name: str, *keys) -> str:
+        """JSON Pointer to a group's schedules list (or an entry in it)."""
+        return to_pointer('devices', 'groups', group_name, 'schedules', *keys)
+    
+    # HTTP status for a failed schedule patch, by apply_patch error_type
+    _SCHEDULE_PATCH_ERROR_STATUS = {
+        'patch': 409,  # Schedule changed or removed concurrently (failed test op, missing path)
+        'validation': 400,
+    }
+    
+    def _schedule_patch_error(self, result: Dict[str, Any]):
+        """Build the error response for a schedule change apply_patch rejected."""
+        status = self._SCHEDULE_PATCH_ERROR_STATUS.get(result.get('error_type'), 500)
+        return jsonify({'error': result['message']}), status
+    
+    def _on_config_changed(self, changes: List[ConfigChange], snapshot: ConfigSnapshot):
+        """
+        Apply hot-reloadable configuration changes to the running scheduler.
+        
+        Registered as a ConfigManager change listener. Also stamps the scheduler
+        with the new config revision so memoized predictions are recomputed.
+        
+        Args:
+            changes: Changed paths
+            snapshot: Newly published configuration snapshot
+        """
+        if not self.scheduler:
+            return
+        
+        subsystems = set()
+        groups = set()
+        for change in changes:
+            subsystem = ConfigManager.get_change_subsystem(change.path)
+            if subsystem:
+                subsystems.add(subsystem)
+            if subsystem == 'schedules':
+                groups.add(change.path[2])
+        
+        self.scheduler.config_revision = snapshot.revision
+        if subsystems:
+            self.scheduler.apply_config_changes(snapshot.config, subsystems, groups)
+    
+    def _get_event_broker(self) -> Optional[EventBroker]:
+        """Get the scheduler's event broker, if available."""
+        broker = getattr(self.scheduler, 'events', None)
+        return broker if isinstance(broker, EventBroker) else None
+    
+    def _publish_event(self, event_type: str, data: Dict[str, Any]):
+        """Publish a state change to event stream subscribers (no-op without a scheduler)."""
+        broker = self._get_event_broker()
+        if broker is not None:
+            broker.publish(event_type, data)
+        
+        # Device switched from the web: refresh the shared status snapshot soon
+        device_status = self._get_device_status_snapshot()
+        if event_type == EVENT_DEVICES and device_status is not None:
+            device_status.request_refresh()
+    
+    def _get_device_status_snapshot(self) -> Optional[DeviceStatusSnapshot]:
+        """Get the scheduler's shared device status snapshot, if available."""
+        snapshot = getattr(self.scheduler, 'device_status', None)
+        return snapshot if isinstance(snapshot, DeviceStatusSnapshot) else None
+    
+    def _get_weather_snapshot(self) -> Optional[WeatherConditionsSnapshot]:
+        """
+        Get the scheduler's shared weather conditions snapshot.
+        
+        Returns:
+            WeatherConditionsSnapshot, or None if the scheduler cannot provide one
+        """
+        if not self.scheduler or not getattr(self.scheduler, 'weather', None):
+            return None
+        
+        try:
+            snapshot = self.scheduler.run_coro_in_loop(self.scheduler.get_weather_snapshot())
+        except Exception as e:
+            logger.debug(f"Weather snapshot unavailable: {e}")
+            return None
+        
+        return snapshot if isinstance(snapshot, WeatherConditionsSnapshot) else None
+    
+    def _get_current_temperature_c(self) -> Optional[float]:
+        """
+        Get the current temperature in Celsius from the shared weather snapshot.
+        
+        Falls back to querying the weather service directly when no snapshot is available.
+        
+        Returns:
+            Temperature in Celsius rounded to 0.1, or None if unavailable
+        """
+        if not self.scheduler or not getattr(self.scheduler, 'weather', None):
+            return None
+        
+        temp_f = None
+        snapshot = self._get_weather_snapshot()
+        if snapshot is not None:
+            temp_f = snapshot.temperature_f
+        else:
+            try:
+                conditions = self.scheduler.run_coro_in_loop(
+                    self.scheduler.weather.get_current_conditions()
+                )
+                if conditions:
+                    temp_f, _ = conditions
+            except Exception as e:
+                logger.debug(f"Failed to get temperature: {e}")
+        
+        if temp_f is None:
+            return None
+        return round((temp_f - 32) * 5/9, 1)
+    
     def _get_system_status(self) -> Dict[str, Any]:
         """
         Get current system status.
@@ -2235,7 +2593,7 @@ class WebServer:
         if self.scheduler:
             try:
                 # Get weather enabled status
-                config = self.config_manager.get_config(include_secrets=False)
+                config = self._config_view()
                 status['weather_enabled'] = config.get('weather_api', {}).get('enabled', True)
                 
                 # Get device groups info
@@ -2255,6 +2613,20 @@ class WebServer:
                 # Add vacation mode status
                 status['vacation_mode'] = getattr(self.scheduler, 'vacation_mode', False)
                 
+                # Add last scheduler cycle summary (per-group action and latency)
+                last_cycle = getattr(self.scheduler, 'last_cycle_summary', None)
+                if isinstance(last_cycle, dict) and last_cycle:
+                    status['last_cycle'] = last_cycle
+                
+                # Add web-to-scheduler call metrics (queue depth, wait times, timeouts)
+                loop_bridge = getattr(self.scheduler, 'loop_bridge', None)
+                if isinstance(loop_bridge, LoopBridge):
+                    status['scheduler_bridge'] = loop_bridge.get_metrics()
+                
+                event_broker = self._get_event_broker()
+                if event_broker is not None:
+                    status['event_streams'] = event_broker.get_stats()
+                
                 # Try to get weather service status
                 if hasattr(self.scheduler, 'weather') and self.scheduler.weather:
                     weather = self.scheduler.weather
@@ -2278,6 +2650,11 @@ class WebServer:
                         cache_age = weather.get_cache_age_hours()
                         if cache_age is not None:
                             status['weather_cache_age_hours'] = round(cache_age, 2)
+                    
+                    # Shared weather conditions used by schedule evaluation
+                    snapshot = self._get_weather_snapshot()
+                    if snapshot is not None:
+                        status['weather_conditions'] = snapshot.to_dict()
                 
                 # Get device expectations for health monitoring
                 if hasattr(self.scheduler, 'get_device_expectations'):
@@ -2550,6 +2927,21 @@ class WebServer:
                     pin = web['pin']
                     if not isinstance(pin, str):
                         errors.append(f"web.pin must be a string, got {type(pin).__name__}")
+                
+                # Validate production server settings
+                if 'server' in web and web['server'] not in ('production', 'development'):
+                    errors.append(f"web.server must be 'production' or 'development', got {web['server']!r}")
+                
+                if 'max_workers' in web:
+                    max_workers = web['max_workers']
+                    if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+                        errors.append(f"web.max_workers must be a positive integer, got {max_workers!r}")
+                
+                for key in ('request_timeout_seconds', 'keepalive_timeout_seconds', 'shutdown_timeout_seconds'):
+                    if key in web:
+                        value = web[key]
+                        if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+                            errors.append(f"web.{key} must be a positive number, got {value!r}")
         
         # Validate scheduler section if present
         if 'scheduler' in config:
@@ -2567,14 +2959,21 @@ class WebServer:
         
         return errors
     
-    def run(self, host: str = '127.0.0.1', port: int = 4328, debug: bool = False):
+    def run(self, host: str = '127.0.0.1', port: int = 4328, debug: bool = False,
+            shutdown_event=None):
         """
         Run the web server.
         
+        web.server selects the server: 'production' (default) serves requests on a
+        bounded worker pool with per-connection timeouts; 'development' uses Flask's
+        built-in server. Debug mode always uses the development server.
+        
         Args:
             host: Host to bind to
             port: Port to bind to
             debug: Enable debug mode
+            shutdown_event: Optional event; the production server shuts down
+                gracefully once it is set
         """
         # Log security warning if binding to non-local address
         if host not in ['127.0.0.1', 'localhost']:
@@ -2582,7 +2981,7 @@ class WebServer:
             logger.warning("SECURITY WARNING: Web UI is accessible over the network")
             logger.warning(f"Binding to: {host}:{port}")
             
-            config = self.config_manager.get_config(include_secrets=False)
+            config = self._config_view()
             auth_enabled = config.get('web', {}).get('auth', {}).get('enabled', False)
             
             if not auth_enabled:
@@ -2591,7 +2990,31 @@ class WebServer:
             
             logger.warning("=" * 80)
         
-        logger.info(f"Starting web server on {host}:{port}")
+        self._shutdown_event = shutdown_event
+        
+        web_config = self._config_view().get('web', {})
+        server_mode = web_config.get('server', 'production')
+        
+        logger.info(f"Starting web server on {host}:{port} ({server_mode} mode)")
+        
+        if server_mode == 'production' and not debug:
+            wsgi_server.serve(
+                self.app,
+                host=host,
+                port=port,
+                max_workers=web_config.get('max_workers', wsgi_server.DEFAULT_MAX_WORKERS),
+                request_timeout=web_config.get(
+                    'request_timeout_seconds', wsgi_server.DEFAULT_REQUEST_TIMEOUT_SECONDS
+                ),
+                keepalive_timeout=web_config.get(
+                    'keepalive_timeout_seconds', wsgi_server.DEFAULT_KEEPALIVE_TIMEOUT_SECONDS
+                ),
+                shutdown_timeout=web_config.get(
+                    'shutdown_timeout_seconds', wsgi_server.DEFAULT_SHUTDOWN_TIMEOUT_SECONDS
+                ),
+                should_stop=shutdown_event.is_set if shutdown_event is not None else None
+            )
+            return
         
         # Run Flask app
         self.app.run(host=host, port=port, debug=debug, use_reloader=False)
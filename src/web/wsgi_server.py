@@ -0,0 +1,237 @@
+"""Production WSGI server with a bounded worker pool and graceful shutdown."""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+
+logger = logging.getLogger(__name__)
+
+# Production server defaults
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 30
+DEFAULT_KEEPALIVE_TIMEOUT_SECONDS = 5
+DEFAULT_SHUTDOWN_TIMEOUT_SECONDS = 10
+DEFAULT_LISTEN_BACKLOG = 64
+
+# How often the shutdown watcher checks the shutdown signal (seconds)
+SHUTDOWN_POLL_INTERVAL = 0.5
+
+
+class PooledRequestHandler(WSGIRequestHandler):
+    """
+    Keep-alive request handler.
+
+    `timeout` bounds socket reads within a request; `keepalive_timeout` bounds
+    the wait for the next request on a kept-alive connection. Kept-alive
+    connections are closed instead when every worker is busy.
+    """
+
+    protocol_version = "HTTP/1.1"
+    timeout = DEFAULT_REQUEST_TIMEOUT_SECONDS
+    keepalive_timeout = DEFAULT_KEEPALIVE_TIMEOUT_SECONDS
+
+    def setup(self):
+        super().setup()
+        self._requests_handled = 0
+
+    def handle_one_request(self):
+        if self._requests_handled and not self._wait_for_next_request():
+            self.close_connection = True
+            return
+        self._requests_handled += 1
+        super().handle_one_request()
+
+    def _wait_for_next_request(self) -> bool:
+        """Wait up to keepalive_timeout for the next request; False to close the connection."""
+        if self.server.saturated:
+            return False
+        self.connection.settimeout(self.keepalive_timeout)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            # Timed out waiting, or the client went away
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    WSGI server that handles connections on a fixed-size thread pool.
+
+    Unlike Werkzeug's threaded development server (one unbounded thread per
+    connection), at most max_workers connections are served at once; further
+    connections wait in the listen backlog. Each connection has a socket timeout
+    and a shorter idle keep-alive timeout, so slow or idle clients cannot hold a
+    worker for long.
+    """
+
+    multithread = True
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        app,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        listen_backlog: int = DEFAULT_LISTEN_BACKLOG,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT_SECONDS
+    ):
+        """
+        Initialize server and bind the listening socket.
+
+        Args:
+            host: Host to bind to
+            port: Port to bind to (0 for an ephemeral port)
+            app: WSGI application
+            max_workers: Maximum connections served concurrently
+            request_timeout: Socket timeout in seconds for each connection
+            listen_backlog: Pending connections queued by the OS while workers are busy
+            keepalive_timeout: Seconds an idle keep-alive connection may wait for its next request
+        """
+        handler = type('PooledRequestHandler', (PooledRequestHandler,), {
+            'timeout': request_timeout,
+            'keepalive_timeout': min(keepalive_timeout, request_timeout)
+        })
+        self.request_queue_size = listen_backlog
+        super().__init__(host, port, app, handler=handler)
+
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='WebWorker')
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._active = 0
+        self._idle = threading.Condition()
+        self._stopping = threading.Event()
+
+    def process_request(self, request, client_address):
+        """Hand the connection to a worker, waiting for a free slot first."""
+        # Bounded waits so shutdown() is not blocked while every worker is busy
+        while not self._slots.acquire(timeout=SHUTDOWN_POLL_INTERVAL):
+            if self._stopping.is_set():
+                self.shutdown_request(request)
+                return
+        with self._idle:
+            self._active += 1
+        try:
+            self._executor.submit(self._process_request_worker, request, client_address)
+        except RuntimeError:
+            # Executor already shut down
+            self._release_slot()
+            self.shutdown_request(request)
+
+    def _process_request_worker(self, request, client_address):
+        """Serve one connection on a worker thread."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._release_slot()
+
+    def _release_slot(self):
+        with self._idle:
+            self._active -= 1
+            self._idle.notify_all()
+        self._slots.release()
+
+    def shutdown(self):
+        """Stop serve_forever, abandoning any connection still waiting for a worker."""
+        self._stopping.set()
+        super().shutdown()
+
+    @property
+    def active_connections(self) -> int:
+        """Number of connections currently being served."""
+        return self._active
+
+    @property
+    def saturated(self) -> bool:
+        """Whether every worker is busy."""
+        return self._active >= self.max_workers
+
+    def drain(self, timeout: float) -> bool:
+        """
+        Wait for in-flight connections to finish and stop the worker pool.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if all connections finished in time
+        """
+        with self._idle:
+            drained = self._idle.wait_for(lambda: self._active == 0, timeout=timeout)
+        self._executor.shutdown(wait=drained, cancel_futures=True)
+        return drained
+
+
+def serve(
+    app,
+    host: str,
+    port: int,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    request_timeout: float = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    shutdown_timeout: float = DEFAULT_SHUTDOWN_TIMEOUT_SECONDS,
+    listen_backlog: int = DEFAULT_LISTEN_BACKLOG,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT_SECONDS,
+    should_stop: Optional[Callable[[], bool]] = None,
+    on_ready: Optional[Callable[[PooledWSGIServer], None]] = None
+):
+    """
+    Serve a WSGI app until interrupted or should_stop() returns True.
+
+    Args:
+        app: WSGI application
+        host: Host to bind to
+        port: Port to bind to
+        max_workers: Maximum connections served concurrently
+        request_timeout: Socket timeout in seconds for each connection
+        shutdown_timeout: Seconds to let in-flight requests finish on shutdown
+        listen_backlog: Pending connections queued by the OS while workers are busy
+        keepalive_timeout: Seconds an idle keep-alive connection may wait for its next request
+        should_stop: Polled periodically; returning True starts a graceful shutdown
+        on_ready: Called with the server once it is listening
+    """
+    server = PooledWSGIServer(
+        host, port, app,
+        max_workers=max_workers,
+        request_timeout=request_timeout,
+        listen_backlog=listen_backlog,
+        keepalive_timeout=keepalive_timeout
+    )
+    stopped = threading.Event()
+
+    def watch_for_shutdown():
+        while not stopped.wait(SHUTDOWN_POLL_INTERVAL):
+            if should_stop():
+                logger.info("Shutdown requested - stopping web server")
+                server.shutdown()
+                return
+
+    if should_stop is not None:
+        threading.Thread(target=watch_for_shutdown, name='WebShutdownWatcher', daemon=True).start()
+
+    logger.info(
+        f"Production web server listening on {host}:{server.port} "
+        f"(workers={max_workers}, request_timeout={request_timeout}s, "
+        f"keepalive_timeout={keepalive_timeout}s)"
+    )
+    if on_ready is not None:
+        on_ready(server)
+
+    try:
+        server.serve_forever(poll_interval=SHUTDOWN_POLL_INTERVAL)
+    finally:
+        stopped.set()
+        if not server.drain(shutdown_timeout):
+            logger.warning(
+                f"Web server stopped with {server.active_connections} request(s) still running "
+                f"after {shutdown_timeout}s"
+            )
+        logger.info("Web server stopped")
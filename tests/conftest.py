@@ -8,6 +8,22 @@ from typing import Dict, Any
 from src.scheduler.solar_calculator import SolarCalculator
 from src.scheduler.schedule_evaluator import ScheduleEvaluator
 from src.scheduler.schedule_types import Schedule
+from src.state.state_store import state_store
+
+
+# ============================================================================
+# State Store Isolation
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def flush_state_store():
+    """Flush the process-wide state store after each test.
+
+    Write-behind documents left pending would otherwise be written by a later
+    test's flush, after their temporary directory may be gone.
+    """
+    yield
+    state_store.flush()
 
 
 # ============================================================================
@@ -20,6 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.config.config_loader import Config
 from src.scheduler.automation_overrides import AutomationOverrides
 from src.scheduler.scheduler_enhanced import EnhancedScheduler
+from src.state.state_store import state_store
 
 
 def test_scheduler_integration():
@@ -122,7 +123,8 @@ web:
         print("\n4. Setting override: morning_mode = False...")
         overrides.set_flag('heattrax', 'morning_mode', False)
         
-        # Verify override was saved
+        # Verify override was saved (writes are batched; flush them to disk)
+        state_store.flush()
         with open(state_file, 'r') as f:
             saved_state = json.load(f)
         assert saved_state == {'heattrax': {'morning_mode': False}}, "Override not saved correctly"
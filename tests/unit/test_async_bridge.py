@@ -0,0 +1,152 @@
+"""Unit tests for the web-to-scheduler loop bridge."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.async_bridge import LoopBridge, SchedulerCallTimeout, coalesced
+
+
+class Probe:
+    """Object with coalesced and plain coroutine methods."""
+
+    def __init__(self):
+        self.calls = 0
+        self.cancelled = False
+
+    @coalesced
+    async def read(self, delay=0.05):
+        self.calls += 1
+        await asyncio.sleep(delay)
+        return self.calls
+
+    async def write(self):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return self.calls
+
+    async def hang(self):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+@pytest.fixture
+def loop():
+    """Event loop running in a background thread (like the scheduler's)."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=2)
+    loop.close()
+
+
+def _run_concurrently(bridge, loop, make_coro, count=3):
+    """Call bridge.run from several threads at once and collect results."""
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(bridge.run(make_coro(), loop)))
+        for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=2)
+    return results
+
+
+@pytest.mark.unit
+class TestLoopBridge:
+    """Tests for LoopBridge."""
+
+    def test_returns_result(self, loop):
+        bridge = LoopBridge()
+        probe = Probe()
+
+        assert bridge.run(probe.write(), loop) == 1
+
+        metrics = bridge.get_metrics()
+        assert metrics['submitted'] == 1
+        assert metrics['pending'] == 0
+        assert metrics['avg_wait_ms'] is not None
+
+    def test_identical_reads_are_coalesced(self, loop):
+        bridge = LoopBridge()
+        probe = Probe()
+
+        results = _run_concurrently(bridge, loop, probe.read)
+
+        assert results == [1, 1, 1]
+        assert probe.calls == 1
+        assert bridge.get_metrics()['coalesced'] == 2
+
+    def test_different_arguments_are_not_coalesced(self, loop):
+        bridge = LoopBridge()
+        probe = Probe()
+
+        threads = [
+            threading.Thread(target=bridge.run, args=(probe.read(delay), loop))
+            for delay in (0.05, 0.06)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert probe.calls == 2
+
+    def test_default_and_explicit_arguments_share_a_key(self, loop):
+        bridge = LoopBridge()
+        probe = Probe()
+        calls = iter([lambda: probe.read(), lambda: probe.read(0.05), lambda: probe.read(delay=0.05)])
+
+        results = _run_concurrently(bridge, loop, lambda: next(calls)())
+
+        assert results == [1, 1, 1]
+        assert probe.calls == 1
+
+    def test_separate_instances_are_not_coalesced(self, loop):
+        bridge = LoopBridge()
+        probes = iter([Probe(), Probe()])
+
+        results = _run_concurrently(bridge, loop, lambda: next(probes).read(), count=2)
+
+        assert results == [1, 1]
+        assert bridge.get_metrics()['coalesced'] == 0
+
+    def test_unmarked_coroutines_are_not_coalesced(self, loop):
+        bridge = LoopBridge()
+        probe = Probe()
+
+        _run_concurrently(bridge, loop, probe.write)
+
+        assert probe.calls == 3
+        assert bridge.get_metrics()['coalesced'] == 0
+
+    def test_timeout_cancels_call_on_loop(self, loop):
+        bridge = LoopBridge(default_timeout=0.05)
+        probe = Probe()
+
+        with pytest.raises(SchedulerCallTimeout):
+            bridge.run(probe.hang(), loop)
+
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result(timeout=1)
+        metrics = bridge.get_metrics()
+        assert probe.cancelled
+        assert metrics['timeouts'] == 1
+        assert metrics['failures'] == 1
+        assert metrics['pending'] == 0
+
+    def test_errors_propagate(self, loop):
+        bridge = LoopBridge()
+
+        async def fail():
+            raise ValueError('boom')
+
+        with pytest.raises(ValueError):
+            bridge.run(fail(), loop)
@@ -7,6 +7,7 @@ import pytest
 import tempfile
 from pathlib import Path
 from src.scheduler.automation_overrides import AutomationOverrides
+from src.state.state_store import state_store
 
 
 class TestAutomationOverrides:
@@ -80,6 +81,7 @@ class TestAutomationOverrides:
             overrides.set_flag("heattrax", "weather_control", True)
             
             assert overrides.get_group_overrides("heattrax") == {"weather_control": True}
+            state_store.flush()
             assert state_file.exists()
     
     def test_set_flag_updates_existing(self):
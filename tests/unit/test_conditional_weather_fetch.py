@@ -0,0 +1,155 @@
+"""Unit tests for conditional weather fetches and unchanged-payload short-circuiting."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, AsyncMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.weather.resilient_weather_service import ResilientWeatherService
+from src.weather.weather_cache import WeatherCache
+from src.weather.weather_service import conditional_headers, response_validators
+
+
+TZ = ZoneInfo('America/New_York')
+
+
+def _payload(hours=24, generation_ms=0.5):
+    """Build an Open-Meteo style payload starting at the current hour."""
+    start = datetime.now(TZ).replace(minute=0, second=0, microsecond=0)
+    times = [(start + timedelta(hours=h)).strftime('%Y-%m-%dT%H:%M') for h in range(hours)]
+    return {
+        'generationtime_ms': generation_ms,
+        'hourly': {
+            'time': times,
+            'temperature_2m': [30.0] * hours,
+            'precipitation': [0.0] * hours
+        }
+    }
+
+
+class FakeProvider:
+    """Weather provider supporting conditional requests."""
+
+    def __init__(self, responses):
+        self.latitude = 40.7
+        self.longitude = -74.0
+        self.timezone = 'America/New_York'
+        self.responses = list(responses)
+        self.sent_validators = []
+
+    async def get_forecast(self, hours_ahead=12):
+        data, _ = self.responses.pop(0)
+        return data
+
+    async def get_forecast_conditional(self, hours_ahead=12, validators=None):
+        self.sent_validators.append(validators)
+        return self.responses.pop(0)
+
+
+def _service(tmp_path, provider):
+    notifier = MagicMock()
+    notifier.notify_new_forecast = AsyncMock()
+    return ResilientWeatherService(
+        weather_service=provider,
+        cache_file=str(tmp_path / 'weather_cache.json'),
+        forecast_horizon_hours=12,
+        forecast_notifier=notifier
+    )
+
+
+@pytest.mark.unit
+class TestConditionalFetch:
+    """Tests for ResilientWeatherService.fetch_and_cache_forecast."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_payload_skips_save_and_notification(self, tmp_path):
+        provider = FakeProvider([
+            (_payload(generation_ms=0.5), {'etag': '"v1"'}),
+            (_payload(generation_ms=0.9), {'etag': '"v1b"'}),
+        ])
+        service = _service(tmp_path, provider)
+
+        assert await service.fetch_and_cache_forecast()
+        await asyncio.sleep(0)
+        fetched_at = service.cache.cache_data['fetched_at']
+        assert service.forecast_notifier.notify_new_forecast.await_count == 1
+
+        service.cache.save_forecast = MagicMock()
+        assert await service.fetch_and_cache_forecast()
+        await asyncio.sleep(0)
+
+        service.cache.save_forecast.assert_not_called()
+        assert service.cache.cache_data['fetched_at'] == fetched_at
+        assert service.forecast_notifier.notify_new_forecast.await_count == 1
+        assert service.cache.validators['etag'] == '"v1b"'
+
+    @pytest.mark.asyncio
+    async def test_not_modified_keeps_cache_and_sends_validators(self, tmp_path):
+        provider = FakeProvider([
+            (_payload(), {'etag': '"v1"', 'last_modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}),
+            (None, {'etag': '"v1"', 'last_modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}),
+        ])
+        service = _service(tmp_path, provider)
+
+        assert await service.fetch_and_cache_forecast()
+        assert await service.fetch_and_cache_forecast()
+
+        assert provider.sent_validators[-1] == {
+            'etag': '"v1"', 'last_modified': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        }
+        assert service.cache.cache_data is not None
+        assert service.cache.get_cache_age_hours() < 0.01
+
+    @pytest.mark.asyncio
+    async def test_changed_payload_is_saved(self, tmp_path):
+        changed = _payload()
+        changed['hourly']['temperature_2m'][3] = 10.0
+        provider = FakeProvider([(_payload(), {}), (changed, {})])
+        service = _service(tmp_path, provider)
+
+        await service.fetch_and_cache_forecast()
+        first_hash = service.cache.validators['content_hash']
+        await service.fetch_and_cache_forecast()
+
+        assert service.cache.validators['content_hash'] != first_hash
+        assert 10.0 in service.cache.forecast_index.temperature_f
+
+    @pytest.mark.asyncio
+    async def test_plain_request_when_cache_does_not_cover_horizon(self, tmp_path):
+        provider = FakeProvider([(_payload(hours=4), {}), (_payload(hours=4), {})])
+        service = _service(tmp_path, provider)
+
+        await service.fetch_and_cache_forecast()
+        await service.fetch_and_cache_forecast()
+
+        assert provider.sent_validators == [{}, {}]
+
+    @pytest.mark.asyncio
+    async def test_validators_persist_across_restarts(self, tmp_path):
+        provider = FakeProvider([(_payload(), {'etag': '"v1"'})])
+        service = _service(tmp_path, provider)
+        await service.fetch_and_cache_forecast()
+
+        reloaded = WeatherCache(str(tmp_path / 'weather_cache.json'), timezone='America/New_York')
+
+        assert reloaded.validators['etag'] == '"v1"'
+        assert reloaded.validators['content_hash'] == service.cache.validators['content_hash']
+
+
+@pytest.mark.unit
+class TestValidatorHelpers:
+    """Tests for conditional header helpers."""
+
+    def test_conditional_headers(self):
+        assert conditional_headers({'etag': '"a"', 'last_modified': 'x'}) == {
+            'If-None-Match': '"a"', 'If-Modified-Since': 'x'
+        }
+        assert conditional_headers({}) == {}
+
+    def test_response_validators(self):
+        response = MagicMock()
+        response.headers = {'ETag': '"a"'}
+
+        assert response_validators(response) == {'etag': '"a"'}
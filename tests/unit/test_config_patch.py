@@ -0,0 +1,262 @@
+"""Unit tests for JSON Patch config updates, structured diffs and hot reload."""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.config.config_loader import Config
+from src.config.config_manager import ConfigManager
+from src.config.patch import ConfigPatchError, apply_json_patch, diff_config, parse_pointer, to_pointer
+from src.scheduler.scheduler_enhanced import EnhancedScheduler
+from src.web.web_server import WebServer
+
+
+SCHEDULE = {
+    'name': 'Evening',
+    'enabled': True,
+    'priority': 'normal',
+    'on': {'type': 'time', 'value': '17:00'},
+    'off': {'type': 'time', 'value': '23:00'}
+}
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    for key in list(os.environ):
+        if key.startswith('HEATTRAX_'):
+            monkeypatch.delenv(key)
+    manager = ConfigManager(str(tmp_path / 'config.yaml'))
+    result = manager.apply_patch([
+        {'op': 'add', 'path': '/devices/groups/heated_mats/schedules', 'value': [SCHEDULE]}
+    ])
+    assert result['status'] == 'ok'
+    return manager
+
+
+@pytest.mark.unit
+class TestJsonPatch:
+    """Tests for apply_json_patch and diff_config."""
+
+    def test_operations(self):
+        document = {'a': {'b': 1}, 'items': [1, 2]}
+
+        result = apply_json_patch(document, [
+            {'op': 'test', 'path': '/a/b', 'value': 1},
+            {'op': 'replace', 'path': '/a/b', 'value': 2},
+            {'op': 'add', 'path': '/items/-', 'value': 3},
+            {'op': 'remove', 'path': '/items/0'},
+            {'op': 'add', 'path': '/a/c', 'value': {'d': True}}
+        ])
+
+        assert result == {'a': {'b': 2, 'c': {'d': True}}, 'items': [2, 3]}
+        assert document == {'a': {'b': 1}, 'items': [1, 2]}
+
+    @pytest.mark.parametrize('operation', [
+        {'op': 'replace', 'path': '/missing', 'value': 1},
+        {'op': 'remove', 'path': '/items/5'},
+        {'op': 'test', 'path': '/a/b', 'value': 2},
+        {'op': 'move', 'path': '/a/b'},
+        {'op': 'add', 'path': 'a/b', 'value': 1},
+    ])
+    def test_invalid_operations(self, operation):
+        with pytest.raises(ConfigPatchError):
+            apply_json_patch({'a': {'b': 1}, 'items': [1]}, [operation])
+
+    def test_pointer_escaping(self):
+        pointer = to_pointer('groups', 'front/back~mats', 0)
+
+        assert pointer == '/groups/front~1back~0mats/0'
+        assert parse_pointer(pointer) == ['groups', 'front/back~mats', '0']
+
+    def test_diff_reports_leaf_paths(self):
+        old = {'a': {'b': 1, 'c': [{'x': 1}, {'x': 2}]}, 'gone': 1}
+        new = {'a': {'b': 1, 'c': [{'x': 1}, {'x': 3}]}, 'added': 2}
+
+        changes = {change.dotted: (change.old, change.new) for change in diff_config(old, new)}
+
+        assert changes == {'a.c.1.x': (2, 3), 'gone': (1, None), 'added': (None, 2)}
+
+
+@pytest.mark.unit
+class TestApplyPatch:
+    """Tests for ConfigManager.apply_patch."""
+
+    def test_schedule_toggle_is_hot_reloadable(self, manager):
+        revision = manager.revision
+
+        result = manager.apply_patch([
+            {'op': 'replace', 'path': '/devices/groups/heated_mats/schedules/0/enabled', 'value': False}
+        ])
+
+        assert result['status'] == 'ok'
+        assert result['restart_required'] == 'false'
+        assert result['reloaded'] == ['schedules']
+        assert result['changes'] == [
+            {'path': 'devices.groups.heated_mats.schedules.0.enabled', 'old': True, 'new': False}
+        ]
+        assert manager.revision == revision + 1
+        assert manager.get_config_view()['devices']['groups']['heated_mats']['schedules'][0]['enabled'] is False
+
+    def test_only_changed_subtrees_are_validated(self, manager):
+        with patch.object(ConfigManager, '_validate_notifications') as notifications, \
+                patch.object(ConfigManager, '_validate_location') as location:
+            result = manager.apply_patch([
+                {'op': 'replace', 'path': '/thresholds/temperature_f', 'value': 30}
+            ])
+
+        assert result['status'] == 'ok'
+        notifications.assert_not_called()
+        location.assert_not_called()
+
+    def test_invalid_patch_leaves_config_unchanged(self, manager):
+        revision = manager.revision
+
+        result = manager.apply_patch([{'op': 'replace', 'path': '/location/latitude', 'value': 999}])
+
+        assert result['status'] == 'error'
+        assert 'Validation error' in result['message']
+        assert manager.revision == revision
+
+    def test_invalid_schedule_is_rejected(self, manager):
+        revision = manager.revision
+        listener = Mock()
+        manager.add_change_listener(listener)
+
+        result = manager.apply_patch([
+            {'op': 'add', 'path': '/devices/groups/heated_mats/schedules/0/days', 'value': [0, 9]}
+        ])
+
+        assert result['status'] == 'error'
+        assert 'Validation error' in result['message']
+        assert 'devices.groups.heated_mats.schedules' in result['message']
+        assert manager.revision == revision
+        assert manager.get_config_view()['devices']['groups']['heated_mats']['schedules'][0] == SCHEDULE
+        listener.assert_not_called()
+
+    def test_full_update_rejects_invalid_schedule(self, manager):
+        revision = manager.revision
+        listener = Mock()
+        manager.add_change_listener(listener)
+        config = manager.get_config(include_secrets=True)
+        config['devices']['groups']['heated_mats']['schedules'][0]['on']['value'] = '25:99'
+
+        result = manager.update_config(config)
+
+        assert result['status'] == 'error'
+        assert 'devices.groups.heated_mats.schedules' in result['message']
+        assert manager.revision == revision
+        listener.assert_not_called()
+
+    def test_structural_change_requires_restart(self, manager):
+        result = manager.apply_patch([{'op': 'replace', 'path': '/web/port', 'value': 5000}])
+
+        assert result['restart_required'] == 'true'
+        assert result['reloaded'] == []
+
+    def test_secrets_are_masked_and_preserved(self, manager):
+        manager.apply_patch([{'op': 'replace', 'path': '/devices/credentials/password', 'value': 'hunter2'}])
+
+        result = manager.apply_patch([
+            {'op': 'replace', 'path': '/devices/credentials/password', 'value': '********'}
+        ])
+        assert result['changes'] == []
+
+        result = manager.apply_patch([
+            {'op': 'replace', 'path': '/devices/credentials/password', 'value': 'correct-horse'}
+        ])
+        assert result['changes'][0]['old'] == '********'
+        assert result['changes'][0]['new'] == '********'
+        assert manager.get_config(include_secrets=True)['devices']['credentials']['password'] == 'correct-horse'
+
+    def test_listeners_receive_changes(self, manager):
+        received = []
+        manager.add_change_listener(lambda changes, snapshot: received.append((changes, snapshot)))
+
+        manager.apply_patch([{'op': 'replace', 'path': '/thresholds/temperature_f', 'value': 30}])
+
+        changes, snapshot = received[0]
+        assert [change.dotted for change in changes] == ['thresholds.temperature_f']
+        assert snapshot is manager.snapshot
+
+
+@pytest.mark.unit
+class TestApplyConfigChanges:
+    """Tests for EnhancedScheduler.apply_config_changes."""
+
+    @pytest.fixture
+    def scheduler(self):
+        return EnhancedScheduler(Config('config.example.yaml'), setup_mode=True)
+
+    def test_invalid_schedule_applies_nothing(self, scheduler):
+        before = dict(scheduler.group_schedules)
+        config = {'devices': {'groups': {
+            'first': {'schedules': [SCHEDULE]},
+            'second': {'schedules': [{**SCHEDULE, 'on': {'type': 'time', 'value': '25:99'}}]}
+        }}, 'thresholds': {'temperature_f': 30}}
+
+        with pytest.raises(ValueError):
+            scheduler.apply_config_changes(config, {'schedules', 'thresholds'}, ['first', 'second'])
+
+        assert scheduler.group_schedules == before
+        assert scheduler.config._config.get('thresholds') != {'temperature_f': 30}
+
+    def test_changes_are_applied_on_the_scheduler_loop(self, scheduler):
+        scheduler.loop = Mock()
+        config = {'devices': {'groups': {'first': {'schedules': [SCHEDULE]}}}}
+
+        scheduler.apply_config_changes(config, {'schedules'}, ['first'])
+
+        assert 'first' not in scheduler.group_schedules
+        callback, *args = scheduler.loop.call_soon_threadsafe.call_args.args
+        callback(*args)
+        assert [schedule.name for schedule in scheduler.group_schedules['first']] == ['Evening']
+
+
+@pytest.mark.unit
+class TestConfigPatchEndpoints:
+    """Tests for PATCH /api/config and schedule endpoints hot reload."""
+
+    @pytest.fixture
+    def server(self, manager):
+        return WebServer(manager, scheduler=Mock())
+
+    def test_patch_endpoint_hot_reloads_thresholds(self, server):
+        response = server.app.test_client().patch(
+            '/api/config', json=[{'op': 'replace', 'path': '/thresholds/temperature_f', 'value': 30}]
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()['reloaded'] == ['thresholds']
+        config, subsystems, groups = server.scheduler.apply_config_changes.call_args.args
+        assert config['thresholds']['temperature_f'] == 30
+        assert subsystems == {'thresholds'}
+        assert server.scheduler.config_revision == server.config_manager.revision
+
+    def test_patch_endpoint_rejects_invalid_patch(self, server):
+        response = server.app.test_client().patch(
+            '/api/config', json=[{'op': 'replace', 'path': '/nope', 'value': 1}]
+        )
+
+        assert response.status_code == 400
+        server.scheduler.apply_config_changes.assert_not_called()
+
+    def test_schedule_toggle_reloads_only_that_group(self, server):
+        response = server.app.test_client().put(
+            '/api/groups/heated_mats/schedules/0/enabled', json={'enabled': False}
+        )
+
+        assert response.status_code == 200
+        _, subsystems, groups = server.scheduler.apply_config_changes.call_args.args
+        assert subsystems == {'schedules'}
+        assert groups == {'heated_mats'}
+
+    @pytest.mark.parametrize('error_type, status', [('validation', 400), ('patch', 409)])
+    def test_schedule_endpoint_error_status(self, server, error_type, status):
+        error = ConfigManager._error_result('rejected', error_type)
+        with patch.object(server.config_manager, 'apply_patch', return_value=error):
+            response = server.app.test_client().put(
+                '/api/groups/heated_mats/schedules/0/enabled', json={'enabled': False}
+            )
+
+        assert response.status_code == status
@@ -0,0 +1,93 @@
+"""Unit tests for immutable ConfigManager snapshots."""
+
+import copy
+import json
+import os
+
+import pytest
+
+from src.config.config_manager import ConfigManager
+from src.config.patch import diff_config
+from src.config.snapshot import FrozenDict, FrozenList, freeze, thaw
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    for key in list(os.environ):
+        if key.startswith('HEATTRAX_'):
+            monkeypatch.delenv(key)
+    return ConfigManager(str(tmp_path / 'config.yaml'))
+
+
+@pytest.mark.unit
+class TestFreeze:
+    """Tests for freeze/thaw."""
+
+    def test_frozen_tree_rejects_mutation(self):
+        frozen = freeze({'a': {'b': [1, 2]}})
+
+        assert isinstance(frozen['a'], FrozenDict)
+        assert isinstance(frozen['a']['b'], FrozenList)
+        with pytest.raises(TypeError):
+            frozen['a']['c'] = 1
+        with pytest.raises(TypeError):
+            frozen['a']['b'].append(3)
+        with pytest.raises(TypeError):
+            frozen.setdefault('x', {})
+
+    def test_copies_are_plain_and_mutable(self):
+        frozen = freeze({'a': {'b': [1, 2]}})
+
+        for copied in (thaw(frozen), copy.deepcopy(frozen)):
+            copied['a']['b'].append(3)
+            assert type(copied['a']) is dict
+            assert copied['a']['b'] == [1, 2, 3]
+        assert frozen == {'a': {'b': [1, 2]}}
+        assert json.loads(json.dumps(frozen)) == {'a': {'b': [1, 2]}}
+
+    def test_unchanged_subtrees_are_shared(self):
+        first = freeze({'web': {'port': 4328}, 'location': {'latitude': 1.0}})
+        second = freeze({'web': {'port': 4329}, 'location': {'latitude': 1.0}}, first)
+
+        assert second['location'] is first['location']
+        assert second['web'] is not first['web']
+
+    @pytest.mark.parametrize('old, new', [(1, True), (0, False), (1, 1.0)])
+    def test_type_only_change_is_not_dropped(self, old, new):
+        first = freeze({'x': {'enabled': old}})
+        second = freeze({'x': {'enabled': new}}, first)
+
+        assert type(second['x']['enabled']) is type(new)
+        assert [change.dotted for change in diff_config(first, second)] == ['x.enabled']
+
+
+@pytest.mark.unit
+class TestConfigManagerSnapshots:
+    """Tests for ConfigManager snapshot publishing."""
+
+    def test_view_is_shared_and_masks_secrets(self, manager):
+        view = manager.get_config_view()
+
+        assert view is manager.get_config_view()
+        assert view['devices']['credentials']['password'] == '********'
+        assert manager.get_config_view(include_secrets=True) is manager.snapshot.config
+
+    def test_get_config_still_returns_mutable_copy(self, manager):
+        config = manager.get_config(include_secrets=True)
+        config['location']['latitude'] = 10.0
+
+        assert manager.get_config_view(include_secrets=True)['location']['latitude'] != 10.0
+
+    def test_update_publishes_new_snapshot(self, manager):
+        before = manager.snapshot
+        config = manager.get_config(include_secrets=True)
+        config['location']['latitude'] = 10.0
+
+        assert manager.update_config(config)['status'] == 'ok'
+
+        after = manager.snapshot
+        assert after.revision == before.revision + 1
+        assert after.public['location']['latitude'] == 10.0
+        # Readers holding the old snapshot keep a consistent view
+        assert before.public['location']['latitude'] != 10.0
+        assert after.public['web'] is before.public['web']
@@ -0,0 +1,134 @@
+"""Unit tests for the ManagedDevice state cache and background verification."""
+
+import asyncio
+from unittest.mock import MagicMock, AsyncMock
+
+import pytest
+
+from src.devices.device_group_manager import ManagedDevice, DeviceGroupManager
+
+
+def _device(is_on=False, **config):
+    """Create an initialized ManagedDevice wrapping a mocked plug."""
+    device = ManagedDevice(
+        config={'name': 'plug', 'ip_address': '10.0.0.1', **config},
+        username='user',
+        password='pass'
+    )
+    plug = MagicMock()
+    plug.children = []
+    plug.is_on = is_on
+    plug.update = AsyncMock()
+    plug.turn_on = AsyncMock()
+    plug.turn_off = AsyncMock()
+    device.device = plug
+    device._initialized = True
+    return device, plug
+
+
+@pytest.mark.unit
+class TestStateCache:
+    """Tests for cached reads."""
+
+    @pytest.mark.asyncio
+    async def test_reads_reuse_recent_update(self):
+        device, plug = _device(is_on=True)
+
+        assert await device.get_state() is True
+        assert await device.get_state() is True
+        status = await device.get_detailed_status()
+
+        assert plug.update.await_count == 1
+        assert status['reachable'] is True
+        assert status['state_age_seconds'] is not None
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_always_queries(self):
+        device, plug = _device(state_cache_ttl_seconds=0)
+
+        await device.get_state()
+        await device.get_state()
+
+        assert plug.update.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_max_age_zero_forces_refresh(self):
+        device, plug = _device()
+
+        await device.get_state()
+        await device.get_detailed_status(max_age=0)
+
+        assert plug.update.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_update(self):
+        device, plug = _device()
+
+        async def slow_update():
+            await asyncio.sleep(0.05)
+        plug.update = AsyncMock(side_effect=slow_update)
+
+        await asyncio.gather(device.get_state(), device.get_state(), device.get_state())
+
+        assert plug.update.await_count == 1
+
+    def test_defaults_from_manager_config(self):
+        device = ManagedDevice(
+            config={'name': 'plug', 'ip_address': '10.0.0.1', 'verify_after_write': True},
+            username='user',
+            password='pass',
+            defaults={'state_cache_ttl_seconds': 30, 'verify_after_write': False}
+        )
+
+        assert device.state_cache_ttl == 30
+        assert device.verify_after_write is True
+
+    def test_manager_collects_device_defaults(self):
+        manager = DeviceGroupManager({
+            'credentials': {'username': 'user', 'password': 'pass'},
+            'state_cache_ttl_seconds': 5,
+            'groups': {}
+        })
+
+        assert manager.device_defaults == {'state_cache_ttl_seconds': 5}
+
+
+@pytest.mark.unit
+class TestWrites:
+    """Tests for write invalidation and verification."""
+
+    @pytest.mark.asyncio
+    async def test_turn_on_does_not_block_on_verification(self):
+        device, plug = _device(is_on=False)
+        device.VERIFY_DELAY_SECONDS = 0.05
+
+        await device.turn_on()
+
+        plug.turn_on.assert_awaited_once()
+        assert device.state_age_seconds is None
+        assert plug.update.await_count == 1
+
+        await asyncio.sleep(0.1)
+        assert plug.update.await_count == 2
+        assert device.state_age_seconds is not None
+
+    @pytest.mark.asyncio
+    async def test_no_write_keeps_cache(self):
+        device, plug = _device(is_on=True)
+
+        await device.get_state()
+        await device.turn_on()
+
+        plug.turn_on.assert_not_awaited()
+        assert plug.update.await_count == 1
+        assert device.state_age_seconds is not None
+
+    @pytest.mark.asyncio
+    async def test_verification_disabled(self):
+        device, plug = _device(is_on=True, verify_after_write=False)
+
+        await device.turn_off()
+        await asyncio.sleep(0)
+
+        assert device._verify_task is None
+        assert device.state_age_seconds is None
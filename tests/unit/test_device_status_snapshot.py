@@ -0,0 +1,126 @@
+"""Unit tests for the shared device status snapshot and /api/devices/status."""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.config.config_manager import ConfigManager
+from src.devices.status_snapshot import DeviceStatusSnapshot
+from src.web.web_server import WebServer
+
+
+def _status(group, on, reachable=True, controlled=True):
+    return {
+        'name': f'{group}-plug', 'group': group, 'reachable': reachable,
+        'outlets': [{'index': 0, 'is_on': on, 'controlled': controlled}],
+    }
+
+
+@pytest.fixture
+def device_manager():
+    manager = Mock()
+    manager.get_all_devices_status = AsyncMock(return_value=[_status('mats', True)])
+    manager.get_initialization_summary.return_value = {'total_groups': 1}
+    return manager
+
+
+@pytest.mark.unit
+class TestDeviceStatusSnapshot:
+    """Tests for DeviceStatusSnapshot."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_queries_devices_once_for_concurrent_callers(self, device_manager):
+        snapshot = DeviceStatusSnapshot(device_manager)
+        assert snapshot.get() is None
+
+        views = await asyncio.gather(snapshot.refresh(), snapshot.refresh())
+
+        device_manager.get_all_devices_status.assert_awaited_once_with(max_age=0)
+        assert views[0]['devices'] == [_status('mats', True)]
+        assert views[0]['age_seconds'] < 1
+        assert views[0]['stale'] is False
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_is_served_and_revalidated(self, device_manager):
+        snapshot = DeviceStatusSnapshot(device_manager, refresh_interval=60)
+        worker = asyncio.create_task(snapshot.run())
+        try:
+            await asyncio.sleep(0.01)
+            assert device_manager.get_all_devices_status.await_count == 1
+
+            snapshot._taken_at -= 120
+            device_manager.get_all_devices_status.return_value = [_status('mats', False)]
+            view = snapshot.get()
+            assert view['stale'] is True
+            assert view['devices'] == [_status('mats', True)]
+
+            await asyncio.sleep(0.01)
+            assert device_manager.get_all_devices_status.await_count == 2
+            assert snapshot.get()['devices'] == [_status('mats', False)]
+        finally:
+            worker.cancel()
+
+    @pytest.mark.asyncio
+    async def test_control_action_requests_refresh(self, device_manager):
+        snapshot = DeviceStatusSnapshot(device_manager, refresh_interval=60)
+        worker = asyncio.create_task(snapshot.run())
+        try:
+            await asyncio.sleep(0.01)
+            snapshot.request_refresh()
+            await asyncio.sleep(0.01)
+        finally:
+            worker.cancel()
+
+        assert device_manager.get_all_devices_status.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_group_state_from_snapshot(self, device_manager):
+        device_manager.get_all_devices_status.return_value = [
+            _status('mats', False), _status('mats', True, controlled=False),
+            _status('walkway', True), _status('porch', True, reachable=False),
+        ]
+        snapshot = DeviceStatusSnapshot(device_manager)
+        assert snapshot.group_is_on('mats') is None
+
+        await snapshot.refresh()
+
+        assert snapshot.group_is_on('mats') is False
+        assert snapshot.group_is_on('walkway') is True
+        assert snapshot.group_is_on('porch') is None
+
+
+@pytest.mark.unit
+class TestDevicesStatusEndpoint:
+    """GET /api/devices/status serves the snapshot."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch, device_manager):
+        for key in list(os.environ):
+            if key.startswith('HEATTRAX_'):
+                monkeypatch.delenv(key)
+        scheduler = Mock()
+        scheduler.device_manager = device_manager
+        scheduler.device_status = DeviceStatusSnapshot(device_manager)
+        scheduler.run_coro_in_loop = lambda coro: asyncio.run(coro)
+        server = WebServer(ConfigManager(str(tmp_path / 'config.yaml')), scheduler=scheduler)
+        return server.app.test_client()
+
+    def test_served_from_snapshot(self, client, device_manager):
+        first = client.get('/api/devices/status').get_json()
+        second = client.get('/api/devices/status').get_json()
+
+        assert device_manager.get_all_devices_status.await_count == 1
+        assert second['devices'] == first['devices'] == [_status('mats', True)]
+        assert second['age_seconds'] >= 0
+        assert second['stale'] is False
+
+    def test_fresh_queries_devices(self, client, device_manager):
+        client.get('/api/devices/status')
+        device_manager.get_all_devices_status.return_value = [_status('mats', False)]
+
+        response = client.get('/api/devices/status?fresh=1').get_json()
+
+        assert device_manager.get_all_devices_status.await_count == 2
+        assert response['devices'] == [_status('mats', False)]
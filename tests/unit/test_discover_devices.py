@@ -0,0 +1,112 @@
+"""Unit tests for concurrent device info fetching during discovery."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.devices import device_discovery
+from src.devices.device_discovery import discover_devices, iter_discovered_devices
+
+
+def _device(ip, delay=0.0, error=None):
+    device = Mock()
+    device.host = ip
+    device.alias = f"plug-{ip}"
+    device.features = []
+
+    async def update():
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+
+    device.update = AsyncMock(side_effect=update)
+    return device
+
+
+@pytest.fixture
+def network():
+    """Devices answering the broadcast discovery, keyed by IP."""
+    found = {}
+    with patch.object(device_discovery.Discover, 'discover', new_callable=AsyncMock) as discover, \
+            patch.object(device_discovery, 'get_local_ip_and_subnet', return_value=None):
+        discover.return_value = found
+        yield found
+
+
+@pytest.mark.unit
+class TestConcurrentDiscovery:
+    """Tests for discover_devices and iter_discovered_devices."""
+
+    @pytest.mark.asyncio
+    async def test_updates_run_concurrently(self, network):
+        for n in range(6):
+            network[f"10.0.0.{n}"] = _device(f"10.0.0.{n}", delay=0.1)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        devices = await discover_devices(timeout=1)
+
+        assert loop.time() - started < 0.3
+        assert sorted(d.ip for d in devices) == [f"10.0.0.{n}" for n in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, network):
+        running = peak = 0
+
+        async def update():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        for n in range(10):
+            network[f"10.0.0.{n}"] = device = _device(f"10.0.0.{n}")
+            device.update.side_effect = update
+
+        devices = await discover_devices(timeout=1, max_concurrency=3)
+
+        assert len(devices) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_and_failing_devices_are_skipped(self, network):
+        network['10.0.0.1'] = _device('10.0.0.1')
+        network['10.0.0.2'] = _device('10.0.0.2', delay=5)
+        network['10.0.0.3'] = _device('10.0.0.3', error=ConnectionError('refused'))
+
+        devices = await discover_devices(timeout=1, update_timeout=0.05)
+
+        assert [d.ip for d in devices] == ['10.0.0.1']
+
+    @pytest.mark.asyncio
+    async def test_generator_yields_in_completion_order(self, network):
+        network['10.0.0.1'] = _device('10.0.0.1', delay=0.05)
+        network['10.0.0.2'] = _device('10.0.0.2')
+
+        ips = [info.ip async for info in iter_discovered_devices(timeout=1)]
+
+        assert ips == ['10.0.0.2', '10.0.0.1']
+
+    @pytest.mark.asyncio
+    async def test_closing_generator_cancels_pending_updates(self, network):
+        cancelled = asyncio.Event()
+
+        async def hang():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        network['10.0.0.1'] = _device('10.0.0.1')
+        network['10.0.0.2'] = slow = _device('10.0.0.2')
+        slow.update.side_effect = hang
+
+        devices = iter_discovered_devices(timeout=1)
+        first = await devices.__anext__()
+        await devices.aclose()
+
+        assert first.ip == '10.0.0.1'
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
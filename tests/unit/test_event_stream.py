@@ -0,0 +1,177 @@
+"""Unit tests for the state change event broker and /api/events stream."""
+
+import json
+import os
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from zoneinfo import ZoneInfo
+
+from src.config.config_manager import ConfigManager
+from src.events import EventBroker, format_sse
+from src.state.manual_override import ManualOverrideManager
+from src.web.web_server import WebServer
+
+
+def _decode(message):
+    """Parse an SSE message into (event type, payload)."""
+    fields = dict(line.split(': ', 1) for line in message.strip().split('\n'))
+    return fields['event'], json.loads(fields['data'])
+
+
+@pytest.mark.unit
+class TestEventBroker:
+    """Tests for EventBroker."""
+
+    def test_publish_reaches_all_subscribers(self):
+        broker = EventBroker()
+        first = broker.subscribe()
+        second = broker.subscribe()
+
+        broker.publish('cycle', {'duration_ms': 12.5})
+
+        for subscription in (first, second):
+            event = subscription.queue.get_nowait()
+            assert event['type'] == 'cycle'
+            assert event['data'] == {'duration_ms': 12.5}
+
+    def test_timestamps_use_configured_timezone(self):
+        broker = EventBroker(timezone='America/New_York')
+        subscription = broker.subscribe()
+
+        broker.publish('cycle')
+
+        timestamp = datetime.fromisoformat(subscription.queue.get_nowait()['timestamp'])
+        assert timestamp.utcoffset() == datetime.now(ZoneInfo('America/New_York')).utcoffset()
+
+    def test_format_sse(self):
+        message = format_sse({'id': 7, 'type': 'cycle', 'timestamp': 't', 'data': {'a': 1}})
+
+        assert message == 'id: 7\nevent: cycle\ndata: {"timestamp": "t", "data": {"a": 1}}\n\n'
+
+    def test_subscriber_limit(self):
+        broker = EventBroker(max_subscribers=1)
+        subscription = broker.subscribe()
+
+        assert broker.subscribe() is None
+
+        broker.unsubscribe(subscription)
+        assert broker.subscribe() is not None
+
+    def test_slow_subscriber_drops_oldest(self):
+        broker = EventBroker(queue_size=2)
+        subscription = broker.subscribe()
+
+        for index in range(3):
+            broker.publish('devices', {'index': index})
+
+        assert subscription.dropped == 1
+        assert subscription.queue.get_nowait()['data'] == {'index': 1}
+
+    def test_stream_formats_events_and_unsubscribes_on_stop(self):
+        broker = EventBroker()
+        subscription = broker.subscribe()
+        broker.publish('weather', {'fetched_at': '2024-01-01T00:00:00'})
+        stopped = []
+
+        stream = broker.stream(subscription, should_stop=lambda: bool(stopped))
+        assert next(stream).startswith('retry:')
+        event_type, payload = _decode(next(stream))
+        assert event_type == 'weather'
+        assert payload['data'] == {'fetched_at': '2024-01-01T00:00:00'}
+
+        stopped.append(True)
+        assert list(stream) == []
+        assert broker.subscriber_count == 0
+
+
+@pytest.mark.unit
+class TestOverrideChangeCallback:
+    """Tests for ManualOverrideManager.on_change."""
+
+    def test_set_and_clear_notify(self, tmp_path):
+        manager = ManualOverrideManager(state_file=str(tmp_path / 'overrides.json'))
+        changes = []
+        manager.on_change = lambda group, override: changes.append((group, override))
+
+        manager.set_override('mats', 'on', 1)
+        manager.clear_override('mats')
+
+        assert changes[0][0] == 'mats'
+        assert changes[0][1]['action'] == 'on'
+        assert changes[1] == ('mats', None)
+
+    def test_callback_errors_do_not_break_updates(self, tmp_path):
+        manager = ManualOverrideManager(state_file=str(tmp_path / 'overrides.json'))
+        manager.on_change = Mock(side_effect=RuntimeError('boom'))
+
+        manager.set_override('mats', 'off', 1)
+
+        assert manager.is_active('mats')
+
+
+@pytest.mark.unit
+class TestEventsEndpoint:
+    """Tests for GET /api/events."""
+
+    @pytest.fixture
+    def make_client(self, tmp_path, monkeypatch):
+        for key in list(os.environ):
+            if key.startswith('HEATTRAX_'):
+                monkeypatch.delenv(key)
+
+        def make(broker):
+            scheduler = Mock()
+            scheduler.events = broker
+            web_server = WebServer(ConfigManager(str(tmp_path / 'config.yaml')), scheduler)
+            return web_server.app.test_client()
+        return make
+
+    def test_streams_published_events(self, make_client):
+        broker = EventBroker()
+        client = make_client(broker)
+
+        response = client.get('/api/events', buffered=False)
+        chunks = iter(response.response)
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/event-stream'
+        assert next(chunks).startswith(b'retry:')
+
+        broker.publish('override', {'group': 'mats', 'override': None})
+        event_type, payload = _decode(next(chunks).decode())
+
+        assert event_type == 'override'
+        assert payload['data'] == {'group': 'mats', 'override': None}
+        response.close()
+        assert broker.subscriber_count == 0
+
+    def test_rejects_when_full(self, make_client):
+        client = make_client(EventBroker(max_subscribers=0))
+
+        response = client.get('/api/events')
+
+        assert response.status_code == 503
+
+    def test_head_does_not_leak_subscribers(self, make_client):
+        broker = EventBroker(max_subscribers=2)
+        client = make_client(broker)
+
+        for _ in range(3):
+            assert client.head('/api/events').status_code == 405
+
+        assert broker.subscriber_count == 0
+        response = client.get('/api/events', buffered=False)
+        assert response.status_code == 200
+        response.close()
+
+    def test_unread_stream_releases_subscriber_on_close(self, make_client):
+        broker = EventBroker()
+        client = make_client(broker)
+
+        response = client.get('/api/events', buffered=False)
+        assert broker.subscriber_count == 1
+        response.close()
+
+        assert broker.subscriber_count == 0
@@ -0,0 +1,213 @@
+"""Unit tests for the parsed, time-indexed forecast store in WeatherCache."""
+
+import json
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.weather.weather_cache import WeatherCache, ForecastIndex
+from src.weather.resilient_weather_service import ResilientWeatherService, WeatherServiceState
+
+
+TZ = ZoneInfo('America/New_York')
+
+
+def _forecast(start, hours, overrides=None):
+    """Build hourly forecast entries starting at start."""
+    entries = []
+    for h in range(hours):
+        entry = {
+            'timestamp': (start + timedelta(hours=h)).isoformat(),
+            'temperature_f': 40.0 + h,
+            'precipitation_mm': 0.0,
+            'dewpoint_f': 20.0,
+            'humidity_percent': 50.0
+        }
+        entry.update((overrides or {}).get(h, {}))
+        entries.append(entry)
+    return entries
+
+
+def _cache_with(tmp_path, forecast):
+    """Create a WeatherCache holding the given forecast entries."""
+    cache = WeatherCache(str(tmp_path / 'cache.json'), timezone='America/New_York')
+    cache.cache_data = {
+        'fetched_at': datetime.now(TZ).isoformat(),
+        'location': {'latitude': 40.7, 'longitude': -74.0},
+        'forecast': forecast
+    }
+    return cache
+
+
+@pytest.mark.unit
+class TestForecastIndex:
+    """Tests for ForecastIndex lookups."""
+    
+    def test_columns_sorted(self):
+        """Entries are sorted by time and columns stay aligned."""
+        start = datetime(2025, 1, 10, 0, 0, tzinfo=TZ)
+        forecast = list(reversed(_forecast(start, 3)))
+        
+        index = ForecastIndex(forecast, TZ)
+        
+        assert len(index) == 3
+        assert index.epochs == sorted(index.epochs)
+        assert index.temperature_f == [40.0, 41.0, 42.0]
+    
+    def test_nearest(self):
+        """Nearest lookup picks the closest entry, earlier on ties."""
+        start = datetime(2025, 1, 10, 0, 0, tzinfo=TZ)
+        index = ForecastIndex(_forecast(start, 3), TZ)
+        
+        assert index.nearest(start - timedelta(hours=5)) == 0
+        assert index.nearest(start + timedelta(minutes=20)) == 0
+        assert index.nearest(start + timedelta(minutes=30)) == 0
+        assert index.nearest(start + timedelta(minutes=31)) == 1
+        assert index.nearest(start + timedelta(hours=10)) == 2
+    
+    def test_nearest_naive_time_uses_index_timezone(self):
+        """Naive lookup times are interpreted in the cache timezone."""
+        start = datetime(2025, 1, 10, 0, 0, tzinfo=TZ)
+        index = ForecastIndex(_forecast(start, 3), TZ)
+        
+        assert index.nearest(datetime(2025, 1, 10, 2, 0)) == 2
+    
+    def test_range_inclusive(self):
+        """Range bounds include both endpoints."""
+        start = datetime(2025, 1, 10, 0, 0, tzinfo=TZ)
+        index = ForecastIndex(_forecast(start, 6), TZ)
+        
+        lo, hi = index.range(start + timedelta(hours=1), start + timedelta(hours=3))
+        
+        assert (lo, hi) == (1, 4)
+        assert index.temperature_f[lo:hi] == [41.0, 42.0, 43.0]
+    
+    def test_unparseable_entries_skipped(self):
+        """Entries with invalid timestamps are dropped."""
+        start = datetime(2025, 1, 10, 0, 0, tzinfo=TZ)
+        forecast = _forecast(start, 2) + [{'timestamp': 'not-a-time'}]
+        
+        assert len(ForecastIndex(forecast, TZ)) == 2
+
+
+@pytest.mark.unit
+class TestWeatherCacheIndex:
+    """Tests for WeatherCache use of the forecast index."""
+    
+    def test_get_weather_at(self, tmp_path):
+        """get_weather_at returns the nearest entry."""
+        start = datetime(2025, 1, 10, 0, 0, tzinfo=TZ)
+        cache = _cache_with(tmp_path, _forecast(start, 4))
+        
+        snapshot = cache.get_weather_at(start + timedelta(hours=2, minutes=10))
+        
+        assert snapshot.temperature_f == 42.0
+    
+    def test_index_invalidated_on_replace(self, tmp_path):
+        """Assigning new cache data rebuilds the index."""
+        start = datetime(2025, 1, 10, 0, 0, tzinfo=TZ)
+        cache = _cache_with(tmp_path, _forecast(start, 2))
+        first = cache.forecast_index
+        
+        cache.cache_data = dict(cache.cache_data, forecast=_forecast(start, 5))
+        
+        assert cache.forecast_index is not first
+        assert len(cache.forecast_index) == 5
+    
+    def test_index_loaded_from_disk(self, tmp_path):
+        """A cache loaded from disk is indexed lazily."""
+        start = datetime.now(TZ).replace(minute=0, second=0, microsecond=0)
+        data = {
+            'fetched_at': datetime.now(TZ).isoformat(),
+            'location': {'latitude': 40.7, 'longitude': -74.0},
+            'forecast': _forecast(start, 3)
+        }
+        (tmp_path / 'cache.json').write_text(json.dumps(data))
+        
+        cache = WeatherCache(str(tmp_path / 'cache.json'), timezone='America/New_York')
+        
+        assert len(cache.forecast_index) == 3
+    
+    def test_get_forecast_range(self, tmp_path):
+        """get_forecast_range returns the entries inside the window."""
+        start = datetime(2025, 1, 10, 0, 0, tzinfo=TZ)
+        cache = _cache_with(tmp_path, _forecast(start, 6))
+        
+        entries = cache.get_forecast_range(start + timedelta(hours=2), start + timedelta(hours=4))
+        
+        assert [e['temperature_f'] for e in entries] == [42.0, 43.0, 44.0]
+    
+    def test_empty_cache(self, tmp_path):
+        """Lookups on an empty cache return nothing."""
+        cache = WeatherCache(str(tmp_path / 'missing.json'), timezone='America/New_York')
+        
+        assert cache.forecast_index is None
+        assert cache.get_weather_at(datetime.now(TZ)) is None
+        assert cache.get_forecast_range(datetime.now(TZ), datetime.now(TZ)) == []
+
+
+class _StubProvider:
+    """Minimal provider exposing the attributes ResilientWeatherService reads."""
+    timezone = 'America/New_York'
+    latitude = 40.7
+    longitude = -74.0
+
+
+@pytest.mark.unit
+class TestResilientServiceUsesIndex:
+    """Tests for precipitation and black ice checks over the index."""
+    
+    def _service(self, tmp_path, forecast):
+        service = ResilientWeatherService(_StubProvider(), cache_file=str(tmp_path / 'cache.json'))
+        service.cache.cache_data = {
+            'fetched_at': datetime.now(TZ).isoformat(),
+            'location': {'latitude': 40.7, 'longitude': -74.0},
+            'forecast': forecast
+        }
+        service.state = WeatherServiceState.ONLINE
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_precipitation_within_horizon(self, tmp_path):
+        """First cold, wet hour inside the horizon is reported."""
+        start = datetime.now(TZ).replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        forecast = _forecast(start, 6, {
+            2: {'precipitation_mm': 1.5, 'temperature_f': 30.0},
+            5: {'precipitation_mm': 3.0, 'temperature_f': 28.0}
+        })
+        service = self._service(tmp_path, forecast)
+        
+        has_precip, precip_time, temp = await service.check_precipitation_forecast(
+            hours_ahead=12, temperature_threshold_f=34.0
+        )
+        
+        assert has_precip is True
+        assert precip_time == start + timedelta(hours=2)
+        assert temp == 30.0
+    
+    @pytest.mark.asyncio
+    async def test_precipitation_outside_horizon_ignored(self, tmp_path):
+        """Precipitation beyond hours_ahead is not reported."""
+        start = datetime.now(TZ).replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        forecast = _forecast(start, 6, {5: {'precipitation_mm': 3.0, 'temperature_f': 28.0}})
+        service = self._service(tmp_path, forecast)
+        
+        result = await service.check_precipitation_forecast(hours_ahead=2, temperature_threshold_f=34.0)
+        
+        assert result == (False, None, None)
+    
+    @pytest.mark.asyncio
+    async def test_black_ice_risk(self, tmp_path):
+        """Black ice conditions are found via the dewpoint/humidity columns."""
+        start = datetime.now(TZ).replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        forecast = _forecast(start, 4, {
+            1: {'temperature_f': 33.0, 'dewpoint_f': 31.0, 'humidity_percent': 90.0}
+        })
+        service = self._service(tmp_path, forecast)
+        
+        has_risk, risk_time, temp, dewpoint = await service.check_black_ice_risk(hours_ahead=12)
+        
+        assert has_risk is True
+        assert risk_time == start + timedelta(hours=1)
+        assert (temp, dewpoint) == (33.0, 31.0)
@@ -0,0 +1,143 @@
+"""Unit tests for unicast health probes and the health check using them."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.devices.device_discovery import DeviceInfo
+from src.health import health_probe
+from src.health.health_check import HealthCheckService
+from src.health.health_probe import HealthProbe, ProbeTiming
+
+
+def _device(ip, mac=None, alias=None):
+    device = Mock()
+    device.host = ip
+    device.mac = mac or f"mac-{ip}"
+    device.alias = alias or f"plug-{ip}"
+    device.features = []
+    return device
+
+
+@pytest.fixture
+def replies():
+    """IP -> device answering unicast probes (missing IPs time out)."""
+    answering = {}
+    in_flight = {'now': 0, 'peak': 0}
+
+    async def discover_single(ip, discovery_timeout):
+        if ip not in answering:
+            return None
+        in_flight['now'] += 1
+        in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+        await asyncio.sleep(0.01)
+        in_flight['now'] -= 1
+        return answering[ip]
+
+    with patch.object(health_probe.Discover, 'discover_single', side_effect=discover_single) as probe:
+        probe.answering = answering
+        probe.in_flight = in_flight
+        yield probe
+
+
+@pytest.fixture
+def sweep():
+    with patch.object(health_probe, 'discover_devices', new_callable=AsyncMock) as discover:
+        discover.return_value = []
+        yield discover
+
+
+@pytest.mark.unit
+class TestHealthProbe:
+    """Tests for HealthProbe."""
+
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently(self, replies):
+        for n in range(10):
+            replies.answering[f"10.0.0.{n}"] = _device(f"10.0.0.{n}")
+        probe = HealthProbe()
+
+        found = await probe.probe_all([f"10.0.0.{n}" for n in range(11)])
+
+        assert replies.in_flight['peak'] == 10
+        assert sorted(found) == [f"10.0.0.{n}" for n in range(10)]
+        assert found['10.0.0.3'].mac == 'mac-10.0.0.3'
+
+    def test_timeout_adapts_to_round_trip_time(self):
+        probe = HealthProbe(min_timeout=0.5, max_timeout=5.0)
+        assert probe.timeout_for('10.0.0.1') == 5.0
+
+        probe.timings['10.0.0.1'] = timing = ProbeTiming()
+        probe._record_rtt(timing, 0.2)
+        assert probe.timeout_for('10.0.0.1') == pytest.approx(0.6)
+
+        timing.misses = 2
+        assert probe.timeout_for('10.0.0.1') == pytest.approx(2.4)
+        timing.misses = 20
+        assert probe.timeout_for('10.0.0.1') == 5.0
+
+    def test_device_info_tolerates_unavailable_properties(self):
+        class Unupdated:
+            host = '10.0.0.1'
+            mac = 'AA:BB'
+
+            @property
+            def alias(self):
+                raise RuntimeError('update() required')
+
+        info = DeviceInfo(Unupdated())
+
+        assert (info.alias, info.mac, info.features) == ('Unknown', 'AA:BB', [])
+
+
+@pytest.mark.unit
+class TestHealthCheckProbing:
+    """HealthCheckService probes configured devices and sweeps only when needed."""
+
+    @pytest.fixture
+    def service(self):
+        return HealthCheckService(
+            check_interval_hours=24,
+            configured_devices={'10.0.0.1': 'mats: front', '10.0.0.2': 'mats: back'},
+            notification_service=AsyncMock(),
+            sweep_interval_hours=168,
+        )
+
+    @pytest.mark.asyncio
+    async def test_sweep_runs_first_then_only_probes(self, service, replies, sweep):
+        replies.answering.update({ip: _device(ip) for ip in ('10.0.0.1', '10.0.0.2')})
+        sweep.return_value = [DeviceInfo(_device('10.0.0.9'))]
+
+        assert await service.run_health_check() is True
+        assert await service.run_health_check() is True
+
+        assert sweep.await_count == 1
+        assert set(service.state.last_known_devices) == {'10.0.0.1', '10.0.0.2', '10.0.0.9'}
+        service.notification_service.notify.assert_awaited()
+        lost = [c for c in service.notification_service.notify.await_args_list
+                if c.kwargs['event_type'] == 'device_lost']
+        assert lost == []
+
+    @pytest.mark.asyncio
+    async def test_missing_device_triggers_sweep_to_find_move(self, service, replies, sweep):
+        replies.answering.update({ip: _device(ip) for ip in ('10.0.0.1', '10.0.0.2')})
+        await service.run_health_check()
+
+        moved = _device('10.0.0.7', mac='mac-10.0.0.2')
+        del replies.answering['10.0.0.2']
+        sweep.return_value = [DeviceInfo(moved)]
+        await service.run_health_check()
+
+        assert sweep.await_count == 2
+        events = [c.kwargs for c in service.notification_service.notify.await_args_list]
+        assert any(e['event_type'] == 'device_ip_changed' and e['details']['new_ip'] == '10.0.0.7'
+                   for e in events)
+
+    @pytest.mark.asyncio
+    async def test_no_replies_counts_as_failure(self, service, replies, sweep):
+        await service.run_health_check()
+        assert await service.run_health_check() is False
+
+        assert service.state.consecutive_failures == 2
+        assert sweep.await_count == 1
@@ -0,0 +1,181 @@
+"""Unit tests for the runtime/energy history store and /api/history."""
+
+import os
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, Mock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.config.config_loader import Config
+from src.config.config_manager import ConfigManager, ConfigValidationError
+from src.scheduler.scheduler_enhanced import EnhancedScheduler
+from src.state.history_store import HistoryStore
+from src.web.web_server import WebServer
+
+
+TZ = ZoneInfo('America/New_York')
+NOW = datetime.now(TZ).replace(minute=0, second=0, microsecond=0)
+# Local midnight two days ago: recent enough to still be raw data when flushed
+DAY = (NOW - timedelta(days=2)).replace(hour=0)
+
+
+@pytest.fixture
+def history(tmp_path):
+    store = HistoryStore(tmp_path / 'state.db', timezone='America/New_York')
+    yield store
+    store.close()
+
+
+def _record_day(history, day_start, hours_on=4, power_watts=1000):
+    """One reading every 10 minutes, on for the first hours_on hours."""
+    for minute in range(0, 24 * 60, 10):
+        when = day_start + timedelta(minutes=minute)
+        history.record_reading('mats', minute < hours_on * 60, temperature_f=30.0,
+                               power_watts=power_watts, when=when)
+    history.flush()
+
+
+@pytest.mark.unit
+class TestHistoryStore:
+    """Tests for HistoryStore recording, rollups and queries."""
+
+    def test_readings_accumulate_on_time_and_energy(self, history):
+        start = NOW - timedelta(hours=1)
+        history.record_reading('mats', False, when=start)
+        history.record_transition('mats', True, when=start + timedelta(minutes=5))
+        history.record_reading('mats', True, temperature_f=28.0, power_watts=1200,
+                               when=start + timedelta(minutes=10))
+        history.record_reading('mats', True, power_watts=1200, when=start + timedelta(minutes=20))
+        history.flush()
+
+        result = history.query(start, NOW, resolution='raw')
+
+        points = result['groups']['mats']['points']
+        assert [p['on_seconds'] for p in points] == [0.0, 300.0, 600.0]
+        assert points[1]['energy_wh'] == 100.0
+        assert points[1]['temperature_f'] == {'avg': 28.0, 'min': 28.0, 'max': 28.0}
+        assert result['groups']['mats']['transitions'] == [
+            {'time': (start + timedelta(minutes=5)).isoformat(), 'state': 'on'}
+        ]
+
+    def test_state_change_between_readings_is_recorded(self, history):
+        history.record_reading('mats', False, when=NOW - timedelta(minutes=20))
+        history.record_reading('mats', True, when=NOW - timedelta(minutes=10))
+        history.flush()
+
+        transitions = history.query(NOW - timedelta(hours=1), NOW)['groups']['mats']['transitions']
+
+        assert transitions == [{'time': (NOW - timedelta(minutes=10)).isoformat(), 'state': 'on'}]
+
+    def test_rollups_preserve_totals(self, history):
+        day = DAY
+        _record_day(history, day)
+        before = history.query(day, day + timedelta(days=1), resolution='day')['groups']['mats']['points']
+
+        history.compact(now=day + timedelta(days=10))
+        hourly = history.query(day, day + timedelta(days=1), resolution='hour')['groups']['mats']['points']
+        history.compact(now=day + timedelta(days=120))
+        after = history.query(day, day + timedelta(days=1), resolution='day')['groups']['mats']['points']
+
+        assert len(hourly) == 24
+        assert hourly[0]['samples'] == 6
+        assert before[0]['on_seconds'] == after[0]['on_seconds'] == 4 * 3600
+        assert after[0]['energy_wh'] == before[0]['energy_wh']
+        assert after[0]['samples'] == 144
+        assert after[0]['time'] == day.isoformat()
+        assert after[0]['temperature_f'] == {'avg': 30.0, 'min': 30.0, 'max': 30.0}
+        assert history.query(day, day + timedelta(days=1), resolution='raw')['groups'] == {}
+
+    def test_daily_retention_drops_old_days(self, history):
+        day = DAY
+        _record_day(history, day)
+
+        history.compact(now=day + timedelta(days=800))
+
+        assert history.query(day, day + timedelta(days=1), resolution='day')['groups'] == {}
+
+    def test_query_filters_by_group(self, history):
+        history.record_reading('mats', True, when=NOW - timedelta(minutes=10))
+        history.record_reading('walkway', True, when=NOW - timedelta(minutes=10))
+        history.flush()
+
+        result = history.query(NOW - timedelta(hours=1), NOW, group_name='walkway')
+
+        assert list(result['groups']) == ['walkway']
+
+    @pytest.mark.parametrize('resolution,start', [('minute', NOW - timedelta(hours=1)), ('auto', NOW)])
+    def test_invalid_queries(self, history, resolution, start):
+        with pytest.raises(ValueError):
+            history.query(start, NOW, resolution=resolution)
+
+
+@pytest.mark.unit
+class TestHistoryEndpoint:
+    """Tests for GET /api/history."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch, history):
+        for key in list(os.environ):
+            if key.startswith('HEATTRAX_'):
+                monkeypatch.delenv(key)
+        scheduler = Mock()
+        scheduler.history = history
+        server = WebServer(ConfigManager(str(tmp_path / 'config.yaml')), scheduler=scheduler)
+        return server.app.test_client()
+
+    def test_returns_history(self, client, history):
+        history.record_reading('mats', True, when=datetime.now(TZ) - timedelta(minutes=10))
+        history.flush()
+
+        response = client.get('/api/history?group=mats&resolution=raw')
+
+        assert response.status_code == 200
+        assert len(response.get_json()['groups']['mats']['points']) == 1
+
+    def test_rejects_bad_parameters(self, client):
+        assert client.get('/api/history?resolution=minute').status_code == 400
+        assert client.get('/api/history?start=yesterday').status_code == 400
+
+    def test_unavailable_without_history(self, tmp_path, monkeypatch):
+        for key in list(os.environ):
+            if key.startswith('HEATTRAX_'):
+                monkeypatch.delenv(key)
+        server = WebServer(ConfigManager(str(tmp_path / 'config.yaml')), scheduler=Mock())
+
+        assert server.app.test_client().get('/api/history').status_code == 503
+
+
+@pytest.mark.unit
+class TestSchedulerHistory:
+    """Tests for the scheduler's per-cycle history recording."""
+
+    @pytest.fixture
+    def scheduler(self, history):
+        scheduler = EnhancedScheduler(Config('config.example.yaml'), setup_mode=True)
+        scheduler.history = history
+        scheduler.manual_override = MagicMock()
+        return scheduler
+
+    @pytest.mark.asyncio
+    async def test_power_watts_is_coerced(self, scheduler, history):
+        scheduler.config._config['devices']['groups'] = {'mats': {'power_watts': '1200'}}
+
+        await scheduler._record_history([{'group': 'mats', 'action': 'turned_on'}])
+
+        assert history.query(NOW - timedelta(hours=1), NOW + timedelta(hours=1), resolution='raw')['groups']
+
+    @pytest.mark.asyncio
+    async def test_history_failure_does_not_break_cycle(self, scheduler):
+        scheduler.history = Mock()
+        scheduler.history.record_reading.side_effect = TypeError('bad reading')
+
+        await scheduler._record_history([{'group': 'mats', 'action': 'turned_on'}])
+
+        scheduler.history.flush.assert_not_called()
+
+    @pytest.mark.parametrize('power_watts', ['abc', 0, -5, True])
+    def test_invalid_power_watts_is_rejected(self, power_watts):
+        with pytest.raises(ConfigValidationError):
+            ConfigManager._validate_device_group('mats', {'power_watts': power_watts})
+        ConfigManager._validate_device_group('mats', {'power_watts': '1200'})
@@ -0,0 +1,74 @@
+"""Unit tests for the shared HTTP session pool."""
+
+import asyncio
+
+import pytest
+
+from src.http_client import HttpSessionPool
+
+
+@pytest.mark.unit
+class TestHttpSessionPool:
+    """Tests for HttpSessionPool."""
+
+    @pytest.mark.asyncio
+    async def test_owner_loop_reuses_session(self):
+        pool = HttpSessionPool(limit_per_host=2, dns_cache_ttl=120)
+        pool.attach(asyncio.get_running_loop())
+
+        async with pool.session() as first:
+            pass
+        async with pool.session() as second:
+            pass
+
+        assert first is second
+        assert not first.closed
+        assert first.connector.limit_per_host == 2
+
+        await pool.close()
+        assert first.closed
+
+    @pytest.mark.asyncio
+    async def test_unattached_pool_uses_temporary_sessions(self):
+        pool = HttpSessionPool()
+
+        async with pool.session() as first:
+            assert not first.closed
+        async with pool.session() as second:
+            pass
+
+        assert first is not second
+        assert first.closed
+
+    def test_other_loop_uses_temporary_session(self):
+        pool = HttpSessionPool()
+        owner = asyncio.new_event_loop()
+        pool.attach(owner)
+
+        async def use_pool():
+            async with pool.session() as session:
+                return session
+
+        try:
+            session = asyncio.run(use_pool())
+        finally:
+            owner.close()
+
+        assert session.closed
+        assert pool._session is None
+
+    @pytest.mark.asyncio
+    async def test_session_recreated_after_close(self):
+        pool = HttpSessionPool()
+        loop = asyncio.get_running_loop()
+        pool.attach(loop)
+
+        async with pool.session() as first:
+            pass
+        await pool.close()
+        pool.attach(loop)
+        async with pool.session() as second:
+            pass
+
+        assert first is not second
+        await pool.close()
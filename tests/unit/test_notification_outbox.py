@@ -0,0 +1,169 @@
+"""Unit tests for the persistent notification outbox."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.notifications.notification_service import NotificationService
+from src.notifications.outbox import NotificationOutbox, create_notification_outbox
+from src.state.state_store import state_store
+
+
+def _provider(result=True):
+    provider = Mock()
+    provider.send = AsyncMock(return_value=result)
+    return provider
+
+
+@pytest.fixture
+def service():
+    service = NotificationService()
+    service.add_provider('email', _provider())
+    service.add_provider('webhook', _provider())
+    return service
+
+
+@pytest.fixture
+def outbox(tmp_path, service):
+    outbox = NotificationOutbox(
+        state_file=str(tmp_path / 'outbox.json'), digest_window_seconds=30,
+        rate_limit_per_minute=2, max_attempts=3, retry_base_seconds=10
+    )
+    outbox.service = service
+    service.outbox = outbox
+    return outbox
+
+
+@pytest.mark.unit
+class TestNotificationOutbox:
+    """Tests for NotificationOutbox."""
+
+    @pytest.mark.asyncio
+    async def test_notify_only_enqueues(self, service, outbox):
+        await service.notify('device_lost', 'Lost 10.0.0.5', {'ip': '10.0.0.5'})
+
+        service.providers['email'].send.assert_not_called()
+        assert outbox.pending_count() == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_wait_for_digest_window(self, service, outbox):
+        await service.notify('device_lost', 'Lost 10.0.0.5')
+
+        delay = await outbox.drain()
+
+        service.providers['email'].send.assert_not_called()
+        assert 29 < delay <= 30
+
+    @pytest.mark.asyncio
+    async def test_same_type_events_are_coalesced(self, service, outbox):
+        for ip in ('10.0.0.5', '10.0.0.6', '10.0.0.7'):
+            await service.notify('device_lost', f'Lost {ip}', {'ip': ip})
+        await service.notify('connectivity_lost', 'Network down')
+
+        await outbox.drain(now=time.time() + 31)
+
+        send = service.providers['email'].send
+        assert send.call_count == 2
+        event_type, message, details = send.call_args_list[0].args
+        assert event_type == 'device_lost'
+        assert message.startswith('3 device lost events:')
+        assert details['count'] == 3
+        assert [e['details']['ip'] for e in details['events']] == ['10.0.0.5', '10.0.0.6', '10.0.0.7']
+        assert send.call_args_list[1].args[:2] == ('connectivity_lost', 'Network down')
+        assert outbox.pending_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_sends_back_off_and_are_dropped(self, service, outbox):
+        service.providers['webhook'].send.return_value = False
+        await service.notify('device_lost', 'Lost 10.0.0.5')
+        now = time.time() + 31
+
+        await outbox.drain(now=now)
+        assert outbox.pending_count('webhook') == 1
+        await outbox.drain(now=now + 5)
+        assert service.providers['webhook'].send.call_count == 1
+
+        await outbox.drain(now=now + 11)
+        await outbox.drain(now=now + 61)
+
+        assert service.providers['webhook'].send.call_count == 3
+        assert outbox.pending_count() == 0
+        assert service.providers['email'].send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_provider_exception_is_retried(self, service, outbox):
+        service.providers['email'].send.side_effect = [ConnectionError('smtp down'), True]
+        await service.notify('device_lost', 'Lost 10.0.0.5')
+        now = time.time() + 31
+
+        await outbox.drain(now=now)
+        await outbox.drain(now=now + 11)
+
+        assert service.providers['email'].send.call_count == 2
+        assert outbox.pending_count('email') == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_per_provider(self, service, outbox):
+        for event_type in ('device_lost', 'connectivity_lost', 'device_ip_changed'):
+            await service.notify(event_type, event_type)
+        now = time.time() + 31
+
+        delay = await outbox.drain(now=now)
+
+        assert service.providers['email'].send.call_count == 2
+        assert outbox.pending_count('email') == 1
+        assert delay == pytest.approx(60)
+
+    @pytest.mark.asyncio
+    async def test_queue_survives_restart(self, tmp_path, service, outbox):
+        await service.notify('device_lost', 'Lost 10.0.0.5', {'ip': '10.0.0.5'})
+        state_store.flush()
+
+        restarted = NotificationOutbox(state_file=str(tmp_path / 'outbox.json'))
+        restarted.service = service
+        await restarted.drain(now=time.time() + 31)
+
+        assert restarted.pending_count() == 0
+        service.providers['email'].send.assert_awaited_once_with(
+            'device_lost', 'Lost 10.0.0.5', {'ip': '10.0.0.5'}
+        )
+
+    @pytest.mark.asyncio
+    async def test_worker_delivers_in_background(self, service, outbox):
+        outbox.configure({'digest_window_seconds': 0})
+        worker = asyncio.create_task(outbox.run())
+        try:
+            await asyncio.sleep(0)
+            await service.notify('device_lost', 'Lost 10.0.0.5')
+            for _ in range(100):
+                if not outbox.pending_count():
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            worker.cancel()
+
+        service.providers['email'].send.assert_awaited_once()
+        assert outbox.pending_count() == 0
+
+    def test_disabled_outbox(self):
+        assert create_notification_outbox({'enabled': False}) is None
+
+    @pytest.mark.asyncio
+    async def test_rejected_reload_detaches_outbox(self, service, outbox):
+        from src.config.config_loader import Config
+        from src.scheduler.scheduler_enhanced import EnhancedScheduler
+
+        scheduler = EnhancedScheduler(Config('config.example.yaml'), setup_mode=True)
+        scheduler.notification_outbox = outbox
+        scheduler.notification_service = service
+        service.close = Mock()
+
+        with patch('src.scheduler.scheduler_enhanced.validate_and_test_notifications',
+                   AsyncMock(return_value=(False, None))):
+            await scheduler._initialize_notifications()
+
+        service.close.assert_called_once()
+        assert outbox.service is None
+        assert scheduler.notification_service is None
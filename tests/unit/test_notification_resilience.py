@@ -132,6 +132,34 @@ class TestNotificationResilience(unittest.TestCase):
         
         asyncio.run(run_test())
 
+    
+    def test_rejected_service_is_closed(self):
+        """Test that a service failing the connectivity test releases its connections."""
+        async def run_test():
+            with patch('src.notifications.notification_service.EmailNotificationProvider.test_connectivity',
+                      new_callable=AsyncMock) as mock_test, \
+                    patch('src.notifications.notification_service.NotificationService.close') as mock_close:
+                mock_test.return_value = (False, "Connection refused")
+                
+                config = {
+                    'email': {
+                        'enabled': True,
+                        'smtp_host': 'smtp.gmail.com',
+                        'smtp_port': 587,
+                        'smtp_username': 'test@example.com',
+                        'smtp_password': 'test_password',
+                        'from_email': 'test@example.com',
+                        'to_emails': ['recipient@example.com']
+                    }
+                }
+                
+                success, service = await validate_and_test_notifications(config, test_connectivity=True)
+                
+                self.assertFalse(success)
+                self.assertIsNone(service)
+                mock_close.assert_called_once()
+        
+        asyncio.run(run_test())
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,170 @@
+"""Unit tests for concurrent device initialization and background re-initialization."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.devices.device_group_manager import DeviceGroup, DeviceGroupManager, ManagedDevice
+
+
+def _items(*names):
+    return [{'name': name, 'ip_address': f'10.0.0.{i + 1}'} for i, name in enumerate(names)]
+
+
+def _manager(groups, **devices_config):
+    return DeviceGroupManager({
+        'credentials': {'username': 'user', 'password': 'pass'},
+        'groups': groups,
+        **devices_config
+    })
+
+
+@pytest.mark.unit
+class TestConcurrentInitialization:
+    """Tests for DeviceGroupManager.initialize concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_devices_initialize_concurrently_within_cap(self):
+        active = 0
+        peak = 0
+
+        async def fake_initialize(self):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+
+        manager = _manager({
+            'mats': {'items': _items('a', 'b', 'c')},
+            'lights': {'items': _items('d', 'e')},
+        }, max_concurrent_initializations=3)
+
+        with patch.object(ManagedDevice, 'initialize', fake_initialize):
+            await manager.initialize()
+
+        assert peak == 3
+        assert [d.name for d in manager.groups['mats'].devices] == ['a', 'b', 'c']
+        assert list(manager.groups) == ['mats', 'lights']
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_failures_keep_config_order(self):
+        async def fake_initialize(self):
+            if self.name in ('b', 'c'):
+                await asyncio.sleep(0.01 if self.name == 'b' else 0)
+                raise ConnectionError(f'{self.name} unreachable')
+
+        group = DeviceGroup('mats', {'items': _items('a', 'b', 'c')}, 'user', 'pass')
+
+        with patch.object(ManagedDevice, 'initialize', fake_initialize):
+            await group.initialize()
+
+        assert [d.name for d in group.devices] == ['a']
+        assert [f['name'] for f in group._failed_devices] == ['b', 'c']
+        assert [d.name for d in group.pending_devices] == ['b', 'c']
+
+    @pytest.mark.asyncio
+    async def test_slow_device_does_not_block_startup(self):
+        release = asyncio.Event()
+
+        async def fake_initialize(self):
+            if self.name == 'slow':
+                await release.wait()
+
+        manager = _manager({'mats': {'items': _items('a', 'slow', 'b')}},
+                           initial_deadline_seconds=0.05)
+
+        with patch.object(ManagedDevice, 'initialize', fake_initialize):
+            await asyncio.wait_for(manager.initialize(), timeout=1)
+            group = manager.groups['mats']
+            assert [d.name for d in group.devices] == ['a', 'b']
+            assert [d.name for d in group.pending_devices] == ['slow']
+            assert await group.retry_failed_devices() == 0  # still in flight, not retried
+
+            release.set()
+            await asyncio.wait_for(manager._reinit_task, timeout=1)
+
+        assert [d.name for d in group.devices] == ['a', 'slow', 'b']
+        assert group._failed_devices == []
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_stragglers(self):
+        async def fake_initialize(self):
+            await asyncio.sleep(60)
+
+        group = DeviceGroup('mats', {'items': _items('a')}, 'user', 'pass')
+
+        with patch.object(ManagedDevice, 'initialize', fake_initialize):
+            await group.initialize(deadline=0.01)
+        task = group._straggler_tasks[group.pending_devices[0]]
+
+        await group.close()
+
+        assert task.cancelled()
+        assert not group.has_stragglers
+
+
+@pytest.mark.unit
+class TestReinitialization:
+    """Tests for background retry of unreachable devices."""
+
+    @pytest.mark.asyncio
+    async def test_retry_recovers_device_in_order(self):
+        reachable = {'a', 'c'}
+
+        async def fake_initialize(self):
+            if self.name not in reachable:
+                raise ConnectionError('unreachable')
+
+        group = DeviceGroup('mats', {'items': _items('a', 'b', 'c')}, 'user', 'pass')
+
+        with patch.object(ManagedDevice, 'initialize', fake_initialize):
+            await group.initialize()
+            assert await group.retry_failed_devices() == 0
+            reachable.add('b')
+            assert await group.retry_failed_devices() == 1
+
+        assert [d.name for d in group.devices] == ['a', 'b', 'c']
+        assert group._failed_devices == []
+        assert group.pending_devices == []
+
+    @pytest.mark.asyncio
+    async def test_manager_retries_in_background(self):
+        reachable = {'a'}
+
+        async def fake_initialize(self):
+            if self.name not in reachable:
+                raise ConnectionError('unreachable')
+
+        manager = _manager({'mats': {'items': _items('a', 'b')}}, reinit_retry_seconds=0.01)
+
+        with patch.object(ManagedDevice, 'initialize', fake_initialize):
+            await manager.initialize()
+            assert manager.groups['mats'].get_initialization_info()['failed_count'] == 1
+
+            reachable.add('b')
+            await asyncio.wait_for(manager._reinit_task, timeout=1)
+
+        info = manager.groups['mats'].get_initialization_info()
+        assert info['initialized_count'] == 2
+        assert info['failed_count'] == 0
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_retry_task(self):
+        async def fake_initialize(self):
+            raise ConnectionError('unreachable')
+
+        manager = _manager({'mats': {'items': _items('a')}})
+
+        with patch.object(ManagedDevice, 'initialize', fake_initialize):
+            await manager.initialize()
+        task = manager._reinit_task
+
+        await manager.close()
+
+        assert task.cancelled()
+        assert manager._reinit_task is None
@@ -0,0 +1,105 @@
+"""Unit tests for memoized mat window predictions."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config.config_loader import Config
+from src.scheduler.scheduler_enhanced import EnhancedScheduler
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    """Setup-mode scheduler with a mocked device manager and an isolated override file."""
+    scheduler = EnhancedScheduler(Config('config.example.yaml'), setup_mode=True)
+    scheduler.weather_enabled = False
+    scheduler.manual_override.state_file = tmp_path / 'manual_overrides.json'
+    scheduler.manual_override.state = {}
+
+    device_manager = MagicMock()
+    device_manager.get_all_groups.return_value = ['mats']
+    device_manager.get_group_config.return_value = {'enabled': True}
+    scheduler.device_manager = device_manager
+    return scheduler
+
+
+@pytest.mark.unit
+class TestPredictionMemo:
+    """Tests for predict_group_windows memoization."""
+
+    def test_repeat_calls_reuse_result(self, scheduler):
+        with patch.object(scheduler, '_compute_predicted_windows',
+                          wraps=scheduler._compute_predicted_windows) as compute:
+            first = scheduler.predict_group_windows(horizon_hours=12)
+            second = scheduler.predict_group_windows(horizon_hours=12)
+
+        assert 'mats' in first
+        assert second is first
+        assert compute.call_count == 1
+
+    @pytest.mark.parametrize('change', [
+        lambda s: setattr(s, 'vacation_mode', not s.vacation_mode),
+        lambda s: setattr(s, 'config_revision', s.config_revision + 1),
+        lambda s: s.manual_override.set_override('mats', 'on', 1),
+        lambda s: s.group_schedules.__setitem__('mats', []),
+    ], ids=['vacation', 'config', 'override', 'schedules'])
+    def test_input_changes_invalidate(self, scheduler, change):
+        with patch.object(scheduler, '_compute_predicted_windows', return_value={'mats': []}) as compute:
+            scheduler.predict_group_windows(horizon_hours=12)
+            change(scheduler)
+            scheduler.predict_group_windows(horizon_hours=12)
+
+        assert compute.call_count == 2
+
+    def test_key_covers_weather_and_time_bucket(self, scheduler):
+        now = datetime.now(scheduler.timezone)
+        key = scheduler._prediction_key(12, now)
+
+        later = now + timedelta(minutes=scheduler.PREDICTION_BUCKET_MINUTES)
+        assert scheduler._prediction_key(12, later) != key
+
+        scheduler.weather = MagicMock()
+        scheduler.weather.cache.cache_data = {'fetched_at': '2024-01-01T00:00:00'}
+        assert scheduler._prediction_key(12, now) != key
+
+    def test_key_tracks_overrides_by_version(self, scheduler):
+        now = datetime.now(scheduler.timezone)
+        scheduler.manual_override.set_override('mats', 'on', 1)
+        scheduler.manual_override.state['mats']['expires_at'] = (now - timedelta(minutes=1)).isoformat()
+        key = scheduler._prediction_key(12, now)
+
+        # Removing the expired override on the scheduler loop changes the key
+        assert scheduler.manual_override.is_active('mats') is False
+        assert scheduler._prediction_key(12, now) != key
+
+        # The key never iterates the live override dict
+        scheduler.manual_override.state = MagicMock(items=MagicMock(side_effect=RuntimeError))
+        scheduler._prediction_key(12, now)
+
+    def test_errors_are_not_cached(self, scheduler):
+        with patch.object(scheduler, '_compute_predicted_windows',
+                          side_effect=[RuntimeError('boom'), {'mats': []}]):
+            assert scheduler.predict_group_windows(horizon_hours=12) == {}
+            assert scheduler.predict_group_windows(horizon_hours=12) == {'mats': []}
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_recomputes_changed_inputs(self, scheduler):
+        scheduler.loop = asyncio.get_running_loop()
+
+        with patch.object(scheduler, '_compute_predicted_windows', return_value={'mats': []}) as compute:
+            # Nothing has been requested yet, so there is nothing to refresh
+            scheduler.schedule_prediction_refresh()
+            await asyncio.sleep(0)
+            assert scheduler._prediction_refresh_task is None
+
+            scheduler.predict_group_windows(horizon_hours=12)
+            scheduler.vacation_mode = not scheduler.vacation_mode
+            scheduler.schedule_prediction_refresh()
+            await asyncio.sleep(0)
+            await scheduler._prediction_refresh_task
+
+            scheduler.predict_group_windows(horizon_hours=12)
+
+        assert compute.call_count == 2
@@ -0,0 +1,82 @@
+"""Unit tests for compiled schedule plans and per-date solar resolution."""
+
+from datetime import date, time
+from unittest.mock import patch
+
+from src.scheduler.schedule_types import (
+    Schedule,
+    ScheduleTimeType,
+    TimeSpec,
+    PRIORITY_RANK,
+    SchedulePriority
+)
+
+
+class TestCompiledSchedule:
+    """Test the evaluation plan built when a Schedule is parsed."""
+
+    def test_clock_times_are_pre_parsed(self, schedule_config_basic):
+        schedule = Schedule(schedule_config_basic)
+
+        assert schedule.on_spec == TimeSpec(type=ScheduleTimeType.TIME, clock=time(6, 0))
+        assert schedule.off_spec == TimeSpec(type=ScheduleTimeType.TIME, clock=time(8, 0))
+
+    def test_solar_and_duration_specs(self, schedule_config_solar, schedule_config_duration):
+        solar = Schedule(schedule_config_solar)
+        duration = Schedule(schedule_config_duration)
+
+        assert solar.on_spec.is_solar
+        assert solar.on_spec.type == ScheduleTimeType.SUNSET
+        assert solar.on_spec.offset_minutes == -30
+        assert solar.on_spec.fallback == '18:00'
+        assert duration.off_spec.type == ScheduleTimeType.DURATION
+        assert duration.off_spec.duration_hours == 2.5
+
+    def test_day_mask(self, schedule_config_basic):
+        schedule = Schedule(schedule_config_basic)
+
+        assert [d for d in range(1, 8) if schedule.is_active_on_day(d)] == [1, 2, 3, 4, 5]
+        assert schedule.days == [1, 2, 3, 4, 5]
+
+    def test_condition_checks_and_priority_rank(self, schedule_config_with_conditions):
+        schedule = Schedule(schedule_config_with_conditions)
+
+        assert schedule.condition_checks == (
+            ('temperature_max', 32),
+            ('precipitation_active', True)
+        )
+        assert schedule.priority_rank == PRIORITY_RANK[SchedulePriority.CRITICAL]
+
+    def test_all_day_has_no_time_specs(self):
+        schedule = Schedule({'name': 'All Day', 'all_day': True})
+
+        assert schedule.on_spec is None
+        assert schedule.off_spec is None
+
+
+class TestSolarResolution:
+    """Test that solar-based times are resolved once per date."""
+
+    def test_solar_times_resolved_once_per_date(self, schedule_evaluator, schedule_config_solar):
+        schedule = Schedule(schedule_config_solar)
+        calc = schedule_evaluator.solar_calculator
+        day = date(2024, 6, 15)
+
+        with patch.object(calc, 'get_sunset_time', wraps=calc.get_sunset_time) as sunset:
+            first = schedule_evaluator._get_schedule_times(schedule, day, None)
+            second = schedule_evaluator._get_schedule_times(schedule, day, None)
+            schedule_evaluator._get_schedule_times(schedule, date(2024, 6, 16), None)
+
+        assert first == second
+        assert sunset.call_count == 2
+
+    def test_solar_cache_is_bounded(self, schedule_evaluator, schedule_config_solar):
+        schedule = Schedule(schedule_config_solar)
+
+        for offset in range(schedule_evaluator.SOLAR_CACHE_DAYS + 3):
+            schedule_evaluator._get_schedule_times(
+                schedule, date(2024, 6, 1 + offset), None
+            )
+
+        assert len(schedule_evaluator._solar_times) == schedule_evaluator.SOLAR_CACHE_DAYS
+        assert date(2024, 6, 1) not in schedule_evaluator._solar_times
@@ -0,0 +1,168 @@
+"""Unit tests for concurrent per-group evaluation in run_cycle_multi_device."""
+
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from src.config.config_loader import Config
+from src.scheduler.scheduler_enhanced import EnhancedScheduler
+from src.scheduler.state_manager import StateManager
+
+
+def _make_scheduler(tmp_path, group_names, get_group_state, **scheduler_overrides):
+    """Create a setup-mode scheduler wired to a mocked device manager."""
+    config = Config('config.example.yaml')
+    config._config['scheduler'].update(scheduler_overrides)
+    scheduler = EnhancedScheduler(config, setup_mode=True)
+    
+    device_manager = MagicMock()
+    device_manager.get_all_groups.return_value = list(group_names)
+    device_manager.get_group_state = AsyncMock(side_effect=get_group_state)
+    device_manager.turn_on_group = AsyncMock()
+    device_manager.turn_off_group = AsyncMock()
+    scheduler.device_manager = device_manager
+    
+    scheduler.states = {
+        name: StateManager(state_file=str(tmp_path / f"{name}.json")) for name in group_names
+    }
+    scheduler.manual_override = MagicMock()
+    scheduler.manual_override.is_active.return_value = False
+    scheduler.should_turn_on_group = AsyncMock(return_value=False)
+    scheduler.should_turn_off_group = AsyncMock(return_value=False)
+    return scheduler
+
+
+@pytest.mark.unit
+class TestConcurrentCycle:
+    """Tests for the concurrent scheduler cycle mode."""
+    
+    @pytest.mark.asyncio
+    async def test_groups_run_concurrently(self, tmp_path):
+        """Slow groups overlap instead of adding up."""
+        async def slow_state(group_name):
+            await asyncio.sleep(0.2)
+            return False
+        
+        scheduler = _make_scheduler(tmp_path, ['a', 'b', 'c'], slow_state)
+        
+        start = time.monotonic()
+        summary = await scheduler.run_cycle_multi_device()
+        elapsed = time.monotonic() - start
+        
+        assert elapsed < 0.5
+        assert summary['mode'] == 'concurrent'
+        assert set(summary['groups']) == {'a', 'b', 'c'}
+        for result in summary['groups'].values():
+            assert result['action'] == 'keep_off'
+            assert result['duration_ms'] >= 150
+            assert result['error'] is None
+        assert scheduler.last_cycle_summary is summary
+    
+    @pytest.mark.asyncio
+    async def test_started_at_is_taken_before_groups_run(self, tmp_path):
+        """started_at marks the beginning of the cycle, not the end of the slowest group."""
+        async def slow_state(group_name):
+            await asyncio.sleep(0.2)
+            return False
+        
+        scheduler = _make_scheduler(tmp_path, ['a', 'b'], slow_state)
+        
+        before = datetime.now(scheduler.timezone)
+        summary = await scheduler.run_cycle_multi_device()
+        
+        started_at = datetime.fromisoformat(summary['started_at'])
+        assert (started_at - before).total_seconds() < 0.1
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self, tmp_path):
+        """No more than max_concurrent_groups groups are in flight at once."""
+        in_flight = 0
+        peak = 0
+        
+        async def tracked_state(group_name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return False
+        
+        scheduler = _make_scheduler(
+            tmp_path, [f"g{i}" for i in range(6)], tracked_state, max_concurrent_groups=2
+        )
+        await scheduler.run_cycle_multi_device()
+        
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated(self, tmp_path):
+        """An exception in one group does not prevent other groups from acting."""
+        async def state(group_name):
+            if group_name == 'broken':
+                raise RuntimeError("plug unreachable")
+            return False
+        
+        scheduler = _make_scheduler(tmp_path, ['broken', 'ok'], state)
+        scheduler.should_turn_on_group = AsyncMock(return_value=True)
+        
+        summary = await scheduler.run_cycle_multi_device()
+        
+        assert summary['groups']['broken']['action'] == 'error'
+        assert 'plug unreachable' in summary['groups']['broken']['error']
+        assert summary['groups']['ok']['action'] == 'turned_on'
+        scheduler.device_manager.turn_on_group.assert_awaited_once_with('ok')
+    
+    @pytest.mark.asyncio
+    async def test_group_timeout(self, tmp_path):
+        """A group exceeding group_timeout_seconds is abandoned and reported."""
+        async def state(group_name):
+            if group_name == 'hung':
+                await asyncio.sleep(5)
+            return False
+        
+        scheduler = _make_scheduler(tmp_path, ['hung', 'ok'], state, group_timeout_seconds=0.1)
+        
+        start = time.monotonic()
+        summary = await scheduler.run_cycle_multi_device()
+        
+        assert time.monotonic() - start < 1
+        assert summary['groups']['hung']['action'] == 'error'
+        assert 'Timed out' in summary['groups']['hung']['error']
+        assert summary['groups']['ok']['action'] == 'keep_off'
+    
+    @pytest.mark.asyncio
+    async def test_sequential_mode(self, tmp_path):
+        """concurrent_groups: false processes groups one at a time, in order."""
+        order = []
+        
+        async def state(group_name):
+            order.append(group_name)
+            await asyncio.sleep(0.01)
+            return True
+        
+        scheduler = _make_scheduler(tmp_path, ['a', 'b'], state, concurrent_groups=False)
+        scheduler.should_turn_off_group = AsyncMock(return_value=True)
+        
+        summary = await scheduler.run_cycle_multi_device()
+        
+        assert summary['mode'] == 'sequential'
+        assert order == ['a', 'b']
+        assert summary['groups']['a']['action'] == 'turned_off'
+        assert summary['groups']['b']['action'] == 'turned_off'
+    
+    @pytest.mark.asyncio
+    async def test_manual_override_skips_group(self, tmp_path):
+        """Groups under an active manual override are reported as 'override'."""
+        scheduler = _make_scheduler(tmp_path, ['a'], AsyncMock(return_value=False))
+        scheduler.manual_override.is_active.return_value = True
+        scheduler.manual_override.get_action.return_value = 'on'
+        scheduler.manual_override.get_status.return_value = {'expires_at': 'later'}
+        scheduler._should_schedule_clear_override = AsyncMock(return_value=False)
+        
+        summary = await scheduler.run_cycle_multi_device()
+        
+        assert summary['groups']['a']['action'] == 'override'
+        scheduler.device_manager.get_group_state.assert_not_called()
@@ -0,0 +1,146 @@
+"""Unit tests for pooled SMTP sessions."""
+
+import asyncio
+import smtplib
+import time
+from email.mime.text import MIMEText
+from unittest.mock import patch
+
+import pytest
+
+from src.notifications.notification_service import EmailNotificationProvider
+from src.notifications.smtp_pool import SMTPSessionPool
+
+
+class FakeSMTP:
+    """Records the commands sent to a stand-in SMTP server."""
+
+    instances = []
+
+    def __init__(self, host, port, timeout=None):
+        self.commands = ['connect']
+        self.alive = True
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        self.commands.append('starttls')
+
+    def login(self, username, password):
+        self.commands.append('login')
+
+    def noop(self):
+        self.commands.append('noop')
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected('gone')
+        return 250, b'OK'
+
+    def send_message(self, msg):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected('gone')
+        self.commands.append('send')
+
+    def quit(self):
+        self.commands.append('quit')
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_smtp():
+    FakeSMTP.instances = []
+    with patch('smtplib.SMTP', FakeSMTP):
+        yield FakeSMTP
+
+
+@pytest.fixture
+def pool(fake_smtp):
+    pool = SMTPSessionPool('smtp.example.com', 587, 'user', 'pass', keepalive_seconds=60)
+    yield pool
+    pool.close()
+
+
+def _message(n=0):
+    return MIMEText(f'alert {n}')
+
+
+@pytest.mark.unit
+class TestSMTPSessionPool:
+    """Tests for SMTPSessionPool."""
+
+    def test_burst_uses_one_session(self, pool, fake_smtp):
+        for n in range(5):
+            pool.send_messages([_message(n)])
+
+        assert pool.connections_opened == 1
+        assert fake_smtp.instances[0].commands == ['connect', 'starttls', 'login'] + ['send'] * 5
+        assert pool.idle_count() == 1
+
+    def test_multiple_messages_per_call(self, pool, fake_smtp):
+        pool.send_messages([_message(n) for n in range(3)])
+
+        assert fake_smtp.instances[0].commands.count('send') == 3
+
+    def test_stale_session_is_checked_with_noop(self, pool, fake_smtp):
+        pool.send_messages([_message()])
+        pool.keepalive_seconds = 0
+        fake_smtp.instances[0].alive = False
+
+        pool.send_messages([_message()])
+
+        assert fake_smtp.instances[0].commands[-2:] == ['noop', 'quit']
+        assert pool.connections_opened == 2
+        assert fake_smtp.instances[1].commands[-1] == 'send'
+
+    def test_dropped_session_is_replaced_once(self, pool, fake_smtp):
+        pool.send_messages([_message()])
+        fake_smtp.instances[0].alive = False
+
+        pool.send_messages([_message()])
+
+        assert pool.connections_opened == 2
+        assert fake_smtp.instances[1].commands[-1] == 'send'
+
+    def test_failed_new_session_is_not_pooled(self, pool, fake_smtp):
+        with patch.object(FakeSMTP, 'send_message', side_effect=smtplib.SMTPDataError(554, b'rejected')):
+            with pytest.raises(smtplib.SMTPDataError):
+                pool.send_messages([_message()])
+
+        assert pool.idle_count() == 0
+        assert fake_smtp.instances[0].commands[-1] == 'quit'
+
+    def test_idle_sessions_expire(self, fake_smtp):
+        pool = SMTPSessionPool('smtp.example.com', 587, 'user', 'pass', idle_timeout_seconds=0.05)
+        try:
+            pool.send_messages([_message()])
+            deadline = time.monotonic() + 5
+            while pool.idle_count() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert pool.idle_count() == 0
+            assert fake_smtp.instances[0].commands[-1] == 'quit'
+        finally:
+            pool.close()
+
+
+@pytest.mark.unit
+class TestEmailProviderPooling:
+    """EmailNotificationProvider sends through its session pool."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_alerts_share_a_session(self, fake_smtp):
+        provider = EmailNotificationProvider(
+            smtp_host='smtp.example.com', smtp_port=587, smtp_username='user',
+            smtp_password='pass', from_email='from@example.com', to_emails=['to@example.com']
+        )
+        try:
+            results = await asyncio.gather(*(
+                provider.send('device_lost', f'Lost device {n}', {}) for n in range(4)
+            ))
+        finally:
+            provider.close()
+
+        assert results == [True] * 4
+        assert len(fake_smtp.instances) == 1
+        assert fake_smtp.instances[0].commands.count('send') == 4
+        assert fake_smtp.instances[0].commands[-1] == 'quit'
@@ -0,0 +1,176 @@
+"""Unit tests for the write-behind state store, its backends and the managers using it."""
+
+import json
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.scheduler.automation_overrides import AutomationOverrides
+from src.scheduler.state_manager import StateManager
+from src.state import state_store as state_store_module
+from src.state.manual_override import ManualOverrideManager
+from src.state.state_store import (
+    JSONFileBackend, SQLiteStateBackend, StateStore, configure_state_store, state_store
+)
+
+
+@pytest.fixture
+def disk_writes():
+    """Count atomic file writes made by the state store."""
+    # Writes still pending from other tests would otherwise be counted here
+    state_store.flush()
+    with patch.object(
+        state_store_module, 'write_json_atomic', wraps=state_store_module.write_json_atomic
+    ) as write:
+        yield write
+
+
+@pytest.mark.unit
+class TestStateStore:
+    """Tests for StateStore."""
+
+    def test_writes_are_coalesced(self, tmp_path, disk_writes):
+        store = StateStore(flush_interval=60)
+        path = tmp_path / 'state.json'
+
+        for count in range(10):
+            store.write(path, {'count': count})
+        disk_writes.assert_not_called()
+        assert store.read(path) == {'count': 9}
+
+        store.flush()
+
+        assert disk_writes.call_count == 1
+        assert json.loads(path.read_text()) == {'count': 9}
+        assert [p.name for p in tmp_path.iterdir()] == ['state.json']
+
+    def test_flushes_after_interval(self, tmp_path):
+        store = StateStore(flush_interval=0.05)
+        path = tmp_path / 'state.json'
+
+        store.write(path, {'on': True})
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert json.loads(path.read_text()) == {'on': True}
+
+    def test_failed_write_is_retried(self, tmp_path):
+        store = StateStore(flush_interval=60)
+        path = tmp_path / 'state.json'
+        store.write(path, {'on': True})
+
+        with patch.object(state_store_module, 'write_json_atomic', side_effect=OSError('disk full')):
+            store.flush()
+        assert not path.exists()
+        assert store.read(path) == {'on': True}
+
+        store.flush()
+        assert json.loads(path.read_text()) == {'on': True}
+
+    def test_exists_reflects_pending_writes(self, tmp_path):
+        store = StateStore(flush_interval=60)
+        path = tmp_path / 'state.json'
+
+        assert not store.exists(path)
+        store.write(path, {})
+        assert store.exists(path)
+
+
+@pytest.mark.unit
+class TestManagersUseStore:
+    """StateManager, ManualOverrideManager and AutomationOverrides write behind."""
+
+    def test_state_manager_changes_are_batched(self, tmp_path, disk_writes):
+        state = StateManager(state_file=str(tmp_path / 'mats.json'))
+
+        state.mark_turned_on()
+        state.start_cooldown()
+        state.mark_turned_off()
+        disk_writes.assert_not_called()
+
+        state_store.flush()
+
+        assert disk_writes.call_count == 1
+        reloaded = StateManager(state_file=str(tmp_path / 'mats.json'))
+        assert reloaded.device_on is False
+        assert reloaded.cooldown_start == state.cooldown_start
+
+    def test_expired_override_read_does_no_io(self, tmp_path, disk_writes):
+        path = tmp_path / 'overrides.json'
+        expired = (datetime.now(ManualOverrideManager(state_file=str(path)).timezone)
+                   - timedelta(minutes=1)).isoformat()
+        path.write_text(json.dumps({'mats': {'action': 'on', 'expires_at': expired}}))
+        manager = ManualOverrideManager(state_file=str(path))
+
+        assert manager.is_active('mats') is False
+        disk_writes.assert_not_called()
+
+        state_store.flush()
+        assert json.loads(path.read_text()) == {}
+
+    def test_automation_overrides_visible_before_flush(self, tmp_path):
+        path = str(tmp_path / 'automation_overrides.json')
+        AutomationOverrides(state_file=path).set_flag('mats', 'morning_mode', False)
+
+        assert AutomationOverrides(state_file=path).get_group_overrides('mats') == {'morning_mode': False}
+
+
+@pytest.mark.unit
+class TestSQLiteStateBackend:
+    """Tests for the SQLite state backend."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = StateStore(flush_interval=60, backend=SQLiteStateBackend(tmp_path / 'state.db'))
+        yield store
+        store.backend.close()
+
+    def test_database_uses_wal(self, store):
+        mode = store.backend._conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == 'wal'
+
+    def test_flush_commits_all_documents_in_one_transaction(self, tmp_path, store):
+        store.write(tmp_path / 'front.json', {'device_on': True})
+        store.write(tmp_path / 'back.json', {'device_on': False})
+
+        conn = store.backend._conn
+        store.backend._conn = Mock(wraps=conn)
+        store.backend._conn.executemany.side_effect = sqlite3.OperationalError('locked')
+        store.flush()
+        store.backend._conn = conn
+        rows = store.backend._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        assert rows == 0
+
+        store.flush()
+        rows = dict(store.backend._conn.execute("SELECT key, document FROM documents").fetchall())
+        assert {key: json.loads(value) for key, value in rows.items()} == {
+            'front.json': {'device_on': True}, 'back.json': {'device_on': False}
+        }
+        assert not (tmp_path / 'front.json').exists()
+
+    def test_json_files_are_migrated_on_first_read(self, tmp_path, store):
+        path = tmp_path / 'manual_overrides.json'
+        path.write_text(json.dumps({'mats': {'action': 'on'}}))
+
+        assert store.read(path) == {'mats': {'action': 'on'}}
+        path.unlink()
+
+        assert store.exists(path)
+        assert store.read(path) == {'mats': {'action': 'on'}}
+
+    def test_configure_switches_backend(self, tmp_path):
+        store = configure_state_store({'backend': 'sqlite', 'database': str(tmp_path / 'state.db')})
+        try:
+            assert isinstance(store.backend, SQLiteStateBackend)
+        finally:
+            configure_state_store({'backend': 'json'})
+        assert isinstance(state_store.backend, JSONFileBackend)
+
+    def test_configure_rejects_unknown_backend(self):
+        with pytest.raises(ValueError):
+            configure_state_store({'backend': 'redis'})
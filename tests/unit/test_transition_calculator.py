@@ -0,0 +1,140 @@
+"""Unit tests for event-driven schedule transition calculation."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.config.config_loader import Config
+from src.scheduler.scheduler_enhanced import EnhancedScheduler
+from src.scheduler.schedule_types import parse_schedules
+from src.weather.weather_cache import ForecastIndex
+
+
+def _at(timezone, hour, minute=0, day=17):
+    """Local datetime on Monday 2024-06-17 (or another June day)."""
+    return datetime(2024, 6, day, hour, minute, tzinfo=timezone)
+
+
+@pytest.mark.unit
+class TestTransitionCandidates:
+    """Tests for ScheduleEvaluator.get_transition_candidates."""
+
+    def test_clock_edges_and_midnights(self, schedule_evaluator, schedule_config_basic, timezone_ny):
+        schedules = parse_schedules([schedule_config_basic])
+
+        candidates = schedule_evaluator.get_transition_candidates(
+            schedules, _at(timezone_ny, 5), _at(timezone_ny, 5, day=18)
+        )
+
+        assert candidates == [
+            _at(timezone_ny, 6),
+            _at(timezone_ny, 8),
+            _at(timezone_ny, 0, day=18),
+        ]
+
+    def test_disabled_schedules_have_no_edges(self, schedule_evaluator, schedule_config_basic, timezone_ny):
+        schedule_config_basic['enabled'] = False
+        schedules = parse_schedules([schedule_config_basic])
+
+        candidates = schedule_evaluator.get_transition_candidates(
+            schedules, _at(timezone_ny, 1), _at(timezone_ny, 23)
+        )
+
+        assert candidates == []
+
+
+@pytest.mark.unit
+class TestNextScheduleChange:
+    """Tests for ScheduleEvaluator.get_next_schedule_change."""
+
+    def test_next_on_edge(self, schedule_evaluator, schedule_config_basic, timezone_ny):
+        schedules = parse_schedules([schedule_config_basic])
+
+        change = schedule_evaluator.get_next_schedule_change(schedules, _at(timezone_ny, 5, 30))
+
+        assert change == (_at(timezone_ny, 6), "ON (schedule 'Morning Schedule')")
+
+    def test_next_off_edge(self, schedule_evaluator, schedule_config_basic, timezone_ny):
+        schedules = parse_schedules([schedule_config_basic])
+
+        change = schedule_evaluator.get_next_schedule_change(schedules, _at(timezone_ny, 7))
+
+        assert change == (_at(timezone_ny, 8), "OFF (no active schedules)")
+
+    def test_skips_days_not_scheduled(self, schedule_evaluator, schedule_config_basic, timezone_ny):
+        """Friday evening: the next ON is Monday morning (weekdays only)."""
+        schedules = parse_schedules([schedule_config_basic])
+
+        change = schedule_evaluator.get_next_schedule_change(
+            schedules, _at(timezone_ny, 20, day=14), horizon_hours=96
+        )
+
+        assert change[0] == _at(timezone_ny, 6, day=17)
+
+    def test_no_schedules(self, schedule_evaluator, timezone_ny):
+        assert schedule_evaluator.get_next_schedule_change([], _at(timezone_ny, 5)) is None
+
+
+@pytest.mark.unit
+class TestForecastSwitchPoints:
+    """Tests for ForecastIndex.switch_points."""
+
+    def test_midpoints_between_entries(self, timezone_ny):
+        base = _at(timezone_ny, 0)
+        forecast = [
+            {'timestamp': (base + timedelta(hours=h)).isoformat(), 'temperature_f': 30.0}
+            for h in range(4)
+        ]
+        index = ForecastIndex(forecast, timezone_ny)
+
+        points = index.switch_points(base, base + timedelta(hours=2))
+
+        assert points == [base + timedelta(minutes=30), base + timedelta(minutes=90)]
+
+
+@pytest.mark.unit
+class TestPredictGroupWindows:
+    """Tests for exact window computation in EnhancedScheduler."""
+
+    @pytest.fixture
+    def scheduler(self, schedule_evaluator):
+        scheduler = EnhancedScheduler(Config('config.example.yaml'), setup_mode=True)
+        scheduler.schedule_evaluator = schedule_evaluator
+        scheduler.timezone = schedule_evaluator.timezone
+        scheduler.weather = None
+        scheduler.vacation_mode = False
+        scheduler.manual_override = MagicMock()
+        scheduler.manual_override.state = {}
+        return scheduler
+
+    def test_windows_have_exact_edges(self, scheduler, schedule_config_basic, timezone_ny):
+        scheduler.group_schedules['mats'] = parse_schedules([schedule_config_basic])
+        start = _at(timezone_ny, 5, 7)
+        end = _at(timezone_ny, 9, 13)
+
+        windows = scheduler._compute_group_windows('mats', {'enabled': True}, start, end, [])
+
+        assert [(w['start'], w['end'], w['state']) for w in windows] == [
+            (start.isoformat(), _at(timezone_ny, 6).isoformat(), 'off'),
+            (_at(timezone_ny, 6).isoformat(), _at(timezone_ny, 8).isoformat(), 'on'),
+            (_at(timezone_ny, 8).isoformat(), end.isoformat(), 'off'),
+        ]
+        assert windows[1]['reason'] == 'schedule:Morning Schedule'
+
+    def test_override_holds_until_expiry(self, scheduler, schedule_config_basic, timezone_ny):
+        scheduler.group_schedules['mats'] = parse_schedules([schedule_config_basic])
+        start = _at(timezone_ny, 7)
+        expires_at = _at(timezone_ny, 9)
+        scheduler.manual_override.state = {
+            'mats': {'action': 'off', 'expires_at': expires_at.isoformat()}
+        }
+
+        windows = scheduler._compute_group_windows(
+            'mats', {'enabled': True}, start, _at(timezone_ny, 10), []
+        )
+
+        assert [(w['end'], w['reason']) for w in windows] == [
+            (expires_at.isoformat(), 'manual_override'),
+            (_at(timezone_ny, 10).isoformat(), 'no_active_schedule'),
+        ]
@@ -0,0 +1,165 @@
+"""Unit tests for the per-cycle WeatherConditionsSnapshot shared across groups."""
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from src.config.config_loader import Config
+from src.scheduler.scheduler_enhanced import EnhancedScheduler
+from src.scheduler.schedule_types import parse_schedules
+from src.scheduler.state_manager import StateManager
+from src.weather import WeatherConditionsSnapshot
+
+
+def _make_weather(fetched_at='2025-01-01T00:00:00-05:00'):
+    """Create a mocked resilient weather service backed by a fake cache."""
+    weather = MagicMock()
+    weather.is_offline.return_value = False
+    weather.cache.cache_data = {'fetched_at': fetched_at}
+    weather.get_current_conditions = AsyncMock(return_value=(28.0, 0.5))
+    weather.check_precipitation_forecast = AsyncMock(return_value=(False, None, None))
+    weather.check_black_ice_risk = AsyncMock(return_value=(False, None, None, None))
+    return weather
+
+
+def _make_scheduler(tmp_path, group_names):
+    """Create a setup-mode scheduler with mocked weather and devices."""
+    config = Config('config.example.yaml')
+    scheduler = EnhancedScheduler(config, setup_mode=True)
+    scheduler.weather_enabled = True
+    scheduler.weather = _make_weather()
+    
+    device_manager = MagicMock()
+    device_manager.get_all_groups.return_value = list(group_names)
+    device_manager.get_group_config.return_value = {'enabled': True, 'items': []}
+    device_manager.get_group_state = AsyncMock(return_value=False)
+    device_manager.turn_on_group = AsyncMock()
+    scheduler.device_manager = device_manager
+    
+    schedules = parse_schedules([{
+        'name': 'Cold',
+        'on': {'type': 'time', 'value': '00:00'},
+        'off': {'type': 'time', 'value': '23:59'},
+        'conditions': {'temperature_max': 32}
+    }])
+    scheduler.group_schedules = {name: schedules for name in group_names}
+    scheduler.states = {
+        name: StateManager(state_file=str(tmp_path / f"{name}.json")) for name in group_names
+    }
+    scheduler.manual_override = MagicMock()
+    scheduler.manual_override.is_active.return_value = False
+    return scheduler
+
+
+@pytest.mark.unit
+class TestWeatherConditionsSnapshot:
+    """Tests for the WeatherConditionsSnapshot value object."""
+    
+    def test_conditions_unavailable(self):
+        """A snapshot without data yields no conditions."""
+        snapshot = WeatherConditionsSnapshot(evaluated_at=datetime.now())
+        assert snapshot.get_conditions() is None
+    
+    def test_conditions_black_ice_toggle(self):
+        """Black ice risk is only reported when requested."""
+        snapshot = WeatherConditionsSnapshot(
+            evaluated_at=datetime.now(), available=True, temperature_f=30.0, black_ice_risk=True
+        )
+        assert snapshot.get_conditions()['black_ice_risk'] is True
+        assert snapshot.get_conditions(include_black_ice=False)['black_ice_risk'] is False
+    
+    def test_snapshot_is_immutable(self):
+        """Snapshots cannot be mutated once shared."""
+        snapshot = WeatherConditionsSnapshot(evaluated_at=datetime.now())
+        with pytest.raises(Exception):
+            snapshot.temperature_f = 10.0
+    
+    def test_to_dict_is_serializable(self):
+        """to_dict converts datetimes to ISO strings."""
+        now = datetime.now(ZoneInfo('UTC'))
+        snapshot = WeatherConditionsSnapshot(
+            evaluated_at=now, available=True, precipitation_time=now + timedelta(minutes=30)
+        )
+        data = snapshot.to_dict()
+        assert data['evaluated_at'] == now.isoformat()
+        assert data['precipitation_time'] == (now + timedelta(minutes=30)).isoformat()
+
+
+@pytest.mark.unit
+class TestSchedulerWeatherSnapshot:
+    """Tests for snapshot sharing inside EnhancedScheduler."""
+    
+    @pytest.mark.asyncio
+    async def test_weather_read_once_per_cycle(self, tmp_path):
+        """Weather service is consulted once per cycle regardless of group count."""
+        scheduler = _make_scheduler(tmp_path, [f"g{i}" for i in range(8)])
+        
+        summary = await scheduler.run_cycle_multi_device()
+        
+        assert scheduler.weather.get_current_conditions.await_count == 1
+        assert scheduler.weather.check_precipitation_forecast.await_count == 1
+        assert scheduler.weather.check_black_ice_risk.await_count == 1
+        assert all(r['action'] == 'turned_on' for r in summary['groups'].values())
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_rebuilt_each_cycle(self, tmp_path):
+        """Each cycle forces a fresh snapshot."""
+        scheduler = _make_scheduler(tmp_path, ['a', 'b'])
+        
+        await scheduler.run_cycle_multi_device()
+        await scheduler.run_cycle_multi_device()
+        
+        assert scheduler.weather.get_current_conditions.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_until_cache_refresh(self, tmp_path):
+        """Snapshot is reused until the weather cache is refreshed."""
+        scheduler = _make_scheduler(tmp_path, ['a'])
+        
+        first = await scheduler.get_weather_snapshot()
+        second = await scheduler.get_weather_snapshot()
+        assert first is second
+        
+        scheduler.weather.cache.cache_data = {'fetched_at': '2025-01-01T01:00:00-05:00'}
+        third = await scheduler.get_weather_snapshot()
+        assert third is not first
+        assert scheduler.weather.get_current_conditions.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_rebuilt_for_distant_time(self, tmp_path):
+        """Evaluating for a time far from the snapshot's time rebuilds it."""
+        scheduler = _make_scheduler(tmp_path, ['a'])
+        now = scheduler._get_local_now()
+        
+        first = await scheduler.get_weather_snapshot(now)
+        second = await scheduler.get_weather_snapshot(now + timedelta(minutes=15))
+        
+        assert first is not second
+    
+    @pytest.mark.asyncio
+    async def test_precipitation_lead_time(self, tmp_path):
+        """Precipitation within the lead time marks the snapshot active."""
+        scheduler = _make_scheduler(tmp_path, ['a'])
+        now = scheduler._get_local_now()
+        scheduler.weather.check_precipitation_forecast = AsyncMock(
+            return_value=(True, now + timedelta(minutes=30), 30.0)
+        )
+        
+        snapshot = await scheduler.get_weather_snapshot(now, force_refresh=True)
+        
+        assert snapshot.precipitation_active is True
+        assert snapshot.get_conditions()['precipitation_active'] is True
+    
+    @pytest.mark.asyncio
+    async def test_offline_weather(self, tmp_path):
+        """Offline weather produces an offline snapshot without reading the cache."""
+        scheduler = _make_scheduler(tmp_path, ['a'])
+        scheduler.weather.is_offline.return_value = True
+        
+        conditions, offline = await scheduler._gather_weather_conditions('a', scheduler._get_local_now())
+        
+        assert conditions is None
+        assert offline is True
+        scheduler.weather.get_current_conditions.assert_not_awaited()
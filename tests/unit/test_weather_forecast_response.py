@@ -0,0 +1,124 @@
+"""Unit tests for the pre-rendered /api/weather/forecast response."""
+
+import gzip
+import json
+import os
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask, request
+
+from src.config.config_manager import ConfigManager
+from src.web.response_cache import CachedJSONResponse
+from src.web.web_server import WebServer
+
+
+def _forecast(hours=24):
+    now = datetime.now()
+    return [
+        {
+            'timestamp': (now + timedelta(hours=h)).isoformat(),
+            'temperature_f': 30.0,
+            'dewpoint_f': 28.0,
+            'humidity_percent': 90.0,
+            'precipitation_mm': 0.5
+        }
+        for h in range(hours)
+    ]
+
+
+@pytest.mark.unit
+class TestCachedJSONResponse:
+    """Tests for CachedJSONResponse."""
+
+    @pytest.fixture
+    def app(self):
+        return Flask(__name__)
+
+    def test_not_modified_when_etag_matches(self, app):
+        cached = CachedJSONResponse('v1', {'status': 'ok'})
+
+        with app.test_request_context(headers={'If-None-Match': cached.etag}):
+            response = cached.to_response(request)
+
+        assert response.status_code == 304
+        assert response.headers['ETag'] == cached.etag
+
+    def test_gzip_when_accepted(self, app):
+        payload = {'hours': [{'temp_f': 30.0}] * 200}
+        cached = CachedJSONResponse('v1', payload)
+
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip, deflate'}):
+            response = cached.to_response(request)
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(response.get_data())) == payload
+
+    def test_small_bodies_are_not_compressed(self, app):
+        cached = CachedJSONResponse('v1', {'status': 'ok'})
+
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+            response = cached.to_response(request)
+
+        assert 'Content-Encoding' not in response.headers
+        assert json.loads(response.get_data()) == {'status': 'ok'}
+
+
+@pytest.mark.unit
+class TestWeatherForecastEndpoint:
+    """Tests for GET /api/weather/forecast caching."""
+
+    @pytest.fixture
+    def server(self, tmp_path, monkeypatch):
+        for key in list(os.environ):
+            if key.startswith('HEATTRAX_'):
+                monkeypatch.delenv(key)
+
+        cache = MagicMock()
+        cache.cache_data = {'fetched_at': datetime.now().isoformat(), 'forecast': _forecast()}
+        cache.get_cache_age_hours.return_value = 0.52
+        scheduler = MagicMock()
+        scheduler.weather.cache = cache
+        scheduler.weather.state.value = 'online'
+
+        return WebServer(ConfigManager(str(tmp_path / 'config.yaml')), scheduler)
+
+    def test_payload_built_once_and_revalidated(self, server):
+        client = server.app.test_client()
+
+        with patch.object(server, '_build_weather_forecast_payload',
+                          wraps=server._build_weather_forecast_payload) as build:
+            first = client.get('/api/weather/forecast')
+            second = client.get('/api/weather/forecast', headers={'If-None-Match': first.headers['ETag']})
+            third = client.get('/api/weather/forecast')
+
+        assert first.status_code == 200
+        assert first.get_json()['cache_age_hours'] == 0.5
+        assert len(first.get_json()['hours']) == 24
+        assert second.status_code == 304
+        assert third.get_data() == first.get_data()
+        assert build.call_count == 1
+
+    def test_rebuilt_after_new_forecast(self, server):
+        client = server.app.test_client()
+        first = client.get('/api/weather/forecast')
+
+        server.scheduler.weather.cache.cache_data = {
+            'fetched_at': datetime.now().isoformat(), 'forecast': _forecast(hours=6)
+        }
+        second = client.get('/api/weather/forecast', headers={'If-None-Match': first.headers['ETag']})
+
+        assert second.status_code == 200
+        assert len(second.get_json()['hours']) == 6
+
+    def test_rebuilt_after_config_change(self, server):
+        client = server.app.test_client()
+        client.get('/api/weather/forecast')
+
+        config = server.config_manager.get_config(include_secrets=True)
+        config['weather_api']['enabled'] = False
+        server.config_manager.update_config(config)
+        response = client.get('/api/weather/forecast')
+
+        assert response.get_json()['status'] == 'no_data'
@@ -0,0 +1,143 @@
+"""Unit tests for the production WSGI server."""
+
+import http.client
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from src.web import wsgi_server
+
+
+def _start(app, **kwargs):
+    """Run wsgi_server.serve in a thread; return (server, thread, stop_event)."""
+    stop = threading.Event()
+    ready = threading.Event()
+    servers = []
+
+    def on_ready(server):
+        servers.append(server)
+        ready.set()
+
+    thread = threading.Thread(
+        target=wsgi_server.serve,
+        args=(app, '127.0.0.1', 0),
+        kwargs={'should_stop': stop.is_set, 'on_ready': on_ready, **kwargs},
+        daemon=True
+    )
+    thread.start()
+    assert ready.wait(timeout=2)
+    return servers[0], thread, stop
+
+
+@pytest.mark.unit
+class TestPooledWSGIServer:
+    """Tests for wsgi_server.serve."""
+
+    def test_serves_keep_alive_requests_and_stops_on_signal(self, monkeypatch):
+        monkeypatch.setattr(wsgi_server, 'SHUTDOWN_POLL_INTERVAL', 0.05)
+        app = Flask(__name__)
+        app.add_url_rule('/ping', 'ping', lambda: 'pong')
+
+        server, thread, stop = _start(app)
+
+        conn = http.client.HTTPConnection('127.0.0.1', server.port, timeout=2)
+        for _ in range(2):
+            conn.request('GET', '/ping')
+            response = conn.getresponse()
+            assert response.read() == b'pong'
+        conn.close()
+
+        stop.set()
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+
+    def test_worker_pool_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(wsgi_server, 'SHUTDOWN_POLL_INTERVAL', 0.05)
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+        app = Flask(__name__)
+
+        def slow():
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.1)
+            with lock:
+                state['active'] -= 1
+            return 'ok'
+
+        app.add_url_rule('/slow', 'slow', slow)
+        server, thread, stop = _start(app, max_workers=2)
+
+        def fetch():
+            conn = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5)
+            conn.request('GET', '/slow', headers={'Connection': 'close'})
+            conn.getresponse().read()
+            conn.close()
+
+        clients = [threading.Thread(target=fetch) for _ in range(4)]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join(timeout=5)
+
+        stop.set()
+        thread.join(timeout=2)
+        assert state['peak'] == 2
+
+    def test_drain_waits_for_in_flight_requests(self):
+        server = wsgi_server.PooledWSGIServer('127.0.0.1', 0, Flask(__name__), max_workers=1)
+        try:
+            assert server.drain(timeout=0.1) is True
+            assert server.active_connections == 0
+        finally:
+            server.server_close()
+
+    def test_idle_keep_alive_connection_releases_worker(self, monkeypatch):
+        monkeypatch.setattr(wsgi_server, 'SHUTDOWN_POLL_INTERVAL', 0.05)
+        app = Flask(__name__)
+        app.add_url_rule('/ping', 'ping', lambda: 'pong')
+
+        server, thread, stop = _start(app, max_workers=1, keepalive_timeout=0.1)
+
+        idle = http.client.HTTPConnection('127.0.0.1', server.port, timeout=2)
+        idle.request('GET', '/ping')
+        assert idle.getresponse().read() == b'pong'
+
+        # The idle connection gives up the only worker after keepalive_timeout
+        other = http.client.HTTPConnection('127.0.0.1', server.port, timeout=2)
+        other.request('GET', '/ping')
+        assert other.getresponse().read() == b'pong'
+        idle.close()
+        other.close()
+
+        stop.set()
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+
+    def test_shutdown_is_not_blocked_by_busy_workers(self, monkeypatch):
+        monkeypatch.setattr(wsgi_server, 'SHUTDOWN_POLL_INTERVAL', 0.05)
+        release = threading.Event()
+        app = Flask(__name__)
+
+        def block():
+            release.wait(timeout=5)
+            return 'ok'
+
+        app.add_url_rule('/block', 'block', block)
+        server, thread, stop = _start(app, max_workers=1, shutdown_timeout=0.1)
+
+        busy = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5)
+        busy.request('GET', '/block')
+        waiting = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5)
+        waiting.request('GET', '/block')
+        time.sleep(0.2)
+
+        stop.set()
+        thread.join(timeout=2)
+        release.set()
+        assert not thread.is_alive()
+        busy.close()
+        waiting.close()
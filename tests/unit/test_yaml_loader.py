@@ -0,0 +1,103 @@
+"""Unit tests for the shared configuration YAML loader and parsed-file cache."""
+
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from src.config import yaml_loader
+from src.config.config_loader import Config
+from src.config.config_manager import ConfigManager
+from src.config.yaml_loader import ConfigFileCache
+
+
+@pytest.fixture
+def count_parses():
+    """Count real YAML parses made through the shared loader."""
+    with patch.object(yaml_loader, 'safe_load', wraps=yaml_loader.safe_load) as parse:
+        yield parse
+
+
+@pytest.mark.unit
+class TestConfigFileCache:
+    """Tests for ConfigFileCache."""
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path, count_parses):
+        path = tmp_path / 'config.yaml'
+        path.write_text('web:\n  port: 4328\n')
+        cache = ConfigFileCache()
+
+        first = cache.load(path)
+        first['web']['port'] = 1
+        second = cache.load(path)
+
+        assert second == {'web': {'port': 4328}}
+        assert count_parses.call_count == 1
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_rewrite_with_same_contents_is_not_reparsed(self, tmp_path, count_parses):
+        path = tmp_path / 'config.yaml'
+        path.write_text('web:\n  port: 4328\n')
+        cache = ConfigFileCache()
+        cache.load(path)
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        cache.load(path)
+
+        assert count_parses.call_count == 1
+
+    def test_changed_contents_are_reparsed(self, tmp_path):
+        path = tmp_path / 'config.yaml'
+        path.write_text('web:\n  port: 4328\n')
+        cache = ConfigFileCache()
+        cache.load(path)
+
+        path.write_text('web:\n  port: 5000\n')
+
+        assert cache.load(path) == {'web': {'port': 5000}}
+
+    def test_stored_document_skips_parsing(self, tmp_path, count_parses):
+        path = tmp_path / 'config.yaml'
+        data = b'web:\n  port: 4328\n'
+        path.write_bytes(data)
+        cache = ConfigFileCache()
+
+        cache.store(path, data, {'web': {'port': 4328}})
+
+        assert cache.load(path) == {'web': {'port': 4328}}
+        count_parses.assert_not_called()
+
+
+@pytest.mark.unit
+class TestSharedConfigLoading:
+    """ConfigManager and Config share one parse of config.yaml."""
+
+    def test_manager_and_config_parse_once(self, tmp_path, monkeypatch, count_parses):
+        for key in list(os.environ):
+            if key.startswith('HEATTRAX_'):
+                monkeypatch.delenv(key)
+        path = tmp_path / 'config.yaml'
+        shutil.copy('config.example.yaml', path)
+
+        manager = ConfigManager(str(path))
+        config = Config(str(path))
+
+        assert count_parses.call_count == 1
+        assert config.location == manager.get_config()['location']
+
+    def test_manager_writes_prime_the_cache(self, tmp_path, monkeypatch, count_parses):
+        for key in list(os.environ):
+            if key.startswith('HEATTRAX_'):
+                monkeypatch.delenv(key)
+        manager = ConfigManager(str(tmp_path / 'config.yaml'))
+        config = manager.get_config(include_secrets=True)
+        config['location']['latitude'] = 10.0
+        manager.update_config(config)
+        count_parses.reset_mock()
+
+        manager.reload_config()
+
+        count_parses.assert_not_called()
+        assert manager.get_config()['location']['latitude'] == 10.0